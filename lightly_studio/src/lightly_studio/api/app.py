@@ -99,6 +99,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        video_frames_media.FRAME_MEDIA_TYPE_HEADER,
+    ],
 )
 
 app.add_middleware(
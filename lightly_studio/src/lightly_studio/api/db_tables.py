@@ -34,6 +34,9 @@ from lightly_studio.models.metadata import (
 from lightly_studio.models.sample_embedding import (
     SampleEmbeddingTable,  # noqa: F401, required for SQLModel to work properly
 )
+from lightly_studio.models.sample_embedding_version import (
+    SampleEmbeddingVersionTable,  # noqa: F401, required for SQLModel to work properly
+)
 from lightly_studio.models.settings import (
     SettingTable,  # noqa: F401, required for SQLModel to work properly
 )
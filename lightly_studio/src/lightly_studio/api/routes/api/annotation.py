@@ -99,6 +99,8 @@ class ReadAnnotationsWithPayloadRequest(BaseModel):
     embedding_region: EmbeddingRegion | None = None
     text_embedding: list[float] | None = None
     sort_by: AnnotationEvaluationMetricSortExpr | None = None
+    # The nextSeekCursor of the previous page; used instead of the pagination cursor.
+    seek_cursor: str | None = None
 
 
 @annotations_router.get(
@@ -188,6 +190,7 @@ def read_annotations_with_payload(
             text_embedding=body.text_embedding,
             order_by=order_by,
         ),
+        seek_cursor=body.seek_cursor,
     )
 
 
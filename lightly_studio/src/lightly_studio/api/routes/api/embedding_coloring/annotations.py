@@ -7,16 +7,20 @@ from uuid import UUID
 from sqlmodel import Session
 
 from lightly_studio.api.routes.api.embedding_coloring import coloring_helpers
-from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import DiscreteColorScale
+from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import (
+    ColorCategories,
+    DiscreteColorScale,
+    SampleIndex,
+)
 from lightly_studio.resolvers import annotation_label_resolver, annotation_resolver
 
 
 def build_annotation_color_maps(
     session: Session,
     annotation_label_ids: list[UUID],
-    sample_ids: list[UUID],
+    sample_index: SampleIndex,
     matching_sample_ids: set[UUID] | None,
-) -> tuple[list[list[int]], dict[int, str]]:
+) -> tuple[ColorCategories, dict[int, str]]:
     """Build color categories and a legend for annotation-based sample coloring.
 
     When more labels are selected than fit in the legend, the labels carried by
@@ -27,21 +31,21 @@ def build_annotation_color_maps(
     Args:
         session: Database session.
         annotation_label_ids: Label IDs to color by.
-        sample_ids: Sample IDs in the order for which to build color categories.
+        sample_index: Index of the samples for which to build color categories.
         matching_sample_ids: Sample IDs matching the active filter. Labels are
             prioritized by their frequency among these samples. ``None`` counts
             all samples.
 
     Returns:
         A tuple of `(color_categories, color_legend)` for the provided samples.
-        The length of `color_categories` is the number of samples; each entry is
-        the list of that sample's color categories, sorted ascending. The `color_legend`
-        is a mapping from color ID to a human-readable string.
+        `color_categories` holds the color categories of each sample in the order
+        of `sample_index`, sorted ascending. The `color_legend` is a mapping from
+        color ID to a human-readable string.
     """
     names = annotation_label_resolver.names_by_ids(session=session, ids=annotation_label_ids)
     sample_to_labels = annotation_resolver.get_label_ids_by_sample_ids(
         session=session,
-        sample_ids=sample_ids,
+        sample_ids=sample_index.sample_ids,
         annotation_label_ids=annotation_label_ids,
     )
 
@@ -56,7 +60,7 @@ def build_annotation_color_maps(
     )
 
     return coloring_helpers.assign_color_categories(
-        sample_ids=sample_ids,
+        sample_index=sample_index,
         sample_to_values=sample_to_labels,
         scale=scale,
     )
@@ -16,6 +16,10 @@ from lightly_studio.api.routes.api.embedding_coloring import (
     metadata,
     tags,
 )
+from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import (
+    ColorCategories,
+    SampleIndex,
+)
 
 
 class TagColorBy(BaseModel):
@@ -49,32 +53,32 @@ def build_color_data(
     session: Session,
     collection_id: UUID,
     color_by: ColorBy | None,
-    sample_ids: list[UUID],
+    sample_index: SampleIndex,
     matching_sample_ids: set[UUID] | None,
-) -> tuple[list[list[int]], dict[int, str]]:
+) -> tuple[ColorCategories, dict[int, str]]:
     """Build color categories and a legend for embedding coloring.
 
     Args:
         session: Database session used to resolve metadata values.
         collection_id: Collection whose samples are being colored.
         color_by: Coloring configuration to apply to the samples.
-        sample_ids: Sample IDs in the same order as the returned color categories.
+        sample_index: Index of the samples, in the order of the returned color categories.
         matching_sample_ids: Sample IDs matching the active filter. Values are
             prioritized by their frequency among these samples so the legend
             reflects the filtered view. ``None`` means no filter is active (all
             samples are counted).
 
     Returns:
-        A tuple of `(color_categories, color_legend)` for the provided samples. The
-        length of `color_categories` is the number of samples; each entry is the
-        list of that sample's color categories, sorted ascending. The `color_legend`
-        is a mapping from color ID to a human-readable string.
+        A tuple of `(color_categories, color_legend)` for the provided samples.
+        `color_categories` holds the color categories of each sample in the order
+        of `sample_index`, sorted ascending. The `color_legend` is a mapping from
+        color ID to a human-readable string.
     """
     if isinstance(color_by, TagColorBy):
         return tags.build_tag_color_maps(
             session=session,
             tag_ids=color_by.tag_ids,
-            sample_ids=sample_ids,
+            sample_index=sample_index,
             matching_sample_ids=matching_sample_ids,
         )
 
@@ -83,7 +87,7 @@ def build_color_data(
             session=session,
             collection_id=collection_id,
             key=color_by.key,
-            sample_ids=sample_ids,
+            sample_index=sample_index,
             matching_sample_ids=matching_sample_ids,
         )
 
@@ -91,7 +95,7 @@ def build_color_data(
         return annotation_coloring.build_annotation_color_maps(
             session=session,
             annotation_label_ids=color_by.annotation_label_ids,
-            sample_ids=sample_ids,
+            sample_index=sample_index,
             matching_sample_ids=matching_sample_ids,
         )
 
@@ -99,4 +103,4 @@ def build_color_data(
     if color_by is not None:
         assert_never(color_by)
 
-    return [[] for _ in sample_ids], {}
+    return ColorCategories.empty(num_samples=len(sample_index)), {}
@@ -9,6 +9,11 @@ from dataclasses import dataclass
 from typing import Generic, Protocol, TypeVar
 from uuid import UUID
 
+import numpy as np
+from numpy.typing import NDArray
+
+from lightly_studio.resolvers import twodim_embedding_resolver
+
 T = TypeVar("T")
 T_contra = TypeVar("T_contra", contravariant=True)
 
@@ -19,6 +24,107 @@ MAX_LEGEND_SLOTS = 256
 FIRST_COLORED_CATEGORY = 3
 # Number of category names listed inside an "Other" bucket label before truncating with an ellipsis.
 MAX_OTHER_NAMES = 5
+# A sample ID as a numpy scalar: its 16 raw bytes, compared bytewise.
+_SAMPLE_ID_DTYPE = np.dtype("V16")
+
+
+class SampleIndex:
+    """Dense index of the samples of a plot, mapping sample IDs to their positions.
+
+    Per-sample data of a plot is kept in numpy arrays ordered like the plot, and this
+    index translates sample IDs coming from the database into positions in those arrays.
+    """
+
+    def __init__(self, sample_id_bytes: bytes) -> None:
+        """Create the index of samples given as concatenated 16-byte sample IDs.
+
+        Args:
+            sample_id_bytes: The raw bytes of each sample ID, in plot order.
+        """
+        self._sample_id_bytes = sample_id_bytes
+        keys = np.frombuffer(sample_id_bytes, dtype=_SAMPLE_ID_DTYPE)
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+    @classmethod
+    def from_sample_ids(cls, sample_ids: Iterable[UUID]) -> SampleIndex:
+        """Create the index of the given samples, in plot order."""
+        return cls(sample_id_bytes=twodim_embedding_resolver.encode_sample_ids(sample_ids))
+
+    def __len__(self) -> int:
+        """Number of samples in the plot."""
+        return len(self._order)
+
+    @property
+    def sample_ids(self) -> list[UUID]:
+        """The sample IDs in plot order."""
+        return twodim_embedding_resolver.decode_sample_ids(self._sample_id_bytes)
+
+    def positions(self, sample_ids: Iterable[UUID]) -> NDArray[np.int64]:
+        """Return the position of each sample ID, -1 for samples not in the plot."""
+        queries = np.frombuffer(
+            twodim_embedding_resolver.encode_sample_ids(sample_ids), dtype=_SAMPLE_ID_DTYPE
+        )
+        if len(self._order) == 0:
+            return np.full(len(queries), -1, dtype=np.int64)
+        found_at = np.minimum(np.searchsorted(self._sorted_keys, queries), len(self._order) - 1)
+        return np.where(self._sorted_keys[found_at] == queries, self._order[found_at], -1)
+
+    def mask(self, sample_ids: Iterable[UUID]) -> NDArray[np.bool_]:
+        """Return a boolean mask over the plot marking the given samples."""
+        positions = self.positions(sample_ids)
+        mask = np.zeros(len(self._order), dtype=np.bool_)
+        mask[positions[positions >= 0]] = True
+        return mask
+
+
+@dataclass(frozen=True)
+class ColorCategories:
+    """Color categories of each sample of a plot, in plot order.
+
+    Stored like an Arrow list array: the categories of the sample at position ``i`` are
+    ``values[offsets[i] : offsets[i + 1]]``, sorted ascending.
+    """
+
+    offsets: NDArray[np.int32]
+    values: NDArray[np.uint8]
+
+    @classmethod
+    def empty(cls, num_samples: int) -> ColorCategories:
+        """Return categories for ``num_samples`` samples without any category."""
+        return cls(
+            offsets=np.zeros(num_samples + 1, dtype=np.int32),
+            values=np.empty(0, dtype=np.uint8),
+        )
+
+    @classmethod
+    def from_pairs(
+        cls,
+        num_samples: int,
+        positions: NDArray[np.int64],
+        categories: NDArray[np.uint8],
+    ) -> ColorCategories:
+        """Group ``(position, category)`` pairs by position.
+
+        Args:
+            num_samples: Number of samples of the plot.
+            positions: Position of the sample of each pair.
+            categories: Category of each pair.
+
+        Returns:
+            The categories of every sample; samples without a pair have none.
+        """
+        order = np.lexsort((categories, positions))
+        counts = np.bincount(positions, minlength=num_samples)
+        offsets = np.zeros(num_samples + 1, dtype=np.int32)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(offsets=offsets, values=categories[order].astype(np.uint8))
+
+    def to_lists(self) -> list[list[int]]:
+        """Return the categories of each sample as Python lists."""
+        values = self.values.tolist()
+        bounds = self.offsets.tolist()
+        return [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
 
 
 class ColorScale(Protocol[T_contra]):
@@ -173,32 +279,44 @@ class DiscreteColorScale(Generic[T]):
 
 
 def assign_color_categories(
-    sample_ids: Sequence[UUID],
+    sample_index: SampleIndex,
     sample_to_values: Mapping[UUID, Iterable[T]],
     scale: ColorScale[T],
-) -> tuple[list[list[int]], dict[int, str]]:
-    """Return per-sample color category list and a legend for the given samples.
+) -> tuple[ColorCategories, dict[int, str]]:
+    """Return per-sample color categories and a legend for the samples of a plot.
 
     Each sample maps to the color categories of its values, sorted by color
-    category. A sample with no value (or no value that maps to a category) maps
-    to an empty list.
+    category. A sample with no value (or no value that maps to a category) has
+    no category. Samples in ``sample_to_values`` that are not in the plot are
+    ignored.
 
     Args:
-        sample_ids: Sample IDs.
+        sample_index: Index of the samples of the plot.
         sample_to_values: Mapping from sample ID to the values it carries.
         scale: Color scale used to map values to categories.
 
     Returns:
-        A tuple of `(color_categories, legend)`. Each per-sample list holds the
-        sample's color categories, sorted ascending.
+        A tuple of `(color_categories, legend)`.
     """
-    color_categories: list[list[int]] = []
-    for sid in sample_ids:
-        values = sample_to_values.get(sid, ())
-        categories = [scale.value_to_category(value) for value in values]
-        categories_not_none = [c for c in categories if c is not None]
-        color_categories.append(sorted(categories_not_none))
-
+    category_by_value: dict[T, int | None] = {}
+    pair_sample_ids: list[UUID] = []
+    pair_categories: list[int] = []
+    for sample_id, values in sample_to_values.items():
+        for value in values:
+            if value not in category_by_value:
+                category_by_value[value] = scale.value_to_category(value)
+            category = category_by_value[value]
+            if category is not None:
+                pair_sample_ids.append(sample_id)
+                pair_categories.append(category)
+
+    positions = sample_index.positions(pair_sample_ids)
+    in_plot = positions >= 0
+    color_categories = ColorCategories.from_pairs(
+        num_samples=len(sample_index),
+        positions=positions[in_plot],
+        categories=np.asarray(pair_categories, dtype=np.uint8)[in_plot],
+    )
     return color_categories, scale.legend
 
 
@@ -9,7 +9,11 @@ from uuid import UUID
 from sqlmodel import Session
 
 from lightly_studio.api.routes.api.embedding_coloring import coloring_helpers
-from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import DiscreteColorScale
+from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import (
+    ColorCategories,
+    DiscreteColorScale,
+    SampleIndex,
+)
 from lightly_studio.resolvers.metadata_resolver import sample as sample_metadata_resolver
 
 
@@ -17,9 +21,9 @@ def build_metadata_color_maps(
     session: Session,
     collection_id: UUID,
     key: str,
-    sample_ids: list[UUID],
+    sample_index: SampleIndex,
     matching_sample_ids: set[UUID] | None,
-) -> tuple[list[list[int]], dict[int, str]]:
+) -> tuple[ColorCategories, dict[int, str]]:
     """Build color categories and a legend for metadata-based sample coloring.
 
     A metadata key holds a single value per sample, so each sample maps to a
@@ -30,15 +34,15 @@ def build_metadata_color_maps(
         session: Database session.
         collection_id: ID of the collection whose metadata should be used.
         key: Metadata field used for coloring.
-        sample_ids: Sample IDs in the order for which to build color categories.
+        sample_index: Index of the samples for which to build color categories.
         matching_sample_ids: Sample IDs matching the active filter. String and
             boolean values are prioritized by their frequency among these samples
             so the legend reflects the filtered view. ``None`` counts all samples.
 
     Returns:
-        A tuple of `(color_categories, color_legend)` for the provided samples. The
-        length of `color_categories` is the number of samples; each entry is a
-        single-element list. The `color_legend` is a mapping from color ID to a
+        A tuple of `(color_categories, color_legend)` for the provided samples.
+        `color_categories` holds at most one category per sample, in the order of
+        `sample_index`. The `color_legend` is a mapping from color ID to a
         human-readable string.
     """
     sample_to_value, metadata_type = sample_metadata_resolver.get_metadata_values_for_key(
@@ -53,7 +57,7 @@ def build_metadata_color_maps(
         matching_sample_ids=matching_sample_ids,
     )
     return coloring_helpers.assign_color_categories(
-        sample_ids=sample_ids,
+        sample_index=sample_index,
         sample_to_values={sid: (value,) for sid, value in sample_to_value.items()},
         scale=scale,
     )
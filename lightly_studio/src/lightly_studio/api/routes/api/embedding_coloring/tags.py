@@ -7,16 +7,20 @@ from uuid import UUID
 from sqlmodel import Session
 
 from lightly_studio.api.routes.api.embedding_coloring import coloring_helpers
-from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import DiscreteColorScale
+from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import (
+    ColorCategories,
+    DiscreteColorScale,
+    SampleIndex,
+)
 from lightly_studio.resolvers import tag_resolver
 
 
 def build_tag_color_maps(
     session: Session,
     tag_ids: list[UUID],
-    sample_ids: list[UUID],
+    sample_index: SampleIndex,
     matching_sample_ids: set[UUID] | None,
-) -> tuple[list[list[int]], dict[int, str]]:
+) -> tuple[ColorCategories, dict[int, str]]:
     """Build color categories and a legend for tag-based sample coloring.
 
     When more tags are selected than fit in the legend, the tags carried by the
@@ -27,16 +31,16 @@ def build_tag_color_maps(
     Args:
         session: Database session.
         tag_ids: Tag IDs to color by.
-        sample_ids: Sample IDs in the order for which to build color categories.
+        sample_index: Index of the samples for which to build color categories.
         matching_sample_ids: Sample IDs matching the active filter. Tags are
             prioritized by their frequency among these samples. ``None`` counts
             all samples.
 
     Returns:
-        A tuple of `(color_categories, color_legend)` for the provided samples. The
-        length of `color_categories` is the number of samples; each entry is the
-        list of that sample's color categories, sorted ascending. The `color_legend`
-        is a mapping from color ID to a human-readable string.
+        A tuple of `(color_categories, color_legend)` for the provided samples.
+        `color_categories` holds the color categories of each sample in the order
+        of `sample_index`, sorted ascending. The `color_legend` is a mapping from
+        color ID to a human-readable string.
     """
     names = tag_resolver.get_names_by_ids(session=session, tag_ids=tag_ids)
     sample_to_tags = tag_resolver.get_tags_by_sample(session=session, tag_ids=tag_ids)
@@ -52,7 +56,7 @@ def build_tag_color_maps(
     )
 
     return coloring_helpers.assign_color_categories(
-        sample_ids=sample_ids,
+        sample_index=sample_index,
         sample_to_values=sample_to_tags,
         scale=scale,
     )
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-import io
 import json
 from typing import Annotated
 from uuid import UUID
 
+import numpy as np
 import pyarrow as pa
-from fastapi import APIRouter, HTTPException, Path, Response
+from fastapi import APIRouter, Header, HTTPException, Path, Response
 from pyarrow import ipc
 from pydantic import BaseModel, Field
 
+from lightly_studio.api.routes.api import embeddings2d_cache
 from lightly_studio.api.routes.api.embedding_coloring import ColorBy, build_color_data
-from lightly_studio.api.routes.api.status import HTTP_STATUS_BAD_REQUEST, HTTP_STATUS_NOT_FOUND
+from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import SampleIndex
+from lightly_studio.api.routes.api.status import (
+    HTTP_STATUS_BAD_REQUEST,
+    HTTP_STATUS_NOT_FOUND,
+    HTTP_STATUS_NOT_MODIFIED,
+)
+from lightly_studio.database import db_generation
 from lightly_studio.database.db_manager import SessionDep
 from lightly_studio.models.collection import CollectionTable, SampleType
 from lightly_studio.resolvers import (
@@ -29,6 +36,15 @@ from lightly_studio.resolvers.video_resolver.video_filter import VideoFilter
 
 embeddings2d_router = APIRouter()
 
+# ASCII codes of the hexadecimal digits, indexed by their value.
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+# Length of the canonical string form of a UUID, "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx".
+_UUID_STRING_LENGTH = 36
+# Positions of the hexadecimal digits in the canonical string form, the rest are dashes.
+_UUID_HEX_POSITIONS = np.array(
+    [index for index in range(_UUID_STRING_LENGTH) if index not in (8, 13, 18, 23)]
+)
+
 
 class GetEmbeddings2DRequest(BaseModel):
     """Request body for retrieving 2D embeddings."""
@@ -44,8 +60,13 @@ def get_2d_embeddings(
     session: SessionDep,
     collection_id: Annotated[UUID, Path(title="Collection Id")],
     body: GetEmbeddings2DRequest,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Response:
-    """Return 2D embeddings serialized as an Arrow stream."""
+    """Return 2D embeddings serialized as an Arrow stream.
+
+    Responses are cached in memory until the next database write. The ``ETag`` of a
+    response can be sent back in ``If-None-Match`` to get a 304 while it is unchanged.
+    """
     collection = session.get(CollectionTable, collection_id)
     if collection is None:
         raise HTTPException(
@@ -54,6 +75,40 @@ def get_2d_embeddings(
         )
     _validate_filter_type(collection=collection, filters=body.filters)
 
+    cache_key = (
+        collection_id,
+        db_generation.get(),
+        type(body.filters).__name__,
+        body.model_dump_json(),
+    )
+    etag = embeddings2d_cache.etag_for(cache_key)
+    headers = {
+        "Content-Disposition": "inline; filename=embeddings2d.arrow",
+        "Content-Type": "application/vnd.apache.arrow.stream",
+        "ETag": etag,
+        "X-Content-Type-Options": "nosniff",
+    }
+    if if_none_match is not None and etag in _parse_etags(if_none_match):
+        return Response(status_code=HTTP_STATUS_NOT_MODIFIED, headers={"ETag": etag})
+
+    content = embeddings2d_cache.response_cache.get(cache_key)
+    if content is None:
+        content = _build_arrow_stream(session=session, collection_id=collection_id, body=body)
+        embeddings2d_cache.response_cache.put(cache_key, content)
+
+    return Response(
+        content=content,
+        media_type="application/vnd.apache.arrow.stream",
+        headers=headers,
+    )
+
+
+def _build_arrow_stream(
+    session: SessionDep,
+    collection_id: UUID,
+    body: GetEmbeddings2DRequest,
+) -> bytes:
+    """Compute the 2D embeddings of a collection and serialize them as an Arrow stream."""
     # TODO(Malte, 09/2025): Support choosing the embedding model via API parameter.
     embedding_model = embedding_model_resolver.get_default_by_collection_id(
         session=session,
@@ -62,11 +117,12 @@ def get_2d_embeddings(
     if embedding_model is None:
         raise ValueError("No embedding model configured.")
 
-    x_array, y_array, sample_ids = twodim_embedding_resolver.get_twodim_embeddings(
+    projection = twodim_embedding_resolver.get_twodim_projection(
         session=session,
         collection_id=collection_id,
         embedding_model_id=embedding_model.embedding_model_id,
     )
+    sample_index = SampleIndex(sample_id_bytes=projection.sample_id_bytes)
 
     matching_sample_ids: set[UUID] | None = None
     filters = body.filters if body else None
@@ -78,16 +134,16 @@ def get_2d_embeddings(
         )
 
     if matching_sample_ids is None:
-        fulfils_filter = [1] * len(sample_ids)
+        fulfils_filter = np.ones(len(sample_index), dtype=np.uint8)
     else:
-        fulfils_filter = [1 if sample_id in matching_sample_ids else 0 for sample_id in sample_ids]
+        fulfils_filter = sample_index.mask(matching_sample_ids).astype(np.uint8)
 
     color_by = body.color_by if body else None
     color_categories, color_legend = build_color_data(
         session=session,
         collection_id=collection_id,
         color_by=color_by,
-        sample_ids=sample_ids,
+        sample_index=sample_index,
         matching_sample_ids=matching_sample_ids,
     )
 
@@ -105,28 +161,52 @@ def get_2d_embeddings(
     )
     table = pa.table(
         {
-            "x": pa.array(x_array, type=pa.float32()),
-            "y": pa.array(y_array, type=pa.float32()),
+            # The coordinates are wrapped without copying them.
+            "x": pa.array(projection.x, type=pa.float32()),
+            "y": pa.array(projection.y, type=pa.float32()),
             "fulfils_filter": pa.array(fulfils_filter, type=pa.uint8()),
-            "color_categories": pa.array(color_categories, type=pa.list_(pa.uint8())),
-            "sample_id": pa.array([str(sample_id) for sample_id in sample_ids], type=pa.string()),
+            "color_categories": pa.ListArray.from_arrays(
+                pa.array(color_categories.offsets, type=pa.int32()),
+                pa.array(color_categories.values, type=pa.uint8()),
+            ),
+            "sample_id": _sample_id_strings(sample_id_bytes=projection.sample_id_bytes),
         },
         schema=schema,
     )
 
-    buffer = io.BytesIO()
-    with ipc.new_stream(buffer, table.schema) as writer:
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
         writer.write_table(table)
-    buffer.seek(0)
+    return sink.getvalue().to_pybytes()  # type: ignore[no-any-return]
 
-    return Response(
-        content=buffer.getvalue(),
-        media_type="application/vnd.apache.arrow.stream",
-        headers={
-            "Content-Disposition": "inline; filename=embeddings2d.arrow",
-            "Content-Type": "application/vnd.apache.arrow.stream",
-            "X-Content-Type-Options": "nosniff",
-        },
+
+def _parse_etags(if_none_match: str) -> list[str]:
+    """Return the entity tags listed in an ``If-None-Match`` header."""
+    return [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+def _sample_id_strings(sample_id_bytes: bytes) -> pa.StringArray:
+    """Format raw 16-byte sample IDs as an Arrow array of canonical UUID strings.
+
+    The characters of all strings are written into a single buffer with numpy, which
+    avoids creating a Python string per sample.
+    """
+    raw = np.frombuffer(sample_id_bytes, dtype=np.uint8).reshape(
+        -1, twodim_embedding_resolver.SAMPLE_ID_NUM_BYTES
+    )
+    num_samples = len(raw)
+    hex_digits = np.empty((num_samples, 2 * raw.shape[1]), dtype=np.uint8)
+    hex_digits[:, 0::2] = _HEX_DIGITS[raw >> 4]
+    hex_digits[:, 1::2] = _HEX_DIGITS[raw & 0x0F]
+    characters = np.full((num_samples, _UUID_STRING_LENGTH), ord("-"), dtype=np.uint8)
+    characters[:, _UUID_HEX_POSITIONS] = hex_digits
+    offsets = np.arange(
+        0, (num_samples + 1) * _UUID_STRING_LENGTH, _UUID_STRING_LENGTH, dtype=np.int32
+    )
+    return pa.StringArray.from_buffers(
+        length=num_samples,
+        value_offsets=pa.py_buffer(offsets),
+        data=pa.py_buffer(characters),
     )
 
 
@@ -0,0 +1,97 @@
+"""In-memory cache of serialized 2D embedding plots.
+
+Entries are keyed by the request and the database write generation (see
+``db_generation``), so any write to the database makes all previous entries unreachable;
+they are evicted as new entries need the space.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from uuid import uuid4
+
+from lightly_studio.dataset import env
+from lightly_studio.utils.cache_stats import CacheStats
+
+# Distinguishes the ETags of this process from those of a previous one, whose write
+# generations may coincide with the ones of this process for different data.
+_PROCESS_TOKEN = uuid4().hex[:16]
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of response payloads, bounded by their total size in bytes.
+
+    Payloads larger than the bound are not cached. A bound of 0 disables the cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache holding at most ``max_bytes`` of payloads."""
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the payload cached for ``key`` and mark it as recently used."""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return content
+
+    def put(self, key: Hashable, content: bytes) -> None:
+        """Cache ``content`` for ``key``, evicting the least recently used payloads."""
+        if len(content) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= len(previous)
+            while self._entries and self._size_bytes + len(content) > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted)
+                self._evictions += 1
+            self._entries[key] = content
+            self._size_bytes += len(content)
+
+    def clear(self) -> None:
+        """Remove all payloads and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+
+def etag_for(key: Hashable) -> str:
+    """Return the ETag of the payload cached under ``key``.
+
+    Equal keys identify equal payloads within a process, so the ETag is derived from the
+    key alone and a matching ``If-None-Match`` is answered without looking up the payload.
+    """
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+    return f'"{_PROCESS_TOKEN}-{digest}"'
+
+
+response_cache = ResponseCache(max_bytes=env.LIGHTLY_STUDIO_EMBEDDINGS2D_CACHE_MAX_BYTES)
@@ -48,6 +48,10 @@ class ReadVideoFramesRequest(BaseModel):
     """Request body for reading videos."""
 
     filter: VideoFrameFilter | None = Field(None, description="Filter parameters for video frames")
+    seek_cursor: str | None = Field(
+        None,
+        description="The nextSeekCursor of the previous page; used instead of the offset",
+    )
 
 
 class ReadCountVideoFramesAnnotationsRequest(BaseModel):
@@ -87,12 +91,14 @@ def get_all_frames(
         collection_id=video_frame_collection_id,
         pagination=pagination,
         video_frame_filter=body.filter,
+        seek_cursor=body.seek_cursor,
     )
 
     return VideoFrameViewsWithCount(
         samples=[_build_video_frame_view(vf=frame) for frame in result.samples],
         total_count=result.total_count,
         next_cursor=result.next_cursor,
+        next_seek_cursor=result.next_seek_cursor,
     )
 
 
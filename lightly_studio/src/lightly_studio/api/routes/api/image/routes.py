@@ -46,6 +46,14 @@ class ReadImagesRequest(BaseModel):
         None, description="Pagination parameters for offset and limit"
     )
     sort_by: list[SortExpr] | None = Field(None, description="Sort expressions for ordering")
+    seek_cursor: str | None = Field(
+        None,
+        description="The nextSeekCursor of the previous page; used instead of the offset",
+    )
+    allow_estimated_count: bool = Field(
+        False,
+        description="Whether very large unfiltered collections may report an estimated count",
+    )
 
 
 @image_router.post("/collections/{collection_id}/images/list")
@@ -73,6 +81,8 @@ def read_images(
         text_embedding=body.text_embedding,
         sample_ids=body.sample_ids,
         order_by=order_by,
+        seek_cursor=body.seek_cursor,
+        allow_estimated_count=body.allow_estimated_count,
     )
     # TODO(Michal, 10/2025): Add SampleView to ImageView and then use a response model
     # instead of manual conversion.
@@ -88,7 +98,9 @@ def read_images(
             for image, score, order_value in zip(result.samples, scores, order_values)
         ],
         total_count=result.total_count,
+        total_count_is_exact=result.total_count_is_exact,
         next_cursor=result.next_cursor,
+        next_seek_cursor=result.next_seek_cursor,
     )
 
 
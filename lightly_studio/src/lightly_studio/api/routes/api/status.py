@@ -5,6 +5,8 @@ HTTP_STATUS_CREATED = 201
 HTTP_STATUS_ACCEPTED = 202
 HTTP_STATUS_NO_CONTENT = 204
 
+HTTP_STATUS_NOT_MODIFIED = 304
+
 HTTP_STATUS_BAD_REQUEST = 400
 HTTP_STATUS_UNAUTHORIZED = 401
 HTTP_STATUS_FORBIDDEN = 403
@@ -6,6 +6,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from pydantic import BaseModel, Field
 
 from lightly_studio.api.routes.api.status import (
     HTTP_STATUS_INTERNAL_SERVER_ERROR,
@@ -49,3 +50,38 @@ def embed_text(
         ) from None
 
     return text_embeddings
+
+
+# Maximum number of texts embedded by one batch request.
+MAX_BATCH_TEXTS = 256
+
+
+class EmbedTextsRequest(BaseModel):
+    """Request body for embedding several texts."""
+
+    texts: list[str] = Field(..., max_length=MAX_BATCH_TEXTS, description="The texts to embed.")
+    embedding_model_id: UUID | None = Field(
+        None, description="The ID of the embedding model to use."
+    )
+
+
+@text_embedding_router.post(
+    "/text_embedding/for_collection/{collection_id}/batch", response_model=list[list[float]]
+)
+def embed_texts(
+    embedding_manager: EmbeddingManagerDep,
+    collection_id: Annotated[UUID, Path(title="The ID of the collection for which to embed.")],
+    body: EmbedTextsRequest,
+) -> list[list[float]]:
+    """Retrieve embeddings for the input texts, in the order of the texts."""
+    try:
+        return embedding_manager.embed_texts(
+            collection_id=collection_id,
+            texts=body.texts,
+            embedding_model_id=body.embedding_model_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=HTTP_STATUS_INTERNAL_SERVER_ERROR,
+            detail=f"{exc}",
+        ) from None
@@ -30,6 +30,10 @@ class ReadVideosRequest(BaseModel):
 
     filter: Optional[VideoFilter] = Field(None, description="Filter parameters for videos")
     text_embedding: Optional[list[float]] = Field(None, description="Text embedding to search for")
+    seek_cursor: Optional[str] = Field(
+        None,
+        description="The nextSeekCursor of the previous page; used instead of the offset",
+    )
 
 
 class ReadVideoSampleIdsRequest(BaseModel):
@@ -101,6 +105,7 @@ def get_all_videos(
         pagination=Paginated(offset=pagination.offset, limit=pagination.limit),
         filters=body.filter,
         text_embedding=body.text_embedding,
+        seek_cursor=body.seek_cursor,
     )
 
 
@@ -6,13 +6,16 @@ import asyncio
 import io
 import os
 from collections.abc import Generator
+from dataclasses import dataclass
+from typing import Annotated
 
 import fsspec
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from PIL import Image, ImageOps, UnidentifiedImageError
 
 from lightly_studio.api.routes.api import status
+from lightly_studio.core.image import thumbnail_cache, thumbnail_pyramid
 from lightly_studio.database import db_manager
 from lightly_studio.models import image
 from lightly_studio.models.settings import GridViewThumbnailQualityType
@@ -23,23 +26,37 @@ app_router = APIRouter()
 JPEG_QUALITY = 75
 
 
+@dataclass(frozen=True)
+class _ImageContent:
+    """Image bytes to serve, or None if the client's copy is still valid."""
+
+    content: bytes | None
+    content_type: str
+    etag: str | None = None
+
+
 @app_router.get("/sample/{sample_id}")
 async def serve_image_by_sample_id(
     sample_id: str,
     quality: GridViewThumbnailQualityType = GridViewThumbnailQualityType.RAW,
     max_width: int | None = Query(default=None, ge=1, le=4096),
     max_height: int | None = Query(default=None, ge=1, le=4096),
-) -> StreamingResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Serve an image by sample ID.
 
+    Thumbnails of the 'high' quality mode are cached on disk and carry a strong ``ETag``.
+    Send it back in ``If-None-Match`` to get a 304 while the source file is unchanged.
+
     Args:
         sample_id: The ID of the sample.
         quality: Thumbnail quality mode. Use 'high' for compressed JPEG output.
         max_width: Maximum width in pixels for high quality mode.
         max_height: Maximum height in pixels for high quality mode.
+        if_none_match: ETags of the thumbnail the client already has.
 
     Returns:
-        StreamingResponse with the image data.
+        StreamingResponse with the image data, or an empty 304 response.
 
     Raises:
         HTTPException: If the sample is not found or the file is not accessible.
@@ -57,29 +74,15 @@ async def serve_image_by_sample_id(
         file_path = sample_record.file_path_abs
 
     try:
-        content, content_type = await asyncio.get_running_loop().run_in_executor(
+        image_content = await asyncio.get_running_loop().run_in_executor(
             get_media_executor("image_thumbnail"),
             _read_and_transform_image,
             file_path,
             quality,
             max_width,
             max_height,
+            if_none_match,
         )
-
-        # Create a streaming response.
-        def generate() -> Generator[bytes, None, None]:
-            yield content
-
-        return StreamingResponse(
-            generate(),
-            media_type=content_type,
-            headers={
-                # Cache for 1 hour
-                "Cache-Control": "public, max-age=3600",
-                "Content-Length": str(len(content)),
-            },
-        )
-
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_STATUS_NOT_FOUND,
@@ -91,25 +94,96 @@ async def serve_image_by_sample_id(
             detail=f"Error accessing file {file_path}: {exc.strerror}",
         ) from exc
 
+    headers = {
+        # Cache for 1 hour
+        "Cache-Control": "public, max-age=3600",
+    }
+    if image_content.etag is not None:
+        headers["ETag"] = image_content.etag
+    content = image_content.content
+    if content is None:
+        return Response(status_code=status.HTTP_STATUS_NOT_MODIFIED, headers=headers)
+
+    # Create a streaming response.
+    def generate() -> Generator[bytes, None, None]:
+        yield content
+
+    return StreamingResponse(
+        generate(),
+        media_type=image_content.content_type,
+        headers={**headers, "Content-Length": str(len(content))},
+    )
+
 
 def _read_and_transform_image(
     file_path: str,
     quality: GridViewThumbnailQualityType,
     max_width: int | None,
     max_height: int | None,
-) -> tuple[bytes, str]:
+    if_none_match: str | None,
+) -> _ImageContent:
     """Read image content and apply transport-level thumbnail conversion."""
     fs, fs_path = fsspec.core.url_to_fs(file_path)
-    content = fs.cat_file(fs_path)
+    if quality != GridViewThumbnailQualityType.HIGH:
+        return _ImageContent(
+            content=fs.cat_file(fs_path), content_type=_get_content_type(file_path)
+        )
 
-    if quality == GridViewThumbnailQualityType.HIGH:
-        return _transform_image(
-            content=content,
-            max_width=max_width,
-            max_height=max_height,
+    version = thumbnail_cache.source_version(info=fs.info(fs_path))
+    if version is None:
+        content, content_type = _transform_image(
+            content=fs.cat_file(fs_path), max_width=max_width, max_height=max_height
         )
+        return _ImageContent(content=content, content_type=content_type)
 
-    return content, _get_content_type(file_path)
+    key = thumbnail_cache.thumbnail_key(
+        file_path=file_path,
+        version=version,
+        max_width=max_width,
+        max_height=max_height,
+        jpeg_quality=JPEG_QUALITY,
+    )
+    etag = thumbnail_cache.etag_for(key=key)
+    if if_none_match is not None and etag in _parse_etags(if_none_match):
+        return _ImageContent(content=None, content_type="image/jpeg", etag=etag)
+
+    cached = thumbnail_cache.thumbnail_cache.get(key=key)
+    if cached is not None:
+        return _ImageContent(content=cached, content_type="image/jpeg", etag=etag)
+
+    # Derive small thumbnails from a pyramid level rather than from the original file.
+    # Always taking the same source keeps the content behind the ETag unchanged. Without
+    # stored pyramids, the pyramid would be rebuilt for every request.
+    level_size = thumbnail_pyramid.covering_level(max_width=max_width, max_height=max_height)
+    if level_size is None or not thumbnail_pyramid.pyramid_cache.enabled:
+        source = fs.cat_file(fs_path)
+    else:
+        try:
+            source = thumbnail_pyramid.get_or_create_level(
+                fs=fs, fs_path=fs_path, file_path=file_path, version=version, size=level_size
+            )
+        except UnidentifiedImageError as exc:
+            raise _unsupported_image_error() from exc
+        if _fits_bounds(content=source, max_width=max_width, max_height=max_height):
+            return _ImageContent(content=source, content_type="image/jpeg", etag=etag)
+    content, content_type = _transform_image(
+        content=source, max_width=max_width, max_height=max_height
+    )
+    thumbnail_cache.thumbnail_cache.put(key=key, content=content)
+    return _ImageContent(content=content, content_type=content_type, etag=etag)
+
+
+def _fits_bounds(content: bytes, max_width: int | None, max_height: int | None) -> bool:
+    """Return whether an encoded image is not larger than the bounds. Reads only its header."""
+    with Image.open(io.BytesIO(content)) as image_file:
+        width: int = image_file.width
+        height: int = image_file.height
+    return width <= (max_width or width) and height <= (max_height or height)
+
+
+def _parse_etags(if_none_match: str) -> list[str]:
+    """Return the entity tags listed in an ``If-None-Match`` header."""
+    return [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
 
 
 def _transform_image(
@@ -144,10 +218,15 @@ def _transform_image(
             )
             return output.getvalue(), "image/jpeg"
     except UnidentifiedImageError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_STATUS_BAD_REQUEST,
-            detail="Unsupported image file for thumbnail conversion",
-        ) from exc
+        raise _unsupported_image_error() from exc
+
+
+def _unsupported_image_error() -> HTTPException:
+    """Return the error for a file that cannot be decoded as an image."""
+    return HTTPException(
+        status_code=status.HTTP_STATUS_BAD_REQUEST,
+        detail="Unsupported image file for thumbnail conversion",
+    )
 
 
 def _resize_image(
@@ -0,0 +1,428 @@
+"""Random access to decoded video frames for the frame media routes.
+
+Seeking a ``cv2.VideoCapture`` to a frame decodes from the keyframe before it, so reading
+frames one request at a time costs up to a group of pictures (GOP) of decoded frames
+each. Three layers avoid most of that work:
+
+- Decoded frames are kept in a memory-bounded LRU shared by all threads.
+- Open captures are pooled and remember the frame they return next. A request reads on
+  a capture positioned before its frame and decodes forward when no keyframe lies in
+  between, which is never more work than seeking. Consecutive frames are thus decoded
+  once each.
+- Keyframe positions come from a per-video index, built once in the background from the
+  demuxed packets. Until it is ready, only the directly following frame is read without
+  seeking.
+"""
+
+from __future__ import annotations
+
+import bisect
+import io
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, cast
+
+import av
+import cv2
+import fsspec
+import numpy as np
+import numpy.typing as npt
+
+from lightly_studio.dataset import env
+from lightly_studio.utils.cache_stats import CacheStats
+from lightly_studio.utils.executor import get_media_executor
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of idle captures kept open across all videos.
+_CAPTURE_POOL_SIZE = 16
+# Maximum number of videos whose keyframe index is kept.
+_KEYFRAME_INDEX_CACHE_SIZE = 256
+
+
+class FSSpecStreamReader(io.BufferedIOBase):
+    """Wrapper to make fsspec file objects compatible with cv2.VideoCapture's interface."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the stream reader.
+
+        Args:
+            path: Path to the video file (local path or cloud URL).
+        """
+        self.fs, self.fs_path = fsspec.core.url_to_fs(url=path)
+        self.file = self.fs.open(path=self.fs_path, mode="rb")
+        # Get file size for size() method
+        try:
+            self.file_size = self.file.size
+        except AttributeError:
+            # Fallback: seek to end to get size
+            current_pos = self.file.tell()
+            self.file.seek(0, 2)
+            self.file_size = self.file.tell()
+            self.file.seek(current_pos)
+
+    def read(self, n: int | None = -1) -> bytes:
+        """Read n bytes from the stream."""
+        return cast(bytes, self.file.read(n))
+
+    def read1(self, n: int = -1) -> bytes:
+        """Read up to n bytes from the stream (implementation for BufferedIOBase)."""
+        return cast(bytes, self.file.read(n))
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Seek to the given offset in the stream."""
+        return cast(int, self.file.seek(offset, whence))
+
+    def tell(self) -> int:
+        """Return the current position in the stream."""
+        return cast(int, self.file.tell())
+
+    def size(self) -> int:
+        """Return the total size of the stream."""
+        return cast(int, self.file_size)
+
+    def close(self) -> None:
+        """Close the stream."""
+        if not self.closed:
+            self.file.close()
+            super().close()
+
+    def __enter__(self) -> FSSpecStreamReader:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit the context manager and close the stream."""
+        self.close()
+
+
+@dataclass
+class VideoCapture:
+    """An open capture of a video and the number of the frame it returns next."""
+
+    video_path: str
+    cap: cv2.VideoCapture
+    stream: FSSpecStreamReader
+    next_frame: int = 0
+
+    def close(self) -> None:
+        """Release the capture and close its stream."""
+        self.cap.release()
+        self.stream.close()
+
+
+class CapturePool:
+    """Thread-safe pool of open captures, bounded by the number of idle ones.
+
+    A capture is used by one thread at a time: ``acquire`` takes it out of the pool and
+    ``release`` puts it back. The least recently released captures are closed when more
+    than ``max_idle`` are in the pool.
+    """
+
+    def __init__(self, max_idle: int) -> None:
+        """Create an empty pool keeping at most ``max_idle`` captures open."""
+        self._max_idle = max_idle
+        # Idle captures in least recently released order.
+        self._idle: list[VideoCapture] = []
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, video_path: str, frame_number: int, keyframes: Sequence[int] | None
+    ) -> VideoCapture:
+        """Take the capture of a video that reaches a frame with the least decoding.
+
+        Prefers the capture closest before the frame without a keyframe in between, then
+        the most recently released capture of the video, which has to seek. Opens a new
+        capture if the pool has none for the video.
+
+        Args:
+            video_path: Path to the video file.
+            frame_number: The frame to read next.
+            keyframes: Sorted numbers of the keyframes of the video, if known.
+
+        Returns:
+            The capture, owned by the caller until it is released.
+
+        Raises:
+            ValueError: If the video file cannot be opened.
+        """
+        with self._lock:
+            candidates = [
+                index
+                for index, capture in enumerate(self._idle)
+                if capture.video_path == video_path
+            ]
+            forward = [
+                index
+                for index in candidates
+                if can_decode_forward(
+                    next_frame=self._idle[index].next_frame,
+                    frame_number=frame_number,
+                    keyframes=keyframes,
+                )
+            ]
+            if forward:
+                chosen: int | None = max(forward, key=lambda index: self._idle[index].next_frame)
+            else:
+                chosen = candidates[-1] if candidates else None
+            if chosen is not None:
+                return self._idle.pop(chosen)
+
+        stream = FSSpecStreamReader(video_path)
+        cap = cv2.VideoCapture(cast(Any, stream), apiPreference=cv2.CAP_FFMPEG, params=())
+        if not cap.isOpened():
+            stream.close()
+            raise ValueError(f"Could not open video: {video_path}")
+        return VideoCapture(video_path=video_path, cap=cap, stream=stream)
+
+    def release(self, capture: VideoCapture) -> None:
+        """Return a capture to the pool, closing the least recently released if full."""
+        with self._lock:
+            self._idle.append(capture)
+            evicted = self._idle[: max(0, len(self._idle) - self._max_idle)]
+            del self._idle[: len(evicted)]
+        for evicted_capture in evicted:
+            evicted_capture.close()
+
+    def clear(self) -> None:
+        """Close all idle captures."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for capture in idle:
+            capture.close()
+
+    def num_idle(self, video_path: str | None = None) -> int:
+        """Return the number of idle captures, of one video or of all."""
+        with self._lock:
+            return sum(1 for capture in self._idle if video_path in (None, capture.video_path))
+
+
+class FrameCache:
+    """Thread-safe LRU cache of decoded frames, bounded by their total size in bytes.
+
+    Cached frames are read-only and shared between threads. A bound of 0 disables the
+    cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache holding at most ``max_bytes`` of frames."""
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, int], npt.NDArray[np.uint8]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, video_path: str, frame_number: int) -> npt.NDArray[np.uint8] | None:
+        """Return the cached frame and mark it as recently used."""
+        key = (video_path, frame_number)
+        with self._lock:
+            frame = self._entries.get(key)
+            if frame is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return frame
+
+    def put(self, video_path: str, frame_number: int, frame: npt.NDArray[np.uint8]) -> None:
+        """Cache a frame, evicting the least recently used frames."""
+        if frame.nbytes > self._max_bytes:
+            return
+        frame.flags.writeable = False
+        key = (video_path, frame_number)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.nbytes
+            while self._entries and self._size_bytes + frame.nbytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.nbytes
+                self._evictions += 1
+            self._entries[key] = frame
+            self._size_bytes += frame.nbytes
+
+    def clear(self) -> None:
+        """Remove all frames and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+
+class KeyframeIndexCache:
+    """Keyframe indexes of recently read videos, built in the background on first use."""
+
+    def __init__(self, max_videos: int) -> None:
+        """Create an empty cache keeping the indexes of at most ``max_videos`` videos."""
+        self._max_videos = max_videos
+        # None marks a video whose keyframes could not be determined.
+        self._indexes: OrderedDict[str, list[int] | None] = OrderedDict()
+        self._pending: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, video_path: str) -> list[int] | None:
+        """Return the keyframe index of a video, or None if it is not available (yet).
+
+        The first call for a video schedules building its index.
+        """
+        with self._lock:
+            if video_path in self._indexes:
+                self._indexes.move_to_end(video_path)
+                return self._indexes[video_path]
+            if video_path not in self._pending:
+                self._pending[video_path] = get_media_executor("video_keyframe_index").submit(
+                    self._build, video_path
+                )
+            return None
+
+    def wait(self, video_path: str) -> list[int] | None:
+        """Return the keyframe index of a video, waiting for it to be built."""
+        self.get(video_path=video_path)
+        with self._lock:
+            pending = self._pending.get(video_path)
+        if pending is not None:
+            pending.result()
+        with self._lock:
+            return self._indexes.get(video_path)
+
+    def clear(self) -> None:
+        """Forget all indexes. Builds in progress still store theirs."""
+        with self._lock:
+            self._indexes.clear()
+
+    def _build(self, video_path: str) -> None:
+        keyframes: list[int] | None = None
+        try:
+            keyframes = build_keyframe_index(video_path=video_path)
+        except (OSError, ValueError, av.FFmpegError) as exc:
+            logger.debug(f"Could not index the keyframes of {video_path}: {exc}")
+        finally:
+            # Also on unexpected errors: a pending build would make every later wait()
+            # raise again.
+            with self._lock:
+                self._pending.pop(video_path, None)
+                self._indexes[video_path] = keyframes
+                while len(self._indexes) > self._max_videos:
+                    self._indexes.popitem(last=False)
+
+
+def build_keyframe_index(video_path: str) -> list[int] | None:
+    """Return the sorted numbers of the keyframes of the first video stream of a file.
+
+    Frames are numbered in presentation order, as in ``add_videos``: the packets are
+    demuxed without decoding them and sorted by their presentation timestamps.
+
+    Args:
+        video_path: Path or URL of the video file.
+
+    Returns:
+        The keyframe numbers, or None if the file has no video stream or a packet lacks
+        a timestamp.
+    """
+    timestamps: list[int] = []
+    is_keyframe: list[bool] = []
+    with fsspec.open(video_path, mode="rb") as file, av.open(file) as container:
+        if not container.streams.video:
+            return None
+        video_stream = container.streams.video[0]
+        for packet in container.demux(video_stream):
+            # Skip the empty packet that flushes the demuxer and packets that the decoder
+            # drops, e.g. frames before the start of an edit list.
+            if packet.size == 0 or packet.is_discard:
+                continue
+            if packet.pts is None:
+                return None
+            timestamps.append(packet.pts)
+            is_keyframe.append(packet.is_keyframe)
+    order = np.argsort(np.asarray(timestamps, dtype=np.int64), kind="stable")
+    keyframe_in_display_order = np.asarray(is_keyframe, dtype=bool)[order]
+    return [int(frame_number) for frame_number in np.flatnonzero(keyframe_in_display_order)]
+
+
+def can_decode_forward(next_frame: int, frame_number: int, keyframes: Sequence[int] | None) -> bool:
+    """Return whether decoding forward reaches a frame with at most the work of a seek.
+
+    That is the case if no keyframe lies after ``next_frame`` up to ``frame_number``: a
+    seek would decode from the last keyframe before the frame, at or before
+    ``next_frame``.
+
+    Args:
+        next_frame: The frame a capture returns next.
+        frame_number: The frame to read.
+        keyframes: Sorted keyframe numbers of the video. If None, only ``next_frame``
+            itself is reached without seeking.
+    """
+    if frame_number < next_frame:
+        return False
+    if keyframes is None:
+        return frame_number == next_frame
+    position = bisect.bisect_right(keyframes, frame_number)
+    return position == 0 or keyframes[position - 1] <= next_frame
+
+
+def read_frame(video_path: str, frame_number: int) -> npt.NDArray[np.uint8]:
+    """Return a decoded frame of a video as a read-only BGR array.
+
+    Args:
+        video_path: Path or URL of the video file.
+        frame_number: Number of the frame, in presentation order.
+
+    Raises:
+        ValueError: If the video cannot be opened or has no such frame.
+    """
+    cached = frame_cache.get(video_path=video_path, frame_number=frame_number)
+    if cached is not None:
+        return cached
+
+    keyframes = keyframe_indexes.get(video_path=video_path)
+    capture = capture_pool.acquire(
+        video_path=video_path, frame_number=frame_number, keyframes=keyframes
+    )
+    try:
+        if can_decode_forward(
+            next_frame=capture.next_frame, frame_number=frame_number, keyframes=keyframes
+        ):
+            # Decode without converting the frames in between.
+            for _ in range(frame_number - capture.next_frame):
+                if not capture.cap.grab():
+                    break
+        else:
+            capture.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        ret, frame = capture.cap.read()
+    except BaseException:
+        capture.close()
+        raise
+    if not ret:
+        # The position of the capture is unknown, so it is not reused.
+        capture.close()
+        raise ValueError(f"No frame at index {frame_number}")
+    capture.next_frame = frame_number + 1
+    capture_pool.release(capture=capture)
+
+    frame = cast(npt.NDArray[np.uint8], frame)
+    frame_cache.put(video_path=video_path, frame_number=frame_number, frame=frame)
+    return frame
+
+
+capture_pool = CapturePool(max_idle=_CAPTURE_POOL_SIZE)
+frame_cache = FrameCache(max_bytes=env.LIGHTLY_STUDIO_VIDEO_FRAME_CACHE_MAX_BYTES)
+keyframe_indexes = KeyframeIndexCache(max_videos=_KEYFRAME_INDEX_CACHE_SIZE)
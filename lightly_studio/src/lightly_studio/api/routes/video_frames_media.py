@@ -3,22 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import io
-import threading
-from collections import OrderedDict
+import json
+import logging
 from collections.abc import Generator
 from dataclasses import dataclass
-from typing import Annotated, Any, cast
+from typing import Annotated, Any
 from uuid import UUID
 
 import cv2
-import fsspec
 import numpy as np
 import numpy.typing as npt
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from sqlmodel import Session
 
+from lightly_studio.api.routes import video_frame_reader
 from lightly_studio.database import db_manager
 from lightly_studio.models.settings import GridViewThumbnailQualityType
 from lightly_studio.resolvers import video_frame_resolver
@@ -27,10 +27,13 @@ from lightly_studio.utils.executor import get_media_executor
 frames_router = APIRouter(prefix="/frames/media", tags=["frames streaming"])
 
 JPEG_QUALITY = 75
+# Maximum number of frames served by one strip request.
+MAX_STRIP_FRAMES = 256
+# Size of the big-endian length of the index that starts the body of a strip response.
+STRIP_INDEX_LENGTH_BYTES = 4
+FRAME_MEDIA_TYPE_HEADER = "X-Frame-Media-Type"
 
-# Thread-local cache for VideoCapture + stream (per thread, not shared)
-_thread_local = threading.local()
-_CAP_CACHE_SIZE = 4
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -50,6 +53,24 @@ class FrameTransformQuery(BaseModel):
     max_height: int | None = Query(default=None, ge=1, le=4096)
 
 
+class FrameStripRequest(BaseModel):
+    """Request body for a strip of frames: either sample IDs or a frame range of a video."""
+
+    sample_ids: list[UUID] | None = Field(
+        None, max_length=MAX_STRIP_FRAMES, description="Frame sample IDs, in display order"
+    )
+    video_id: UUID | None = Field(None, description="Sample ID of the video of a frame range")
+    start_frame: int = Field(0, ge=0, description="First frame number of the range")
+    end_frame: int | None = Field(
+        None,
+        ge=0,
+        description=(
+            "Frame number after the last frame of the range. "
+            f"Defaults to start_frame + {MAX_STRIP_FRAMES}."
+        ),
+    )
+
+
 ROTATION_MAP: dict[int, Any] = {
     0: None,
     90: cv2.ROTATE_90_COUNTERCLOCKWISE,
@@ -58,107 +79,6 @@ ROTATION_MAP: dict[int, Any] = {
 }
 
 
-class FSSpecStreamReader(io.BufferedIOBase):
-    """Wrapper to make fsspec file objects compatible with cv2.VideoCapture's interface."""
-
-    def __init__(self, path: str) -> None:
-        """Initialize the stream reader.
-
-        Args:
-            path: Path to the video file (local path or cloud URL).
-        """
-        self.fs, self.fs_path = fsspec.core.url_to_fs(url=path)
-        self.file = self.fs.open(path=self.fs_path, mode="rb")
-        # Get file size for size() method
-        try:
-            self.file_size = self.file.size
-        except AttributeError:
-            # Fallback: seek to end to get size
-            current_pos = self.file.tell()
-            self.file.seek(0, 2)
-            self.file_size = self.file.tell()
-            self.file.seek(current_pos)
-
-    def read(self, n: int | None = -1) -> bytes:
-        """Read n bytes from the stream."""
-        return cast(bytes, self.file.read(n))
-
-    def read1(self, n: int = -1) -> bytes:
-        """Read up to n bytes from the stream (implementation for BufferedIOBase)."""
-        return cast(bytes, self.file.read(n))
-
-    def seek(self, offset: int, whence: int = 0) -> int:
-        """Seek to the given offset in the stream."""
-        return cast(int, self.file.seek(offset, whence))
-
-    def tell(self) -> int:
-        """Return the current position in the stream."""
-        return cast(int, self.file.tell())
-
-    def size(self) -> int:
-        """Return the total size of the stream."""
-        return cast(int, self.file_size)
-
-    def close(self) -> None:
-        """Close the stream."""
-        if not self.closed:
-            self.file.close()
-            super().close()
-
-    def __enter__(self) -> FSSpecStreamReader:
-        """Enter the context manager."""
-        return self
-
-    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit the context manager and close the stream."""
-        self.close()
-
-
-def _get_cached_capture(video_path: str) -> cv2.VideoCapture:
-    """Get a cached VideoCapture for a video file, or create new if not cached.
-
-    This function implements a thread-local cache for VideoCapture objects and
-    their underlying fsspec stream. Each thread in the thread pool maintains its
-    own independent cache, allowing safe concurrent access without locking.
-
-    Args:
-        video_path: Path to the video file.
-
-    Returns:
-        Open cv2.VideoCapture object for the video.
-
-    Raises:
-        ValueError: If the video file cannot be opened.
-    """
-    if not hasattr(_thread_local, "cap_cache"):
-        _thread_local.cap_cache = OrderedDict()
-    cache: OrderedDict[str, tuple[cv2.VideoCapture, FSSpecStreamReader]] = _thread_local.cap_cache
-
-    if video_path in cache:
-        cap, stream = cache.pop(video_path)
-        if cap.isOpened():
-            cache[video_path] = (cap, stream)  # move to end
-            return cap
-        # stale entry
-        stream.close()
-
-    # open new
-    stream = FSSpecStreamReader(video_path)
-    cap = cv2.VideoCapture(cast(Any, stream), apiPreference=cv2.CAP_FFMPEG, params=())
-    if not cap.isOpened():
-        stream.close()
-        raise ValueError(f"Could not open video: {video_path}")
-
-    cache[video_path] = (cap, stream)
-    # enforce cache size
-    while len(cache) > _CAP_CACHE_SIZE:
-        _, (old_cap, old_stream) = cache.popitem(last=False)
-        old_cap.release()
-        old_stream.close()
-
-    return cap
-
-
 def _process_video_frame(
     video_path: str,
     frame_number: int,
@@ -168,9 +88,8 @@ def _process_video_frame(
     """Process a video frame (CPU-intensive work, runs in thread pool).
 
     This function extracts a single frame from a video file, applies any necessary
-    transformations (rotation), and encodes it as PNG or JPEG. It uses a cached
-    VideoCapture object to avoid reopening the video file for each frame request,
-    which is especially beneficial for cloud-stored videos.
+    transformations (rotation), and encodes it as PNG or JPEG. Frames are read with
+    ``video_frame_reader``, which reuses open captures and recently decoded frames.
 
     Args:
         video_path: Path to the video file.
@@ -184,16 +103,56 @@ def _process_video_frame(
     Raises:
         ValueError: If frame cannot be processed.
     """
-    cap = _get_cached_capture(video_path)
+    frame = video_frame_reader.read_frame(video_path=video_path, frame_number=frame_number)
+    return _encode_frame(frame=frame, rotation_deg=rotation_deg, transform=transform)
+
+
+def _process_video_frame_strip(
+    video_path: str,
+    frames: list[video_frame_resolver.VideoFrameMediaInfo],
+    transform: FrameTransformOptions,
+) -> dict[UUID, npt.NDArray[np.uint8]]:
+    """Process frames of one video in frame order (CPU-intensive work, runs in thread pool).
 
-    # Seek to the correct frame and read it
-    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-    ret, frame = cap.read()
-    # Do not release/close; cached for reuse
+    Once the keyframe index of the video is built, ``video_frame_reader`` decodes forward
+    from one frame to the next instead of seeking, so each frame is decoded once. Until
+    then, frames are read by seeking rather than waiting for the index.
 
-    if not ret:
-        raise ValueError(f"No frame at index {frame_number}")
+    Args:
+        video_path: Path to the video file.
+        frames: Frames of the video to extract.
+        transform: Transport-level resize and encoding options.
+
+    Returns:
+        Encoded buffers by frame sample ID. Frames that cannot be processed are omitted.
+    """
+    buffers: dict[UUID, npt.NDArray[np.uint8]] = {}
+    for frame_info in sorted(frames, key=lambda frame_info: frame_info.frame_number):
+        try:
+            frame = video_frame_reader.read_frame(
+                video_path=video_path, frame_number=frame_info.frame_number
+            )
+            buffers[frame_info.sample_id], _ = _encode_frame(
+                frame=frame, rotation_deg=frame_info.rotation_deg, transform=transform
+            )
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Skipping frame {frame_info.sample_id} of the strip: {exc}")
+    return buffers
+
+
+def _encode_frame(
+    frame: npt.NDArray[np.uint8],
+    rotation_deg: int,
+    transform: FrameTransformOptions,
+) -> tuple[npt.NDArray[np.uint8], str]:
+    """Rotate, resize and encode a decoded frame.
+
+    Returns:
+        Tuple of (encoded_buffer, media_type).
 
+    Raises:
+        ValueError: If the frame cannot be encoded.
+    """
     # Apply counter-rotation if needed
     rotate_code = ROTATION_MAP[rotation_deg]
     if rotate_code is not None:
@@ -208,15 +167,67 @@ def _process_video_frame(
             )
         encode_params = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
         success, buffer = cv2.imencode(".jpg", frame, encode_params)
-        media_type = "image/jpeg"
     else:
         success, buffer = cv2.imencode(".png", frame)
-        media_type = "image/png"
 
     if not success:
         raise ValueError("Could not encode frame")
 
-    return buffer, media_type
+    return buffer, _media_type(transform=transform)
+
+
+def _get_strip_frames(
+    session: Session, body: FrameStripRequest
+) -> list[video_frame_resolver.VideoFrameMediaInfo]:
+    """Return the frames requested for a strip, in the order they are served.
+
+    Raises:
+        HTTPException: If the request does not select frames in exactly one way, or selects
+            too many.
+    """
+    if body.sample_ids is not None and body.video_id is None:
+        return video_frame_resolver.get_frame_media_infos_by_ids(
+            session=session, sample_ids=list(dict.fromkeys(body.sample_ids))
+        )
+    if body.video_id is not None and body.sample_ids is None:
+        end_frame = body.end_frame
+        if end_frame is None:
+            end_frame = body.start_frame + MAX_STRIP_FRAMES
+        if end_frame - body.start_frame > MAX_STRIP_FRAMES:
+            raise HTTPException(400, f"A strip has at most {MAX_STRIP_FRAMES} frames")
+        return video_frame_resolver.get_frame_media_infos_by_video(
+            session=session,
+            video_id=body.video_id,
+            start_frame=body.start_frame,
+            end_frame=end_frame,
+        )
+    raise HTTPException(400, "Exactly one of sample_ids and video_id is required")
+
+
+def _media_type(transform: FrameTransformOptions) -> str:
+    """Return the media type frames are encoded in."""
+    if transform.quality == GridViewThumbnailQualityType.HIGH:
+        return "image/jpeg"
+    return "image/png"
+
+
+def _transform_options(transform_query: FrameTransformQuery) -> FrameTransformOptions:
+    """Validate the transport query parameters.
+
+    Raises:
+        HTTPException: If ``quality=high`` is requested without bounds.
+    """
+    if (
+        transform_query.quality == GridViewThumbnailQualityType.HIGH
+        and transform_query.max_width is None
+        and transform_query.max_height is None
+    ):
+        raise HTTPException(400, "max_width or max_height is required when quality=high")
+    return FrameTransformOptions(
+        quality=transform_query.quality,
+        max_width=transform_query.max_width,
+        max_height=transform_query.max_height,
+    )
 
 
 def _resize_frame(
@@ -259,17 +270,7 @@ async def stream_frame(
         video_path = video_frame.video.file_path_abs
         frame_number = video_frame.frame_number
         rotation_deg = video_frame.rotation_deg
-    if (
-        transform_query.quality == GridViewThumbnailQualityType.HIGH
-        and transform_query.max_width is None
-        and transform_query.max_height is None
-    ):
-        raise HTTPException(400, "max_width or max_height is required when quality=high")
-    transform = FrameTransformOptions(
-        quality=transform_query.quality,
-        max_width=transform_query.max_width,
-        max_height=transform_query.max_height,
-    )
+    transform = _transform_options(transform_query=transform_query)
 
     # Run CPU-intensive video processing in thread pool to avoid blocking event loop
     try:
@@ -295,3 +296,71 @@ async def stream_frame(
             "Content-Length": str(buffer.nbytes),
         },
     )
+
+
+@frames_router.post("/strip")
+async def stream_frame_strip(
+    body: FrameStripRequest,
+    transform_query: Annotated[FrameTransformQuery, Depends(FrameTransformQuery)],
+) -> Response:
+    """Serve many video frames in one response, for frame grids.
+
+    The frames are given either as sample IDs or as a range of frames of one video. Each
+    video is decoded once, in frame order, with the videos processed in parallel.
+
+    The body starts with an index: its length in bytes as a big-endian unsigned integer
+    of ``STRIP_INDEX_LENGTH_BYTES`` bytes, followed by a UTF-8 JSON object. Its
+    ``sample_ids`` lists the sample IDs of the frames, and ``offsets`` the byte offset of
+    each frame after the index followed by the length of the frames, so frame ``i`` spans
+    ``offsets[i]:offsets[i + 1]``. The encoded frames follow, packed back to back in the
+    order of the request (or of the frame numbers, for a range). The index is not sent in
+    headers, which proxies limit to a few kilobytes. ``X-Frame-Media-Type`` is the media
+    type of every frame. Unknown sample IDs and frames that cannot be decoded are left out.
+
+    Args:
+        body: The frames to serve.
+        transform_query: Transport-level query parameters for frame encoding.
+    """
+    transform = _transform_options(transform_query=transform_query)
+    # Avoid SessionDep here, see ``stream_frame``.
+    with db_manager.session() as sess:
+        frames = _get_strip_frames(session=sess, body=body)
+
+    frames_by_video: dict[str, list[video_frame_resolver.VideoFrameMediaInfo]] = {}
+    for frame_info in frames:
+        frames_by_video.setdefault(frame_info.video_path, []).append(frame_info)
+    loop = asyncio.get_running_loop()
+    buffers_per_video = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                get_media_executor("video_frame"),
+                _process_video_frame_strip,
+                video_path,
+                video_frames,
+                transform,
+            )
+            for video_path, video_frames in frames_by_video.items()
+        )
+    )
+    buffers: dict[UUID, npt.NDArray[np.uint8]] = {}
+    for video_buffers in buffers_per_video:
+        buffers.update(video_buffers)
+
+    sample_ids = [frame_info.sample_id for frame_info in frames if frame_info.sample_id in buffers]
+    offsets = [0]
+    for sample_id in sample_ids:
+        offsets.append(offsets[-1] + buffers[sample_id].nbytes)
+    index = json.dumps(
+        {"sample_ids": [str(sample_id) for sample_id in sample_ids], "offsets": offsets}
+    ).encode()
+    return Response(
+        content=b"".join(
+            [
+                len(index).to_bytes(STRIP_INDEX_LENGTH_BYTES, "big"),
+                index,
+                *(buffers[sample_id].tobytes() for sample_id in sample_ids),
+            ]
+        ),
+        media_type="application/octet-stream",
+        headers={FRAME_MEDIA_TYPE_HEADER: _media_type(transform=transform)},
+    )
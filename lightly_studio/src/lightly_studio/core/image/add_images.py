@@ -2,23 +2,25 @@
 
 from __future__ import annotations
 
+import io
 import itertools
 import json
 import logging
 import posixpath
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from uuid import UUID
 
 import fsspec
-import PIL
 from labelformat.model.image import Image
 from labelformat.model.instance_segmentation import (
     InstanceSegmentationInput,
 )
 from labelformat.model.object_detection import ObjectDetectionInput
 from labelformat.utils import ImageDimensionError
+from PIL import Image as PILImage
 from sqlmodel import Session
 from tqdm import tqdm
 
@@ -28,10 +30,12 @@ from lightly_studio.core.file_outcome_report import (
     BrokenInputFileError,
     FileOutcome,
     FileOutcomeReport,
+    InputFileError,
     MissingInputFileError,
 )
-from lightly_studio.core.image import add_annotations
+from lightly_studio.core.image import add_annotations, image_header
 from lightly_studio.core.image.image_sample import ImageSample
+from lightly_studio.dataset import file_utils
 from lightly_studio.models.caption import CaptionCreate
 from lightly_studio.models.image import ImageCreate
 from lightly_studio.resolvers import (
@@ -41,11 +45,20 @@ from lightly_studio.resolvers import (
     tag_resolver,
 )
 from lightly_studio.type_definitions import PathLike
+from lightly_studio.utils import parallelize, workers
 
 logger = logging.getLogger(__name__)
 
 # Constants
 SAMPLE_BATCH_SIZE = 32  # Number of samples to process in a single batch
+# Decoded images handed to an ``ImageBatchConsumer`` are downscaled to this shorter side.
+# Embedding models resize their input to a few hundred pixels anyway, and full resolution
+# pixels of a few batches would take gigabytes.
+DECODED_IMAGE_SHORT_SIDE = 512
+
+# Receives the sample IDs of a created batch, their decoded images and the content hashes of
+# their files (see ``file_utils.get_bytes_xxhash``), in the same order.
+ImageBatchConsumer = Callable[[list[UUID], list[PILImage.Image], list[str]], None]
 
 
 class BrokenImageCollector:
@@ -71,19 +84,37 @@ class BrokenImageCollector:
         self.report.record(path=path_str, outcome=FileOutcome.BROKEN)
 
 
-def load_into_dataset_from_paths(
+def load_into_dataset_from_paths(  # noqa: PLR0913
     session: Session,
     root_collection_id: UUID,
     image_paths: Iterable[str],
     show_progress: bool = True,
+    num_workers: int | None = None,
+    consume_images: ImageBatchConsumer | None = None,
 ) -> list[UUID]:
     """Load images from file paths into the dataset.
 
+    Reading the image headers (existence check and width/height) is I/O bound, especially
+    for remote (e.g. S3) inputs, so it runs on a bounded thread pool with one task per image.
+    Results are consumed in input order and all database writes stay on the calling thread.
+
+    With ``consume_images``, each file is fetched whole instead of only its header, and the
+    worker also decodes it. After each batch of samples is created, the decoded images of
+    the batch are handed to ``consume_images`` (e.g. to embed them), so a file is read from
+    storage once for both steps. Files whose header is readable but whose pixels are not
+    are still added, as without ``consume_images``, but are not passed on.
+
     Args:
         session: The database session.
         root_collection_id: The ID of the dataset to load images into.
         image_paths: An iterable of file paths to the images to load.
         show_progress: Whether to display a progress bar and final summary of loading results.
+        num_workers: Number of threads reading image headers concurrently. Defaults to
+            the available cores - 1 (at least 1), capped at 16.
+        consume_images: Called on the calling thread with the sample IDs, decoded RGB
+            images and content hashes of each created batch. Images are downscaled to
+            a shorter side of ``DECODED_IMAGE_SHORT_SIDE``, while the created samples keep
+            the original size. By default, files are not decoded.
 
     Returns:
         A list of UUIDs of the created samples.
@@ -91,6 +122,7 @@ def load_into_dataset_from_paths(
     Raises:
         AllInputFilesFailedError: If at least one file was attempted and every
             attempted file was missing or broken.
+        ValueError: If ``num_workers`` is less than 1.
     """
     # Normalize all paths up front so the database check can happen once, before the
     # main processing loop, instead of once per batch.
@@ -104,66 +136,66 @@ def load_into_dataset_from_paths(
         collection_id=root_collection_id,
         file_paths_abs=normalized_paths,
     )
+    # The workers only read this snapshot; the set above keeps growing on the calling thread.
+    existing_paths = frozenset(seen_or_existing_paths)
 
-    samples_to_create: list[ImageCreate] = []
+    decode = consume_images is not None
+    images_to_create: list[_IndexedImage] = []
     created_sample_ids: list[UUID] = []
 
     report = FileOutcomeReport()
 
-    # TODO(Malte, 07/2026): Parallelize image indexing across images with
-    # parallelize.thread_imap_lazy (one task per image; workers and prefetch stay
-    # bounded) to overlap the per-image reads, especially for remote (e.g. S3) inputs.
-    # Keep DB writes on a single thread.
-    for normalized_path in tqdm(
-        normalized_paths,
+    indexed_images = parallelize.thread_imap_lazy(
+        function=lambda path: _index_image(path=path, existing_paths=existing_paths, decode=decode),
+        iterable=normalized_paths,
+        max_workers=num_workers if num_workers is not None else workers.default_num_workers(),
+        # Read one database batch ahead so the next batch is ready while the current is
+        # written. Decoded images are much larger than headers, so read ahead only one
+        # batch: at most two batches of downscaled images are held, plus the full
+        # resolution image each worker is decoding.
+        buffer_size=SAMPLE_BATCH_SIZE if decode else 2 * SAMPLE_BATCH_SIZE,
+    )
+    for indexed_image in tqdm(
+        indexed_images,
+        total=len(normalized_paths),
         desc="Processing images",
         unit=" images",
         disable=not show_progress,
     ):
-        with report.track(path=normalized_path):
+        with report.track(path=indexed_image.path):
             # Skip paths already in the database or already seen in this call.
-            if normalized_path in seen_or_existing_paths:
+            if indexed_image.path in seen_or_existing_paths:
                 raise AlreadyPresentInputFileError()
+            # Re-raise the worker's missing/broken signal here so the report records it.
+            if indexed_image.error is not None:
+                raise indexed_image.error
+            assert indexed_image.sample is not None
 
-            # Detect a missing path proactively: FileNotFoundError is unreliable across
-            # fsspec backends and is a subclass of OSError, which we treat as broken.
-            if not _file_exists(normalized_path):
-                raise MissingInputFileError()
-
-            # Translate a failed header read into a broken-file signal at this I/O
-            # boundary; any other exception propagates rather than being recorded.
-            fs, fs_path = fsspec.core.url_to_fs(normalized_path)
-            try:
-                with fs.open(fs_path, "rb") as file:
-                    image = PIL.Image.open(file)
-                    width, height = image.size
-                    image.close()
-            except BROKEN_IMAGE_ERRORS as e:
-                raise BrokenInputFileError() from e
-
-            sample = ImageCreate(
-                file_name=Path(normalized_path).name,
-                file_path_abs=normalized_path,
-                width=width,
-                height=height,
-            )
-            seen_or_existing_paths.add(normalized_path)
-            samples_to_create.append(sample)
+            seen_or_existing_paths.add(indexed_image.path)
+            images_to_create.append(indexed_image)
 
             # Process batch when it reaches SAMPLE_BATCH_SIZE
-            if len(samples_to_create) >= SAMPLE_BATCH_SIZE:
-                created_path_to_id = _create_batch_samples(
-                    session=session, collection_id=root_collection_id, samples=samples_to_create
+            if len(images_to_create) >= SAMPLE_BATCH_SIZE:
+                created_sample_ids.extend(
+                    _create_indexed_batch(
+                        session=session,
+                        collection_id=root_collection_id,
+                        indexed_images=images_to_create,
+                        consume_images=consume_images,
+                    )
                 )
-                created_sample_ids.extend(created_path_to_id.values())
-                samples_to_create = []
+                images_to_create = []
 
     # Handle remaining samples
-    if samples_to_create:
-        created_path_to_id = _create_batch_samples(
-            session=session, collection_id=root_collection_id, samples=samples_to_create
+    if images_to_create:
+        created_sample_ids.extend(
+            _create_indexed_batch(
+                session=session,
+                collection_id=root_collection_id,
+                indexed_images=images_to_create,
+                consume_images=consume_images,
+            )
         )
-        created_sample_ids.extend(created_path_to_id.values())
 
     report.log_summary()
     report.raise_if_all_failed()
@@ -490,6 +522,112 @@ def _group_captions_by_image_id(
     return captions_by_image_id
 
 
+@dataclass(frozen=True)
+class _IndexedImage:
+    """Result of reading a single image header on an indexing worker.
+
+    Exactly one of ``sample`` and ``error`` is set. ``pixels`` and ``content_hash`` are only
+    set when the worker decoded the image and the decode succeeded.
+    """
+
+    path: str
+    sample: ImageCreate | None = None
+    error: InputFileError | None = None
+    pixels: PILImage.Image | None = None
+    content_hash: str | None = None
+
+
+def _index_image(path: str, existing_paths: frozenset[str], decode: bool = False) -> _IndexedImage:
+    """Read the header of the image at ``path`` into an ``ImageCreate``.
+
+    Runs on an indexing worker thread, so it must not touch the database session. The
+    per-file signals are returned instead of raised, because an exception would abort
+    the whole ``thread_imap_lazy`` iteration; the caller re-raises them inside
+    ``FileOutcomeReport.track``.
+
+    Args:
+        path: The normalized absolute path of the image.
+        existing_paths: Paths already in the database. Their files are not read.
+        decode: Whether to fetch the whole file and also decode it to RGB pixels.
+
+    Returns:
+        The indexed image, holding either the sample to create or the per-file signal.
+    """
+    pixels = None
+    content_hash = None
+    try:
+        # The caller classifies these as already present; avoid reading them.
+        if path in existing_paths:
+            raise AlreadyPresentInputFileError()
+
+        # Detect a missing path proactively: FileNotFoundError is unreliable across
+        # fsspec backends and is a subclass of OSError, which we treat as broken.
+        if not _file_exists(path):
+            raise MissingInputFileError()
+
+        # Translate a failed header read into a broken-file signal at this I/O
+        # boundary; any other exception propagates rather than being recorded. Only a
+        # prefix of the file is fetched, which matters for remote (e.g. S3) inputs.
+        try:
+            if decode:
+                (width, height), pixels, content_hash = _read_image(path=path)
+            else:
+                width, height = image_header.read_image_size(path=path)
+        except BROKEN_IMAGE_ERRORS as e:
+            raise BrokenInputFileError() from e
+    except InputFileError as error:
+        return _IndexedImage(path=path, error=error)
+
+    return _IndexedImage(
+        path=path,
+        sample=ImageCreate(
+            file_name=Path(path).name,
+            file_path_abs=path,
+            width=width,
+            height=height,
+        ),
+        pixels=pixels,
+        content_hash=content_hash,
+    )
+
+
+def _read_image(path: str) -> tuple[tuple[int, int], PILImage.Image | None, str | None]:
+    """Fetch the whole image at ``path`` once and return its size, RGB pixels and content hash.
+
+    The size comes from the header, like ``image_header.read_image_size``. The pixels are
+    downscaled to a shorter side of ``DECODED_IMAGE_SHORT_SIDE``; JPEGs are decoded at a
+    reduced scale right away. The pixels and the hash are ``None`` when the header is
+    readable but decoding fails, e.g. for a truncated file.
+
+    Raises:
+        UnidentifiedImageError: If the file is not a readable image.
+        OSError: If the file cannot be read.
+        Image.DecompressionBombError: If the image exceeds ``Image.MAX_IMAGE_PIXELS``.
+    """
+    fs, fs_path = fsspec.core.url_to_fs(path)
+    data = fs.cat_file(fs_path)
+    with PILImage.open(io.BytesIO(data)) as image:
+        size = image.size
+        target_size = _decoded_size(size=size)
+        try:
+            image.draft("RGB", target_size)
+            pixels = image.convert("RGB")
+        except BROKEN_IMAGE_ERRORS:
+            return size, None, None
+    if pixels.size != target_size:
+        pixels = pixels.resize(target_size, PILImage.Resampling.BICUBIC)
+    return size, pixels, file_utils.get_bytes_xxhash(data)
+
+
+def _decoded_size(size: tuple[int, int]) -> tuple[int, int]:
+    """Return ``size`` scaled down to a shorter side of ``DECODED_IMAGE_SHORT_SIDE``."""
+    width, height = size
+    scale = DECODED_IMAGE_SHORT_SIDE / min(width, height)
+    if scale >= 1:
+        return size
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
 def _file_exists(path: str) -> bool:
     """Return whether ``path`` resolves to an existing file on its fsspec backend.
 
@@ -557,6 +695,42 @@ def _create_batch_samples(
     }
 
 
+def _create_indexed_batch(
+    session: Session,
+    collection_id: UUID,
+    indexed_images: list[_IndexedImage],
+    consume_images: ImageBatchConsumer | None,
+) -> list[UUID]:
+    """Create the samples of a batch of indexed images and hand on their pixels.
+
+    Args:
+        session: The database session.
+        collection_id: The ID of the collection to create samples in.
+        indexed_images: Successfully indexed images, each with a sample to create.
+        consume_images: Receives the created sample IDs, pixels and content hashes of the
+            decoded images.
+
+    Returns:
+        The IDs of the created samples, in the order of ``indexed_images``.
+    """
+    samples = [image.sample for image in indexed_images if image.sample is not None]
+    created_path_to_id = _create_batch_samples(
+        session=session, collection_id=collection_id, samples=samples
+    )
+    if consume_images is not None:
+        decoded_sample_ids: list[UUID] = []
+        decoded_pixels: list[PILImage.Image] = []
+        content_hashes: list[str] = []
+        for image in indexed_images:
+            if image.pixels is not None and image.content_hash is not None:
+                decoded_sample_ids.append(created_path_to_id[image.path])
+                decoded_pixels.append(image.pixels)
+                content_hashes.append(image.content_hash)
+        if decoded_pixels:
+            consume_images(decoded_sample_ids, decoded_pixels, content_hashes)
+    return list(created_path_to_id.values())
+
+
 def _process_batch_captions(
     session: Session,
     collection_id: UUID,
@@ -22,11 +22,12 @@ from labelformat.model.instance_segmentation import (
 from labelformat.model.object_detection import (
     ObjectDetectionInput,
 )
+from PIL import Image as PILImage
 from sqlmodel import Session
 
 from lightly_studio.core.dataset import BaseSampleDataset
 from lightly_studio.core.dataset_query.dataset_query import DatasetQuery
-from lightly_studio.core.image import add_annotations, add_images
+from lightly_studio.core.image import add_annotations, add_images, thumbnail_pyramid
 from lightly_studio.core.image.add_images import BrokenImageCollector
 from lightly_studio.core.image.image_sample import ImageSample
 from lightly_studio.dataset import fsspec_lister
@@ -127,13 +128,14 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             raise IndexError(f"No sample found for sample_id: {sample_id}")
         return ImageSample(inner=sample)
 
-    def add_images_from_path(
+    def add_images_from_path(  # noqa: PLR0913
         self,
         path: PathLike,
         allowed_extensions: Iterable[str] | None = None,
         embed: bool = True,
         tag_depth: int = 0,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Adding images from the specified path to the dataset.
 
@@ -149,6 +151,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                   less deeply, so an image may receive several tags. Images
                   directly under `path` are not tagged.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added images in the
+                thumbnail cache, so that the grid view shows them without decoding the
+                original files.
 
         Raises:
             ValueError: If tag_depth is negative, or if limit is not None and not
@@ -171,11 +176,18 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
 
         logger.info(f"Found {len(image_paths)} images in {path}.")
 
-        # Process images
+        # Embed each batch while loading, from the pixels read for indexing, so every file
+        # is fetched once instead of again by a separate embedding pass.
+        consume_images = (
+            _embedding_image_consumer(session=self.session, collection_id=self.collection_id)
+            if embed
+            else None
+        )
         created_sample_ids = add_images.load_into_dataset_from_paths(
             session=self.session,
             root_collection_id=self.collection_id,
             image_paths=image_paths,
+            consume_images=consume_images,
         )
 
         if created_sample_ids:
@@ -187,12 +199,8 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 tag_depth=tag_depth,
             )
 
-        if embed:
-            _generate_embeddings_image(
-                session=self.session,
-                collection_id=self.collection_id,
-                sample_ids=created_sample_ids,
-            )
+        if generate_thumbnails:
+            _generate_thumbnails(session=self.session, sample_ids=created_sample_ids)
 
     def add_annotations_from_labelformat(
         self,
@@ -339,6 +347,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
         annotation_source: str | None = None,
         embed_annotations: bool = True,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Load a dataset from a labelformat object and store in database.
 
@@ -353,6 +362,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 a default source is used.
             embed_annotations: If True, generate embeddings for the annotation crops.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added samples in
+                the thumbnail cache, so that the grid view shows them without decoding
+                the original files.
 
         Raises:
             ValueError: If limit is not None and not greater than 0.
@@ -375,6 +387,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             sample_ids=created_sample_ids,
             tag=split,
             embed=embed,
+            generate_thumbnails=generate_thumbnails,
         )
         _generate_embeddings_annotations(
             session=self.session,
@@ -391,6 +404,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
         annotation_source: str | None = None,
         embed_annotations: bool = True,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Load a dataset in YOLO format and store in DB.
 
@@ -405,6 +419,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             embed_annotations: If True, generate embeddings for the annotation crops.
             limit: Maximum number of samples to load, in total across all processed
                 splits. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added samples in
+                the thumbnail cache, so that the grid view shows them without decoding
+                the original files.
 
         Raises:
             ValueError: If limit is not None and not greater than 0.
@@ -450,6 +467,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 sample_ids=created_sample_ids,
                 tag=split,
                 embed=False,
+                generate_thumbnails=False,
             )
 
             all_created_sample_ids.extend(created_sample_ids)
@@ -463,6 +481,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             sample_ids=all_created_sample_ids,
             tag=None,
             embed=embed,
+            generate_thumbnails=generate_thumbnails,
         )
         _generate_embeddings_annotations(
             session=self.session,
@@ -481,6 +500,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
         annotation_source: str | None = None,
         embed_annotations: bool = True,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Load a dataset in COCO Object Detection format and store in DB.
 
@@ -497,6 +517,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 a default source is used.
             embed_annotations: If True, generate embeddings for the annotation crops.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added samples in
+                the thumbnail cache, so that the grid view shows them without decoding
+                the original files.
 
         Raises:
             ValueError: If limit is not None and not greater than 0.
@@ -535,6 +558,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             sample_ids=created_sample_ids,
             tag=split,
             embed=embed,
+            generate_thumbnails=generate_thumbnails,
         )
         _generate_embeddings_annotations(
             session=self.session,
@@ -552,6 +576,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
         embed: bool = True,
         annotation_source: str | None = None,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Load a Pascal VOC segmentation dataset and store in DB.
 
@@ -570,6 +595,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 to. Reusing the same source name appends to that source. If `None`,
                 a default source is used.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added samples in
+                the thumbnail cache, so that the grid view shows them without decoding
+                the original files.
 
         Raises:
             ValueError: If limit is not None and not greater than 0.
@@ -607,6 +635,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             sample_ids=created_sample_ids,
             tag=split,
             embed=embed,
+            generate_thumbnails=generate_thumbnails,
         )
 
     def add_samples_from_lightly(  # noqa: PLR0913
@@ -618,6 +647,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
         annotation_source: str | None = None,
         embed_annotations: bool = True,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Load a dataset in Lightly format and store in DB.
 
@@ -632,6 +662,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 a default source is used.
             embed_annotations: If True, generate embeddings for the annotation crops.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added samples in
+                the thumbnail cache, so that the grid view shows them without decoding
+                the original files.
 
         Raises:
             ValueError: If limit is not None and not greater than 0.
@@ -660,6 +693,7 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             sample_ids=created_sample_ids,
             tag=split,
             embed=embed,
+            generate_thumbnails=generate_thumbnails,
         )
         _generate_embeddings_annotations(
             session=self.session,
@@ -668,13 +702,14 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             embed=embed_annotations,
         )
 
-    def add_samples_from_coco_caption(
+    def add_samples_from_coco_caption(  # noqa: PLR0913
         self,
         annotations_json: PathLike,
         images_path: PathLike,
         split: str | None = None,
         embed: bool = True,
         limit: int | None = None,
+        generate_thumbnails: bool = False,
     ) -> None:
         """Load a dataset in COCO caption format and store in DB.
 
@@ -685,6 +720,9 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
                 If provided, all samples will be tagged with this name.
             embed: If True, generate embeddings for the newly added samples.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            generate_thumbnails: If True, store thumbnails of the newly added samples in
+                the thumbnail cache, so that the grid view shows them without decoding
+                the original files.
 
         Raises:
             ValueError: If limit is not None and not greater than 0.
@@ -710,6 +748,42 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
             sample_ids=created_sample_ids,
             tag=split,
             embed=embed,
+            generate_thumbnails=generate_thumbnails,
+        )
+
+    def compute_embeddings(self) -> None:
+        """Generate embeddings for the images that have none for the default model yet.
+
+        Embeddings are stored in chunks while they are generated. If a run is interrupted,
+        e.g. while adding images with ``embed=True``, calling this method continues with
+        the images that are still missing an embedding.
+
+        Raises:
+            AllInputFilesFailedError: If no remaining image could be embedded because
+                every attempted file was broken.
+        """
+        embedding_manager = EmbeddingManagerProvider.get_embedding_manager()
+        model_id = embedding_manager.load_or_get_default_model(
+            session=self.session, collection_id=self.collection_id
+        )
+        if model_id is None:
+            logger.warning("No embedding model loaded. Skipping embedding generation.")
+            return
+
+        sample_ids = image_resolver.get_unembedded_image_ids(
+            session=self.session,
+            collection_id=self.collection_id,
+            embedding_model_id=model_id,
+        )
+        if not sample_ids:
+            logger.info("No images to embed.")
+            return
+
+        embedding_manager.embed_images(
+            session=self.session,
+            collection_id=self.collection_id,
+            sample_ids=sample_ids,
+            embedding_model_id=model_id,
         )
 
     def evaluate(self, query: DatasetQuery | None = None) -> ImageDatasetEvaluate:
@@ -732,12 +806,13 @@ class ImageDataset(BaseSampleDataset[ImageSample]):
         )
 
 
-def _postprocess_created_images(
+def _postprocess_created_images(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
     sample_ids: list[UUID],
     tag: str | None,
     embed: bool,
+    generate_thumbnails: bool,
 ) -> None:
     """Post-process newly created images by generating embeddings and tagging.
 
@@ -747,6 +822,7 @@ def _postprocess_created_images(
         sample_ids: List of sample IDs to process.
         embed: If True, generate embeddings for the samples.
         tag: Optional tag name to assign to the samples.
+        generate_thumbnails: If True, store thumbnails of the samples in the thumbnail cache.
     """
     if tag is not None and sample_ids:
         db_tag = tag_resolver.get_or_create_sample_tag_by_name(
@@ -760,6 +836,9 @@ def _postprocess_created_images(
             sample_ids=sample_ids,
         )
 
+    if generate_thumbnails:
+        _generate_thumbnails(session=session, sample_ids=sample_ids)
+
     if embed:
         _generate_embeddings_image(
             session=session,
@@ -768,6 +847,19 @@ def _postprocess_created_images(
         )
 
 
+def _generate_thumbnails(session: Session, sample_ids: list[UUID]) -> None:
+    """Store the thumbnail pyramids of samples in the thumbnail cache.
+
+    Args:
+        session: Database session for resolver operations.
+        sample_ids: List of sample IDs to generate thumbnails for.
+    """
+    if not sample_ids:
+        return
+    images = image_resolver.get_many_by_id(session=session, sample_ids=sample_ids)
+    thumbnail_pyramid.generate(file_paths=[image.file_path_abs for image in images])
+
+
 def _normalize_input_path(path: PathLike) -> PathLike:
     """Return absolute path for local inputs and preserve remote URIs."""
     fs, _ = fsspec.core.url_to_fs(url=str(path))
@@ -807,6 +899,41 @@ def _generate_embeddings_image(
     )
 
 
+def _embedding_image_consumer(
+    session: Session, collection_id: UUID
+) -> add_images.ImageBatchConsumer | None:
+    """Return a consumer that embeds and stores decoded images of created samples.
+
+    Args:
+        session: Database session for resolver operations.
+        collection_id: The ID of the collection to associate with the embedding model.
+
+    Returns:
+        The consumer, or None if no embedding model is available.
+    """
+    embedding_manager = EmbeddingManagerProvider.get_embedding_manager()
+    model_id = embedding_manager.load_or_get_default_model(
+        session=session, collection_id=collection_id
+    )
+    if model_id is None:
+        logger.warning("No embedding model loaded. Skipping embedding generation.")
+        return None
+
+    def consume_images(
+        sample_ids: list[UUID], images: list[PILImage.Image], content_hashes: list[str]
+    ) -> None:
+        embedding_manager.embed_and_store_pil_images(
+            session=session,
+            embedding_model_id=model_id,
+            sample_ids=sample_ids,
+            images=images,
+            show_progress=False,
+            content_hashes=content_hashes,
+        )
+
+    return consume_images
+
+
 def _generate_embeddings_annotations(
     session: Session,
     root_collection_id: UUID,
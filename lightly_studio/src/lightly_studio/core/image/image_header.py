@@ -0,0 +1,79 @@
+"""Read image dimensions from a prefix of the file instead of the whole object.
+
+Indexing only needs an image's width and height, which every supported format stores in
+its header. Opening the file through ``fs.open`` lets fsspec read ahead in large blocks
+(several MiB on S3/GCS), so most of each object is transferred just to read a few bytes.
+``read_image_size`` instead fetches a small byte range with ``fs.cat_file`` and grows it
+only when the header does not fit, e.g. a JPEG whose EXIF/ICC segments precede the frame
+header, or a TIFF whose first IFD sits at the end of the file.
+"""
+
+from __future__ import annotations
+
+import io
+
+import fsspec
+from PIL import Image
+
+# Covers the header of PNG, GIF, BMP, WebP and of most JPEGs, including an EXIF thumbnail.
+DEFAULT_INITIAL_PROBE_BYTES = 64 * 1024
+# Largest prefix probed before falling back to reading the whole file.
+DEFAULT_MAX_PROBE_BYTES = 4 * 1024 * 1024
+# Factor by which the probed prefix grows after a header did not fit.
+_PROBE_GROWTH_FACTOR = 4
+
+
+def read_image_size(
+    path: str,
+    initial_probe_bytes: int = DEFAULT_INITIAL_PROBE_BYTES,
+    max_probe_bytes: int = DEFAULT_MAX_PROBE_BYTES,
+) -> tuple[int, int]:
+    """Return the ``(width, height)`` of an image, reading as few bytes as possible.
+
+    The first ``initial_probe_bytes`` of the file are fetched and parsed. If the header is
+    not complete within them, the prefix grows by a factor of 4 up to ``max_probe_bytes``,
+    after which the whole file is read.
+
+    Args:
+        path: Path or URL of the image, on any fsspec backend.
+        initial_probe_bytes: Size of the first prefix fetched. Must be at least 1.
+        max_probe_bytes: Largest prefix fetched before reading the whole file.
+
+    Returns:
+        The image width and height in pixels, as reported by the file header.
+
+    Raises:
+        UnidentifiedImageError: If the file is not a readable image.
+        OSError: If the file cannot be read.
+        Image.DecompressionBombError: If the image exceeds ``Image.MAX_IMAGE_PIXELS``.
+        ValueError: If ``initial_probe_bytes`` is less than 1.
+    """
+    if initial_probe_bytes < 1:
+        raise ValueError(f"initial_probe_bytes must be at least 1, got {initial_probe_bytes}.")
+    fs, fs_path = fsspec.core.url_to_fs(path)
+    probe_bytes: int | None = initial_probe_bytes
+    while True:
+        if probe_bytes is None:
+            data = fs.cat_file(fs_path)
+        else:
+            data = fs.cat_file(fs_path, start=0, end=probe_bytes)
+        # A short read means the prefix already holds the whole file.
+        is_whole_file = probe_bytes is None or len(data) < probe_bytes
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                width, height = image.size
+                return width, height
+        except OSError:
+            # Pillow reports a header cut off by the prefix as unidentified or truncated
+            # (``UnidentifiedImageError`` subclasses ``OSError``). Only a whole file that
+            # fails to parse is broken.
+            if is_whole_file:
+                raise
+        probe_bytes = _next_probe_bytes(probe_bytes=probe_bytes, max_probe_bytes=max_probe_bytes)
+
+
+def _next_probe_bytes(probe_bytes: int | None, max_probe_bytes: int) -> int | None:
+    """Return the next prefix size to fetch, or ``None`` to read the whole file."""
+    if probe_bytes is None or probe_bytes >= max_probe_bytes:
+        return None
+    return min(probe_bytes * _PROBE_GROWTH_FACTOR, max_probe_bytes)
@@ -0,0 +1,221 @@
+"""On-disk cache of encoded image thumbnails.
+
+Thumbnails are content-addressed: the key of an entry is a digest of the source file path,
+its version as reported by the filesystem (e.g. the mtime of a local file or the ETag of an
+object in a bucket), the requested bounds and the encoder settings. A changed source file
+thus gets a new key, and the stale entry is evicted once the cache runs out of space. The
+key doubles as a strong ``ETag``, so a matching ``If-None-Match`` is answered without
+reading the source file or the cached thumbnail.
+
+Entries are evicted in least recently used order when their total size exceeds the bound.
+The cache directory may be shared by several processes; each keeps its own index, which is
+rebuilt from the directory the first time it is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from lightly_studio.dataset import env
+from lightly_studio.utils.cache_stats import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Bump when the encoding of thumbnails changes, so that entries of older versions are no
+# longer looked up.
+_FORMAT_VERSION = 2
+_SUFFIX = ".thumbnail"
+# Keys in the ``fs.info`` result that change with the content of a file, in order of
+# preference. Covers local files, S3, GCS and Azure Blob Storage.
+_VERSION_INFO_KEYS = (
+    "ETag",
+    "etag",
+    "generation",
+    "md5Hash",
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "updated",
+)
+
+
+class ThumbnailCache:
+    """Thread-safe LRU cache of thumbnails in a directory, bounded by their total size.
+
+    Thumbnails larger than the bound are not cached. A bound of 0 disables the cache.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        """Create a cache storing at most ``max_bytes`` of thumbnails in ``directory``."""
+        self._directory = directory
+        self._max_bytes = max_bytes
+        # Sizes of the entries by key, in least recently used order. None until loaded.
+        self._entries: OrderedDict[str, int] | None = None
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        """The upper bound of the total size of the cached thumbnails."""
+        return self._max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        """Whether thumbnails are cached at all."""
+        return self._max_bytes > 0
+
+    def get(self, key: str) -> bytes | None:
+        """Return the thumbnail cached for ``key`` and mark it as recently used."""
+        if not self.enabled:
+            return None
+        path = self._path(key=key)
+        with self._lock:
+            entries = self._load_entries()
+            if key not in entries:
+                self._misses += 1
+                return None
+            entries.move_to_end(key)
+        try:
+            content = path.read_bytes()
+            # Persist the recency for the index of the next process.
+            os.utime(path)
+        except OSError:
+            # Removed by another process sharing the directory.
+            with self._lock:
+                self._forget(key=key)
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """Cache ``content`` for ``key``, evicting the least recently used thumbnails."""
+        if len(content) > self._max_bytes:
+            return
+        path = self._path(key=key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that readers never see a partial thumbnail.
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+                try:
+                    file.write(content)
+                    file.close()
+                    os.replace(file.name, path)
+                except OSError:
+                    Path(file.name).unlink(missing_ok=True)
+                    raise
+        except OSError as exc:
+            logger.warning("Could not cache thumbnail in %s: %s", path, exc)
+            return
+        with self._lock:
+            entries = self._load_entries()
+            self._forget(key=key)
+            evicted: list[str] = []
+            while entries and self._size_bytes + len(content) > self._max_bytes:
+                evicted_key, evicted_size = entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+                evicted.append(evicted_key)
+            entries[key] = len(content)
+            self._size_bytes += len(content)
+        for evicted_key in evicted:
+            self._path(key=evicted_key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all thumbnails and reset the counters."""
+        with self._lock:
+            for key in self._load_entries():
+                self._path(key=key).unlink(missing_ok=True)
+            self._entries = OrderedDict()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries or ()),
+                size_bytes=self._size_bytes,
+            )
+
+    def _path(self, key: str) -> Path:
+        # Spread the files over subdirectories to keep directory listings short.
+        return self._directory / key[:2] / f"{key}{_SUFFIX}"
+
+    def _forget(self, key: str) -> None:
+        """Drop ``key`` from the index. Requires the lock."""
+        size = self._load_entries().pop(key, None)
+        if size is not None:
+            self._size_bytes -= size
+
+    def _load_entries(self) -> OrderedDict[str, int]:
+        """Return the index, building it from the directory on first use. Requires the lock."""
+        if self._entries is None:
+            files = []
+            for path in self._directory.glob(f"*/*{_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, path.stem, stat.st_size))
+            files.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in files)
+            self._size_bytes = sum(size for _, _, size in files)
+        return self._entries
+
+
+def source_version(info: Mapping[str, Any]) -> str | None:
+    """Return a token that changes with the content of a file.
+
+    Args:
+        info: The ``fs.info`` result of the file.
+
+    Returns:
+        The token, or None if the filesystem reports nothing that identifies the content.
+        Such files must not be cached.
+    """
+    for info_key in _VERSION_INFO_KEYS:
+        value = info.get(info_key)
+        if value is not None:
+            return f"{info_key}={value};size={info.get('size')}"
+    return None
+
+
+def thumbnail_key(
+    file_path: str,
+    version: str,
+    max_width: int | None,
+    max_height: int | None,
+    jpeg_quality: int,
+) -> str:
+    """Return the cache key of a thumbnail."""
+    parts = (_FORMAT_VERSION, file_path, version, max_width, max_height, jpeg_quality)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def etag_for(key: str) -> str:
+    """Return the strong ``ETag`` of the thumbnail cached under ``key``."""
+    return f'"{key[:32]}"'
+
+
+thumbnail_cache = ThumbnailCache(
+    directory=env.LIGHTLY_STUDIO_THUMBNAIL_CACHE_DIR,
+    max_bytes=env.LIGHTLY_STUDIO_THUMBNAIL_CACHE_MAX_BYTES,
+)
@@ -0,0 +1,199 @@
+"""Thumbnail pyramids of images, kept on disk apart from the thumbnail cache.
+
+The grid view requests thumbnails sized to its cells, which differ between screens and
+zoom levels. Instead of decoding the original file for each size, thumbnails with bounds of
+at most ``PYRAMID_SIZES[-1]`` are derived from the smallest pyramid level covering them: a
+small JPEG that decodes in a fraction of the time. Pyramids are built on the first request
+for an image, or ahead of time when images are added to a dataset with
+``generate_thumbnails=True``. They have their own bound, see
+``LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_MAX_BYTES``, so that thumbnails cached while browsing
+do not evict them.
+
+Large JPEGs are decoded directly at a reduced scale (``Image.draft``), and each level is
+resized from the next larger one.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+from collections.abc import Sequence
+
+import fsspec
+from fsspec import AbstractFileSystem
+from PIL import Image, ImageOps
+from tqdm import tqdm
+
+from lightly_studio.core.image import thumbnail_cache
+from lightly_studio.dataset import env
+from lightly_studio.utils import parallelize, workers
+
+logger = logging.getLogger(__name__)
+
+# Longest side in pixels of each level, in increasing order.
+PYRAMID_SIZES = (128, 256, 512)
+JPEG_QUALITY = 75
+
+
+def generate(
+    file_paths: Sequence[str],
+    show_progress: bool = True,
+    num_workers: int | None = None,
+) -> int:
+    """Store the thumbnail pyramids of the given images.
+
+    Images are read and encoded on a thread pool; PIL releases the GIL while decoding,
+    resizing and encoding. Files that cannot be read are skipped, they were already
+    reported when the images were added. A warning is logged if storing the pyramids
+    evicted others, e.g. those of images added earlier.
+
+    Args:
+        file_paths: Paths or URLs of the images.
+        show_progress: Whether to display a progress bar.
+        num_workers: Number of threads generating pyramids concurrently. Defaults to the
+            available cores - 1 (at least 1), capped at 16.
+
+    Returns:
+        The number of images whose pyramid was stored.
+    """
+    if not file_paths or not pyramid_cache.enabled:
+        return 0
+    if num_workers is None:
+        num_workers = workers.default_num_workers()
+    num_evictions = pyramid_cache.stats().evictions
+    results = parallelize.thread_imap_unordered_lazy(
+        function=_generate_for_file,
+        iterable=file_paths,
+        max_workers=num_workers,
+        buffer_size=2 * num_workers,
+    )
+    num_generated = sum(
+        tqdm(
+            results,
+            total=len(file_paths),
+            desc="Generating thumbnails",
+            unit=" images",
+            disable=not show_progress,
+        )
+    )
+    logger.info(f"Generated thumbnails for {num_generated} of {len(file_paths)} images.")
+    num_evicted = pyramid_cache.stats().evictions - num_evictions
+    if num_evicted:
+        logger.warning(
+            f"Evicted {num_evicted} thumbnail pyramid levels to stay within "
+            f"LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_MAX_BYTES={pyramid_cache.max_bytes}. Raise the "
+            "bound to keep the thumbnails of all images fast."
+        )
+    return num_generated
+
+
+def covering_level(max_width: int | None, max_height: int | None) -> int | None:
+    """Return the size of the smallest level covering the bounds of a thumbnail.
+
+    Returns:
+        The size, or None if the thumbnail must be derived from the original file because
+        a bound is missing or larger than the largest level.
+    """
+    if max_width is None or max_height is None:
+        return None
+    for size in PYRAMID_SIZES:
+        if size >= max_width and size >= max_height:
+            return size
+    return None
+
+
+def get_or_create_level(
+    fs: AbstractFileSystem,
+    fs_path: str,
+    file_path: str,
+    version: str,
+    size: int,
+) -> bytes:
+    """Return a level of the pyramid of an image, building the pyramid if it is not cached.
+
+    Args:
+        fs: The filesystem of the image.
+        fs_path: The path of the image within ``fs``.
+        file_path: The path or URL of the image, as stored in the database.
+        version: The version of the file, see ``thumbnail_cache.source_version``.
+        size: One of ``PYRAMID_SIZES``.
+
+    Returns:
+        The JPEG encoded level.
+    """
+    cached = pyramid_cache.get(key=_level_key(file_path=file_path, version=version, size=size))
+    if cached is not None:
+        return cached
+    levels = _build_and_store(content=fs.cat_file(fs_path), file_path=file_path, version=version)
+    return levels[size]
+
+
+def _generate_for_file(file_path: str) -> bool:
+    """Build and store the pyramid of one image. Returns whether it was stored."""
+    try:
+        fs, fs_path = fsspec.core.url_to_fs(file_path)
+        version = thumbnail_cache.source_version(info=fs.info(fs_path))
+        if version is None:
+            return False
+        _build_and_store(content=fs.cat_file(fs_path), file_path=file_path, version=version)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        # UnidentifiedImageError is an OSError.
+        logger.debug(f"Could not generate thumbnails for {file_path}: {exc}")
+        return False
+    return True
+
+
+def _build_and_store(content: bytes, file_path: str, version: str) -> dict[int, bytes]:
+    """Encode all levels of the pyramid of an image and store them."""
+    levels = _build(content=content)
+    for size, level in levels.items():
+        pyramid_cache.put(
+            key=_level_key(file_path=file_path, version=version, size=size), content=level
+        )
+    return levels
+
+
+def _build(content: bytes) -> dict[int, bytes]:
+    """Encode all levels of the pyramid of an image as JPEGs, by size."""
+    levels: dict[int, bytes] = {}
+    with Image.open(io.BytesIO(content)) as image_file:
+        # Let the JPEG decoder skip the detail that the largest level drops anyway. The
+        # requested box is square, so a rotation by the EXIF orientation does not matter.
+        image_file.draft("RGB", (PYRAMID_SIZES[-1], PYRAMID_SIZES[-1]))
+        image = ImageOps.exif_transpose(image_file)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        for size in reversed(PYRAMID_SIZES):
+            image = _fit(image=image, size=size)
+            output = io.BytesIO()
+            image.save(output, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+            levels[size] = output.getvalue()
+    return levels
+
+
+def _fit(image: Image.Image, size: int) -> Image.Image:
+    """Downscale an image to fit into a square of ``size`` pixels, keeping its aspect ratio."""
+    scale = size / max(image.width, image.height)
+    if scale >= 1:
+        return image
+    target_size = (
+        max(1, round(image.width * scale)),
+        max(1, round(image.height * scale)),
+    )
+    return image.resize(target_size, Image.Resampling.BILINEAR)
+
+
+def _level_key(file_path: str, version: str, size: int) -> str:
+    return thumbnail_cache.thumbnail_key(
+        file_path=file_path,
+        version=version,
+        max_width=size,
+        max_height=size,
+        jpeg_quality=JPEG_QUALITY,
+    )
+
+
+pyramid_cache = thumbnail_cache.ThumbnailCache(
+    directory=env.LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_DIR,
+    max_bytes=env.LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_MAX_BYTES,
+)
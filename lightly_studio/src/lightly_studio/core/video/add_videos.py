@@ -5,9 +5,9 @@ from __future__ import annotations
 import itertools
 import logging
 import math
-import os
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
 from typing import cast
 from uuid import UUID
@@ -39,6 +39,7 @@ from lightly_studio.core.file_outcome_report import (
     AlreadyPresentInputFileError,
     BrokenInputFileError,
     FileOutcomeReport,
+    InputFileError,
     MissingInputFileError,
 )
 from lightly_studio.dataset.embedding_manager import EmbeddingManagerProvider
@@ -56,6 +57,7 @@ from lightly_studio.resolvers import (
     video_frame_resolver,
     video_resolver,
 )
+from lightly_studio.utils import batching, parallelize, workers
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,22 @@ VIDEO_EXTENSIONS = {
     ".wmv",
 }
 
+# Largest deviation, in time base ticks, between two frame intervals of a constant frame
+# rate stream. Containers with a coarse time base (e.g. milliseconds in Matroska) round
+# the timestamps of rates like 29.97 fps, which makes the intervals alternate by one tick.
+_MAX_FRAME_INTERVAL_JITTER_TICKS = 1
+
+
+class FrameIndexingMode(str, Enum):
+    """How the frames of a video are enumerated while indexing it."""
+
+    # Decode every frame and read its timestamp and rotation from the decoded frame.
+    DECODE = "decode"
+    # Read frame timestamps from the demuxed packets without decoding them. Only the first
+    # frame is decoded, to read the rotation. Streams without a constant frame rate fall
+    # back to DECODE.
+    DEMUX = "demux"
+
 
 @dataclass
 class FrameExtractionContext:
@@ -85,6 +103,7 @@ class FrameExtractionContext:
     video_sample_id: UUID
     embed_frames: bool = False
     embedding_model_id: UUID | None = None
+    frame_indexing: FrameIndexingMode = FrameIndexingMode.DECODE
 
 
 @dataclass
@@ -99,6 +118,40 @@ class VideoLoadContext:
     target_fps: float | None
     embed_frames: bool
     embedding_model_id: UUID | None
+    frame_indexing: FrameIndexingMode = FrameIndexingMode.DECODE
+
+
+@dataclass(frozen=True)
+class _FrameMetadata:
+    """Metadata of a single decoded video frame, independent of its parent sample."""
+
+    frame_number: int
+    frame_timestamp_s: float
+    frame_timestamp_pts: int
+    rotation_deg: int
+
+    def to_video_frame_create(self, parent_sample_id: UUID) -> VideoFrameCreate:
+        """Return the frame sample to create under the given video sample."""
+        return VideoFrameCreate(
+            frame_number=self.frame_number,
+            frame_timestamp_s=self.frame_timestamp_s,
+            frame_timestamp_pts=self.frame_timestamp_pts,
+            parent_sample_id=parent_sample_id,
+            rotation_deg=self.rotation_deg,
+        )
+
+
+@dataclass(frozen=True)
+class _ProbedVideo:
+    """Result of decoding a single video on a worker thread.
+
+    Either ``video`` is set or ``error`` holds the per-file signal.
+    """
+
+    path: str
+    video: VideoCreate | None = None
+    frames: list[_FrameMetadata] = field(default_factory=list)
+    error: InputFileError | None = None
 
 
 def load_into_collection_from_paths(  # noqa: PLR0913
@@ -110,9 +163,17 @@ def load_into_collection_from_paths(  # noqa: PLR0913
     show_progress: bool = True,
     target_fps: float | None = None,
     embed_frames: bool = False,
+    num_workers: int = 1,
+    frame_indexing: FrameIndexingMode = FrameIndexingMode.DECODE,
 ) -> tuple[list[UUID], list[UUID]]:
     """Load video samples from file paths into the dataset using PyAV.
 
+    With ``num_workers > 1``, whole videos are opened and decoded concurrently on a bounded
+    thread pool (one task per video) while all database writes stay on the calling thread.
+    This suits collections of many short videos, e.g. on remote storage. Frame embedding
+    needs the decoded pixels on the embedding thread, so with ``embed_frames`` the videos
+    are always loaded one after another.
+
     Args:
         session: The database session.
         collection_id: The ID of the collection to load video samples into. It should have
@@ -127,6 +188,13 @@ def load_into_collection_from_paths(  # noqa: PLR0913
             original. Must be greater than 0.
         embed_frames: If True, generate image embeddings for extracted video frames during
             decoding. Requires an image-compatible embedding model.
+        num_workers: Number of videos decoded concurrently. Each video is decoded with
+            a single FFmpeg thread unless ``num_decode_threads`` is given. Ignored, with a
+            warning, when frames are embedded.
+        frame_indexing: How frames are enumerated. ``FrameIndexingMode.DEMUX`` reads the
+            frame timestamps of constant frame rate streams from the container packets
+            without decoding them, which is much faster for long videos but does not
+            detect corrupt frame data. Ignored, with a warning, when frames are embedded.
 
     Returns:
         A tuple containing:
@@ -135,6 +203,8 @@ def load_into_collection_from_paths(  # noqa: PLR0913
     """
     if target_fps is not None and target_fps <= 0:
         raise ValueError(f"target_fps must be greater than 0, got {target_fps}.")
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}.")
 
     created_video_sample_ids: list[UUID] = []
     created_video_frame_sample_ids: list[UUID] = []
@@ -162,6 +232,10 @@ def load_into_collection_from_paths(  # noqa: PLR0913
         if embedding_model_id is None:
             logger.warning("No embedding model loaded. Skipping frame embedding generation.")
     effective_embed_frames = embed_frames and embedding_model_id is not None
+    if effective_embed_frames:
+        _warn_about_options_ignored_when_embedding(
+            num_workers=num_workers, frame_indexing=frame_indexing
+        )
 
     load_context = VideoLoadContext(
         session=session,
@@ -172,27 +246,35 @@ def load_into_collection_from_paths(  # noqa: PLR0913
         target_fps=target_fps,
         embed_frames=effective_embed_frames,
         embedding_model_id=embedding_model_id,
+        frame_indexing=frame_indexing,
     )
 
-    # TODO(Malte, 07/2026): Parallelize video indexing across videos with
-    # parallelize.thread_imap_lazy (one task per whole video, never split a video;
-    # workers and prefetch stay bounded) to overlap remote reads. Decode single-threaded
-    # per video and keep DB writes and embedding on a single thread, as neither the
-    # session nor the model is thread-safe.
-    for video_path in tqdm(
-        video_paths_list,
-        desc="Loading frames from videos",
-        unit=" video",
-        disable=not show_progress,
-    ):
-        with report.track(path=video_path):
-            video_sample_id, frame_sample_ids = _load_single_video(
-                context=load_context,
-                video_path=video_path,
-                seen_or_existing_paths=seen_or_existing_paths,
-            )
-            created_video_sample_ids.append(video_sample_id)
-            created_video_frame_sample_ids.extend(frame_sample_ids)
+    if num_workers > 1 and not effective_embed_frames:
+        _load_videos_parallel(
+            context=load_context,
+            video_paths=video_paths_list,
+            seen_or_existing_paths=seen_or_existing_paths,
+            report=report,
+            num_workers=num_workers,
+            show_progress=show_progress,
+            out_video_sample_ids=created_video_sample_ids,
+            out_frame_sample_ids=created_video_frame_sample_ids,
+        )
+    else:
+        for video_path in tqdm(
+            video_paths_list,
+            desc="Loading frames from videos",
+            unit=" video",
+            disable=not show_progress,
+        ):
+            with report.track(path=video_path):
+                video_sample_id, frame_sample_ids = _load_single_video(
+                    context=load_context,
+                    video_path=video_path,
+                    seen_or_existing_paths=seen_or_existing_paths,
+                )
+                created_video_sample_ids.append(video_sample_id)
+                created_video_frame_sample_ids.extend(frame_sample_ids)
 
     report.log_summary()
     report.raise_if_all_failed()
@@ -200,6 +282,23 @@ def load_into_collection_from_paths(  # noqa: PLR0913
     return created_video_sample_ids, created_video_frame_sample_ids
 
 
+def _warn_about_options_ignored_when_embedding(
+    num_workers: int, frame_indexing: FrameIndexingMode
+) -> None:
+    """Log a warning if options that embedding frames rules out were given."""
+    ignored = []
+    if num_workers > 1:
+        ignored.append(f"num_workers={num_workers}")
+    if frame_indexing == FrameIndexingMode.DEMUX:
+        ignored.append("frame_indexing=FrameIndexingMode.DEMUX")
+    if ignored:
+        logger.warning(
+            f"Ignoring {' and '.join(ignored)}: embedding frames decodes every frame of one "
+            "video at a time. Pass embed_frames=False to load the videos faster and embed "
+            "their frames separately."
+        )
+
+
 def _load_single_video(
     context: VideoLoadContext,
     video_path: str,
@@ -232,36 +331,17 @@ def _load_single_video(
             raise BrokenInputFileError() from e
 
         try:
-            # Translate a failed header read into a broken-file signal; any other
-            # exception propagates rather than being recorded.
-            try:
-                video_stream = video_container.streams.video[context.video_channel]
-
-                # Get video metadata
-                framerate = float(video_stream.average_rate) or 0.0
-                video_width = video_stream.width or 0
-                video_height = video_stream.height or 0
-                if video_stream.duration and video_stream.time_base:
-                    video_duration = float(video_stream.duration * video_stream.time_base)
-                else:
-                    video_duration = None
-            except (OSError, IndexError, FFmpegError) as e:
-                raise BrokenInputFileError() from e
+            video = _read_video_create(
+                video_container=video_container,
+                video_channel=context.video_channel,
+                video_path=video_path,
+            )
 
             # Create video sample
             video_sample_ids = video_resolver.create_many(
                 session=context.session,
                 collection_id=context.collection_id,
-                samples=[
-                    VideoCreate(
-                        file_path_abs=video_path,
-                        width=video_width,
-                        height=video_height,
-                        duration_s=video_duration,
-                        fps=framerate,
-                        file_name=Path(video_path).name,
-                    )
-                ],
+                samples=[video],
             )
 
             if len(video_sample_ids) != 1:
@@ -274,6 +354,7 @@ def _load_single_video(
                 video_sample_id=video_sample_ids[0],
                 embed_frames=context.embed_frames,
                 embedding_model_id=context.embedding_model_id,
+                frame_indexing=context.frame_indexing,
             )
             try:
                 frame_sample_ids = _create_video_frame_samples(
@@ -302,6 +383,186 @@ def _load_single_video(
         video_file.close()
 
 
+def _load_videos_parallel(  # noqa: PLR0913
+    context: VideoLoadContext,
+    video_paths: list[str],
+    seen_or_existing_paths: set[str],
+    report: FileOutcomeReport,
+    num_workers: int,
+    show_progress: bool,
+    out_video_sample_ids: list[UUID],
+    out_frame_sample_ids: list[UUID],
+) -> None:
+    """Decode videos on a thread pool and store them on the calling thread.
+
+    Each task opens and decodes one whole video into its metadata, never touching the
+    database session. Results are consumed in input order, so the created IDs are
+    appended to ``out_video_sample_ids`` and ``out_frame_sample_ids`` in the same order
+    as the sequential path.
+    """
+    # The workers only read this snapshot; the set keeps growing on the calling thread.
+    existing_paths = frozenset(seen_or_existing_paths)
+    # Decoding several videos at once already uses the cores, so each video gets a single
+    # decode thread unless the caller asked for a specific count.
+    num_decode_threads = context.num_decode_threads if context.num_decode_threads is not None else 1
+    probed_videos = parallelize.thread_imap_lazy(
+        function=lambda video_path: _probe_video(
+            video_path=video_path,
+            existing_paths=existing_paths,
+            video_channel=context.video_channel,
+            num_decode_threads=num_decode_threads,
+            target_fps=context.target_fps,
+            frame_indexing=context.frame_indexing,
+        ),
+        iterable=video_paths,
+        max_workers=num_workers,
+    )
+    for probed_video in tqdm(
+        probed_videos,
+        total=len(video_paths),
+        desc="Loading frames from videos",
+        unit=" video",
+        disable=not show_progress,
+    ):
+        with report.track(path=probed_video.path):
+            # Skip paths already in the database or already seen in this call.
+            if probed_video.path in seen_or_existing_paths:
+                raise AlreadyPresentInputFileError()
+            seen_or_existing_paths.add(probed_video.path)
+            # Re-raise the worker's missing/broken signal here so the report records it.
+            if probed_video.error is not None:
+                raise probed_video.error
+            video_sample_id, frame_sample_ids = _store_probed_video(
+                context=context, probed_video=probed_video
+            )
+            out_video_sample_ids.append(video_sample_id)
+            out_frame_sample_ids.extend(frame_sample_ids)
+
+
+def _probe_video(  # noqa: PLR0913
+    video_path: str,
+    existing_paths: frozenset[str],
+    video_channel: int,
+    num_decode_threads: int,
+    target_fps: float | None,
+    frame_indexing: FrameIndexingMode,
+) -> _ProbedVideo:
+    """Open and decode one video into its sample and frame metadata.
+
+    Runs on a worker thread, so it must not touch the database session. The per-file
+    signals are returned instead of raised, because an exception would abort the whole
+    ``thread_imap_lazy`` iteration; the caller re-raises them inside ``report.track``.
+    """
+    try:
+        # The caller classifies these as already present; avoid reading them.
+        if video_path in existing_paths:
+            raise AlreadyPresentInputFileError()
+
+        # Detect a missing path proactively: FileNotFoundError is unreliable across
+        # fsspec backends and is a subclass of OSError, which we treat as broken.
+        fs, fs_path = fsspec.core.url_to_fs(url=video_path)
+        if not fs.exists(fs_path):
+            raise MissingInputFileError()
+
+        with fs.open(path=fs_path, mode="rb") as video_file:
+            try:
+                video_container = container.open(file=video_file)
+            except (OSError, FFmpegError) as e:
+                raise BrokenInputFileError() from e
+            try:
+                video = _read_video_create(
+                    video_container=video_container,
+                    video_channel=video_channel,
+                    video_path=video_path,
+                )
+                # Nothing is stored before the whole video decoded, so a frame that fails
+                # to decode mid-stream leaves no rows behind.
+                try:
+                    frames = list(
+                        _iter_kept_frame_metadata(
+                            video_container=video_container,
+                            video_channel=video_channel,
+                            num_decode_threads=num_decode_threads,
+                            target_fps=target_fps,
+                            frame_indexing=frame_indexing,
+                        )
+                    )
+                except (OSError, FFmpegError) as e:
+                    raise BrokenInputFileError() from e
+            finally:
+                video_container.close()
+    except InputFileError as error:
+        return _ProbedVideo(path=video_path, error=error)
+    return _ProbedVideo(path=video_path, video=video, frames=frames)
+
+
+def _store_probed_video(
+    context: VideoLoadContext, probed_video: _ProbedVideo
+) -> tuple[UUID, list[UUID]]:
+    """Create the video sample and its frame samples from a probed video."""
+    assert probed_video.video is not None
+    video_sample_ids = video_resolver.create_many(
+        session=context.session,
+        collection_id=context.collection_id,
+        samples=[probed_video.video],
+    )
+    if len(video_sample_ids) != 1:
+        raise RuntimeError(f"There was an error adding {probed_video.path} to the dataset.")
+
+    extraction_context = FrameExtractionContext(
+        session=context.session,
+        collection_id=context.video_frames_collection_id,
+        video_sample_id=video_sample_ids[0],
+    )
+    frame_sample_ids: list[UUID] = []
+    for frame_batch in batching.batched(probed_video.frames, batch_size=SAMPLE_BATCH_SIZE):
+        frame_sample_ids.extend(
+            _flush_frame_batch(
+                context=extraction_context,
+                samples_to_create=[
+                    frame_metadata.to_video_frame_create(parent_sample_id=video_sample_ids[0])
+                    for frame_metadata in frame_batch
+                ],
+                pil_frames=[],
+            )
+        )
+    return video_sample_ids[0], frame_sample_ids
+
+
+def _read_video_create(
+    video_container: InputContainer, video_channel: int, video_path: str
+) -> VideoCreate:
+    """Read the video sample metadata from an opened container.
+
+    Raises:
+        BrokenInputFileError: If the stream metadata cannot be read.
+    """
+    # Translate a failed header read into a broken-file signal; any other
+    # exception propagates rather than being recorded.
+    try:
+        video_stream = video_container.streams.video[video_channel]
+
+        # Get video metadata
+        framerate = float(video_stream.average_rate) if video_stream.average_rate else 0.0
+        video_width = video_stream.width or 0
+        video_height = video_stream.height or 0
+        if video_stream.duration and video_stream.time_base:
+            video_duration = float(video_stream.duration * video_stream.time_base)
+        else:
+            video_duration = None
+    except (OSError, IndexError, FFmpegError) as e:
+        raise BrokenInputFileError() from e
+
+    return VideoCreate(
+        file_path_abs=video_path,
+        width=video_width,
+        height=video_height,
+        duration_s=video_duration,
+        fps=framerate,
+        file_name=Path(video_path).name,
+    )
+
+
 def load_video_annotations_from_labelformat(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
@@ -473,8 +734,9 @@ def _create_video_frame_samples(
 ) -> list[UUID]:
     """Create video frame samples for a video by parsing all frames.
 
-    This function decodes all frames to extract metadata. When frame embedding is enabled,
-    embeddings are generated from the decoded frames in the same pass.
+    This function decodes all frames to extract metadata, unless the context asks for
+    ``FrameIndexingMode.DEMUX`` and frames are not embedded. When frame embedding is
+    enabled, embeddings are generated from the decoded frames in the same pass.
 
     Args:
         context: Frame extraction context (session, dataset and parent video).
@@ -491,6 +753,76 @@ def _create_video_frame_samples(
     created_sample_ids: list[UUID] = []
     samples_to_create: list[VideoFrameCreate] = []
     pil_frames: list[Image.Image] = []
+
+    # Embedding needs the decoded pixels; otherwise the metadata alone is enough.
+    kept_frames: Iterable[tuple[_FrameMetadata, AVVideoFrame | None]]
+    if context.embed_frames:
+        kept_frames = _iter_kept_frames(
+            video_container=video_container,
+            video_channel=video_channel,
+            num_decode_threads=num_decode_threads,
+            target_fps=target_fps,
+        )
+    else:
+        kept_frames = (
+            (frame_metadata, None)
+            for frame_metadata in _iter_kept_frame_metadata(
+                video_container=video_container,
+                video_channel=video_channel,
+                num_decode_threads=num_decode_threads,
+                target_fps=target_fps,
+                frame_indexing=context.frame_indexing,
+            )
+        )
+
+    for frame_metadata, frame in kept_frames:
+        samples_to_create.append(
+            frame_metadata.to_video_frame_create(parent_sample_id=context.video_sample_id)
+        )
+        if frame is not None:
+            pil_frames.append(frame.to_image().convert("RGB"))  # type: ignore[no-untyped-call]
+
+        if len(samples_to_create) >= SAMPLE_BATCH_SIZE:
+            created_sample_ids.extend(
+                _flush_frame_batch(
+                    context=context,
+                    samples_to_create=samples_to_create,
+                    pil_frames=pil_frames,
+                )
+            )
+            samples_to_create = []
+            pil_frames = []
+
+    if samples_to_create:
+        created_sample_ids.extend(
+            _flush_frame_batch(
+                context=context,
+                samples_to_create=samples_to_create,
+                pil_frames=pil_frames,
+            )
+        )
+
+    return created_sample_ids
+
+
+def _iter_kept_frames(
+    video_container: InputContainer,
+    video_channel: int,
+    num_decode_threads: int | None,
+    target_fps: float | None,
+) -> Iterator[tuple[_FrameMetadata, AVVideoFrame]]:
+    """Decode all frames of a video, yielding the ones selected by the target fps.
+
+    Args:
+        video_container: The PyAV container with the opened video.
+        video_channel: The video channel from which frames are decoded.
+        num_decode_threads: Optional override for FFmpeg decode thread count.
+        target_fps: Optional target frame rate for subsampling. If omitted, all frames
+            are yielded.
+
+    Yields:
+        The metadata of each kept frame together with the decoded frame.
+    """
     video_stream = video_container.streams.video[video_channel]
     _configure_stream_threading(video_stream=video_stream, num_decode_threads=num_decode_threads)
 
@@ -498,7 +830,7 @@ def _create_video_frame_samples(
     time_base = video_stream.time_base if video_stream.time_base else None
     original_fps = float(video_stream.average_rate) if video_stream.average_rate else 0.0
 
-    # Decode all frames, persisting only the subset selected by the target fps.
+    # Decode all frames, keeping only the subset selected by the target fps.
     for decoded_index, frame in enumerate(video_container.decode(video_stream)):
         if not _should_keep_frame(
             decoded_index=decoded_index, target_fps=target_fps, original_fps=original_fps
@@ -513,38 +845,132 @@ def _create_video_frame_samples(
             # Fallback to frame.time if pts or time_base is not available
             frame_timestamp_s = frame.time if frame.time is not None else -1.0
 
-        sample = VideoFrameCreate(
+        frame_metadata = _FrameMetadata(
             frame_number=decoded_index,
             frame_timestamp_s=frame_timestamp_s,
             frame_timestamp_pts=frame.pts if frame.pts is not None else -1,
-            parent_sample_id=context.video_sample_id,
             rotation_deg=_get_frame_rotation_deg(frame=frame),
         )
-        samples_to_create.append(sample)
-        if context.embed_frames:
-            pil_frames.append(frame.to_image().convert("RGB"))  # type: ignore[no-untyped-call]
+        yield frame_metadata, frame
 
-        if len(samples_to_create) >= SAMPLE_BATCH_SIZE:
-            created_sample_ids.extend(
-                _flush_frame_batch(
-                    context=context,
-                    samples_to_create=samples_to_create,
-                    pil_frames=pil_frames,
-                )
-            )
-            samples_to_create = []
-            pil_frames = []
 
-    if samples_to_create:
-        created_sample_ids.extend(
-            _flush_frame_batch(
-                context=context,
-                samples_to_create=samples_to_create,
-                pil_frames=pil_frames,
-            )
+def _iter_kept_frame_metadata(
+    video_container: InputContainer,
+    video_channel: int,
+    num_decode_threads: int | None,
+    target_fps: float | None,
+    frame_indexing: FrameIndexingMode,
+) -> Iterator[_FrameMetadata]:
+    """Yield the metadata of the frames selected by the target fps.
+
+    With ``FrameIndexingMode.DEMUX`` the frames are enumerated from the container packets
+    if the stream has a constant frame rate, and decoded otherwise.
+
+    Args:
+        video_container: The PyAV container with the opened video.
+        video_channel: The video channel from which frames are read.
+        num_decode_threads: Optional override for FFmpeg decode thread count.
+        target_fps: Optional target frame rate for subsampling. If omitted, the metadata
+            of all frames is yielded.
+        frame_indexing: How the frames are enumerated.
+
+    Yields:
+        The metadata of each kept frame.
+    """
+    if frame_indexing == FrameIndexingMode.DEMUX:
+        demuxed_frames = _read_frame_metadata_from_packets(
+            video_container=video_container, video_channel=video_channel
         )
+        if demuxed_frames is not None:
+            video_stream = video_container.streams.video[video_channel]
+            original_fps = float(video_stream.average_rate) if video_stream.average_rate else 0.0
+            for frame_metadata in demuxed_frames:
+                if _should_keep_frame(
+                    decoded_index=frame_metadata.frame_number,
+                    target_fps=target_fps,
+                    original_fps=original_fps,
+                ):
+                    yield frame_metadata
+            return
+        # Irregular timestamps: decode the whole stream from its start instead.
+        video_container.seek(0)
+
+    for frame_metadata, _ in _iter_kept_frames(
+        video_container=video_container,
+        video_channel=video_channel,
+        num_decode_threads=num_decode_threads,
+        target_fps=target_fps,
+    ):
+        yield frame_metadata
 
-    return created_sample_ids
+
+def _read_frame_metadata_from_packets(
+    video_container: InputContainer, video_channel: int
+) -> list[_FrameMetadata] | None:
+    """Read the metadata of all frames from the demuxed packets, without decoding them.
+
+    Each packet of a video stream holds one frame. Packets are stored in decode order, so
+    their presentation timestamps are sorted to get the frames in display order, matching
+    the order in which the decoder would output them. The rotation is stream-level side
+    data, so it is read from the first decoded frame and shared by all frames.
+
+    Args:
+        video_container: The PyAV container with the opened video.
+        video_channel: The video channel from which packets are read.
+
+    Returns:
+        The metadata of all frames in display order, or None if the stream has no time
+        base, a packet lacks a timestamp, or the frame intervals are not constant. The
+        container is then left at an arbitrary position.
+    """
+    video_stream = video_container.streams.video[video_channel]
+    time_base = video_stream.time_base
+    if time_base is None:
+        return None
+
+    frame_pts: list[int] = []
+    for packet in video_container.demux(video_stream):
+        # Skip the empty packet that flushes the demuxer and packets that the decoder
+        # drops, e.g. frames before the start of an edit list.
+        if packet.size == 0 or packet.is_discard:
+            continue
+        if packet.pts is None:
+            return None
+        frame_pts.append(packet.pts)
+    frame_pts.sort()
+    if not _has_constant_frame_interval(sorted_pts=frame_pts):
+        return None
+
+    video_container.seek(0)
+    rotation_deg = 0
+    for frame in video_container.decode(video_stream):
+        rotation_deg = _get_frame_rotation_deg(frame=frame)
+        break
+
+    return [
+        _FrameMetadata(
+            frame_number=frame_number,
+            frame_timestamp_s=float(pts * time_base),
+            frame_timestamp_pts=pts,
+            rotation_deg=rotation_deg,
+        )
+        for frame_number, pts in enumerate(frame_pts)
+    ]
+
+
+def _has_constant_frame_interval(sorted_pts: list[int]) -> bool:
+    """Check whether sorted frame timestamps are evenly spaced.
+
+    Intervals may deviate from the median interval by ``_MAX_FRAME_INTERVAL_JITTER_TICKS``
+    to tolerate timestamps rounded to the time base. Repeated timestamps are irregular.
+    """
+    intervals = np.diff(np.asarray(sorted_pts, dtype=np.int64))
+    if intervals.size == 0:
+        return True
+    if intervals.min() <= 0:
+        return False
+    deviation = np.abs(intervals - np.median(intervals))
+    return bool(deviation.max() <= _MAX_FRAME_INTERVAL_JITTER_TICKS)
 
 
 def _flush_frame_batch(
@@ -579,9 +1005,7 @@ def _configure_stream_threading(video_stream: VideoStream, num_decode_threads: i
         return
 
     if num_decode_threads is None:
-        cpu_count = os.cpu_count() or 1
-        # Use available cores - 1 but at least 1. Cap to prevent runaway usage.
-        num_decode_threads = max(1, min(cpu_count - 1 or 1, 16))
+        num_decode_threads = workers.default_num_workers()
 
     try:
         codec_context.thread_type = ThreadType.AUTO
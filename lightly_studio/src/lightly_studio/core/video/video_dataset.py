@@ -16,7 +16,7 @@ from sqlmodel import Session
 from lightly_studio.core.dataset import BaseSampleDataset
 from lightly_studio.core.dataset_query.dataset_query import DatasetQuery
 from lightly_studio.core.video import add_annotations, add_videos
-from lightly_studio.core.video.add_videos import VIDEO_EXTENSIONS
+from lightly_studio.core.video.add_videos import VIDEO_EXTENSIONS, FrameIndexingMode
 from lightly_studio.core.video.video_frame_dataset import VideoFrameDataset
 from lightly_studio.core.video.video_sample import VideoSample
 from lightly_studio.dataset import fsspec_lister
@@ -125,6 +125,8 @@ class VideoDataset(BaseSampleDataset[VideoSample]):
         embed_frames: bool = True,
         target_fps: float | None = None,
         limit: int | None = None,
+        num_workers: int = 1,
+        frame_indexing: FrameIndexingMode = FrameIndexingMode.DECODE,
     ) -> None:
         """Adding video frames from the specified path to the dataset.
 
@@ -142,6 +144,14 @@ class VideoDataset(BaseSampleDataset[VideoSample]):
                 frame rate, only selected frames are kept. frame_number values remain
                 original. Must be greater than 0.
             limit: Maximum number of samples to load. By default, all samples are loaded.
+            num_workers: Number of videos decoded concurrently. Speeds up loading many
+                short videos. Each video is then decoded with a single FFmpeg thread unless
+                `num_decode_threads` is given. Ignored, with a warning, when `embed_frames`
+                is True.
+            frame_indexing: How frames are enumerated. `FrameIndexingMode.DEMUX` reads the
+                frame timestamps of constant frame rate videos from the container without
+                decoding every frame, which speeds up adding long videos. Ignored, with a
+                warning, when `embed_frames` is True.
         """
         if target_fps is not None and target_fps <= 0:
             raise ValueError(f"target_fps must be greater than 0, got {target_fps}.")
@@ -160,6 +170,8 @@ class VideoDataset(BaseSampleDataset[VideoSample]):
             num_decode_threads=num_decode_threads,
             target_fps=target_fps,
             embed_frames=embed_frames,
+            num_workers=num_workers,
+            frame_indexing=frame_indexing,
         )
 
         if embed:
@@ -0,0 +1,62 @@
+"""Process-wide counter of database writes, used to invalidate in-memory caches.
+
+Every statement other than a plain ``SELECT`` executed through any SQLAlchemy engine of this
+process increments the generation. A connection that wrote increments it again when it is
+returned to the pool, which happens after its transaction was committed or rolled back. A
+value computed while a write was not yet visible thus belongs to an older generation than
+any read after the write completed, and a cache keyed by the generation never returns it.
+
+Writes made by other processes, e.g. a second server on the same PostgreSQL database, are
+not observed.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import ConnectionPoolEntry, Pool
+
+# Key in the info of a pooled connection marking that it wrote since it was checked out.
+_HAS_WRITES_KEY = "lightly_studio_has_writes"
+# Leading keywords of statements that do not modify the database. EXPLAIN only plans the
+# statement when it is not asked to ANALYZE it.
+_READ_ONLY_PREFIXES = ("SELECT", "SET ", "SHOW ", "EXPLAIN (FORMAT JSON) SELECT")
+
+_lock = threading.Lock()
+_generation = 0
+
+
+def get() -> int:
+    """Return the current write generation."""
+    return _generation
+
+
+def _increment() -> None:
+    global _generation  # noqa: PLW0603
+    with _lock:
+        _generation += 1
+
+
+def _is_write(statement: str) -> bool:
+    """Return whether ``statement`` may modify the database.
+
+    Besides ``SELECT``, ``SET`` and ``SHOW`` only read or change settings of the session,
+    and ``EXPLAIN (FORMAT JSON) SELECT`` plans a ``SELECT`` without running it.
+    """
+    return not statement.lstrip().upper().startswith(_READ_ONLY_PREFIXES)
+
+
+@event.listens_for(Engine, "after_cursor_execute", named=True)
+def _after_cursor_execute(conn: Connection, statement: str, **_: Any) -> None:
+    if _is_write(statement=statement):
+        conn.info[_HAS_WRITES_KEY] = True
+        _increment()
+
+
+@event.listens_for(Pool, "checkin", named=True)
+def _checkin(connection_record: ConnectionPoolEntry, **_: Any) -> None:
+    if connection_record.info.pop(_HAS_WRITES_KEY, False):
+        _increment()
@@ -1,4 +1,4 @@
-"""Dialect-aware JSON extraction functions.
+"""Dialect-aware JSON extraction and merge functions.
 
 Thin wrappers over SQLAlchemy's JSON indexing, which compiles to the right operator
 chain for DuckDB and PostgreSQL and binds every key as a parameter.
@@ -17,8 +17,11 @@ import re
 from typing import Any, cast
 
 import sqlalchemy
-from sqlalchemy import ColumnElement, Text
+from sqlalchemy import JSON, ColumnElement, Text
 from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import GenericFunction
 from sqlalchemy.types import TypeDecorator
 
 _DUCKDB_DIALECT = "duckdb"
@@ -98,6 +101,57 @@ def json_extract_key_as_float(column: Any, key: str) -> ColumnElement[float]:
     return cast(ColumnElement[float], column[_bind_key(key)].as_float())
 
 
+class json_object_merge(GenericFunction[Any]):  # noqa: N801
+    """Shallow merge of two JSON objects; keys of the second replace those of the first.
+
+    Top-level values are replaced as a whole, including nested objects and ``null``s, as
+    ``dict.update`` does. This differs from ``json_merge_patch``, which merges nested
+    objects and drops keys whose new value is ``null``.
+
+    Compiles to dialect-specific SQL:
+    - DuckDB: ``map_concat`` of both objects cast to ``MAP(VARCHAR, JSON)``
+    - PostgreSQL: ``||`` of both objects cast to ``jsonb``
+    """
+
+    type = JSON()
+    inherit_cache = True
+
+
+@compiles(json_object_merge)
+def _compile_json_object_merge_unsupported(
+    element: json_object_merge, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """Raise for unsupported dialects."""
+    raise NotImplementedError(
+        f"Unsupported dialect: {compiler.dialect.name}."
+        " Only 'postgresql' and 'duckdb' are supported."
+    )
+
+
+@compiles(json_object_merge, "duckdb")
+def _compile_json_object_merge_duckdb(
+    element: json_object_merge, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """DuckDB compilation: map_concat over MAP(VARCHAR, JSON) casts."""
+    left, right = (
+        f"CAST({compiler.process(clause, **kw)} AS MAP(VARCHAR, JSON))"
+        for clause in element.clauses
+    )
+    return f"CAST(map_concat({left}, {right}) AS JSON)"
+
+
+@compiles(json_object_merge, "postgresql")
+def _compile_json_object_merge_postgresql(
+    element: json_object_merge, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """PostgreSQL compilation: jsonb concatenation, cast back to the json column type."""
+    left, right = list(element.clauses)
+    return (
+        f"(CAST({compiler.process(left, **kw)} AS JSONB)"
+        f" || CAST({compiler.process(right, **kw)} AS JSONB))::json"
+    )
+
+
 class _JsonKeyType(TypeDecorator[str]):
     """Bind one object key so that each database reads it as a key and nothing else.
 
@@ -0,0 +1,74 @@
+"""Dialect-aware staging of client-side rows as a table for set-based statements.
+
+Sending many rows as ``VALUES`` binds one parameter per cell, which is slow on DuckDB and
+capped on PostgreSQL. Staged rows are instead shipped in bulk: DuckDB scans a registered
+Arrow table in place, and PostgreSQL receives them through ``COPY`` into a temporary
+table. Statements then read them as a regular table, e.g. in an ``INSERT ... SELECT``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import pyarrow as pa
+from sqlalchemy import TableClause, Text, column, table, text
+from sqlmodel import Session
+
+from lightly_studio.database.db_manager import DatabaseBackend
+
+
+@contextmanager
+def staged_text_table(
+    session: Session,
+    name: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[str]],
+) -> Iterator[TableClause]:
+    """Make text rows available as a table for the duration of the block.
+
+    Values are staged as text; cast them to the column types in the statement reading
+    them. The table lives on the session's connection, inside its transaction, and is
+    removed when the block exits. Does not commit.
+
+    Args:
+        session: The database session.
+        name: Name of the staged table. Must be a plain SQL identifier that is not taken.
+        columns: Column names, also plain SQL identifiers.
+        rows: The rows, one value per column.
+
+    Yields:
+        The staged table, to use in SQLAlchemy statements.
+    """
+    staged = table(name, *(column(column_name, Text) for column_name in columns))
+    # psycopg or DuckDB connection, whose bulk interfaces SQLAlchemy does not expose.
+    driver_connection: Any = session.connection().connection.driver_connection
+    if session.get_bind().dialect.name == DatabaseBackend.POSTGRESQL.value:
+        session.exec(  # type: ignore[call-overload]
+            text(
+                f"CREATE TEMPORARY TABLE {name} "
+                f"({', '.join(f'{column_name} TEXT' for column_name in columns)})"
+            )
+        )
+        copy_sql = f"COPY {name} ({', '.join(columns)}) FROM STDIN"
+        with driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+        try:
+            yield staged
+        finally:
+            session.exec(text(f"DROP TABLE IF EXISTS {name}"))  # type: ignore[call-overload]
+        return
+
+    arrow_table = pa.table(
+        {
+            column_name: pa.array([row[index] for row in rows], type=pa.string())
+            for index, column_name in enumerate(columns)
+        }
+    )
+    driver_connection.register(name, arrow_table)
+    try:
+        yield staged
+    finally:
+        driver_connection.unregister(name)
@@ -0,0 +1,379 @@
+"""On-disk cache of embeddings, keyed by the content of the embedded file.
+
+The key of an entry is a digest of the xxhash of the file content, the hash of the embedding
+model and, for image crops, the crop box. Files with identical content thus share their
+embeddings across datasets and repeated ingests, whatever their path, and an entry of a
+changed file or another model is never looked up.
+
+Embeddings are small and numerous, so they are stored as rows of a single SQLite database
+instead of one file per entry. Entries are evicted in least recently used order when their
+total size exceeds the bound. The total is kept up to date by triggers, so a write does not
+scan the cache. The database may be shared by several processes.
+
+Looking an embedding up requires the content hash, so a file that is not in memory already
+is read once more to hash it. The cache is therefore disabled by default; enable it when
+files are embedded repeatedly and inference costs more than reading them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from lightly_studio.core.file_outcome_report import AllInputFilesFailedError
+from lightly_studio.dataset import env, file_utils
+from lightly_studio.dataset.embedding_generator import ImageCrop
+from lightly_studio.dataset.embedding_result import EmbeddingResult
+from lightly_studio.utils import batching, parallelize
+from lightly_studio.utils.cache_stats import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored representation of embeddings changes, so that entries of older
+# versions are no longer looked up.
+_FORMAT_VERSION = 1
+# Number of files hashed concurrently. Hashing is I/O bound for remote files.
+_HASH_WORKERS = 8
+# Keys per SQL statement, below the SQLite limit of bound parameters.
+_SQL_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """Thread-safe LRU cache of embeddings in an SQLite database, bounded by their total size.
+
+    A bound of 0 disables the cache.
+    """
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        """Create a cache storing at most ``max_bytes`` of embeddings in the file ``path``."""
+        self._path = path
+        self._max_bytes = max_bytes
+        self._connection: sqlite3.Connection | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether embeddings are cached at all."""
+        return self._max_bytes > 0
+
+    def get_many(self, keys: Sequence[str]) -> list[NDArray[np.float32] | None]:
+        """Return the embedding cached for each key, or None, and mark them as recently used."""
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+        found: dict[str, NDArray[np.float32]] = {}
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                self._misses += len(keys)
+                return [None] * len(keys)
+            for key_batch in batching.batched(
+                items=list(dict.fromkeys(keys)), batch_size=_SQL_BATCH_SIZE
+            ):
+                placeholders = ",".join("?" * len(key_batch))
+                rows = connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                    key_batch,
+                ).fetchall()
+                found.update(
+                    (key, np.frombuffer(embedding, dtype=np.float32)) for key, embedding in rows
+                )
+                # Persist the recency, also for the other processes sharing the database.
+                connection.execute(
+                    f"UPDATE embeddings SET last_used = ? WHERE key IN ({placeholders})",
+                    (time.time(), *key_batch),
+                )
+            connection.commit()
+            embeddings = [found.get(key) for key in keys]
+            num_hits = sum(embedding is not None for embedding in embeddings)
+            self._hits += num_hits
+            self._misses += len(keys) - num_hits
+        return embeddings
+
+    def put_many(self, items: Sequence[tuple[str, NDArray[np.float32]]]) -> None:
+        """Cache the embedding of each key, evicting the least recently used embeddings."""
+        if not self.enabled or not items:
+            return
+        now = time.time()
+        rows = []
+        for key, embedding in items:
+            content = np.asarray(embedding, dtype=np.float32).tobytes()
+            rows.append((key, content, len(content), now))
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete fires no trigger.
+            connection.executemany(
+                "INSERT INTO embeddings (key, embedding, size, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET embedding = excluded.embedding, "
+                "size = excluded.size, last_used = excluded.last_used",
+                rows,
+            )
+            self._evict(connection=connection)
+            connection.commit()
+
+    def clear(self) -> None:
+        """Remove all embeddings and reset the counters."""
+        with self._lock:
+            connection = self._connect()
+            if connection is not None:
+                connection.execute("DELETE FROM embeddings")
+                connection.commit()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+        with self._lock:
+            num_entries, size_bytes = 0, 0
+            connection = self._connect()
+            if connection is not None:
+                (num_entries,) = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+                size_bytes = _total_size(connection=connection)
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=num_entries,
+                size_bytes=size_bytes,
+            )
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used embeddings beyond the bound. Requires the lock.
+
+        Only scans the embeddings if their total size exceeds the bound.
+        """
+        size_bytes = _total_size(connection=connection)
+        if size_bytes <= self._max_bytes:
+            return
+        evicted: list[str] = []
+        # The rowid breaks ties between entries used at the same time in insertion order.
+        rows = connection.execute("SELECT key, size FROM embeddings ORDER BY last_used, rowid")
+        for key, size in rows:
+            if size_bytes <= self._max_bytes:
+                break
+            evicted.append(key)
+            size_bytes -= size
+        for key_batch in batching.batched(items=evicted, batch_size=_SQL_BATCH_SIZE):
+            placeholders = ",".join("?" * len(key_batch))
+            connection.execute(
+                f"DELETE FROM embeddings WHERE key IN ({placeholders})",
+                key_batch,
+            )
+        self._evictions += len(evicted)
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Return the connection, opening the database on first use. Requires the lock.
+
+        Returns:
+            The connection, or None if the database cannot be opened. The cache then
+            behaves as if it was empty.
+        """
+        if self._connection is None:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self._path, check_same_thread=False, timeout=30)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, "
+                    "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+                )
+                _create_size_total(connection=connection)
+                connection.commit()
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Could not open the embedding cache %s: %s", self._path, exc)
+                return None
+            self._connection = connection
+        return self._connection
+
+
+def _create_size_total(connection: sqlite3.Connection) -> None:
+    """Create the total size of the embeddings and the triggers keeping it up to date."""
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+    )
+    # Scans the embeddings once, only if the total does not exist yet.
+    connection.execute(
+        "INSERT OR IGNORE INTO totals (name, value) "
+        "SELECT 'size', COALESCE(SUM(size), 0) FROM embeddings"
+    )
+    connection.execute(
+        "CREATE TRIGGER IF NOT EXISTS embeddings_size_insert AFTER INSERT ON embeddings "
+        "BEGIN UPDATE totals SET value = value + NEW.size WHERE name = 'size'; END"
+    )
+    connection.execute(
+        "CREATE TRIGGER IF NOT EXISTS embeddings_size_update AFTER UPDATE OF size ON embeddings "
+        "BEGIN UPDATE totals SET value = value - OLD.size + NEW.size WHERE name = 'size'; END"
+    )
+    connection.execute(
+        "CREATE TRIGGER IF NOT EXISTS embeddings_size_delete AFTER DELETE ON embeddings "
+        "BEGIN UPDATE totals SET value = value - OLD.size WHERE name = 'size'; END"
+    )
+
+
+def _total_size(connection: sqlite3.Connection) -> int:
+    """Return the total size in bytes of the cached embeddings."""
+    (size_bytes,) = connection.execute("SELECT value FROM totals WHERE name = 'size'").fetchone()
+    return int(size_bytes)
+
+
+def embedding_key(
+    content_hash: str,
+    embedding_model_hash: str,
+    crop: tuple[int, int, int, int] | None = None,
+) -> str:
+    """Return the cache key of the embedding of a file, or of a crop ``(x, y, width, height)``."""
+    parts = (_FORMAT_VERSION, content_hash, embedding_model_hash, crop)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def hash_files(filepaths: Sequence[str]) -> dict[str, str | None]:
+    """Return the content hash of each file, reading the files concurrently.
+
+    Args:
+        filepaths: ``fsspec``-compatible paths of the files. Each file is read once.
+
+    Returns:
+        The hash by file path, None for a file that cannot be read. Such files are
+        not cached; embedding them reports them as broken or missing as usual.
+    """
+    unique_filepaths = list(dict.fromkeys(filepaths))
+    hashes = parallelize.thread_imap_lazy(
+        function=_hash_file,
+        iterable=unique_filepaths,
+        max_workers=_HASH_WORKERS,
+    )
+    return dict(zip(unique_filepaths, hashes))
+
+
+def file_keys(filepaths: Sequence[str], embedding_model_hash: str) -> list[str | None]:
+    """Return the cache key of the embedding of each file, None for an unreadable file."""
+    content_hashes = hash_files(filepaths=filepaths)
+    return [
+        _key_or_none(
+            content_hash=content_hashes[filepath], embedding_model_hash=embedding_model_hash
+        )
+        for filepath in filepaths
+    ]
+
+
+def crop_keys(image_crops: Sequence[ImageCrop], embedding_model_hash: str) -> list[str | None]:
+    """Return the cache key of the embedding of each crop, None if its file is unreadable.
+
+    Each source file is hashed once, however many crops it has.
+    """
+    content_hashes = hash_files(filepaths=[image_crop.filepath for image_crop in image_crops])
+    return [
+        _key_or_none(
+            content_hash=content_hashes[image_crop.filepath],
+            embedding_model_hash=embedding_model_hash,
+            crop=(image_crop.x, image_crop.y, image_crop.width, image_crop.height),
+        )
+        for image_crop in image_crops
+    ]
+
+
+def embed_with_cache(
+    keys: Sequence[str | None],
+    embed: Callable[[list[int]], EmbeddingResult],
+    cache: EmbeddingCache,
+) -> EmbeddingResult:
+    """Embed items, taking the embeddings of cached items from ``cache``.
+
+    Args:
+        keys: The cache key of each item, None for an item that cannot be cached.
+        embed: Embeds the items at the given indices. The ``kept_indices`` of its result
+            are positions in the list of given indices.
+        cache: The cache to look up and to store the new embeddings in.
+
+    Returns:
+        An ``EmbeddingResult`` over all items, as if ``embed`` had embedded all of them.
+
+    Raises:
+        AllInputFilesFailedError: If nothing was cached and ``embed`` raised it.
+    """
+    if not cache.enabled:
+        return embed(list(range(len(keys))))
+
+    cacheable = [index for index, key in enumerate(keys) if key is not None]
+    cached = cache.get_many([keys[index] or "" for index in cacheable])
+    rows: dict[int, NDArray[np.float32]] = {
+        index: embedding for index, embedding in zip(cacheable, cached) if embedding is not None
+    }
+    miss_indices = [index for index in range(len(keys)) if index not in rows]
+    if not miss_indices:
+        return _assemble(rows=rows, embedding_dimension=None)
+
+    try:
+        result = embed(miss_indices)
+    except AllInputFilesFailedError:
+        # Only the uncached files failed; the cached ones still have their embeddings.
+        if not rows:
+            raise
+        return _assemble(rows=rows, embedding_dimension=None)
+
+    new_entries: list[tuple[str, NDArray[np.float32]]] = []
+    for row, position in enumerate(result.kept_indices):
+        index = miss_indices[position]
+        rows[index] = result.embeddings[row]
+        key = keys[index]
+        if key is not None:
+            new_entries.append((key, result.embeddings[row]))
+    cache.put_many(new_entries)
+    return _assemble(rows=rows, embedding_dimension=result.embeddings.shape[1])
+
+
+def _assemble(
+    rows: dict[int, NDArray[np.float32]], embedding_dimension: int | None
+) -> EmbeddingResult:
+    """Return the result holding the embedding of each item in ``rows``, in input order."""
+    kept_indices = sorted(rows)
+    if not kept_indices:
+        return EmbeddingResult(
+            embeddings=np.empty((0, embedding_dimension or 0), dtype=np.float32),
+            kept_indices=[],
+        )
+    embeddings = np.stack([rows[index] for index in kept_indices]).astype(np.float32)
+    return EmbeddingResult(embeddings=embeddings, kept_indices=kept_indices)
+
+
+def _key_or_none(
+    content_hash: str | None,
+    embedding_model_hash: str,
+    crop: tuple[int, int, int, int] | None = None,
+) -> str | None:
+    """Return ``embedding_key`` of a content hash, or None if the content is unknown."""
+    if content_hash is None:
+        return None
+    return embedding_key(
+        content_hash=content_hash, embedding_model_hash=embedding_model_hash, crop=crop
+    )
+
+
+def _hash_file(filepath: str) -> str | None:
+    """Return the content hash of the file at ``filepath``, None if it cannot be read."""
+    try:
+        return file_utils.get_file_xxhash(filepath)
+    except OSError:
+        return None
+
+
+embedding_cache = EmbeddingCache(
+    path=env.LIGHTLY_STUDIO_EMBEDDING_CACHE_PATH,
+    max_bytes=env.LIGHTLY_STUDIO_EMBEDDING_CACHE_MAX_BYTES,
+)
@@ -57,6 +57,9 @@ class EmbeddingGenerator(Protocol):
     To provide custom embeddings, implement one of the protocols below (``ImageEmbeddingGenerator``
     and/or ``VideoEmbeddingGenerator``) and register it with ``set_default_embedding_model``
     before you add a dataset or start the GUI.
+
+    A generator may also implement ``embed_texts(texts: list[str]) -> list[list[float]]`` to
+    embed several texts in one call; otherwise ``embed_text`` is called for each text.
     """
 
     def get_embedding_model_input(self, collection_id: UUID) -> EmbeddingModelCreate:
@@ -217,6 +220,10 @@ class RandomEmbeddingGenerator(ImageEmbeddingGenerator, VideoEmbeddingGenerator)
         """Generate a random embedding for a text sample."""
         return [random.random() for _ in range(self._dimension)]
 
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Generate random embeddings for multiple text samples."""
+        return [self.embed_text(text) for text in texts]
+
     def embed_images(self, filepaths: list[str], show_progress: bool = True) -> EmbeddingResult:
         """Generate random embeddings for multiple image samples."""
         _ = show_progress  # Not used for random embeddings.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
 from uuid import UUID
@@ -12,12 +13,15 @@ from PIL import Image
 from sqlmodel import Session
 from tqdm import tqdm
 
-from lightly_studio.dataset import env
+from lightly_studio.core.file_outcome_report import AllInputFilesFailedError
+from lightly_studio.dataset import embedding_cache, env, text_embedding_cache
 from lightly_studio.dataset.embedding_generator import (
     EmbeddingGenerator,
+    ImageCrop,
     ImageEmbeddingGenerator,
     VideoEmbeddingGenerator,
 )
+from lightly_studio.dataset.embedding_result import EmbeddingResult
 from lightly_studio.models.collection import SampleType
 from lightly_studio.models.embedding_model import EmbeddingModelTable
 from lightly_studio.models.sample_embedding import SampleEmbeddingCreate
@@ -30,6 +34,7 @@ from lightly_studio.resolvers import (
     video_resolver,
 )
 from lightly_studio.utils import batching
+from lightly_studio.utils.cache_stats import CacheStats
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,10 @@ logger = logging.getLogger(__name__)
 # round-trips but higher peak memory. 1024 balances the two.
 EMBEDDING_INSERTION_BATCH_SIZE = 1024
 
+# Number of images embedded and committed per chunk in embed_images. Bounds peak memory
+# and the work lost when a run is interrupted.
+IMAGE_EMBED_BATCH_SIZE = 2048
+
 # Number of annotation crops processed per chunk in embed_annotations.
 ANNOTATION_EMBED_BATCH_SIZE = 2048
 # Mapping of sample types to the generator type used for embedding generation.
@@ -106,6 +115,11 @@ class EmbeddingManager:
         # Keyed by generator sample type (IMAGE or VIDEO) and consulted before
         # loading a generator from the environment.
         self._override_generators: dict[SampleType, EmbeddingGenerator] = {}
+        # Hashes of the registered models, which key their entries in the embedding cache.
+        self._model_hashes: dict[UUID, str] = {}
+        self._text_embedding_cache = text_embedding_cache.TextEmbeddingCache(
+            max_entries=env.LIGHTLY_STUDIO_TEXT_EMBEDDING_CACHE_MAX_ENTRIES
+        )
 
     def set_default_embedding_model(self, embedding_generator: EmbeddingGenerator) -> None:
         """Register a generator that overrides the env-var default for all collections.
@@ -171,6 +185,7 @@ class EmbeddingManager:
 
         # Store the model in our dictionary
         self._models[model_id] = embedding_generator
+        self._model_hashes[model_id] = db_model.embedding_model_hash
 
         # Set as default if requested or if it's the first model
         if set_as_default or collection_id not in self._collection_id_to_default_model_id:
@@ -181,6 +196,8 @@ class EmbeddingManager:
     def embed_text(self, collection_id: UUID, text_query: TextEmbedQuery) -> list[float]:
         """Generate an embedding for a text sample.
 
+        Embeddings of recent texts are cached, see ``embed_texts``.
+
         Args:
             collection_id: The ID of the collection to determine the registered default model.
                 It is used if embedding_model_id is not valid.
@@ -189,13 +206,59 @@ class EmbeddingManager:
         Returns:
             A list of floats representing the generated embedding.
         """
+        return self.embed_texts(
+            collection_id=collection_id,
+            texts=[text_query.text],
+            embedding_model_id=text_query.embedding_model_id,
+        )[0]
+
+    def embed_texts(
+        self,
+        collection_id: UUID,
+        texts: list[str],
+        embedding_model_id: UUID | None = None,
+    ) -> list[list[float]]:
+        """Generate embeddings for several text samples, e.g. the prompts of a classification.
+
+        Texts are embedded without leading, trailing and repeated whitespace. Embeddings of
+        recent texts are taken from an in-memory cache keyed by the model and the text;
+        the others are embedded in a single call to the model if it implements
+        ``embed_texts``, and one by one with ``embed_text`` otherwise.
+
+        Args:
+            collection_id: The ID of the collection to determine the registered default model.
+                It is used if embedding_model_id is not valid.
+            texts: The texts to embed.
+            embedding_model_id: ID of the model to use. Uses default if None.
+
+        Returns:
+            The embedding of each text, in the order of the input texts.
+        """
         model_id = self._get_default_or_validate(
-            collection_id=collection_id, embedding_model_id=text_query.embedding_model_id
+            collection_id=collection_id, embedding_model_id=embedding_model_id
         )
-
         model = self._models[model_id]
 
-        return model.embed_text(text_query.text)
+        normalized_texts = [text_embedding_cache.normalize_text(text) for text in texts]
+        embeddings: dict[str, list[float]] = {}
+        for text in dict.fromkeys(normalized_texts):
+            embedding = self._text_embedding_cache.get(embedding_model_id=model_id, text=text)
+            if embedding is not None:
+                embeddings[text] = embedding
+        missing_texts = [text for text in dict.fromkeys(normalized_texts) if text not in embeddings]
+        if missing_texts:
+            for text, embedding in zip(
+                missing_texts, _embed_texts(model=model, texts=missing_texts)
+            ):
+                self._text_embedding_cache.put(
+                    embedding_model_id=model_id, text=text, embedding=embedding
+                )
+                embeddings[text] = embedding
+        return [list(embeddings[text]) for text in normalized_texts]
+
+    def text_embedding_cache_stats(self) -> CacheStats:
+        """Return the counters of the cache of text embeddings."""
+        return self._text_embedding_cache.stats()
 
     def embed_images(
         self,
@@ -206,6 +269,11 @@ class EmbeddingManager:
     ) -> None:
         """Generate and store embeddings for image samples.
 
+        Images are embedded in chunks of ``IMAGE_EMBED_BATCH_SIZE`` and each chunk is
+        committed before the next one starts. Peak memory does not grow with the number of
+        samples, and an interrupted run keeps the embeddings of its finished chunks; pass
+        the IDs from ``image_resolver.get_unembedded_image_ids`` to continue it.
+
         Args:
             session: Database session for resolver operations.
             collection_id: The ID of the collection to determine the registered default model.
@@ -216,34 +284,40 @@ class EmbeddingManager:
         Raises:
             ValueError: If no embedding model is registered, provided model
             ID doesn't exist or if the embedding model does not support images.
+            AllInputFilesFailedError: Only if every chunk failed because all of its files
+                were broken. A chunk whose files are all broken is skipped otherwise, and
+                the embeddings of the other chunks are kept.
         """
         model_id = self._get_default_or_validate(
             collection_id=collection_id, embedding_model_id=embedding_model_id
         )
         model = self._get_image_model(model_id)
 
-        # Query image filenames from the database.
-        sample_id_to_filepath = {
-            sample.sample_id: sample.file_path_abs
-            for sample in image_resolver.get_many_by_id(
-                session=session,
-                sample_ids=sample_ids,
-            )
-        }
-
-        # Extract filepaths in the same order as sample_ids.
-        filepaths = [sample_id_to_filepath[sample_id] for sample_id in sample_ids]
-
-        # Generate embeddings for the samples.
-        result = model.embed_images(filepaths=filepaths)
-        kept_sample_ids = [sample_ids[index] for index in result.kept_indices]
-
-        _store_embeddings(
-            session=session,
-            model_id=model_id,
-            sample_ids=kept_sample_ids,
-            embeddings=result.embeddings,
-        )
+        # A chunk whose files are all broken raises; the run only fails if every chunk did.
+        all_failed_error: AllInputFilesFailedError | None = None
+        num_embedded = 0
+        with tqdm(
+            total=len(sample_ids),
+            desc="Generating embeddings",
+            unit=" images",
+        ) as progress:
+            for sample_id_chunk in batching.batched(
+                items=sample_ids, batch_size=IMAGE_EMBED_BATCH_SIZE
+            ):
+                try:
+                    num_embedded += _embed_image_chunk(
+                        session=session,
+                        model=model,
+                        model_id=model_id,
+                        model_hash=self._model_hashes[model_id],
+                        sample_ids=sample_id_chunk,
+                    )
+                except AllInputFilesFailedError as error:
+                    all_failed_error = error
+                progress.update(len(sample_id_chunk))
+
+        if num_embedded == 0 and all_failed_error is not None:
+            raise all_failed_error
 
     def embed_annotations(
         self,
@@ -292,9 +366,19 @@ class EmbeddingManager:
                 if not annotation_crops:
                     continue
 
-                result = model.embed_image_crops(
-                    image_crops=[crop.image_crop for crop in annotation_crops],
-                    show_progress=False,
+                image_crops = [crop.image_crop for crop in annotation_crops]
+                cache = embedding_cache.embedding_cache
+                result = embedding_cache.embed_with_cache(
+                    keys=(
+                        embedding_cache.crop_keys(
+                            image_crops=image_crops,
+                            embedding_model_hash=self._model_hashes[model_id],
+                        )
+                        if cache.enabled
+                        else [None] * len(image_crops)
+                    ),
+                    embed=functools.partial(_embed_image_crops_at, model, image_crops),
+                    cache=cache,
                 )
                 sample_ids = [crop.annotation_sample_id for crop in annotation_crops]
                 kept_sample_ids = [sample_ids[index] for index in result.kept_indices]
@@ -390,13 +474,14 @@ class EmbeddingManager:
             embeddings=result.embeddings,
         )
 
-    def embed_and_store_pil_images(
+    def embed_and_store_pil_images(  # noqa: PLR0913
         self,
         session: Session,
         embedding_model_id: UUID,
         sample_ids: list[UUID],
         images: list[Image.Image],
         show_progress: bool = True,
+        content_hashes: list[str] | None = None,
     ) -> None:
         """Generate and store embeddings for in-memory PIL images.
 
@@ -406,6 +491,10 @@ class EmbeddingManager:
             sample_ids: Sample IDs the embeddings are stored for.
             images: PIL images to embed, in the same order as sample_ids.
             show_progress: Whether to show a progress bar during embedding and storage.
+            content_hashes: Content hashes of the files the images were decoded from, in
+                the same order as sample_ids (see ``file_utils.get_bytes_xxhash``). If
+                given, images whose embedding is in the embedding cache are not embedded
+                again.
 
         Raises:
             ValueError: If the model is missing, does not support image embedding, or
@@ -418,7 +507,27 @@ class EmbeddingManager:
             )
 
         model = self._get_image_model(embedding_model_id)
-        embeddings = model.embed_pil_images(images=images, show_progress=show_progress)
+        model_hash = self._model_hashes[embedding_model_id]
+        result = embedding_cache.embed_with_cache(
+            keys=(
+                [
+                    embedding_cache.embedding_key(
+                        content_hash=content_hash, embedding_model_hash=model_hash
+                    )
+                    for content_hash in content_hashes
+                ]
+                if content_hashes is not None
+                else [None] * len(images)
+            ),
+            embed=lambda indices: EmbeddingResult(
+                embeddings=model.embed_pil_images(
+                    images=[images[index] for index in indices], show_progress=show_progress
+                ),
+                kept_indices=list(range(len(indices))),
+            ),
+            cache=embedding_cache.embedding_cache,
+        )
+        embeddings = result.embeddings
         _store_embeddings(
             session=session,
             model_id=embedding_model_id,
@@ -515,6 +624,80 @@ class EmbeddingManager:
         return model
 
 
+def _embed_texts(model: EmbeddingGenerator, texts: list[str]) -> list[list[float]]:
+    """Embed texts in one call if the model implements ``embed_texts``, else one by one.
+
+    ``embed_texts`` is optional so that custom generators only need ``embed_text``.
+    """
+    embed_texts = getattr(model, "embed_texts", None)
+    if embed_texts is None:
+        return [model.embed_text(text) for text in texts]
+    embeddings: list[list[float]] = embed_texts(texts)
+    return embeddings
+
+
+def _embed_image_chunk(
+    session: Session,
+    model: ImageEmbeddingGenerator,
+    model_id: UUID,
+    model_hash: str,
+    sample_ids: list[UUID],
+) -> int:
+    """Embed a chunk of image samples and commit their embeddings.
+
+    Files whose embedding is in the embedding cache are not embedded again.
+
+    Returns:
+        The number of stored embeddings. Samples whose files are broken are skipped.
+
+    Raises:
+        AllInputFilesFailedError: If every file of the chunk is broken.
+    """
+    # Query image filenames from the database.
+    sample_id_to_filepath = {
+        sample.sample_id: sample.file_path_abs
+        for sample in image_resolver.get_many_by_id(
+            session=session,
+            sample_ids=sample_ids,
+        )
+    }
+
+    # Extract filepaths in the same order as sample_ids.
+    filepaths = [sample_id_to_filepath[sample_id] for sample_id in sample_ids]
+
+    cache = embedding_cache.embedding_cache
+    result = embedding_cache.embed_with_cache(
+        keys=(
+            embedding_cache.file_keys(filepaths=filepaths, embedding_model_hash=model_hash)
+            if cache.enabled
+            else [None] * len(filepaths)
+        ),
+        embed=lambda indices: model.embed_images(
+            filepaths=[filepaths[index] for index in indices], show_progress=False
+        ),
+        cache=cache,
+    )
+    kept_sample_ids = [sample_ids[index] for index in result.kept_indices]
+
+    _store_embeddings(
+        session=session,
+        model_id=model_id,
+        sample_ids=kept_sample_ids,
+        embeddings=result.embeddings,
+        show_progress=False,
+    )
+    return len(kept_sample_ids)
+
+
+def _embed_image_crops_at(
+    model: ImageEmbeddingGenerator, image_crops: list[ImageCrop], indices: list[int]
+) -> EmbeddingResult:
+    """Embed the crops at ``indices`` of ``image_crops``."""
+    return model.embed_image_crops(
+        image_crops=[image_crops[index] for index in indices], show_progress=False
+    )
+
+
 def _store_embeddings(
     session: Session,
     model_id: UUID,
@@ -524,8 +707,11 @@ def _store_embeddings(
 ) -> None:
     """Store embeddings in the database.
 
-    Insertion is batched to reduce peak memory. All batches are committed together
-    so a failure leaves no partially embedded dataset behind.
+    Insertion is batched to reduce peak memory. The batches of one call are committed
+    together, so a failure stores none of the given embeddings. ``embed_images`` calls
+    this once per chunk of ``IMAGE_EMBED_BATCH_SIZE`` images instead: an interrupted run
+    keeps the embeddings of its finished chunks and is resumed with the IDs from
+    ``image_resolver.get_unembedded_image_ids``.
     """
     with tqdm(
         total=len(sample_ids),
@@ -47,3 +47,72 @@ LIGHTLY_STUDIO_REQUEST_TIMING_ERROR_MS: int = env.int("LIGHTLY_STUDIO_REQUEST_TI
 LIGHTLY_STUDIO_REQUEST_TIMING_FAIL_ON_ERROR: bool = env.bool(
     "LIGHTLY_STUDIO_REQUEST_TIMING_FAIL_ON_ERROR", False
 )
+
+# Fraction of a collection's samples that may be added to or removed from its cached 2D
+# embedding projection before the projection is recomputed from scratch. Below it, new
+# samples are placed next to their nearest neighbours in the existing layout. Set to 0 to
+# always recompute.
+LIGHTLY_STUDIO_2D_EMBEDDING_MAX_DRIFT: float = env.float(
+    "LIGHTLY_STUDIO_2D_EMBEDDING_MAX_DRIFT", 0.1
+)
+
+# Upper bound in bytes of the serialized 2D embedding plots kept in memory, so that a repeated
+# view of the same plot with the same filter and coloring is served without recomputing it.
+# Set to 0 to disable the cache.
+LIGHTLY_STUDIO_EMBEDDINGS2D_CACHE_MAX_BYTES: int = env.int(
+    "LIGHTLY_STUDIO_EMBEDDINGS2D_CACHE_MAX_BYTES", 256 * 1024 * 1024
+)
+
+# Collections with at least this many embeddings of a model narrow similarity searches down
+# with an approximate nearest-neighbour index before ranking by exact distance; smaller ones
+# are ranked by a full scan. Set to 0 to always use the index.
+LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS: int = env.int("LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS", 100_000)
+
+# Grid queries that accept an estimated total count use the database planner's estimate once it
+# reaches this many rows, instead of counting them. Only PostgreSQL provides estimates.
+LIGHTLY_STUDIO_ESTIMATED_COUNT_MIN_ROWS: int = env.int(
+    "LIGHTLY_STUDIO_ESTIMATED_COUNT_MIN_ROWS", 1_000_000
+)
+
+# Directory of the on-disk cache of grid view thumbnails, and the upper bound in bytes of the
+# thumbnails kept there. Least recently used thumbnails are removed beyond it. Set the bound to
+# 0 to disable the cache.
+LIGHTLY_STUDIO_THUMBNAIL_CACHE_DIR: Path = env.path(
+    "LIGHTLY_STUDIO_THUMBNAIL_CACHE_DIR", LIGHTLY_STUDIO_MODEL_CACHE_DIR / "thumbnails"
+)
+LIGHTLY_STUDIO_THUMBNAIL_CACHE_MAX_BYTES: int = env.int(
+    "LIGHTLY_STUDIO_THUMBNAIL_CACHE_MAX_BYTES", 2 * 1024 * 1024 * 1024
+)
+
+# Directory of the thumbnail pyramids of images, and the upper bound in bytes of the pyramids
+# kept there. Pyramids are stored apart from the thumbnail cache, so that the thumbnails of
+# one browsing session do not evict the pyramids built when images were added. Least recently
+# used pyramids are removed beyond the bound. Set the bound to 0 to disable pyramids.
+LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_DIR: Path = env.path(
+    "LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_DIR", LIGHTLY_STUDIO_MODEL_CACHE_DIR / "thumbnail_pyramids"
+)
+LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_MAX_BYTES: int = env.int(
+    "LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_MAX_BYTES", 16 * 1024 * 1024 * 1024
+)
+
+# File of the on-disk cache of embeddings keyed by file content and model, and the upper bound
+# in bytes of the embeddings kept there. Least recently used embeddings are removed beyond it.
+# Disabled by default (bound 0): a lookup reads each file once more to hash its content.
+LIGHTLY_STUDIO_EMBEDDING_CACHE_PATH: Path = env.path(
+    "LIGHTLY_STUDIO_EMBEDDING_CACHE_PATH", LIGHTLY_STUDIO_MODEL_CACHE_DIR / "embeddings.sqlite"
+)
+LIGHTLY_STUDIO_EMBEDDING_CACHE_MAX_BYTES: int = env.int(
+    "LIGHTLY_STUDIO_EMBEDDING_CACHE_MAX_BYTES", 0
+)
+
+# Number of text query embeddings kept in memory, so that a repeated text search does not run
+# the text encoder again. Set to 0 to disable the cache.
+LIGHTLY_STUDIO_TEXT_EMBEDDING_CACHE_MAX_ENTRIES: int = env.int(
+    "LIGHTLY_STUDIO_TEXT_EMBEDDING_CACHE_MAX_ENTRIES", 1024
+)
+
+# Upper bound in bytes of the decoded video frames kept in memory, so that a frame requested
+# again, e.g. in another size, is not decoded again. Set to 0 to disable the cache.
+LIGHTLY_STUDIO_VIDEO_FRAME_CACHE_MAX_BYTES: int = env.int(
+    "LIGHTLY_STUDIO_VIDEO_FRAME_CACHE_MAX_BYTES", 256 * 1024 * 1024
+)
@@ -8,6 +8,7 @@ import shutil
 import tempfile
 from pathlib import Path
 
+import fsspec
 import requests
 import xxhash
 
@@ -48,19 +49,33 @@ def download_file_if_does_not_exist(url: str, local_filename: Path) -> None:
                 logger.warning(f"Failed to clean up temp file {tmp_path}: {e}")
 
 
-def get_file_xxhash(file_path: Path) -> str:
+def get_file_xxhash(file_path: Path | str) -> str:
     """Calculate the xxhash of a file.
 
     XXHash is a fast non-cryptographic hash function.
 
     Args:
-        file_path: Path to the file.
+        file_path: Path to the file. A string can also be an ``fsspec`` URI.
 
     Returns:
         The xxhash of the file as a string.
     """
     hasher = xxhash.xxh64()
-    with file_path.open("rb") as f:
-        while chunk := f.read(8192):
+    with fsspec.open(str(file_path), "rb") as f:
+        while chunk := f.read(1024 * 1024):
             hasher.update(chunk)
     return hasher.hexdigest()
+
+
+def get_bytes_xxhash(data: bytes) -> str:
+    """Calculate the xxhash of file content that is already in memory.
+
+    Equals ``get_file_xxhash`` of a file with this content.
+
+    Args:
+        data: The file content.
+
+    Returns:
+        The xxhash of the content as a string.
+    """
+    return xxhash.xxh64(data).hexdigest()
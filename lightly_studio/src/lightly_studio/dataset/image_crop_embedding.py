@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import fsspec
@@ -19,6 +20,7 @@ from lightly_studio.core.file_outcome_report import (
 from lightly_studio.dataset.embedding_generator import ImageCrop
 from lightly_studio.dataset.embedding_result import EmbeddingResult
 from lightly_studio.dataset.image_embedding import EmbeddingContext
+from lightly_studio.utils import parallelize, workers
 
 
 def embed_image_crops_batched(
@@ -32,6 +34,10 @@ def embed_image_crops_batched(
     unreadable/undecodable, all of its crops are skipped rather than aborting the whole
     run; the file is recorded once as broken.
 
+    Reading, decoding, cropping and preprocessing a file runs on a bounded thread pool, one
+    task per file, so images with many crops no longer keep a single core busy. Results are
+    consumed in file order; batching, inference and the report stay on the calling thread.
+
     Args:
         image_crops: Crop definitions to embed.
         context: Model-specific embedding configuration.
@@ -75,24 +81,24 @@ def embed_image_crops_batched(
         ) as progress_bar,
         torch.no_grad(),
     ):
-        for filepath, indexed_crops in crops_by_filepath.items():
-            try:
-                with fsspec.open(filepath, "rb") as file:
-                    image = Image.open(file).convert("RGB")
-            except BROKEN_IMAGE_ERRORS:
+        num_workers = workers.default_num_workers()
+        preprocessed_files = parallelize.thread_imap_lazy(
+            function=lambda file_crops: _preprocess_file_crops(
+                filepath=file_crops[0],
+                indexed_crops=file_crops[1],
+                preprocess=context.preprocess,
+            ),
+            iterable=crops_by_filepath.items(),
+            max_workers=num_workers,
+            # Files can hold many crops, so bound the read-ahead in files, not crops.
+            buffer_size=2 * num_workers,
+        )
+        for filepath, preprocessed_crops in zip(crops_by_filepath, preprocessed_files):
+            if preprocessed_crops is None:
                 report.record(path=filepath, outcome=FileOutcome.BROKEN)
                 continue
             report.record(path=filepath, outcome=FileOutcome.ADDED)
-            for index, image_crop in indexed_crops:
-                cropped = image.crop(
-                    (
-                        image_crop.x,
-                        image_crop.y,
-                        image_crop.x + image_crop.width,
-                        image_crop.y + image_crop.height,
-                    )
-                )
-                preprocessed = context.preprocess(cropped)
+            for index, preprocessed in preprocessed_crops:
                 if batch_buffer is None:
                     batch_buffer = torch.empty(
                         (context.max_batch_size, *preprocessed.shape),
@@ -126,6 +132,43 @@ def embed_image_crops_batched(
     return EmbeddingResult(embeddings=embeddings[kept_indices], kept_indices=kept_indices)
 
 
+def _preprocess_file_crops(
+    filepath: str,
+    indexed_crops: list[tuple[int, ImageCrop]],
+    preprocess: Callable[[Image.Image], torch.Tensor],
+) -> list[tuple[int, torch.Tensor]] | None:
+    """Open a file once and preprocess all of its crops.
+
+    Runs on a worker thread. A broken file is returned as ``None`` instead of raised, so
+    the caller records it and the other files are still embedded.
+
+    Returns:
+        The input index and the preprocessed tensor of each crop, or ``None`` if the file
+        is unreadable or undecodable.
+    """
+    try:
+        with fsspec.open(filepath, "rb") as file:
+            image = Image.open(file).convert("RGB")
+    except BROKEN_IMAGE_ERRORS:
+        return None
+    return [
+        (
+            index,
+            preprocess(
+                image.crop(
+                    (
+                        image_crop.x,
+                        image_crop.y,
+                        image_crop.x + image_crop.width,
+                        image_crop.y + image_crop.height,
+                    )
+                )
+            ),
+        )
+        for index, image_crop in indexed_crops
+    ]
+
+
 def _flush_crop_batch(
     batch_buffer: torch.Tensor | None,
     batch_indices: list[int],
@@ -78,12 +78,25 @@ class MobileCLIPEmbeddingGenerator(ImageEmbeddingGenerator):
         Returns:
             A list of floats representing the generated embedding.
         """
-        tokenized = self._tokenizer([text]).to(self._device)
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with MobileCLIP in a single forward pass.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            The embedding of each text, in the order of the input texts.
+        """
+        if not texts:
+            return []
+        tokenized = self._tokenizer(texts).to(self._device)
         with torch.no_grad():
-            embedding = self._model.encode_text(tokenized)[0]  # type: ignore[operator]
-            # Convert embedding to list of floats.
-            embedding_list: list[float] = embedding.cpu().numpy().flatten().tolist()
-        return embedding_list
+            embeddings = self._model.encode_text(tokenized)  # type: ignore[operator]
+            # Convert embeddings to lists of floats.
+            embedding_lists: list[list[float]] = embeddings.cpu().numpy().tolist()
+        return embedding_lists
 
     def embed_images(self, filepaths: list[str], show_progress: bool = True) -> EmbeddingResult:
         """Embed images with MobileCLIP.
@@ -88,12 +88,25 @@ class PerceptionEncoderEmbeddingGenerator(ImageEmbeddingGenerator, VideoEmbeddin
         Returns:
             A list of floats representing the generated embedding.
         """
-        tokenized = self._tokenizer([text]).to(self._device)
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with Perception Encoder in a single forward pass.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            The embedding of each text, in the order of the input texts.
+        """
+        if not texts:
+            return []
+        tokenized = self._tokenizer(texts).to(self._device)
         with torch.no_grad():
-            embedding = self._model.encode_text(tokenized, normalize=True)[0]
-            # Convert embedding to list of floats.
-            embedding_list: list[float] = embedding.cpu().numpy().flatten().tolist()
-        return embedding_list
+            embeddings = self._model.encode_text(tokenized, normalize=True)
+            # Convert embeddings to lists of floats.
+            embedding_lists: list[list[float]] = embeddings.cpu().numpy().tolist()
+        return embedding_lists
 
     def embed_images(self, filepaths: list[str], show_progress: bool = True) -> EmbeddingResult:
         """Embed images with Perception Encoder.
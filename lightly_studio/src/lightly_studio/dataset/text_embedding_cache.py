@@ -0,0 +1,86 @@
+"""In-memory cache of text query embeddings.
+
+Text search embeds the query of every request, and the same queries recur as the user edits
+and repeats searches. Entries are keyed by the embedding model ID and the normalized text, so
+texts differing only in surrounding or repeated whitespace share their embedding.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from uuid import UUID
+
+from lightly_studio.utils.cache_stats import CacheStats
+
+# Embedding values are reported as Python floats of 8 bytes each.
+_BYTES_PER_VALUE = 8
+
+
+class TextEmbeddingCache:
+    """Thread-safe LRU cache of text embeddings, bounded by the number of entries.
+
+    A bound of 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Create an empty cache holding at most ``max_entries`` embeddings."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[UUID, str], tuple[float, ...]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, embedding_model_id: UUID, text: str) -> list[float] | None:
+        """Return the embedding cached for a normalized text and mark it as recently used."""
+        key = (embedding_model_id, text)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(embedding)
+
+    def put(self, embedding_model_id: UUID, text: str, embedding: list[float]) -> None:
+        """Cache the embedding of a normalized text, evicting the least recently used one."""
+        if self._max_entries <= 0:
+            return
+        key = (embedding_model_id, text)
+        with self._lock:
+            self._entries[key] = tuple(embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all embeddings and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=sum(
+                    len(embedding) * _BYTES_PER_VALUE for embedding in self._entries.values()
+                ),
+            )
+
+
+def normalize_text(text: str) -> str:
+    """Return ``text`` without leading, trailing and repeated whitespace.
+
+    The text is not lowercased, since a custom text encoder may be case sensitive.
+    """
+    return " ".join(text.split())
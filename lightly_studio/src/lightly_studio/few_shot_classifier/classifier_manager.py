@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import copy
 import io
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from random import sample
 from uuid import UUID, uuid4
 
+import numpy as np
 from sqlmodel import Session
 
 from lightly_studio.few_shot_classifier import random_forest_classifier
@@ -28,6 +29,7 @@ from lightly_studio.models.annotation_label import (
     AnnotationLabelCreate,
 )
 from lightly_studio.models.classifier import EmbeddingClassifier
+from lightly_studio.models.collection import SampleType
 from lightly_studio.models.image import ImageTable
 from lightly_studio.resolvers import (
     annotation_label_resolver,
@@ -37,6 +39,7 @@ from lightly_studio.resolvers import (
     image_resolver,
     sample_embedding_resolver,
 )
+from lightly_studio.utils import batching
 
 HIGH_CONFIDENCE_THRESHOLD = 0.5
 LOW_CONFIDENCE_THRESHOLD = 0.5
@@ -401,28 +404,26 @@ class ClassifierManager:
                 f"{classifier.few_shot_classifier.embedding_model_hash}'"
             )
 
-        # Create list of SampleEmbedding objects to track sample IDs
-        sample_embeddings = sample_embedding_resolver.get_all_by_collection_id(
+        sample_embeddings = sample_embedding_resolver.get_matrix_by_collection_id(
             session=session,
             collection_id=collection_id,
             embedding_model_id=embedding_model.embedding_model_id,
         )
 
-        # Get predictions for all embeddings.
-        embeddings = [se.embedding for se in sample_embeddings]
-        predictions = classifier.few_shot_classifier.predict(embeddings)
+        # Get predictions for all embeddings. The rows are views into the matrix.
+        predictions = classifier.few_shot_classifier.predict(list(sample_embeddings.embeddings))
 
         # Group samples by prediction confidence.
         high_conf = []  # > 0.5
         low_conf = []  # <= 0.5
 
-        for sample_embedding, pred in zip(sample_embeddings, predictions):
-            if sample_embedding.sample_id in used_samples:
+        for sample_id, pred in zip(sample_embeddings.sample_ids, predictions):
+            if sample_id in used_samples:
                 continue
             if pred[0] > HIGH_CONFIDENCE_THRESHOLD:
-                high_conf.append(sample_embedding.sample_id)
+                high_conf.append(sample_id)
             elif pred[0] <= LOW_CONFIDENCE_THRESHOLD:
-                low_conf.append(sample_embedding.sample_id)
+                low_conf.append(sample_id)
 
         return {
             classifier.few_shot_classifier.classes[0]: sample(
@@ -433,13 +434,29 @@ class ClassifierManager:
             ),
         }
 
-    def run_classifier(self, session: Session, classifier_id: UUID, collection_id: UUID) -> None:
+    def run_classifier(
+        self,
+        session: Session,
+        classifier_id: UUID,
+        collection_id: UUID,
+        batch_size: int = batching.DEFAULT_BATCH_SIZE,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
         """Run the classifier on the collection.
 
+        Embeddings are read, classified and written as annotations in batches, so peak
+        memory is bounded by ``batch_size`` rather than by the size of the collection. The
+        previous annotations of the classifier are replaced in a single transaction, which
+        is rolled back if any batch fails. On DuckDB, evaluation metrics referencing the
+        previous annotations are deleted and committed before that transaction starts.
+
         Args:
             session: Database session for resolver operations.
             classifier_id: The ID of the classifier to run.
             collection_id: The ID of the collection to run the classifier on.
+            batch_size: Number of samples classified at once.
+            progress_callback: Called after each batch with the number of classified
+                samples and the total number of samples to classify.
 
         Raises:
             ValueError: If the classifier with the given ID does not exist
@@ -464,53 +481,77 @@ class ClassifierManager:
                 f"{classifier.few_shot_classifier.embedding_model_hash}'"
             )
 
-        # Create list of SampleEmbedding objects to track sample IDs
-        sample_embeddings = sample_embedding_resolver.get_all_by_collection_id(
+        num_samples = sample_embedding_resolver.get_embedding_count(
             session=session,
             collection_id=collection_id,
             embedding_model_id=embedding_model.embedding_model_id,
         )
-
-        # Extract just the embeddings for prediction
-        embeddings = [se.embedding for se in sample_embeddings]
-        predictions = classifier.few_shot_classifier.predict(embeddings)
-        if len(predictions):
-            _create_annotation_labels_for_classifier(
-                session=session,
-                collection_id=collection_id,
-                classifier=classifier,
-            )
-        else:
+        if num_samples == 0:
             raise ValueError(f"Predict returned empty list for classifier:'{classifier_id}'")
-        # Check if annotation labels are available
-        if not classifier.annotation_label_ids:
-            raise ValueError(f"Classifier with ID '{classifier_id}' has no annotation labels")
-
-        # For each prediction add a classification annotation for the
-        # sample or update an existing one.
-        classification_annotations = []
-        for sample_embedding, prediction in zip(sample_embeddings, predictions):
-            max_index = prediction.index(max(prediction))
-            classification_annotations.append(
-                AnnotationCreate(
-                    parent_sample_id=sample_embedding.sample_id,
-                    annotation_label_id=classifier.annotation_label_ids[max_index],
-                    annotation_type=AnnotationType.CLASSIFICATION,
-                    confidence=prediction[max_index],
-                )
-            )
-        #  Clear previous annotations by this classifier
-        annotation_resolver.delete_annotations(
+        _create_annotation_labels_for_classifier(
             session=session,
-            annotation_label_ids=classifier.annotation_label_ids,
+            collection_id=collection_id,
+            classifier=classifier,
         )
-        annotation_resolver.create_many(
+        # Check if annotation labels are available
+        annotation_label_ids = classifier.annotation_label_ids
+        if not annotation_label_ids:
+            raise ValueError(f"Classifier with ID '{classifier_id}' has no annotation labels")
+        # Creating the annotation collection commits, so it is created before the
+        # transaction that replaces the annotations.
+        collection_resolver.get_or_create_child_collection(
             session=session,
-            parent_collection_id=collection_id,
-            annotations=classification_annotations,
-            collection_name=classifier.few_shot_classifier.name,
+            collection_id=collection_id,
+            sample_type=SampleType.ANNOTATION,
+            name=classifier.few_shot_classifier.name,
         )
 
+        try:
+            #  Clear previous annotations by this classifier
+            annotation_resolver.delete_annotations(
+                session=session,
+                annotation_label_ids=annotation_label_ids,
+                commit=False,
+            )
+            num_classified = 0
+            for sample_embeddings in sample_embedding_resolver.iter_batches_by_collection_id(
+                session=session,
+                collection_id=collection_id,
+                embedding_model_id=embedding_model.embedding_model_id,
+                batch_size=batch_size,
+            ):
+                predictions = np.asarray(
+                    classifier.few_shot_classifier.predict(
+                        [sample_embedding.embedding for sample_embedding in sample_embeddings]
+                    )
+                )
+                max_indices = predictions.argmax(axis=1)
+                # Add a classification annotation for each sample.
+                annotation_resolver.create_many(
+                    session=session,
+                    parent_collection_id=collection_id,
+                    annotations=[
+                        AnnotationCreate(
+                            parent_sample_id=sample_embedding.sample_id,
+                            annotation_label_id=annotation_label_ids[max_index],
+                            annotation_type=AnnotationType.CLASSIFICATION,
+                            confidence=float(prediction[max_index]),
+                        )
+                        for sample_embedding, prediction, max_index in zip(
+                            sample_embeddings, predictions, max_indices
+                        )
+                    ],
+                    collection_name=classifier.few_shot_classifier.name,
+                    commit=False,
+                )
+                num_classified += len(sample_embeddings)
+                if progress_callback is not None:
+                    progress_callback(num_classified, num_samples)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
     def get_all_classifiers(self, collection_id: UUID) -> list[EmbeddingClassifier]:
         """Get all active classifiers for a given collection.
 
@@ -11,6 +11,7 @@ from pathlib import Path
 
 import numpy as np
 import sklearn  # type: ignore[import-untyped]
+from numpy.typing import NDArray
 from sklearn.ensemble import (  # type: ignore[import-untyped]
     RandomForestClassifier,
 )
@@ -386,23 +387,134 @@ def predict_with_lightly_random_forest(
         ValueError: If the provided embeddings have different size than
             expected.
     """
-    expected_dim = model.metadata.num_input_features
-    all_probs: list[list[float]] = []
+    probabilities: list[list[float]] = (
+        compile_random_forest(model=model).predict(embeddings=embeddings).tolist()
+    )
+    return probabilities
+
+
+@dataclass(frozen=True)
+class CompiledRandomForest:
+    """A RandomForestExport compiled into flat arrays for batched prediction.
+
+    The inner nodes and the leaves of all trees are concatenated. A child or root
+    index ``i >= 0`` refers to inner node ``i``, and ``i < 0`` to leaf ``-i - 1``.
+    """
+
+    num_input_features: int
+    # Per inner node: the compared feature, the threshold and the two children.
+    feature_indices: NDArray[np.intp]
+    thresholds: NDArray[np.float64]
+    left_children: NDArray[np.int64]
+    right_children: NDArray[np.int64]
+    # Per leaf: the class probabilities, shape (num_leaves, num_classes).
+    leaf_probabilities: NDArray[np.float64]
+    # Per tree: the root node.
+    roots: NDArray[np.int64]
+
+    def predict(
+        self, embeddings: Sequence[Embedding] | NDArray[np.float32], batch_size: int = 4096
+    ) -> NDArray[np.float64]:
+        """Predicts the class probabilities of a batch of embeddings.
+
+        All trees descend one level per step for all embeddings of a batch at once.
+
+        Args:
+            embeddings: The embeddings, one per sample.
+            batch_size: Number of embeddings evaluated at once. Bounds the memory of the
+                per-tree node positions.
 
-    for embedding in embeddings:
-        if len(embedding) != expected_dim:
+        Returns:
+            The probabilities averaged over the trees, shape (num_embeddings, num_classes).
+
+        Raises:
+            ValueError: If the provided embeddings have different size than
+                expected.
+        """
+        num_classes = self.leaf_probabilities.shape[1]
+        if len(embeddings) == 0:
+            return np.zeros((0, num_classes), dtype=np.float64)
+        try:
+            embeddings_np = np.asarray(embeddings, dtype=np.float32)
+        except ValueError as e:
             raise ValueError(
-                f"Embedding has wrong dimensionality: expected {expected_dim},got {len(embedding)}"
+                f"Embedding has wrong dimensionality: expected {self.num_input_features}"
+            ) from e
+        if embeddings_np.ndim != 2 or embeddings_np.shape[1] != self.num_input_features:  # noqa: PLR2004
+            raise ValueError(
+                f"Embedding has wrong dimensionality: expected {self.num_input_features},"
+                f"got {embeddings_np.shape[-1]}"
             )
 
-        tree_probs: list[list[float]] = [
-            _predict_tree_probs(tree, embedding) for tree in model.trees
-        ]
+        probabilities = np.empty((len(embeddings_np), num_classes), dtype=np.float64)
+        for start in range(0, len(embeddings_np), batch_size):
+            batch = embeddings_np[start : start + batch_size]
+            probabilities[start : start + len(batch)] = self._predict_batch(batch=batch)
+        return probabilities
+
+    def _predict_batch(self, batch: NDArray[np.float32]) -> NDArray[np.float64]:
+        num_trees = len(self.roots)
+        # Node of every (embedding, tree) pair, descended until all are leaves.
+        nodes = np.tile(self.roots, len(batch))
+        rows = np.repeat(np.arange(len(batch)), num_trees)
+        active = np.flatnonzero(nodes >= 0)
+        while len(active) > 0:
+            inner = nodes[active]
+            values = batch[rows[active], self.feature_indices[inner]]
+            nodes[active] = np.where(
+                values <= self.thresholds[inner],
+                self.left_children[inner],
+                self.right_children[inner],
+            )
+            active = active[nodes[active] >= 0]
 
-        mean_probs = np.mean(tree_probs, axis=0).tolist()
-        all_probs.append(mean_probs)
+        leaves = (-nodes - 1).reshape(len(batch), num_trees)
+        sums = np.zeros((len(batch), self.leaf_probabilities.shape[1]), dtype=np.float64)
+        for tree_index in range(num_trees):
+            sums += self.leaf_probabilities[leaves[:, tree_index]]
+        return sums / num_trees
 
-    return all_probs
+
+def compile_random_forest(model: RandomForestExport) -> CompiledRandomForest:
+    """Compiles a RandomForestExport into flat arrays for batched prediction.
+
+    Args:
+        model: A RandomForestExport instance containing the model and metadata.
+
+    Returns:
+        The compiled forest, predicting the same probabilities as the export.
+    """
+    num_classes = len(model.metadata.class_names)
+    feature_indices: list[int] = []
+    thresholds: list[float] = []
+    left_children: list[int] = []
+    right_children: list[int] = []
+    leaf_probabilities: list[list[float]] = []
+    roots: list[int] = []
+
+    def to_global(child: int, inner_offset: int, leaf_offset: int) -> int:
+        return child + inner_offset if child >= 0 else child - leaf_offset
+
+    for tree in model.trees:
+        inner_offset = len(feature_indices)
+        leaf_offset = len(leaf_probabilities)
+        roots.append(inner_offset if tree.inner_nodes else -leaf_offset - 1)
+        for node in tree.inner_nodes:
+            feature_indices.append(node.feature_index)
+            thresholds.append(node.threshold)
+            left_children.append(to_global(node.left_child, inner_offset, leaf_offset))
+            right_children.append(to_global(node.right_child, inner_offset, leaf_offset))
+        leaf_probabilities.extend(leaf.class_probabilities for leaf in tree.leaf_nodes)
+
+    return CompiledRandomForest(
+        num_input_features=model.metadata.num_input_features,
+        feature_indices=np.array(feature_indices, dtype=np.intp),
+        thresholds=np.array(thresholds, dtype=np.float64),
+        left_children=np.array(left_children, dtype=np.int64),
+        right_children=np.array(right_children, dtype=np.int64),
+        leaf_probabilities=np.array(leaf_probabilities, dtype=np.float64).reshape(-1, num_classes),
+        roots=np.array(roots, dtype=np.int64),
+    )
 
 
 def _export_single_tree(
@@ -471,27 +583,3 @@ def _export_single_tree(
         )
 
     return ExportedTree(inner_nodes=inner_nodes, leaf_nodes=leaf_nodes)
-
-
-def _predict_tree_probs(tree: ExportedTree, embedding: Embedding) -> list[float]:
-    """Predicts class probabilities for an embedding using a single tree.
-
-    Args:
-        tree: A ExportedTree instance used to determine the probability.
-        embedding: A single embedding.
-
-    """
-    if not tree.inner_nodes:
-        return tree.leaf_nodes[0].class_probabilities
-
-    node_idx = 0  # Start at root
-    while node_idx >= 0:
-        node = tree.inner_nodes[node_idx]
-        if embedding[node.feature_index] <= node.threshold:
-            node_idx = node.left_child
-        else:
-            node_idx = node.right_child
-
-    leaf_idx = -node_idx - 1
-    leaf = tree.leaf_nodes[leaf_idx]
-    return leaf.class_probabilities
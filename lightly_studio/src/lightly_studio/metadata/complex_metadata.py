@@ -10,6 +10,10 @@ COMPLEX_METADATA_TYPES: dict[str, type[ComplexMetadata]] = {
     "gps_coordinate": GPSCoordinate,
 }
 
+# JSON-native types, which skip the slow isinstance check against the runtime-checkable
+# ComplexMetadata protocol.
+_JSON_SCALAR_TYPES = (bool, int, float, str, type(None))
+
 
 def serialize_complex_metadata(value: Any) -> Any:
     """Serialize complex metadata for JSON storage.
@@ -21,6 +25,8 @@ def serialize_complex_metadata(value: Any) -> Any:
         Serialized value if it is ComplexMetadata, the original
         value otherwise.
     """
+    if type(value) in _JSON_SCALAR_TYPES:
+        return value
     if isinstance(value, ComplexMetadata):
         return value.as_dict()
 
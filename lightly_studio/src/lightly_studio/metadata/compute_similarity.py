@@ -45,24 +45,22 @@ def compute_similarity_metadata(
     Returns:
         The name of the metadata storing the similarity values.
     """
-    key_samples = sample_embedding_resolver.get_all_by_collection_id(
+    key_samples = sample_embedding_resolver.get_matrix_by_collection_id(
         session=session, collection_id=key_collection_id, embedding_model_id=embedding_model_id
     )
-    key_embeddings = [sample.embedding for sample in key_samples]
-    similarity = Similarity(key_embeddings=key_embeddings)
+    similarity = Similarity(key_embeddings=key_samples.embeddings)
 
     query_tag = tag_resolver.get_by_id(session=session, tag_id=query_tag_id)
     if query_tag is None:
         raise TagNotFoundError("Query tag with ID {query_tag_id} not found")
     tag_filter = SampleFilter(tag_ids=[query_tag_id])
-    query_samples = sample_embedding_resolver.get_all_by_collection_id(
+    query_samples = sample_embedding_resolver.get_matrix_by_collection_id(
         session=session,
         collection_id=key_collection_id,
         embedding_model_id=embedding_model_id,
         filters=tag_filter,
     )
-    query_embeddings = [sample.embedding for sample in query_samples]
-    similarity_values = similarity.calculate_similarity(query_embeddings=query_embeddings)
+    similarity_values = similarity.calculate_similarity(query_embeddings=query_samples.embeddings)
     if metadata_name is None:
         date = datetime.now(timezone.utc)
         # Only use whole seconds, such as "2025-11-26T10:11:56'. This is 19 characters.
@@ -70,8 +68,8 @@ def compute_similarity_metadata(
         metadata_name = f"similarity_{query_tag.name}_{formatted_date}"
 
     metadata: list[tuple[UUID, Mapping[str, Any]]] = [
-        (sample.sample_id, {metadata_name: similarity})
-        for sample, similarity in zip(key_samples, similarity_values)
+        (sample_id, {metadata_name: similarity})
+        for sample_id, similarity in zip(key_samples.sample_ids, similarity_values)
     ]
 
     metadata_resolver.bulk_update_metadata(session, metadata)
@@ -40,22 +40,21 @@ def compute_typicality_metadata(
             The name of the metadata field to store the typicality values in.
             Defaults to "typicality".
     """
-    samples = sample_embedding_resolver.get_all_by_collection_id(
+    samples = sample_embedding_resolver.get_matrix_by_collection_id(
         session=session, collection_id=collection_id, embedding_model_id=embedding_model_id
     )
 
-    embeddings = [sample.embedding for sample in samples]
-    typicality = Typicality(embeddings=embeddings)
+    typicality = Typicality(embeddings=samples.embeddings)
     typicality_values = typicality.calculate_typicality(
         num_nearest_neighbors=DEFAULT_NUM_NEAREST_NEIGHBORS
     )
-    assert len(samples) == len(typicality_values), (
+    assert len(samples.sample_ids) == len(typicality_values), (
         "The number of samples and computed typicality values must match"
     )
 
     metadata: list[tuple[UUID, Mapping[str, Any]]] = [
-        (sample.sample_id, {metadata_name: typicality})
-        for sample, typicality in zip(samples, typicality_values)
+        (sample_id, {metadata_name: typicality})
+        for sample_id, typicality in zip(samples.sample_ids, typicality_values)
     ]
 
     metadata_resolver.bulk_update_metadata(session, metadata)
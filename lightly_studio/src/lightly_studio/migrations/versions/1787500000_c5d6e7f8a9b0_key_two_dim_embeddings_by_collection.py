@@ -0,0 +1,53 @@
+"""key_two_dim_embeddings_by_collection.
+
+Keys ``two_dim_embeddings`` by collection and embedding model and stores the ordered
+sample ids of each projection, so a projection can be extended when samples are added
+instead of being recomputed. The table only caches projections that are recomputed on
+demand, so it is recreated empty instead of migrating its rows.
+
+Revision ID: c5d6e7f8a9b0
+Revises: a05138ab5fc4
+Create Date: 2026-08-23 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlmodel.sql.sqltypes import AutoString
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, Sequence[str], None] = "a05138ab5fc4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_table("two_dim_embeddings")
+    op.create_table(
+        "two_dim_embeddings",
+        sa.Column("collection_id", sa.Uuid(), nullable=False),
+        sa.Column("embedding_model_id", sa.Uuid(), nullable=False),
+        sa.Column("hash", AutoString(), nullable=False),
+        sa.Column("x", sa.ARRAY(sa.Float()), nullable=True),
+        sa.Column("y", sa.ARRAY(sa.Float()), nullable=True),
+        sa.Column("sample_ids", sa.ARRAY(sa.Uuid()), nullable=True),
+        sa.Column("num_changed_samples", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("collection_id", "embedding_model_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("two_dim_embeddings")
+    op.create_table(
+        "two_dim_embeddings",
+        sa.Column("hash", AutoString(), nullable=False),
+        sa.Column("x", sa.ARRAY(sa.Float()), nullable=True),
+        sa.Column("y", sa.ARRAY(sa.Float()), nullable=True),
+        sa.PrimaryKeyConstraint("hash"),
+    )
@@ -0,0 +1,42 @@
+"""add_sample_embedding_version.
+
+Adds the ``sample_embedding_version`` table, a change counter per collection and embedding
+model, and stores the counter a 2D projection was computed at in
+``two_dim_embeddings.embedding_version``. Existing collections have no counter yet; it is
+created on first access.
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-08-24 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "sample_embedding_version",
+        sa.Column("collection_id", sa.Uuid(), nullable=False),
+        sa.Column("embedding_model_id", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("collection_id", "embedding_model_id"),
+    )
+    op.add_column("two_dim_embeddings", sa.Column("embedding_version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("two_dim_embeddings", "embedding_version")
+    op.drop_table("sample_embedding_version")
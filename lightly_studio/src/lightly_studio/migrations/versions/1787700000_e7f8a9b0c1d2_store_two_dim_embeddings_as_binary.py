@@ -0,0 +1,59 @@
+"""store_two_dim_embeddings_as_binary.
+
+Stores the coordinates and sample ids of ``two_dim_embeddings`` as binary blobs instead of
+arrays: ``x`` and ``y`` hold little-endian float32 values and ``sample_ids`` holds the 16
+raw bytes of each sample id. The table only caches projections that are recomputed on
+demand, so it is recreated empty instead of migrating its rows.
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-08-25 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlmodel.sql.sqltypes import AutoString
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_table("two_dim_embeddings")
+    op.create_table(
+        "two_dim_embeddings",
+        sa.Column("collection_id", sa.Uuid(), nullable=False),
+        sa.Column("embedding_model_id", sa.Uuid(), nullable=False),
+        sa.Column("hash", AutoString(), nullable=False),
+        sa.Column("embedding_version", sa.Integer(), nullable=True),
+        sa.Column("x", sa.LargeBinary(), nullable=False),
+        sa.Column("y", sa.LargeBinary(), nullable=False),
+        sa.Column("sample_ids", sa.LargeBinary(), nullable=False),
+        sa.Column("num_changed_samples", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("collection_id", "embedding_model_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("two_dim_embeddings")
+    op.create_table(
+        "two_dim_embeddings",
+        sa.Column("collection_id", sa.Uuid(), nullable=False),
+        sa.Column("embedding_model_id", sa.Uuid(), nullable=False),
+        sa.Column("hash", AutoString(), nullable=False),
+        sa.Column("embedding_version", sa.Integer(), nullable=True),
+        sa.Column("x", sa.ARRAY(sa.Float()), nullable=True),
+        sa.Column("y", sa.ARRAY(sa.Float()), nullable=True),
+        sa.Column("sample_ids", sa.ARRAY(sa.Uuid()), nullable=True),
+        sa.Column("num_changed_samples", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("collection_id", "embedding_model_id"),
+    )
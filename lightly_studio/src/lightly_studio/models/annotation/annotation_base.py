@@ -298,6 +298,7 @@ class AnnotationWithPayloadAndCountView(BaseModel):
     annotations: list[AnnotationWithPayloadView] = PydanticField(..., alias="data")
     total_count: int
     next_cursor: Optional[int] = PydanticField(None, alias="nextCursor")
+    next_seek_cursor: Optional[str] = PydanticField(None, alias="nextSeekCursor")
 
 
 class SampleAnnotationDetailsView(BaseModel):
@@ -140,4 +140,6 @@ class ImageViewsWithCount(BaseModel):
 
     samples: list[ImageView] = PydanticField(..., alias="data")
     total_count: int
+    total_count_is_exact: bool = True
     next_cursor: Optional[int] = PydanticField(None, alias="nextCursor")
+    next_seek_cursor: Optional[str] = PydanticField(None, alias="nextSeekCursor")
@@ -0,0 +1,23 @@
+"""This module defines the SampleEmbeddingVersion model for the application."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class SampleEmbeddingVersionTable(SQLModel, table=True):
+    """Change counter of the sample embeddings of a collection for one embedding model.
+
+    The counter is incremented whenever embeddings of the collection's samples are inserted
+    or deleted, so caches derived from the embeddings, e.g. the 2D projection, can be
+    validated without reading the embeddings. A missing row means the version is unknown.
+    The ids carry no foreign keys, so rows of deleted collections are harmless leftovers.
+    """
+
+    __tablename__ = "sample_embedding_version"
+
+    collection_id: UUID = Field(primary_key=True)
+    embedding_model_id: UUID = Field(primary_key=True)
+    version: int = 0
@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
-from sqlalchemy import ARRAY, Float
+from uuid import UUID
+
+from sqlalchemy import LargeBinary
 from sqlmodel import Column, Field, SQLModel
 
 
 class TwoDimEmbeddingTable(SQLModel, table=True):
-    """Persisted 2D embedding projection identified by a deterministic hash."""
+    """Persisted 2D embedding projection of a collection for one embedding model.
+
+    ``hash`` identifies the high-dimensional embeddings the projection was computed from,
+    and ``embedding_version`` is the version of the embeddings at that time, see
+    ``SampleEmbeddingVersionTable``. The projection is valid while the version is unchanged;
+    the hash verifies it once the version changed.
+    ``x`` and ``y`` hold the coordinates as little-endian float32 values and ``sample_ids``
+    the 16 raw bytes of each sample id, in matching order. The binary layout is read back
+    without creating a Python object per sample. When samples are added or removed,
+    the projection is updated in place by placing new samples next to their nearest
+    neighbours, and ``num_changed_samples`` counts the samples added or removed since the
+    projection was last computed from scratch.
+    """
 
     __tablename__ = "two_dim_embeddings"
 
-    hash: str = Field(primary_key=True)
-    x: list[float] = Field(sa_column=Column(ARRAY(Float)))
-    y: list[float] = Field(sa_column=Column(ARRAY(Float)))
+    collection_id: UUID = Field(primary_key=True)
+    embedding_model_id: UUID = Field(primary_key=True)
+    hash: str
+    embedding_version: int | None = None
+    x: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    y: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    sample_ids: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    num_changed_samples: int = 0
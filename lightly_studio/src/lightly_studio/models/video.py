@@ -78,6 +78,7 @@ class VideoViewsWithCount(BaseModel):
     samples: list[VideoView] = PydanticField(..., alias="data")
     total_count: int
     next_cursor: Optional[int] = PydanticField(None, alias="nextCursor")
+    next_seek_cursor: Optional[str] = PydanticField(None, alias="nextSeekCursor")
 
 
 class VideoFrameBase(SQLModel):
@@ -143,6 +144,7 @@ class VideoFrameViewsWithCount(BaseModel):
     samples: list[VideoFrameView] = PydanticField(..., alias="data")
     total_count: int
     next_cursor: Optional[int] = PydanticField(None, alias="nextCursor")
+    next_seek_cursor: Optional[str] = PydanticField(None, alias="nextSeekCursor")
 
 
 class VideoFieldsBoundsView(BaseModel):
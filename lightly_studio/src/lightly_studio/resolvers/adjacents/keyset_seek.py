@@ -1,22 +1,34 @@
-"""Keyset (seek) engine shared by the adjacency resolvers.
+"""Keyset (seek) engine shared by the adjacency and grid resolvers.
 
 Reads the anchor row's sort-key values once, then jumps straight to its neighbours with
 ``LIMIT 1`` queries instead of sorting the whole collection and scanning it with window
 functions. Position and total come from two ``COUNT``s. Callers supply the sort keys and
 the base query, so resolvers for different sample types can share the engine.
+
+Grid pages use the same comparison: a page ends with an opaque cursor holding the sort-key
+values of its last row, and the next page selects the rows after them. The database then
+seeks in its index instead of sorting and skipping all rows before the page, so page N
+costs the same as page 1.
 """
 
 from __future__ import annotations
 
-from typing import Any, Union
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, TypeVar, Union
 from uuid import UUID
 
 import sqlalchemy
+from sqlalchemy import Select as SQLAlchemySelect
 from sqlalchemy.orm import Mapped
 from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import Session, select
 from sqlmodel.sql.expression import SelectOfScalar
 
+from lightly_studio.api.routes.api.validators import Paginated
 from lightly_studio.models.adjacents import AdjacentResultView
 
 # A sort key column, either built as an expression or taken from a model with ``col()``.
@@ -25,6 +37,9 @@ SortColumn = Union[ColumnElement[Any], Mapped[Any]]
 # A keyset sort key paired with its sort direction (True == ascending).
 SortKey = tuple[SortColumn, bool]
 
+# A select statement, paginated without changing its row type.
+_QueryT = TypeVar("_QueryT", bound=SQLAlchemySelect[Any])
+
 
 def get_adjacent_result(
     session: Session,
@@ -85,6 +100,104 @@ def fetch_anchor(session: Session, query: SelectOfScalar[Any]) -> tuple[Any, ...
     return tuple(row)
 
 
+def order_by_columns(sort_keys: list[SortKey]) -> list[ColumnElement[Any]]:
+    """Return the ``ORDER BY`` clauses that sort rows in the keyset order."""
+    return [
+        _directional_column(column=column, ascending=ascending, forward=True)
+        for column, ascending in sort_keys
+    ]
+
+
+def after_cursor(sort_keys: list[SortKey], values: tuple[Any, ...]) -> ColumnElement[bool]:
+    """Return the condition selecting the rows after the row with the given sort-key values."""
+    return _keyset_condition(sort_keys=sort_keys, anchor=values, after=True)
+
+
+def paginate(
+    query: _QueryT,
+    pagination: Paginated,
+    sort_keys: list[SortKey] | None,
+    seek_cursor: str | None,
+) -> _QueryT:
+    """Limit an ordered query to one page.
+
+    The page starts after the row of ``seek_cursor`` when the cursor decodes for
+    ``sort_keys``, which must then be the query's ordering. Otherwise the page starts at
+    ``pagination.offset``.
+    """
+    cursor_values = None
+    if sort_keys is not None and seek_cursor is not None:
+        cursor_values = decode_cursor(sort_keys=sort_keys, cursor=seek_cursor)
+    if sort_keys is not None and cursor_values is not None:
+        query = query.where(after_cursor(sort_keys=sort_keys, values=cursor_values))
+    else:
+        query = query.offset(pagination.offset)
+    return query.limit(pagination.limit)
+
+
+def encode_cursor(sort_keys: list[SortKey], values: tuple[Any, ...]) -> str:
+    """Encode the sort-key values of a row as an opaque cursor.
+
+    Args:
+        sort_keys: The sort keys of the page the row ends.
+        values: The row's sort-key values, positionally aligned with ``sort_keys``.
+
+    Returns:
+        A URL-safe string, only valid for the same sort keys.
+    """
+    payload = {
+        "sort": _sort_signature(sort_keys=sort_keys),
+        "values": [_encode_value(value) for value in values],
+    }
+    encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
+
+def decode_cursor(sort_keys: list[SortKey], cursor: str) -> tuple[Any, ...] | None:
+    """Decode a cursor from ``encode_cursor``.
+
+    Returns:
+        The sort-key values, or ``None`` if the cursor is malformed or was encoded for
+        other sort keys, e.g. because the sort changed between two pages. Callers then
+        fall back to offset pagination.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["sort"] != _sort_signature(sort_keys=sort_keys):
+            return None
+        values = tuple(_decode_value(value) for value in payload["values"])
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError):
+        # json.JSONDecodeError is a ValueError.
+        return None
+    if len(values) != len(sort_keys):
+        return None
+    return values
+
+
+def _sort_signature(sort_keys: list[SortKey]) -> str:
+    """Return a short digest identifying the sort keys and their directions."""
+    description = repr([(str(column), ascending) for column, ascending in sort_keys])
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+def _encode_value(value: Any) -> Any:
+    """Return a JSON-compatible representation of a sort-key value."""
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Invert ``_encode_value``."""
+    if isinstance(value, dict):
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        return datetime.fromisoformat(value["datetime"])
+    return value
+
+
 def _seek_neighbor(
     session: Session,
     base_query: SelectOfScalar[UUID],
@@ -32,6 +32,7 @@ def create_many(
     parent_collection_id: UUID,
     annotations: list[AnnotationCreate],
     collection_name: str | None = None,
+    commit: bool = True,
 ) -> list[UUID]:
     """Create multiple annotations in bulk with their respective type-specific details.
 
@@ -48,6 +49,9 @@ def create_many(
         annotations: List of annotation objects to create.
         collection_name: Name of the annotation collection these annotations belong to. It could be
         a name of an existing collection. If `None`, a default name is used.
+        commit: Whether to commit. Pass ``False`` to insert as part of a larger transaction
+        that the caller commits. Creating the annotation collection commits regardless, so
+        it should already exist in that case.
 
     Returns:
         List of created annotation IDs.
@@ -144,7 +148,8 @@ def create_many(
     )
 
     # Commit everything
-    session.commit()
+    if commit:
+        session.commit()
 
     return [annotation.sample_id for annotation in base_annotations]
 
@@ -19,7 +19,7 @@ from lightly_studio.models.evaluation_sample_metric import EvaluationSampleMetri
 from lightly_studio.models.sample import SampleTable, SampleTagLinkTable
 from lightly_studio.models.sample_embedding import SampleEmbeddingTable
 from lightly_studio.models.temporal_span import TemporalSpanTable
-from lightly_studio.resolvers import annotation_resolver
+from lightly_studio.resolvers import annotation_resolver, sample_embedding_resolver
 from lightly_studio.utils import batching
 
 
@@ -91,6 +91,9 @@ def delete_annotation(
                 col(SampleEmbeddingTable.sample_id) == annotation_sample_id
             )
         )
+        sample_embedding_resolver.increment_versions(
+            session=session, sample_ids=[annotation_sample_id]
+        )
         session.commit()
 
         annotation_sample = session.get(SampleTable, annotation_sample_id)
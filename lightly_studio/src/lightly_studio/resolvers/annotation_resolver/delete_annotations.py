@@ -4,12 +4,21 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlmodel import Session, col, delete
+from sqlalchemy import or_
+from sqlmodel import Session, col, delete, select
 
+from lightly_studio.database.db_manager import DatabaseBackend
 from lightly_studio.models.annotation.annotation_base import (
     AnnotationBaseTable,
 )
-from lightly_studio.resolvers import annotation_resolver
+from lightly_studio.models.annotation.object_detection import (
+    ObjectDetectionAnnotationTable,
+)
+from lightly_studio.models.annotation.segmentation import (
+    SegmentationAnnotationTable,
+)
+from lightly_studio.models.evaluation_annotation_metric import EvaluationAnnotationMetricTable
+from lightly_studio.models.temporal_span import TemporalSpanTable
 from lightly_studio.resolvers.annotation_resolver.delete_annotation import (
     delete_evaluation_metrics,
 )
@@ -18,47 +27,104 @@ from lightly_studio.resolvers.annotations.annotations_filter import (
 )
 from lightly_studio.utils import batching
 
+# Tables holding the type-specific details of an annotation, keyed by its sample ID.
+_DETAILS_TABLES = (
+    ObjectDetectionAnnotationTable,
+    SegmentationAnnotationTable,
+    TemporalSpanTable,
+)
+
 
 def delete_annotations(
     session: Session,
     annotation_label_ids: list[UUID] | None,
+    commit: bool = True,
 ) -> None:
     """Delete all annotations and their tag links using filters.
 
+    Annotations are deleted in batches of the IDs matching the filters, so memory stays
+    bounded by the batch size regardless of the number of deleted annotations. A first
+    pass deletes the details and evaluation metrics of all matching annotations, a second
+    one the annotations themselves.
+
     Args:
         session: Database session.
         annotation_label_ids: List of annotation label IDs to filter by.
+        commit: Whether to commit. Pass ``False`` to delete as part of a larger
+            transaction that the caller commits. On DuckDB, which checks foreign keys
+            against committed rows, the first pass is still committed if it deleted any
+            details or metrics, before any annotation is deleted.
     """
-    annotations = annotation_resolver.get_all(
-        session,
-        filters=AnnotationsFilter(
-            annotation_label_ids=annotation_label_ids,
-        ),
-    ).annotations
+    annotations_filter = AnnotationsFilter(annotation_label_ids=annotation_label_ids)
+    if (
+        _delete_dependent_rows(session=session, annotations_filter=annotations_filter)
+        and session.get_bind().dialect.name == DatabaseBackend.DUCKDB.value
+    ):
+        session.commit()
 
-    # Delete annotation details first
-    for annotation in annotations:
-        if annotation.object_detection_details:
-            session.delete(annotation.object_detection_details)
-        if annotation.segmentation_details:
-            session.delete(annotation.segmentation_details)
-        if annotation.temporal_span_details:
-            session.delete(annotation.temporal_span_details)
-    session.commit()
+    statement = annotations_filter.apply(select(AnnotationBaseTable.sample_id)).limit(
+        batching.DEFAULT_BATCH_SIZE
+    )
+    # Deleted annotations no longer match, so each query returns the next batch.
+    while annotation_ids := list(session.exec(statement).all()):
+        session.exec(
+            delete(AnnotationBaseTable).where(
+                col(AnnotationBaseTable.sample_id).in_(annotation_ids)
+            )
+        )
+    if commit:
+        session.commit()
 
-    # Now delete the annotations themselves
-    annotation_ids = [annotation.sample_id for annotation in annotations]
-    parent_sample_ids = list({annotation.parent_sample_id for annotation in annotations})
-    if annotation_ids:
-        # TODO(Jonas, 06/2026): Replace eager deletion with explicit evaluation invalidation
-        # once evaluation results can be recomputed or marked stale independently.
+
+def _delete_dependent_rows(session: Session, annotations_filter: AnnotationsFilter) -> bool:
+    """Delete the details and evaluation metrics of all annotations matching a filter.
+
+    Returns:
+        Whether any rows were deleted. Does not commit.
+    """
+    deleted = False
+    statement = annotations_filter.apply(
+        select(AnnotationBaseTable.sample_id, AnnotationBaseTable.parent_sample_id)
+    ).order_by(col(AnnotationBaseTable.sample_id))
+    last_annotation_id: UUID | None = None
+    while True:
+        page = statement
+        if last_annotation_id is not None:
+            page = page.where(col(AnnotationBaseTable.sample_id) > last_annotation_id)
+        rows = session.exec(page.limit(batching.DEFAULT_BATCH_SIZE)).all()
+        if not rows:
+            return deleted
+        last_annotation_id = rows[-1][0]
+        annotation_ids = [annotation_id for annotation_id, _ in rows]
+        if not _has_dependent_rows(session=session, annotation_ids=annotation_ids):
+            continue
+        deleted = True
+        for details_table in _DETAILS_TABLES:
+            session.exec(
+                delete(details_table).where(col(details_table.sample_id).in_(annotation_ids))
+            )
+        # TODO(Jonas, 06/2026): Replace eager deletion with explicit evaluation
+        # invalidation once evaluation results can be recomputed or marked stale
+        # independently.
         delete_evaluation_metrics(
             session=session,
             annotation_ids=annotation_ids,
-            parent_sample_ids=parent_sample_ids,
+            parent_sample_ids=list({parent_sample_id for _, parent_sample_id in rows}),
         )
-    for batch in batching.batched(items=annotation_ids):
-        session.exec(
-            delete(AnnotationBaseTable).where(col(AnnotationBaseTable.sample_id).in_(batch))
+
+
+def _has_dependent_rows(session: Session, annotation_ids: list[UUID]) -> bool:
+    """Whether any details or evaluation metrics reference the given annotations."""
+    statements = [
+        select(details_table.sample_id).where(col(details_table.sample_id).in_(annotation_ids))
+        for details_table in _DETAILS_TABLES
+    ]
+    statements.append(
+        select(EvaluationAnnotationMetricTable.evaluation_run_id).where(
+            or_(
+                col(EvaluationAnnotationMetricTable.pred_annotation_id).in_(annotation_ids),
+                col(EvaluationAnnotationMetricTable.gt_annotation_id).in_(annotation_ids),
+            )
         )
-    session.commit()
+    )
+    return any(session.exec(statement.limit(1)).first() is not None for statement in statements)
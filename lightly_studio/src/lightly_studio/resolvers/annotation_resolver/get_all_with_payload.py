@@ -14,6 +14,7 @@ from sqlmodel.sql.expression import Select
 
 from lightly_studio.api.routes.api.validators import Paginated
 from lightly_studio.core.dataset_query.order_by import OrderByExpression
+from lightly_studio.database import db_array
 from lightly_studio.models.annotation.annotation_base import (
     AnnotationBaseTable,
     AnnotationView,
@@ -29,6 +30,7 @@ from lightly_studio.models.image import ImageTable
 from lightly_studio.models.sample import SampleTable
 from lightly_studio.models.video import VideoFrameTable, VideoTable
 from lightly_studio.resolvers import collection_resolver, embedding_region_resolver
+from lightly_studio.resolvers.adjacents import keyset_seek
 from lightly_studio.resolvers.annotations import annotation_ordering
 from lightly_studio.resolvers.annotations.annotations_filter import (
     AnnotationsFilter,
@@ -36,6 +38,7 @@ from lightly_studio.resolvers.annotations.annotations_filter import (
 from lightly_studio.resolvers.similarity_utils import (
     apply_similarity_join,
     distance_to_similarity,
+    fetch_similarity_page,
     get_distance_expression,
 )
 
@@ -57,21 +60,26 @@ class AnnotationOrdering:
     order_by: OrderByExpression | None = None
 
 
-def get_all_with_payload(
+def get_all_with_payload(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
     pagination: Paginated | None = None,
     filters: AnnotationsFilter | None = None,
     ordering: AnnotationOrdering | None = None,
+    seek_cursor: str | None = None,
 ) -> AnnotationWithPayloadAndCountView:
     """Get all annotations with payload from the database.
 
+    Pages ordered by the tiebreaker chain alone also return ``next_seek_cursor``.
+
     Args:
         session: Database session
         pagination: Optional pagination parameters
         filters: Optional filters to apply to the query
         collection_id: ID of the collection to get annotations for
         ordering: Optional ordering applied before the tiebreaker chain.
+        seek_cursor: Optional ``next_seek_cursor`` of the previous page. The page then
+            starts after it instead of at ``pagination.offset``.
 
     Returns:
         List of annotations matching the filters with payload
@@ -127,30 +135,110 @@ def get_all_with_payload(
             leading_order_key=distance_expr,
         ),
     )
+    # Only the tiebreaker chain is a keyset; distances and metric values are not unique.
+    sort_keys = (
+        _tiebreaker_sort_keys(sample_type=sample_type)
+        if distance_expr is None and order_by is None
+        else None
+    )
     if distance_expr is not None:
         annotations_query = annotations_query.add_columns(distance_expr)
 
     total_count_query = select(func.count()).select_from(base_query.subquery())
     total_count = session.exec(total_count_query).one()
 
-    if pagination is not None:
-        annotations_query = annotations_query.offset(pagination.offset).limit(pagination.limit)
-
     next_cursor = None
     if pagination and pagination.offset + pagination.limit < total_count:
         next_cursor = pagination.offset + pagination.limit
 
-    rows = session.exec(annotations_query).all()
+    if embedding_model_id is not None and ordering.text_embedding is not None:
+        rows = fetch_similarity_page(
+            session=session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            text_embedding=ordering.text_embedding,
+            pagination=pagination,
+            fetch_page=lambda candidate_sample_ids: _fetch_rows(
+                session=session,
+                annotations_query=annotations_query,
+                pagination=pagination,
+                candidate_sample_ids=candidate_sample_ids,
+            ),
+        )
+    else:
+        rows = _fetch_rows(
+            session=session,
+            annotations_query=annotations_query,
+            pagination=pagination,
+            candidate_sample_ids=None,
+            sort_keys=sort_keys,
+            seek_cursor=seek_cursor,
+        )
+
+    next_seek_cursor = None
+    if sort_keys is not None and pagination is not None and len(rows) == pagination.limit:
+        next_seek_cursor = _seek_cursor_after(row=rows[-1], sort_keys=sort_keys)
 
     return AnnotationWithPayloadAndCountView(
         total_count=total_count,
         next_cursor=next_cursor,
+        next_seek_cursor=next_seek_cursor,
         annotations=_build_annotation_views(
             rows=rows, sample_type=sample_type, has_distance=distance_expr is not None
         ),
     )
 
 
+def _fetch_rows(  # noqa: PLR0913
+    session: Session,
+    annotations_query: Any,
+    pagination: Paginated | None,
+    candidate_sample_ids: Sequence[UUID] | None,
+    sort_keys: list[keyset_seek.SortKey] | None = None,
+    seek_cursor: str | None = None,
+) -> Sequence[Any]:
+    """Run a page of the annotations query, restricted to the candidate samples if given.
+
+    The page seeks past ``seek_cursor`` if it decodes for ``sort_keys``, otherwise it
+    starts at ``pagination.offset``.
+    """
+    if candidate_sample_ids is not None:
+        annotations_query = annotations_query.where(
+            db_array.in_array(
+                column=col(AnnotationBaseTable.sample_id), values=candidate_sample_ids
+            )
+        )
+    if pagination is not None:
+        annotations_query = keyset_seek.paginate(
+            query=annotations_query,
+            pagination=pagination,
+            sort_keys=sort_keys,
+            seek_cursor=seek_cursor,
+        )
+    return session.exec(annotations_query).all()  # type: ignore[no-any-return]
+
+
+def _tiebreaker_sort_keys(sample_type: SampleType) -> list[keyset_seek.SortKey]:
+    """Return the tiebreaker chain of the annotations of the given sample type."""
+    return annotation_ordering.build_sort_keys(
+        file_path_abs=annotation_ordering.file_path_abs_expression(sample_type=sample_type),
+        created_at=col(AnnotationBaseTable.created_at),
+        annotation_sample_id=col(AnnotationBaseTable.sample_id),
+    )
+
+
+def _seek_cursor_after(row: Any, sort_keys: list[keyset_seek.SortKey]) -> str:
+    """Return the cursor of the page after the row, for the sort keys of ``build_sort_keys``."""
+    annotation, payload = row
+    file_path_abs = (
+        payload.file_path_abs if isinstance(payload, ImageTable) else payload.video.file_path_abs
+    )
+    return keyset_seek.encode_cursor(
+        sort_keys=sort_keys,
+        values=(file_path_abs, annotation.created_at, annotation.sample_id),
+    )
+
+
 def _build_annotation_views(
     rows: Sequence[Any],
     sample_type: SampleType,
@@ -50,7 +50,7 @@ from lightly_studio.models.sample_embedding import SampleEmbeddingTable
 from lightly_studio.models.tag import TagTable
 from lightly_studio.models.temporal_span import TemporalSpanTable
 from lightly_studio.models.video import VideoFrameTable, VideoTable
-from lightly_studio.resolvers import dataset_resolver
+from lightly_studio.resolvers import dataset_resolver, sample_embedding_resolver
 from lightly_studio.resolvers.dataset_resolver import table_coverage_utils
 
 # Execution options for every bulk DELETE below. An ORM-enabled DELETE with a subquery predicate
@@ -168,13 +168,18 @@ def _delete_sample_group_links(session: Session, dataset_id: UUID) -> None:
 
 
 def _delete_sample_embeddings(session: Session, dataset_id: UUID) -> None:
-    """Delete sample embeddings for the dataset's samples."""
+    """Delete sample embeddings for the dataset's samples and invalidate caches of them."""
     session.exec(
         delete(SampleEmbeddingTable).where(
             col(SampleEmbeddingTable.sample_id).in_(_sample_ids_subquery(dataset_id))
         ),
         execution_options=_DELETE_EXECUTION_OPTIONS,
     )
+    # A dataset has few collections, so their IDs are selected rather than its sample IDs.
+    sample_embedding_resolver.increment_collection_versions(
+        session=session,
+        collection_ids=session.exec(_collection_ids_subquery(dataset_id)).all(),
+    )
 
 
 def _delete_sample_metadata(session: Session, dataset_id: UUID) -> None:
@@ -0,0 +1,158 @@
+"""Total counts of grid queries, cached across pages and optionally estimated.
+
+A grid fetches a query page by page, and every page reports the total number of matching
+rows. Counting them runs the whole query with all its filters and joins, so counts are
+cached by a fingerprint of the query and the database write generation (see
+``db_generation``): the following pages reuse the count until the next write.
+
+Callers may also accept an estimate. On PostgreSQL, the planner's row estimate for the
+query (``EXPLAIN``) is used instead of counting when it reaches
+``LIGHTLY_STUDIO_ESTIMATED_COUNT_MIN_ROWS``. Planner estimates are read from table
+statistics and take constant time, but are only accurate for simple predicates, so callers
+only accept them for unfiltered collections. DuckDB counts are always exact: its columnar
+scans count large collections quickly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+
+from lightly_studio.database import db_generation
+from lightly_studio.database.db_manager import DatabaseBackend
+from lightly_studio.dataset import env
+
+# Counts are a few bytes each; the bound only keeps abandoned queries from accumulating.
+_COUNT_CACHE_MAX_ENTRIES = 1024
+# Plan nodes whose estimated rows are not the rows of the counted query.
+_AGGREGATE_NODE_TYPES = ("Aggregate", "Gather", "Gather Merge")
+
+
+@dataclass(frozen=True)
+class TotalCount:
+    """The number of rows matching a query, and whether it was counted or estimated."""
+
+    count: int
+    is_exact: bool
+
+
+class CountCache:
+    """Thread-safe LRU cache of exact counts."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Create an empty cache holding at most ``max_entries`` counts."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> int | None:
+        """Return the count cached for ``key`` and mark it as recently used."""
+        with self._lock:
+            count = self._entries.get(key)
+            if count is not None:
+                self._entries.move_to_end(key)
+            return count
+
+    def put(self, key: Hashable, count: int) -> None:
+        """Cache ``count`` for ``key``, evicting the least recently used count if full."""
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = count
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all counts."""
+        with self._lock:
+            self._entries.clear()
+
+
+def get_total_count(
+    session: Session,
+    query: SelectOfScalar[int],
+    fingerprint: tuple[Any, ...],
+    allow_estimate: bool = False,
+) -> TotalCount:
+    """Count the rows of a grid query, reusing the count of a previous page if possible.
+
+    Args:
+        session: The database session.
+        query: A ``SELECT COUNT(*)`` query.
+        fingerprint: Values that identify the counted rows, e.g. the collection ID and the
+            filters. Queries with equal fingerprints must count the same rows.
+        allow_estimate: Whether a planner estimate may be returned instead of the count.
+
+    Returns:
+        The count, or an estimate if allowed and the estimate is large enough.
+    """
+    if allow_estimate:
+        estimate = estimate_count(session=session, query=query)
+        if estimate is not None and estimate >= env.LIGHTLY_STUDIO_ESTIMATED_COUNT_MIN_ROWS:
+            return TotalCount(count=estimate, is_exact=False)
+
+    # Read the generation before counting: a write during the count then invalidates it.
+    key = (db_generation.get(), _digest(fingerprint))
+    count = count_cache.get(key)
+    if count is None:
+        count = session.exec(query).one()
+        count_cache.put(key, count)
+    return TotalCount(count=count, is_exact=True)
+
+
+def estimate_count(session: Session, query: SelectOfScalar[int]) -> int | None:
+    """Return the planner's estimate of the rows counted by a ``SELECT COUNT(*)`` query.
+
+    Returns:
+        The estimated number of rows, or ``None`` if the database has no planner estimate.
+    """
+    dialect = session.get_bind().dialect
+    if dialect.name != DatabaseBackend.POSTGRESQL.value:
+        return None
+    compiled = query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return _counted_rows(node=plan[0]["Plan"])
+
+
+def _counted_rows(node: dict[str, Any]) -> int:
+    """Return the estimated rows entering the aggregate at the root of a plan.
+
+    Parallel plans estimate the rows of each process below a ``Gather``; they are scaled
+    back up with the divisor of PostgreSQL's cost model.
+    """
+    divisor = 1.0
+    while node["Node Type"] in _AGGREGATE_NODE_TYPES and node.get("Plans"):
+        if node["Node Type"] != "Aggregate":
+            divisor = _parallel_divisor(num_workers=node.get("Workers Planned", 0))
+        node = node["Plans"][0]
+    return round(float(node["Plan Rows"]) * divisor)
+
+
+def _parallel_divisor(num_workers: int) -> float:
+    """Return the number of processes PostgreSQL divides a parallel scan's rows by.
+
+    Mirrors ``get_parallel_divisor`` of PostgreSQL: the leader also scans, less so the more
+    workers there are.
+    """
+    leader_contribution = 1.0 - 0.3 * num_workers
+    return num_workers + max(leader_contribution, 0.0)
+
+
+def _digest(fingerprint: tuple[Any, ...]) -> str:
+    """Return a digest of a fingerprint, whose values may be large ID lists."""
+    return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+
+count_cache = CountCache(max_entries=_COUNT_CACHE_MAX_ENTRIES)
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from sqlmodel import Session
 
-from lightly_studio.resolvers import image_resolver
+from lightly_studio.resolvers import image_resolver, sample_embedding_resolver
 
 
 def delete(session: Session, sample_id: UUID) -> bool:
@@ -15,6 +15,8 @@ def delete(session: Session, sample_id: UUID) -> bool:
     if not sample:
         return False
 
+    # Caches derived from the collection's embeddings may still list the image's sample.
+    sample_embedding_resolver.increment_versions(session=session, sample_ids=[sample_id])
     session.delete(sample)
     session.commit()
     return True
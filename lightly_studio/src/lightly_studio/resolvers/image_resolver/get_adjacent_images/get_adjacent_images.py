@@ -6,12 +6,13 @@ from uuid import UUID
 
 from sqlmodel import Session
 
-from lightly_studio.core.dataset_query.order_by import OrderByExpression, OrderByField
+from lightly_studio.core.dataset_query.order_by import OrderByExpression
 from lightly_studio.models.adjacents import AdjacentResultView
 from lightly_studio.resolvers import similarity_utils
 from lightly_studio.resolvers.image_filter import ImageFilter
 from lightly_studio.resolvers.image_resolver.get_adjacent_images.get_adjacent_images_keyset import (
     get_adjacent_images_keyset,
+    is_keyset_sortable,
 )
 from lightly_studio.resolvers.image_resolver.get_adjacent_images.get_adjacent_images_window import (
     get_adjacent_images_window,
@@ -53,7 +54,7 @@ def get_adjacent_images(  # noqa: PLR0913
     )
 
     is_similarity_search = distance_expr is not None or embedding_model_id is not None
-    if not is_similarity_search and _is_keyset_sortable(order_by):
+    if not is_similarity_search and is_keyset_sortable(order_by):
         return get_adjacent_images_keyset(
             session=session,
             sample_id=sample_id,
@@ -71,15 +72,3 @@ def get_adjacent_images(  # noqa: PLR0913
         embedding_model_id=embedding_model_id,
         order_by=order_by,
     )
-
-
-def _is_keyset_sortable(order_by: list[OrderByExpression] | None) -> bool:
-    """Return whether the sort can be served by the keyset seek path.
-
-    Keyset comparison needs non-nullable, single-column sort keys. Plain image
-    columns (``OrderByField``) qualify; metadata / evaluation-metric sorts use
-    outer joins and nullable values, so they keep the window implementation.
-    """
-    if not order_by:
-        return True
-    return all(isinstance(expr, OrderByField) for expr in order_by)
@@ -3,9 +3,9 @@
 The seek engine lives in ``resolvers.adjacents.keyset_seek``; only the sort keys and the
 base query are image-specific.
 
-Needs a total, deterministic order over non-nullable columns; see
-``get_adjacent_images._is_keyset_sortable`` for the eligibility check and
-``get_adjacent_images_window`` for the fallback.
+Needs a total, deterministic order over non-nullable columns; see ``is_keyset_sortable``
+for the eligibility check and ``get_adjacent_images_window`` for the fallback. The image
+grid seeks its pages along the same sort keys.
 """
 
 from __future__ import annotations
@@ -43,11 +43,11 @@ def get_adjacent_images_keyset(
     Returns:
         The adjacency result, or ``None`` if the anchor is filtered out.
     """
-    sort_keys = _keyset_sort_keys(order_by)
+    sort_keys = keyset_sort_keys(order_by)
 
     anchor = keyset_seek.fetch_anchor(
         session=session,
-        query=_keyset_query(
+        query=keyset_query(
             columns=[column for column, _ in sort_keys],
             collection_id=collection_id,
             filters=filters,
@@ -60,7 +60,7 @@ def get_adjacent_images_keyset(
     return keyset_seek.get_adjacent_result(
         session=session,
         sample_id=sample_id,
-        base_query=_keyset_query(
+        base_query=keyset_query(
             columns=[col(ImageTable.sample_id)],
             collection_id=collection_id,
             filters=filters,
@@ -70,7 +70,19 @@ def get_adjacent_images_keyset(
     )
 
 
-def _keyset_sort_keys(order_by: list[OrderByExpression] | None) -> list[keyset_seek.SortKey]:
+def is_keyset_sortable(order_by: list[OrderByExpression] | None) -> bool:
+    """Return whether the sort can be served by the keyset seek path.
+
+    Keyset comparison needs non-nullable, single-column sort keys. Plain image
+    columns (``OrderByField``) qualify; metadata / evaluation-metric sorts use
+    outer joins and nullable values, so they keep the window implementation.
+    """
+    if not order_by:
+        return True
+    return all(isinstance(expr, OrderByField) for expr in order_by)
+
+
+def keyset_sort_keys(order_by: list[OrderByExpression] | None) -> list[keyset_seek.SortKey]:
     """Build the ordered, fully deterministic list of keyset sort keys.
 
     Mirrors the window query's ordering: the requested sort columns, then a
@@ -95,7 +107,7 @@ def _keyset_sort_keys(order_by: list[OrderByExpression] | None) -> list[keyset_s
     return keys
 
 
-def _keyset_query(
+def keyset_query(
     columns: list[keyset_seek.SortColumn],
     collection_id: UUID,
     filters: ImageFilter | None,
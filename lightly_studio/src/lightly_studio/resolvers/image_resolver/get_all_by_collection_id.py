@@ -24,11 +24,15 @@ from lightly_studio.database import db_array
 from lightly_studio.models.annotation.annotation_base import AnnotationBaseTable
 from lightly_studio.models.image import ImageTable
 from lightly_studio.models.sample import SampleTable
-from lightly_studio.resolvers import embedding_region_resolver
+from lightly_studio.resolvers import embedding_region_resolver, grid_count
+from lightly_studio.resolvers.adjacents import keyset_seek
 from lightly_studio.resolvers.image_filter import ImageFilter
+from lightly_studio.resolvers.image_resolver.get_adjacent_images import get_adjacent_images_keyset
+from lightly_studio.resolvers.sample_resolver.sample_filter import SampleFilter
 from lightly_studio.resolvers.similarity_utils import (
     apply_similarity_join,
     distance_to_similarity,
+    fetch_similarity_page,
     get_distance_expression,
 )
 
@@ -52,12 +56,18 @@ def _coerce_order_value(value: object) -> float | None:
     return None
 
 
+# Filters that select every image of a collection.
+_UNFILTERED_FILTERS = (None, ImageFilter(), ImageFilter(sample_filter=SampleFilter()))
+
+
 class GetAllSamplesByCollectionIdResult(BaseModel):
     """Result of getting all samples."""
 
     samples: Sequence[ImageTable]
     total_count: int
+    total_count_is_exact: bool = True
     next_cursor: int | None = None
+    next_seek_cursor: str | None = None
     similarity_scores: Sequence[float] | None = None
     order_values: Sequence[float | None] | None = None
 
@@ -80,12 +90,45 @@ def _get_load_options() -> LoaderOption:
 
 def _compute_next_cursor(
     pagination: Paginated | None,
-    total_count: int,
+    total_count: grid_count.TotalCount,
+    num_samples: int,
 ) -> int | None:
     """Compute next cursor for pagination."""
-    if pagination and pagination.offset + pagination.limit < total_count:
-        return pagination.offset + pagination.limit
-    return None
+    if pagination is None:
+        return None
+    # An estimate may be off in either direction, so only a partial page marks the end.
+    has_more = (
+        pagination.offset + pagination.limit < total_count.count
+        if total_count.is_exact
+        else num_samples == pagination.limit
+    )
+    return pagination.offset + pagination.limit if has_more else None
+
+
+def _get_total_count(  # noqa: PLR0913
+    session: Session,
+    total_count_query: SelectOfScalar[int],
+    collection_id: UUID,
+    embedding_model_id: UUID | None,
+    filters: ImageFilter | None,
+    sample_ids: list[UUID] | None,
+    allow_estimated_count: bool,
+) -> grid_count.TotalCount:
+    """Count the images of a grid query, estimating only for unfiltered collections."""
+    return grid_count.get_total_count(
+        session=session,
+        query=total_count_query,
+        fingerprint=(
+            "image",
+            collection_id,
+            embedding_model_id,
+            filters.model_dump_json() if filters is not None else None,
+            sample_ids,
+        ),
+        allow_estimate=(
+            allow_estimated_count and not sample_ids and filters in _UNFILTERED_FILTERS
+        ),
+    )
 
 
 def get_all_by_collection_id(  # noqa: PLR0913
@@ -96,8 +139,21 @@ def get_all_by_collection_id(  # noqa: PLR0913
     text_embedding: list[float] | None = None,
     sample_ids: list[UUID] | None = None,
     order_by: list[OrderByExpression] | None = None,
+    seek_cursor: str | None = None,
+    allow_estimated_count: bool = False,
 ) -> GetAllSamplesByCollectionIdResult:
-    """Retrieve samples for a specific collection with optional filtering."""
+    """Retrieve samples for a specific collection with optional filtering.
+
+    Total counts are cached until the next database write, so later pages of the same query
+    do not count again. With ``allow_estimated_count``, very large unfiltered collections
+    report the planner's estimate instead, and ``total_count_is_exact`` is False.
+
+    Pages sorted by plain image columns also return ``next_seek_cursor``. Passing it as
+    ``seek_cursor`` for the next page seeks to the page instead of skipping
+    ``pagination.offset`` rows, so deep pages cost as much as the first one. The offset is
+    used when the cursor does not match the sort, and for similarity search and sorts over
+    metadata or evaluation metrics.
+    """
     # Resolve any embedding-plot region selection to concrete sample ids on the filter before the
     # query is built (the point-in-polygon test needs the session, which `apply` lacks).
     if (
@@ -121,15 +177,17 @@ def get_all_by_collection_id(  # noqa: PLR0913
         text_embedding=text_embedding,
     )
 
-    if distance_expr is not None and embedding_model_id is not None:
+    if distance_expr is not None and embedding_model_id is not None and text_embedding is not None:
         return _get_all_with_similarity(
             session=session,
             collection_id=collection_id,
             embedding_model_id=embedding_model_id,
+            text_embedding=text_embedding,
             distance_expr=distance_expr,
             pagination=pagination,
             filters=filters,
             sample_ids=sample_ids,
+            allow_estimated_count=allow_estimated_count,
         )
     return _get_all_without_similarity(
         session=session,
@@ -138,6 +196,8 @@ def get_all_by_collection_id(  # noqa: PLR0913
         filters=filters,
         sample_ids=sample_ids,
         order_by=order_by,
+        seek_cursor=seek_cursor,
+        allow_estimated_count=allow_estimated_count,
     )
 
 
@@ -145,10 +205,12 @@ def _get_all_with_similarity(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
     embedding_model_id: UUID,
+    text_embedding: list[float],
     distance_expr: ColumnElement[float],
     pagination: Paginated | None,
     filters: ImageFilter | None,
     sample_ids: list[UUID] | None,
+    allow_estimated_count: bool,
 ) -> GetAllSamplesByCollectionIdResult:
     """Get samples with similarity search - returns (ImageTable, float) tuples."""
     load_options = _get_load_options()
@@ -192,19 +254,44 @@ def _get_all_with_similarity(  # noqa: PLR0913
 
     samples_query = samples_query.order_by(distance_expr, col(ImageTable.file_path_abs).asc())
 
-    if pagination is not None:
-        samples_query = samples_query.offset(pagination.offset).limit(pagination.limit)
+    def fetch_page(
+        candidate_sample_ids: Sequence[UUID] | None,
+    ) -> Sequence[tuple[ImageTable, float]]:
+        page_query = samples_query
+        if candidate_sample_ids is not None:
+            page_query = page_query.where(
+                db_array.in_array(column=col(ImageTable.sample_id), values=candidate_sample_ids)
+            )
+        if pagination is not None:
+            page_query = page_query.offset(pagination.offset).limit(pagination.limit)
+        return session.exec(page_query).all()
 
-    total_count = session.exec(total_count_query).one()
-    results = session.exec(samples_query).all()
+    total_count = _get_total_count(
+        session=session,
+        total_count_query=total_count_query,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        filters=filters,
+        sample_ids=sample_ids,
+        allow_estimated_count=allow_estimated_count,
+    )
+    results = fetch_similarity_page(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        text_embedding=text_embedding,
+        pagination=pagination,
+        fetch_page=fetch_page,
+    )
 
     samples = [r[0] for r in results]
     similarity_scores = [distance_to_similarity(r[1]) for r in results]
 
     return GetAllSamplesByCollectionIdResult(
         samples=samples,
-        total_count=total_count,
-        next_cursor=_compute_next_cursor(pagination, total_count),
+        total_count=total_count.count,
+        total_count_is_exact=total_count.is_exact,
+        next_cursor=_compute_next_cursor(pagination, total_count, num_samples=len(samples)),
         similarity_scores=similarity_scores,
         order_values=None,
     )
@@ -217,6 +304,8 @@ def _get_all_without_similarity(  # noqa: PLR0913
     filters: ImageFilter | None,
     sample_ids: list[UUID] | None,
     order_by: list[OrderByExpression] | None,
+    seek_cursor: str | None,
+    allow_estimated_count: bool,
 ) -> GetAllSamplesByCollectionIdResult:
     """Get samples without similarity search.
 
@@ -224,7 +313,14 @@ def _get_all_without_similarity(  # noqa: PLR0913
     otherwise a ``file_path_abs`` tiebreaker is appended when missing. The primary sort expression
     is appended to the SELECT so its value can be returned per row in ``order_values``.
     Non-numeric sort values (e.g. strings) are coerced to ``None``.
+
+    Sorts over plain image columns get ``sample_id`` as a final tiebreaker, the keyset order
+    of ``get_adjacent_images_keyset``, and their pages seek along it.
     """
+    sort_keys = None
+    if pagination is not None and get_adjacent_images_keyset.is_keyset_sortable(order_by):
+        sort_keys = get_adjacent_images_keyset.keyset_sort_keys(order_by)
+
     load_options = _get_load_options()
 
     samples_query: SelectOfScalar[ImageTable] = (
@@ -254,8 +350,15 @@ def _get_all_without_similarity(  # noqa: PLR0913
             db_array.in_array(column=col(ImageTable.sample_id), values=sample_ids)
         )
 
-    total_count = session.exec(total_count_query).one()
-    next_cursor = _compute_next_cursor(pagination, total_count)
+    total_count = _get_total_count(
+        session=session,
+        total_count_query=total_count_query,
+        collection_id=collection_id,
+        embedding_model_id=None,
+        filters=filters,
+        sample_ids=sample_ids,
+        allow_estimated_count=allow_estimated_count,
+    )
 
     # Add `file_path_abs` tiebreaker to `order_by`.
     if not order_by:
@@ -276,18 +379,56 @@ def _get_all_without_similarity(  # noqa: PLR0913
     for expr in order_by[1:]:
         ordered_query = expr.apply_joins(ordered_query)
         ordered_query = ordered_query.order_by(*expr.to_column_elements())
+    if sort_keys is not None:
+        ordered_query = ordered_query.order_by(col(ImageTable.sample_id).asc())
     if pagination is not None:
-        ordered_query = ordered_query.offset(pagination.offset).limit(pagination.limit)
+        ordered_query = keyset_seek.paginate(
+            query=ordered_query,
+            pagination=pagination,
+            sort_keys=sort_keys,
+            seek_cursor=seek_cursor,
+        )
 
     # Multi-column rows: ImageTable at index 0, sort value read by label.
     rows = session.execute(ordered_query).all()
     samples = [cast(ImageTable, row[0]) for row in rows]
     order_values = [_coerce_order_value(get_order_value(row)) for row in rows]
 
+    next_seek_cursor = None
+    if sort_keys is not None and pagination is not None and len(samples) == pagination.limit:
+        next_seek_cursor = _seek_cursor_after(
+            session=session,
+            collection_id=collection_id,
+            sort_keys=sort_keys,
+            sample_id=samples[-1].sample_id,
+        )
+
     return GetAllSamplesByCollectionIdResult(
         samples=samples,
-        total_count=total_count,
-        next_cursor=next_cursor,
+        total_count=total_count.count,
+        total_count_is_exact=total_count.is_exact,
+        next_cursor=_compute_next_cursor(pagination, total_count, num_samples=len(samples)),
+        next_seek_cursor=next_seek_cursor,
         similarity_scores=None,
         order_values=order_values,
     )
+
+
+def _seek_cursor_after(
+    session: Session,
+    collection_id: UUID,
+    sort_keys: list[keyset_seek.SortKey],
+    sample_id: UUID,
+) -> str | None:
+    """Return the cursor of the page after the given image."""
+    values = keyset_seek.fetch_anchor(
+        session=session,
+        query=get_adjacent_images_keyset.keyset_query(
+            columns=[column for column, _ in sort_keys],
+            collection_id=collection_id,
+            filters=None,
+        ).where(col(ImageTable.sample_id) == sample_id),
+    )
+    if values is None:
+        return None
+    return keyset_seek.encode_cursor(sort_keys=sort_keys, values=values)
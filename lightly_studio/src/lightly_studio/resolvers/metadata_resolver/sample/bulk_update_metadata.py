@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import JSON, ColumnElement, TableClause, Uuid, cast, func, literal
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import Session, col, select
 
-from lightly_studio.models.metadata import SampleMetadataTable
-from lightly_studio.utils import batching
+from lightly_studio.database import db_json, db_staging
+from lightly_studio.metadata.complex_metadata import serialize_complex_metadata
+from lightly_studio.models.metadata import (
+    SampleMetadataTable,
+    get_type_name,
+    validate_type_compatibility,
+)
+
+# Name of the table the new metadata is staged in, visible only to the session's connection.
+_STAGED_TABLE_NAME = "metadata_patch"
+
+
+@dataclass
+class _MetadataPatch:
+    """Serialized key-value pairs and their schema types to merge into one sample."""
+
+    data: dict[str, Any] = field(default_factory=dict)
+    metadata_schema: dict[str, str] = field(default_factory=dict)
 
 
 def bulk_update_metadata(
@@ -21,30 +43,145 @@ def bulk_update_metadata(
     If a sample does not have metadata, a new metadata row is created.
     If a sample already has metadata, the new key-value pairs are merged with the existing metadata.
 
+    The new metadata is staged as a table and merged in the database by a single
+    ``INSERT ... ON CONFLICT DO UPDATE``, so the existing metadata rows are never loaded
+    into Python.
+
     Args:
         session: The database session.
         sample_metadata: list of (sample_id, metadata_mapping) tuples.
+
+    Raises:
+        ValueError: If a value does not match the type of its key in the metadata schema of
+            the sample. Nothing is written in that case.
     """
-    # TODO(Mihnea, 10/2025): Consider using SQLAlchemy's bulk operations
-    #  (Session.bulk_insert/update_mappings) if performance becomes a bottleneck.
     if not sample_metadata:
         return
 
-    # Get all existing metadata rows for the given sample IDs.
-    sample_ids = [s[0] for s in sample_metadata]
-    sample_id_to_existing_metadata: dict[UUID, SampleMetadataTable] = {}
-    for batch in batching.batched(items=sample_ids):
-        existing_metadata = session.exec(
-            select(SampleMetadataTable).where(col(SampleMetadataTable.sample_id).in_(batch))
-        ).all()
-        sample_id_to_existing_metadata.update({meta.sample_id: meta for meta in existing_metadata})
+    patches, values_by_type = _build_patches(sample_metadata=sample_metadata)
+    now = datetime.now(timezone.utc)
+    with db_staging.staged_text_table(
+        session=session,
+        name=_STAGED_TABLE_NAME,
+        columns=("sample_id", "data", "metadata_schema"),
+        rows=[
+            (str(sample_id), json.dumps(patch.data), json.dumps(patch.metadata_schema))
+            for sample_id, patch in patches.items()
+        ],
+    ) as staged:
+        _validate_existing_schema_types(
+            session=session, staged=staged, values_by_type=values_by_type
+        )
+        statement = pg_insert(SampleMetadataTable).from_select(
+            [
+                "custom_metadata_id",
+                "created_at",
+                "updated_at",
+                "sample_id",
+                "data",
+                "metadata_schema",
+            ],
+            sa_select(
+                func.gen_random_uuid(),
+                literal(now),
+                literal(now),
+                _staged_sample_id(staged=staged),
+                cast(staged.c.data, JSON),
+                _staged_schema(staged=staged),
+            ),
+        )
+        session.exec(
+            statement.on_conflict_do_update(
+                index_elements=[col(SampleMetadataTable.sample_id)],
+                set_={
+                    "data": db_json.json_object_merge(
+                        SampleMetadataTable.data, statement.excluded.data
+                    ),
+                    # Keys already in the schema keep their type.
+                    "metadata_schema": db_json.json_object_merge(
+                        statement.excluded.metadata_schema, SampleMetadataTable.metadata_schema
+                    ),
+                    "updated_at": statement.excluded.updated_at,
+                },
+            )
+        )
+
+    session.commit()
+
+
+def _build_patches(
+    sample_metadata: list[tuple[UUID, Mapping[str, Any]]],
+) -> tuple[dict[UUID, _MetadataPatch], dict[tuple[str, str], Any]]:
+    """Serialize the new metadata into one patch per sample.
+
+    Mappings for the same sample are merged in order, since a single statement cannot
+    update a row twice.
+
+    Returns:
+        The patches by sample ID, and one new value per key and type name.
 
+    Raises:
+        ValueError: If two values for the same key of a sample have different types.
+    """
+    patches: dict[UUID, _MetadataPatch] = {}
+    values_by_type: dict[tuple[str, str], Any] = {}
     for sample_id, new_metadata in sample_metadata:
-        metadata = sample_id_to_existing_metadata.get(
-            sample_id, SampleMetadataTable(sample_id=sample_id)
-        )
+        patch = patches.setdefault(sample_id, _MetadataPatch())
         for key, value in new_metadata.items():
-            metadata.set_value(key, value)
-        session.add(metadata)
+            type_name = get_type_name(value)
+            expected_type = patch.metadata_schema.get(key)
+            if expected_type is None:
+                patch.metadata_schema[key] = type_name
+            elif not validate_type_compatibility(expected_type, value):
+                raise _type_mismatch_error(key=key, expected_type=expected_type, value=value)
+            patch.data[key] = serialize_complex_metadata(value)
+            values_by_type.setdefault((key, type_name), value)
+    return patches, values_by_type
 
-    session.commit()
+
+def _validate_existing_schema_types(
+    session: Session, staged: TableClause, values_by_type: Mapping[tuple[str, str], Any]
+) -> None:
+    """Check that the staged values match the types already in the schemas of their samples.
+
+    Values of the same type are compatible with the same schema types, so one query per
+    key fetches the distinct pairs of existing and new types to check.
+
+    Raises:
+        ValueError: If a value does not match the schema type of its key.
+    """
+    for key in {key for key, _ in values_by_type}:
+        existing_type = db_json.json_extract_key_as_text(
+            column=SampleMetadataTable.metadata_schema, key=key
+        )
+        new_type = db_json.json_extract_key_as_text(column=_staged_schema(staged=staged), key=key)
+        type_pairs = session.exec(
+            select(existing_type, new_type)
+            .distinct()
+            .join_from(
+                staged,
+                SampleMetadataTable,
+                col(SampleMetadataTable.sample_id) == _staged_sample_id(staged=staged),
+            )
+            .where(existing_type.is_not(None), new_type.is_not(None))
+        ).all()
+        for expected_type, type_name in type_pairs:
+            value = values_by_type[(key, type_name)]
+            if not validate_type_compatibility(expected_type, value):
+                raise _type_mismatch_error(key=key, expected_type=expected_type, value=value)
+
+
+def _staged_sample_id(staged: TableClause) -> ColumnElement[UUID]:
+    return cast(staged.c.sample_id, Uuid)
+
+
+def _staged_schema(staged: TableClause) -> ColumnElement[Any]:
+    return cast(staged.c.metadata_schema, JSON)
+
+
+def _type_mismatch_error(key: str, expected_type: str, value: Any) -> ValueError:
+    """Return the error ``MetadataBase.ensure_schema`` raises for a mismatching value."""
+    return ValueError(
+        f"Value type mismatch for key '{key}'. "
+        f"Expected {expected_type}, got {get_type_name(value)}."
+    )
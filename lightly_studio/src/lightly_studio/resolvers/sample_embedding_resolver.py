@@ -3,25 +3,44 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
 from typing import Any, NamedTuple
 from uuid import UUID
 
-from sqlalchemy import func
+import numpy as np
+import pyarrow.compute as pc
+from numpy.typing import NDArray
+from sqlalchemy import func, update
 from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select, SelectOfScalar
 
 from lightly_studio.database import db_vector
 from lightly_studio.database.db_manager import DatabaseBackend
 from lightly_studio.database.db_vector import Embedding
+from lightly_studio.models.embedding_model import EmbeddingModelTable
 from lightly_studio.models.sample import SampleTable
 from lightly_studio.models.sample_embedding import (
     SampleEmbeddingCreate,
     SampleEmbeddingTable,
 )
+from lightly_studio.models.sample_embedding_version import SampleEmbeddingVersionTable
 from lightly_studio.resolvers.sample_resolver.sample_filter import SampleFilter
 from lightly_studio.utils import batching
 
 
+class EmbeddingMatrix(NamedTuple):
+    """Sample ids paired with their embeddings, stacked into one float32 matrix.
+
+    Row ``i`` of ``embeddings``, of shape ``(len(sample_ids), embedding_dim)``, is the
+    embedding of ``sample_ids[i]``. No per-row array is created, so the matrix costs about
+    half the memory of a list of ``SampleEmbeddingRow`` and is passed to numpy or
+    ``lightly_mundig`` without conversion. An empty result has shape ``(0, 0)``.
+    """
+
+    sample_ids: list[UUID]
+    embeddings: NDArray[np.float32]
+
+
 class SampleEmbeddingRow(NamedTuple):
     """A sample id paired with its embedding vector.
 
@@ -37,6 +56,11 @@ def create(session: Session, sample_embedding: SampleEmbeddingCreate) -> SampleE
     """Create a new SampleEmbedding in the database."""
     db_sample_embedding = SampleEmbeddingTable.model_validate(sample_embedding)
     session.add(db_sample_embedding)
+    increment_versions(
+        session=session,
+        sample_ids=[sample_embedding.sample_id],
+        embedding_model_ids=[sample_embedding.embedding_model_id],
+    )
     session.commit()
     session.refresh(db_sample_embedding)
     return db_sample_embedding
@@ -55,6 +79,11 @@ def create_many(
     """
     db_sample_embeddings = [SampleEmbeddingTable.model_validate(e) for e in sample_embeddings]
     session.bulk_save_objects(db_sample_embeddings)
+    increment_versions(
+        session=session,
+        sample_ids=[e.sample_id for e in sample_embeddings],
+        embedding_model_ids={e.embedding_model_id for e in sample_embeddings},
+    )
     if commit:
         session.commit()
 
@@ -69,6 +98,10 @@ def create_many(
 #   get_by_sample_ids        "= ANY" SQL                   batched IN
 #   get_all_by_collection_id compiled SELECT               session.exec
 #   backend read primitive   _read_embedding_rows_binary   ---
+#
+# The get_matrix_* variants return one float32 matrix instead of a row per sample and
+# share _read_embedding_matrix: PostgreSQL stacks batches read on the binary cursor,
+# DuckDB fetches the result as an Arrow table.
 
 
 def get_by_sample_ids(
@@ -139,27 +172,116 @@ def get_all_by_collection_id(
     Returns:
         Embeddings for the collection, ordered by sample creation time.
     """
+    statement = _collection_embeddings_statement(
+        collection_id=collection_id, embedding_model_id=embedding_model_id, filters=filters
+    )
+    return _read_embedding_rows(session=session, statement=statement)
+
+
+def get_matrix_by_collection_id(
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    filters: SampleFilter | None = None,
+) -> EmbeddingMatrix:
+    """Get all sample embeddings of a collection as one contiguous matrix.
+
+    Same rows and order as ``get_all_by_collection_id``. DuckDB returns the result as an
+    Arrow table whose values are copied into the matrix at once; PostgreSQL reads it on
+    the binary cursor and stacks it in batches.
+
+    Args:
+        session: The database session.
+        collection_id: The collection ID to filter by.
+        embedding_model_id: The embedding model ID to filter by.
+        filters: Filters to apply to the samples.
+
+    Returns:
+        Embeddings for the collection, ordered by sample creation time.
+    """
+    statement = _collection_embeddings_statement(
+        collection_id=collection_id, embedding_model_id=embedding_model_id, filters=filters
+    )
+    return _read_embedding_matrix(session=session, statement=statement)
+
+
+def get_matrix_by_sample_ids(
+    session: Session,
+    sample_ids: Sequence[UUID],
+    embedding_model_id: UUID,
+) -> EmbeddingMatrix:
+    """Get the embeddings of the specified samples as one contiguous matrix.
+
+    Output order matches the input order, as in ``get_by_sample_ids``. Samples without an
+    embedding are skipped.
+
+    Args:
+        session: The database session.
+        sample_ids: IDs of the samples to get embeddings for.
+        embedding_model_id: The embedding model ID to filter by.
+
+    Returns:
+        Embeddings of the samples, in input order.
+    """
+    batches = [
+        _read_embedding_matrix(
+            session=session,
+            statement=select(SampleEmbeddingTable.sample_id, col(SampleEmbeddingTable.embedding))
+            .where(col(SampleEmbeddingTable.sample_id).in_(batch))
+            .where(SampleEmbeddingTable.embedding_model_id == embedding_model_id),
+        )
+        for batch in batching.batched(items=sample_ids)
+    ]
+    read_sample_ids = [sample_id for batch in batches for sample_id in batch.sample_ids]
+    embeddings = _concatenate_rows(chunks=[batch.embeddings for batch in batches])
+    row_by_sample_id = {sample_id: row for row, sample_id in enumerate(read_sample_ids)}
+    rows = [row_by_sample_id[id_] for id_ in sample_ids if id_ in row_by_sample_id]
+    if rows == list(range(len(read_sample_ids))):
+        return EmbeddingMatrix(sample_ids=read_sample_ids, embeddings=embeddings)
+    return EmbeddingMatrix(
+        sample_ids=[read_sample_ids[row] for row in rows],
+        embeddings=embeddings[np.asarray(rows, dtype=np.intp)],
+    )
+
+
+def iter_batches_by_collection_id(
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    batch_size: int = batching.DEFAULT_BATCH_SIZE,
+) -> Iterator[list[SampleEmbeddingRow]]:
+    """Yield the sample embeddings of a collection in batches of at most ``batch_size``.
+
+    Unlike ``get_all_by_collection_id``, only one batch is held in memory at a time. Each
+    batch is a separate keyset-paginated query, so the session can be used for other
+    statements, e.g. writes, between batches. Output is ordered by ``sample_id``.
+
+    Args:
+        session: The database session.
+        collection_id: The collection ID to filter by.
+        embedding_model_id: The embedding model ID to filter by.
+        batch_size: Maximum number of embeddings per batch.
+
+    Yields:
+        Non-empty batches of embeddings for the collection.
+    """
     statement = (
         select(SampleEmbeddingTable.sample_id, col(SampleEmbeddingTable.embedding))
         .join(SampleTable, col(SampleEmbeddingTable.sample_id) == col(SampleTable.sample_id))
         .where(SampleTable.collection_id == collection_id)
         .where(SampleEmbeddingTable.embedding_model_id == embedding_model_id)
-        .order_by(col(SampleTable.created_at).asc(), col(SampleEmbeddingTable.sample_id).asc())
+        .order_by(col(SampleEmbeddingTable.sample_id).asc())
+        .limit(batch_size)
     )
-    if filters:
-        statement = filters.apply(statement)
-    if session.get_bind().dialect.name == DatabaseBackend.POSTGRESQL.value:
-        # Compile to SQL + params and read it on the binary cursor.
-        compiled = statement.compile(
-            dialect=session.get_bind().dialect,
-            compile_kwargs={"render_postcompile": True},
+    batch = _read_embedding_rows(session=session, statement=statement)
+    while batch:
+        yield batch
+        if len(batch) < batch_size:
+            return
+        batch = _read_embedding_rows(
+            session=session,
+            statement=statement.where(col(SampleEmbeddingTable.sample_id) > batch[-1].sample_id),
         )
-        return _read_embedding_rows_binary(session, str(compiled), compiled.params)
-    streamed = statement.execution_options(yield_per=batching.DEFAULT_BATCH_SIZE)
-    return [
-        SampleEmbeddingRow(sample_id=sample_id, embedding=embedding)
-        for sample_id, embedding in session.exec(streamed)
-    ]
 
 
 def get_hash_by_collection_id(
@@ -170,7 +292,9 @@ def get_hash_by_collection_id(
     """Return a combined hash and ordered sample IDs with embeddings for a collection.
 
     The cache key is derived from the first dimension of each embedding vector,
-    which is database-agnostic (works with both DuckDB and PostgreSQL).
+    which is database-agnostic (works with both DuckDB and PostgreSQL). Computing it reads
+    a row per embedding; prefer ``get_version`` to validate a cache and use the
+    hash only to verify it when the version changed.
 
     Args:
         session: Database session.
@@ -205,6 +329,111 @@ def get_hash_by_collection_id(
     return hasher.hexdigest(), sample_ids
 
 
+def get_version(session: Session, collection_id: UUID, embedding_model_id: UUID) -> int:
+    """Return the version of the embeddings of a collection for an embedding model.
+
+    The version changes whenever embeddings of the collection's samples are inserted or
+    deleted, so a cache derived from the embeddings is valid while the version is unchanged.
+    Collections whose embeddings never changed have no stored version and report 0. Does not
+    write to the database.
+
+    Args:
+        session: Database session.
+        collection_id: The collection ID to consider.
+        embedding_model_id: Embedding model identifier.
+
+    Returns:
+        The current version.
+    """
+    version = session.get(SampleEmbeddingVersionTable, (collection_id, embedding_model_id))
+    return 0 if version is None else version.version
+
+
+def increment_versions(
+    session: Session,
+    sample_ids: Sequence[UUID],
+    embedding_model_ids: Collection[UUID] = (),
+) -> None:
+    """Increment the embedding versions of the collections containing the given samples.
+
+    Must be called whenever embeddings of these samples are inserted or deleted, while the
+    samples still exist. See ``increment_collection_versions``. Does not commit.
+
+    Args:
+        session: Database session.
+        sample_ids: Samples whose embeddings were inserted or deleted.
+        embedding_model_ids: Models of inserted embeddings.
+    """
+    collection_ids: set[UUID] = set()
+    for batch in batching.batched(items=list(set(sample_ids))):
+        collection_ids.update(
+            session.exec(
+                select(SampleTable.collection_id)
+                .where(col(SampleTable.sample_id).in_(batch))
+                .distinct()
+            ).all()
+        )
+    increment_collection_versions(
+        session=session, collection_ids=collection_ids, embedding_model_ids=embedding_model_ids
+    )
+
+
+def increment_collection_versions(
+    session: Session,
+    collection_ids: Collection[UUID],
+    embedding_model_ids: Collection[UUID] = (),
+) -> None:
+    """Increment the embedding versions of the given collections.
+
+    Missing versions are inserted at 1, since ``get_version`` reports them as 0, for the
+    embedding models of the collections and for ``embedding_model_ids``. A model may embed
+    the samples of another collection than its own, so inserting embeddings must pass their
+    models. Deleting embeddings need not: their versions were stored when they were inserted.
+    Does not commit.
+
+    Args:
+        session: Database session.
+        collection_ids: Collections whose embeddings were inserted or deleted.
+        embedding_model_ids: Models of inserted embeddings.
+    """
+    if not collection_ids:
+        return
+    session.exec(
+        update(SampleEmbeddingVersionTable)
+        .where(col(SampleEmbeddingVersionTable.collection_id).in_(collection_ids))
+        .values(version=SampleEmbeddingVersionTable.version + 1)
+        .execution_options(synchronize_session="fetch")
+    )
+    existing = set(
+        session.exec(
+            select(
+                SampleEmbeddingVersionTable.collection_id,
+                SampleEmbeddingVersionTable.embedding_model_id,
+            ).where(col(SampleEmbeddingVersionTable.collection_id).in_(collection_ids))
+        ).all()
+    )
+    missing = {
+        (collection_id, embedding_model_id)
+        for collection_id, embedding_model_id in session.exec(
+            select(EmbeddingModelTable.collection_id, EmbeddingModelTable.embedding_model_id).where(
+                col(EmbeddingModelTable.collection_id).in_(collection_ids)
+            )
+        ).all()
+    }
+    missing.update(
+        (collection_id, embedding_model_id)
+        for collection_id in collection_ids
+        for embedding_model_id in embedding_model_ids
+    )
+    session.add_all(
+        SampleEmbeddingVersionTable(
+            collection_id=collection_id, embedding_model_id=embedding_model_id, version=1
+        )
+        for collection_id, embedding_model_id in missing - existing
+    )
+    session.flush()
+
+
 def get_embedding_count(session: Session, collection_id: UUID, embedding_model_id: UUID) -> int:
     """Get the number of sample embeddings for samples in a specific collection.
 
@@ -225,6 +454,90 @@ def get_embedding_count(session: Session, collection_id: UUID, embedding_model_i
     return session.exec(query).one()
 
 
+def _collection_embeddings_statement(
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    filters: SampleFilter | None,
+) -> Select[tuple[UUID, Embedding]]:
+    """Select the ``(sample_id, embedding)`` rows of a collection in creation order."""
+    statement = (
+        select(SampleEmbeddingTable.sample_id, col(SampleEmbeddingTable.embedding))
+        .join(SampleTable, col(SampleEmbeddingTable.sample_id) == col(SampleTable.sample_id))
+        .where(SampleTable.collection_id == collection_id)
+        .where(SampleEmbeddingTable.embedding_model_id == embedding_model_id)
+        .order_by(col(SampleTable.created_at).asc(), col(SampleEmbeddingTable.sample_id).asc())
+    )
+    if filters:
+        statement = filters.apply(statement)
+    return statement
+
+
+def _read_embedding_matrix(
+    session: Session, statement: SelectOfScalar[Any] | Select[Any]
+) -> EmbeddingMatrix:
+    """Run a ``(sample_id, embedding)`` SELECT and stack the embeddings into a matrix."""
+    # Both paths bypass SQLAlchemy's result handling, which does not flush by itself.
+    session.flush()
+    if session.get_bind().dialect.name == DatabaseBackend.POSTGRESQL.value:
+        compiled = statement.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        sample_ids: list[UUID] = []
+        chunks: list[NDArray[np.float32]] = []
+        connection = db_vector.get_pgvector_connection(session)
+        with connection.cursor(binary=True) as cursor:
+            cursor.execute(str(compiled), compiled.params)
+            while rows := cursor.fetchmany(batching.DEFAULT_BATCH_SIZE):
+                sample_ids.extend(sample_id for sample_id, _ in rows)
+                chunks.append(np.stack([embedding for _, embedding in rows]))
+        return EmbeddingMatrix(sample_ids=sample_ids, embeddings=_concatenate_rows(chunks=chunks))
+
+    result = session.connection().execute(statement)
+    try:
+        table = result.cursor.fetch_arrow_table()
+    finally:
+        result.close()
+    embeddings = table.column(1)
+    lengths = pc.unique(pc.list_value_length(embeddings)).to_pylist()
+    if len(lengths) > 1:
+        raise ValueError(f"Embeddings have different dimensions: {sorted(lengths)}.")
+    values = pc.list_flatten(embeddings)
+    return EmbeddingMatrix(
+        sample_ids=[UUID(sample_id) for sample_id in table.column(0).to_pylist()],
+        embeddings=_concatenate_rows(
+            chunks=[
+                chunk.to_numpy().reshape(-1, lengths[0]) for chunk in values.chunks if len(chunk)
+            ]
+        ),
+    )
+
+
+def _concatenate_rows(chunks: list[NDArray[np.float32]]) -> NDArray[np.float32]:
+    """Concatenate row chunks into one writable float32 matrix; ``(0, 0)`` if empty."""
+    if not chunks:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.concatenate(chunks, axis=0).astype(np.float32, copy=False)
+
+
+def _read_embedding_rows(
+    session: Session, statement: SelectOfScalar[Any] | Select[Any]
+) -> list[SampleEmbeddingRow]:
+    """Run a ``(sample_id, embedding)`` SELECT on the backend-specific read path."""
+    if session.get_bind().dialect.name == DatabaseBackend.POSTGRESQL.value:
+        # Compile to SQL + params and read it on the binary cursor.
+        compiled = statement.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        return _read_embedding_rows_binary(session, str(compiled), compiled.params)
+    streamed = statement.execution_options(yield_per=batching.DEFAULT_BATCH_SIZE)
+    return [
+        SampleEmbeddingRow(sample_id=sample_id, embedding=embedding)
+        for sample_id, embedding in session.exec(streamed)
+    ]
+
+
 def _read_embedding_rows_binary(
     session: Session, sql: str, params: Sequence[Any] | Mapping[str, Any]
 ) -> list[SampleEmbeddingRow]:
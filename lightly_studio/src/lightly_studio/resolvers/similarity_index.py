@@ -0,0 +1,463 @@
+"""Approximate nearest-neighbour index over the sample embeddings of a collection.
+
+Similarity search ranks samples by the exact cosine distance of their embedding to a query,
+which scans every embedding of the collection. For collections with at least
+``LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS`` embeddings, ``search`` instead returns a short list of
+candidates, which the caller ranks by exact distance:
+
+- PostgreSQL uses an HNSW index of pgvector, one partial index per embedding model, created
+  on first use and kept up to date by the database.
+- DuckDB uses an in-process IVF index: the embeddings are grouped around k-means centroids
+  and a search only scores the groups whose centroids are closest to the query. The index
+  is stored next to the database file and rebuilt once the embeddings of the collection
+  changed, see ``sample_embedding_resolver.get_version``. Indices are loaded and built in
+  the background; until the index of a model holds the current embedding version, its
+  searches fall back to the full scan.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+from uuid import UUID
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import text
+from sqlmodel import Session
+
+from lightly_studio.database.db_manager import DatabaseBackend
+from lightly_studio.dataset import env
+from lightly_studio.models.embedding_model import EmbeddingModelTable
+from lightly_studio.models.sample_embedding import SampleEmbeddingTable
+from lightly_studio.resolvers import sample_embedding_resolver
+from lightly_studio.resolvers.sample_embedding_resolver import EmbeddingMatrix
+from lightly_studio.utils.executor import get_media_executor
+
+logger = logging.getLogger(__name__)
+
+# Largest number of candidates of an HNSW search, the upper bound of ``hnsw.ef_search``.
+_HNSW_MAX_CANDIDATES = 1000
+# Smallest ``hnsw.ef_search``, the pgvector default.
+_HNSW_MIN_EF_SEARCH = 40
+# Number of IVF lists scored per search, unless more are needed to hold the candidates.
+# More lists increase the recall and the latency of a search.
+DEFAULT_NUM_PROBES = 16
+# Upper bound of the number of IVF lists, which is the square root of the number of
+# embeddings otherwise.
+_MAX_NUM_LISTS = 4096
+# Number of embeddings per list used to train the k-means centroids.
+_TRAINING_SAMPLES_PER_LIST = 64
+_NUM_KMEANS_ITERATIONS = 10
+# Number of embeddings assigned to their nearest centroid at once, bounding the size of
+# the similarity matrix.
+_ASSIGNMENT_BATCH_SIZE = 16_384
+# Number of IVF indices kept in memory.
+_MAX_CACHED_INDICES = 4
+# A sample ID as a numpy scalar: its 16 raw bytes.
+_SAMPLE_ID_DTYPE = np.dtype("V16")
+
+_ivf_indices: OrderedDict[tuple[str, UUID], IVFIndex] = OrderedDict()
+# Background load or build of the IVF index of each embedding model. At most one runs per
+# model, builds of different models run concurrently.
+_ivf_builds: dict[tuple[str, UUID], Future[None]] = {}
+# Guards ``_ivf_indices`` and ``_ivf_builds``; never held while reading or building an index.
+_ivf_indices_lock = threading.Lock()
+# Number of embeddings of each embedding model, with the embedding version it was counted at.
+_num_embeddings: dict[tuple[str, UUID], tuple[int, int]] = {}
+# Embedding models with an HNSW index.
+_hnsw_indexed_models: set[tuple[str, UUID]] = set()
+
+
+@dataclass(frozen=True)
+class IVFIndex:
+    """Inverted file index of unit-length embeddings grouped by their nearest centroid.
+
+    The embeddings of list ``i`` are ``embeddings[list_offsets[i] : list_offsets[i + 1]]``,
+    and ``sample_id_bytes`` holds the 16 raw bytes of their sample IDs in the same order.
+    """
+
+    embedding_version: int
+    centroids: NDArray[np.float32]
+    list_offsets: NDArray[np.int64]
+    embeddings: NDArray[np.float32]
+    sample_id_bytes: bytes
+
+    def __len__(self) -> int:
+        """Number of indexed embeddings."""
+        return len(self.embeddings)
+
+    @classmethod
+    def build(
+        cls,
+        sample_ids: Sequence[UUID],
+        embeddings: NDArray[np.float32],
+        embedding_version: int,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """Build the index of the given embeddings.
+
+        Args:
+            sample_ids: Sample ID of each embedding.
+            embeddings: Embeddings to index, shape (N, D).
+            embedding_version: Version of the embeddings, see
+                ``sample_embedding_resolver.get_version``.
+            seed: Seed of the k-means initialization.
+
+        Returns:
+            The index.
+        """
+        unit = _normalize_rows(embeddings)
+        num_lists = min(_MAX_NUM_LISTS, max(1, round(math.sqrt(len(unit)))))
+        centroids = _train_centroids(
+            embeddings=unit, num_lists=num_lists, rng=np.random.default_rng(seed)
+        )
+        assignments = _assign(embeddings=unit, centroids=centroids)
+        order = np.argsort(assignments, kind="stable")
+        list_offsets = np.zeros(num_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=num_lists), out=list_offsets[1:])
+        raw_sample_ids = np.frombuffer(
+            b"".join(sample_id.bytes for sample_id in sample_ids), dtype=_SAMPLE_ID_DTYPE
+        )
+        return cls(
+            embedding_version=embedding_version,
+            centroids=centroids,
+            list_offsets=list_offsets,
+            embeddings=unit[order],
+            sample_id_bytes=raw_sample_ids[order].tobytes(),
+        )
+
+    def search(
+        self,
+        query_embedding: Sequence[float] | NDArray[np.float32],
+        k: int,
+        num_probes: int = DEFAULT_NUM_PROBES,
+    ) -> list[UUID]:
+        """Return the sample IDs of the ``k`` nearest embeddings in the probed lists.
+
+        Args:
+            query_embedding: Embedding to search for.
+            k: Number of sample IDs to return.
+            num_probes: Number of lists to score, in order of the similarity of their
+                centroid to the query. More lists are scored if they hold fewer than ``k``
+                embeddings.
+
+        Returns:
+            Up to ``k`` sample IDs, the nearest first.
+        """
+        query = _normalize_rows(np.asarray(query_embedding, dtype=np.float32).reshape(1, -1))[0]
+        list_order = np.argsort(-(self.centroids @ query), kind="stable")
+        cumulative_sizes = np.cumsum(np.diff(self.list_offsets)[list_order])
+        num_lists = max(num_probes, int(np.searchsorted(cumulative_sizes, k)) + 1)
+        rows = np.concatenate(
+            [
+                np.arange(self.list_offsets[list_index], self.list_offsets[list_index + 1])
+                for list_index in list_order[:num_lists]
+            ]
+        )
+        scores = self.embeddings[rows] @ query
+        top = np.argpartition(-scores, k - 1)[:k] if len(rows) > k else np.arange(len(rows))
+        nearest_rows = rows[top[np.argsort(-scores[top], kind="stable")]]
+        raw_sample_ids = np.frombuffer(self.sample_id_bytes, dtype=_SAMPLE_ID_DTYPE)
+        return [UUID(bytes=raw.tobytes()) for raw in raw_sample_ids[nearest_rows]]
+
+    def save(self, path: Path) -> None:
+        """Write the index to ``path``, replacing an existing file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with temporary_path.open("wb") as file:
+            np.savez(
+                file,
+                embedding_version=np.int64(self.embedding_version),
+                centroids=self.centroids,
+                list_offsets=self.list_offsets,
+                embeddings=self.embeddings,
+                sample_id_bytes=np.frombuffer(self.sample_id_bytes, dtype=np.uint8),
+            )
+        temporary_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> IVFIndex:
+        """Read an index written by ``save``."""
+        with np.load(path) as data:
+            return cls(
+                embedding_version=int(data["embedding_version"]),
+                centroids=data["centroids"],
+                list_offsets=data["list_offsets"],
+                embeddings=data["embeddings"],
+                sample_id_bytes=data["sample_id_bytes"].tobytes(),
+            )
+
+
+def search(
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    query_embedding: Sequence[float],
+    k: int,
+) -> list[UUID] | None:
+    """Return approximately the ``k`` samples whose embeddings are nearest to the query.
+
+    The candidates are ordered by approximate distance and may miss some of the exact
+    nearest samples.
+
+    Args:
+        session: Database session.
+        collection_id: Collection of the samples.
+        embedding_model_id: Embedding model of the embeddings to search.
+        query_embedding: Embedding to search for.
+        k: Number of candidates.
+
+    Returns:
+        The sample IDs of the candidates, or None if the samples have to be ranked by a
+        full scan: because the collection has fewer than
+        ``LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS`` embeddings, because ``k`` is not smaller
+        than the number of embeddings or larger than the index supports, or because the
+        index is still being built.
+    """
+    embedding_version = sample_embedding_resolver.get_version(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+    )
+    num_embeddings = _get_num_embeddings(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        embedding_version=embedding_version,
+    )
+    if num_embeddings < max(1, env.LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS) or k >= num_embeddings:
+        return None
+
+    if session.get_bind().dialect.name == DatabaseBackend.POSTGRESQL.value:
+        return _search_hnsw(
+            session=session,
+            embedding_model_id=embedding_model_id,
+            query_embedding=query_embedding,
+            k=k,
+        )
+    index = _get_ivf_index(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        embedding_version=embedding_version,
+    )
+    if index is None:
+        return None
+    return index.search(query_embedding=query_embedding, k=k)
+
+
+def wait_for_ivf_builds() -> None:
+    """Block until the IVF indices being loaded or built in the background are stored."""
+    with _ivf_indices_lock:
+        pending = list(_ivf_builds.values())
+    wait(pending)
+
+
+def _get_num_embeddings(
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    embedding_version: int,
+) -> int:
+    """Return the number of embeddings of a model, counted once per embedding version."""
+    key = (_database_key(session=session), embedding_model_id)
+    cached = _num_embeddings.get(key)
+    if cached is not None and cached[0] == embedding_version:
+        return cached[1]
+    num_embeddings = sample_embedding_resolver.get_embedding_count(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+    )
+    _num_embeddings[key] = (embedding_version, num_embeddings)
+    return num_embeddings
+
+
+def _search_hnsw(
+    session: Session,
+    embedding_model_id: UUID,
+    query_embedding: Sequence[float],
+    k: int,
+) -> list[UUID] | None:
+    """Search the pgvector HNSW index of an embedding model, creating it if needed."""
+    if k > _HNSW_MAX_CANDIDATES:
+        return None
+    embedding_model = session.get(EmbeddingModelTable, embedding_model_id)
+    if embedding_model is None:
+        raise ValueError(f"Embedding model {embedding_model_id} not found.")
+    # The embedding column has no dimension, which HNSW requires, so the index is built
+    # over a cast to the dimension of the model. The model ID is inlined rather than bound,
+    # so that the planner can match the partial index for any query plan.
+    vector_type = f"vector({int(embedding_model.embedding_dimension)})"
+    table_name = SampleEmbeddingTable.__tablename__
+    key = (_database_key(session=session), embedding_model_id)
+    if key not in _hnsw_indexed_models:
+        session.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table_name}_hnsw_{embedding_model_id.hex} "
+                f"ON {table_name} USING hnsw ((embedding::{vector_type}) vector_cosine_ops) "
+                f"WHERE embedding_model_id = '{embedding_model_id}'"
+            )
+        )
+        session.commit()
+        _hnsw_indexed_models.add(key)
+
+    session.execute(text(f"SET LOCAL hnsw.ef_search = {max(k, _HNSW_MIN_EF_SEARCH)}"))
+    rows = session.execute(
+        text(
+            f"SELECT sample_id FROM {table_name} "
+            f"WHERE embedding_model_id = '{embedding_model_id}' "
+            f"ORDER BY embedding::{vector_type} <=> CAST(:query AS {vector_type}) "
+            "LIMIT :k"
+        ),
+        {"query": "[" + ",".join(str(float(value)) for value in query_embedding) + "]", "k": k},
+    ).all()
+    return [row[0] for row in rows]
+
+
+def _get_ivf_index(
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    embedding_version: int,
+) -> IVFIndex | None:
+    """Return the IVF index of an embedding model at the given embedding version.
+
+    If the index in memory does not hold the current embedding version, it is loaded from
+    its file or built and written to its file in the background, and None is returned
+    until it is stored. The embeddings to build it from are read here, as the session must
+    not be used by another thread.
+    """
+    key = (_database_key(session=session), embedding_model_id)
+    with _ivf_indices_lock:
+        index = _ivf_indices.get(key)
+        if index is not None and index.embedding_version == embedding_version:
+            _ivf_indices.move_to_end(key)
+            return index
+        if key in _ivf_builds:
+            return None
+
+    path = _ivf_index_path(session=session, embedding_model_id=embedding_model_id)
+    matrix = None
+    if path is None or _stored_embedding_version(path=path) != embedding_version:
+        matrix = sample_embedding_resolver.get_matrix_by_collection_id(
+            session=session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+        )
+
+    with _ivf_indices_lock:
+        if key not in _ivf_builds:
+            _ivf_builds[key] = get_media_executor("similarity_index").submit(
+                _load_or_build_ivf_index,
+                key=key,
+                path=path,
+                matrix=matrix,
+                embedding_version=embedding_version,
+            )
+    return None
+
+
+def _load_or_build_ivf_index(
+    key: tuple[str, UUID],
+    path: Path | None,
+    matrix: EmbeddingMatrix | None,
+    embedding_version: int,
+) -> None:
+    """Load the IVF index from ``path``, or build it from ``matrix``, and store it."""
+    index: IVFIndex | None = None
+    try:
+        if matrix is not None:
+            index = IVFIndex.build(
+                sample_ids=matrix.sample_ids,
+                embeddings=matrix.embeddings,
+                embedding_version=embedding_version,
+            )
+            if path is not None:
+                index.save(path=path)
+        elif path is not None:
+            index = IVFIndex.load(path=path)
+    except Exception:
+        # The next search of the model schedules another attempt.
+        logger.exception(f"Could not build the IVF index of embedding model {key[1]}.")
+    finally:
+        with _ivf_indices_lock:
+            _ivf_builds.pop(key, None)
+            if index is not None:
+                _ivf_indices[key] = index
+                _ivf_indices.move_to_end(key)
+                while len(_ivf_indices) > _MAX_CACHED_INDICES:
+                    _ivf_indices.popitem(last=False)
+
+
+def _stored_embedding_version(path: Path) -> int | None:
+    """Return the embedding version of the IVF index file, None if there is none."""
+    if not path.exists():
+        return None
+    # Only reads the version, the arrays of an ``.npz`` file are loaded on access.
+    with np.load(path) as data:
+        return int(data["embedding_version"])
+
+
+def _ivf_index_path(session: Session, embedding_model_id: UUID) -> Path | None:
+    """Return the file of the IVF index of an embedding model, None for in-memory databases."""
+    database = session.get_bind().engine.url.database
+    if not database or database == ":memory:":
+        return None
+    return Path(f"{database}.ann") / f"{embedding_model_id}.npz"
+
+
+def _database_key(session: Session) -> str:
+    """Identify the database of a session."""
+    return str(session.get_bind().engine.url)
+
+
+def _train_centroids(
+    embeddings: NDArray[np.float32], num_lists: int, rng: np.random.Generator
+) -> NDArray[np.float32]:
+    """Cluster unit-length embeddings with spherical k-means on a random subset."""
+    num_training = min(len(embeddings), num_lists * _TRAINING_SAMPLES_PER_LIST)
+    training = embeddings[np.sort(rng.choice(len(embeddings), size=num_training, replace=False))]
+    centroids: NDArray[np.float32] = training[
+        rng.choice(num_training, size=num_lists, replace=False)
+    ].copy()
+    for _ in range(_NUM_KMEANS_ITERATIONS):
+        assignments = _assign(embeddings=training, centroids=centroids)
+        counts = np.bincount(assignments, minlength=num_lists)
+        starts = np.cumsum(counts) - counts
+        non_empty = counts > 0
+        sums = np.zeros_like(centroids)
+        sums[non_empty] = np.add.reduceat(
+            training[np.argsort(assignments, kind="stable")], starts[non_empty], axis=0
+        )
+        centroids = _normalize_rows(sums)
+        # Restart empty clusters from random embeddings.
+        num_empty = int(np.count_nonzero(~non_empty))
+        if num_empty > 0:
+            centroids[~non_empty] = training[rng.choice(num_training, size=num_empty)]
+    return centroids
+
+
+def _assign(embeddings: NDArray[np.float32], centroids: NDArray[np.float32]) -> NDArray[np.int64]:
+    """Return the index of the most similar centroid of each embedding."""
+    assignments = np.empty(len(embeddings), dtype=np.int64)
+    for start in range(0, len(embeddings), _ASSIGNMENT_BATCH_SIZE):
+        batch = embeddings[start : start + _ASSIGNMENT_BATCH_SIZE]
+        assignments[start : start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return assignments
+
+
+def _normalize_rows(values: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Scale each row to unit length, leaving all-zero rows unchanged."""
+    values = np.asarray(values, dtype=np.float32)
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    return cast(NDArray[np.float32], values / np.where(norms == 0, 1.0, norms))
@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
 from uuid import UUID
 
 from sqlalchemy import ColumnElement
 from sqlmodel import Session, col, select
 
+from lightly_studio.api.routes.api.validators import Paginated
 from lightly_studio.database import db_vector
 from lightly_studio.models.embedding_model import EmbeddingModelTable
 from lightly_studio.models.sample_embedding import SampleEmbeddingTable
+from lightly_studio.resolvers import similarity_index
 from lightly_studio.type_definitions import QueryType
 
+T = TypeVar("T")
+
+# Number of candidates requested from the approximate index per row up to the end of the
+# page, leaving room for candidates removed by the filters of the query.
+_CANDIDATES_PER_ROW = 4
+# Smallest number of candidates requested from the approximate index.
+_MIN_CANDIDATES = 256
+# Factor by which the number of candidates grows when the filters removed too many.
+_CANDIDATES_GROWTH_FACTOR = 4
+
 
 def get_distance_expression(
     session: Session,
@@ -72,3 +85,51 @@ def apply_ordering(
     if distance_expr is not None:
         return query.order_by(distance_expr)
     return query.order_by(col(default_order_column).asc())
+
+
+def fetch_similarity_page(  # noqa: PLR0913
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    text_embedding: list[float],
+    pagination: Paginated | None,
+    fetch_page: Callable[[Sequence[UUID] | None], Sequence[T]],
+) -> Sequence[T]:
+    """Fetch a page of a similarity search, narrowed down by the approximate index if possible.
+
+    ``fetch_page`` runs the query of the caller, ordered by exact distance and paginated. It
+    receives the sample IDs of the candidates to restrict the query to, or None to scan all
+    samples. If the candidates that pass the filters of the query do not fill the page, the
+    search is repeated with more candidates, up to a full scan. Pages of the index results
+    are thus exact up to the recall of the index, see ``similarity_index.search``.
+
+    Args:
+        session: Database session.
+        collection_id: Collection of the samples.
+        embedding_model_id: Embedding model of the search.
+        text_embedding: Embedding to search for.
+        pagination: Pagination of the query. Without it, all samples are scanned.
+        fetch_page: Runs the query, restricted to the given sample IDs unless None.
+
+    Returns:
+        The rows returned by ``fetch_page``.
+    """
+    if pagination is None:
+        return fetch_page(None)
+    num_candidates = max(
+        _MIN_CANDIDATES, (pagination.offset + pagination.limit) * _CANDIDATES_PER_ROW
+    )
+    while True:
+        candidate_sample_ids = similarity_index.search(
+            session=session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            query_embedding=text_embedding,
+            k=num_candidates,
+        )
+        if not candidate_sample_ids:
+            return fetch_page(None)
+        rows = fetch_page(candidate_sample_ids)
+        if len(rows) >= pagination.limit:
+            return rows
+        num_candidates *= _CANDIDATES_GROWTH_FACTOR
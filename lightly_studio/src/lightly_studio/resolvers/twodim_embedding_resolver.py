@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from uuid import UUID
 
 import numpy as np
@@ -10,35 +12,139 @@ from numpy.typing import NDArray
 from sqlmodel import Session
 
 from lightly_studio.database.db_vector import Embedding
+from lightly_studio.dataset import env
 from lightly_studio.models.embedding_model import EmbeddingModelTable
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
 from lightly_studio.resolvers import sample_embedding_resolver
 
+# Number of nearest neighbours in the existing layout that place a new sample.
+_NUM_NEIGHBORS = 5
+# Largest number of already projected samples searched for neighbours. Larger layouts are
+# subsampled evenly, which keeps an update cheap on collections with millions of samples.
+_MAX_REFERENCE_SAMPLES = 20_000
+# Number of new samples whose neighbours are searched at once, bounding the size of the
+# similarity matrix.
+_NEIGHBOR_SEARCH_BATCH_SIZE = 256
+
+
+# Byte order and width of the stored coordinates.
+_COORDINATE_DTYPE = np.dtype("<f4")
+# Number of bytes of a stored sample id.
+SAMPLE_ID_NUM_BYTES = 16
+
+
+@dataclass(frozen=True)
+class TwoDimProjection:
+    """A cached 2D projection in its stored binary layout.
+
+    The coordinates are read-only views on the stored bytes. ``sample_id_bytes`` holds the
+    16 raw bytes of each sample id in the order of the coordinates; ``sample_ids`` decodes
+    them, which creates one Python object per sample.
+    """
+
+    x: NDArray[np.float32]
+    y: NDArray[np.float32]
+    sample_id_bytes: bytes
+
+    @property
+    def sample_ids(self) -> list[UUID]:
+        """The sample IDs in the order of the coordinates."""
+        return decode_sample_ids(self.sample_id_bytes)
+
+
+@dataclass(frozen=True)
+class _Projection:
+    """A 2D projection together with the samples it covers, in matching order."""
+
+    x: NDArray[np.float32]
+    y: NDArray[np.float32]
+    sample_ids: list[UUID]
+    num_changed_samples: int
+
 
 def get_twodim_embeddings(
     session: Session,
     collection_id: UUID,
     embedding_model_id: UUID,
+    max_drift: float | None = None,
 ) -> tuple[NDArray[np.float32], NDArray[np.float32], list[UUID]]:
     """Return cached 2D embeddings together with their sample identifiers.
 
-    Uses a cache to avoid recomputing the 2D embeddings. The cache key combines the sorted
-    sample identifiers with a deterministic 64-bit hash over the stored high-dimensional
-    embeddings.
+    See ``get_twodim_projection``, which avoids decoding the sample IDs.
 
     Args:
         session: Database session.
         collection_id: Collection identifier.
         embedding_model_id: Embedding model identifier.
+        max_drift: Fraction of samples that may be added or removed incrementally before
+            the projection is recomputed. Defaults to
+            ``LIGHTLY_STUDIO_2D_EMBEDDING_MAX_DRIFT``.
 
     Returns:
         Tuple of (x coordinates, y coordinates, ordered sample IDs).
     """
+    projection = get_twodim_projection(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        max_drift=max_drift,
+    )
+    return projection.x, projection.y, projection.sample_ids
+
+
+def get_twodim_projection(
+    session: Session,
+    collection_id: UUID,
+    embedding_model_id: UUID,
+    max_drift: float | None = None,
+) -> TwoDimProjection:
+    """Return the cached 2D projection of a collection.
+
+    Uses a cache to avoid recomputing the 2D embeddings. The cache is valid while the
+    embedding version of the collection is unchanged, which takes a single lookup. Once
+    the version changed, the cache is verified against a deterministic hash over the
+    stored high-dimensional embeddings.
+
+    When samples were added or removed since the cached projection was computed, the
+    projection is updated incrementally: removed samples are dropped and each new sample
+    is placed at the similarity-weighted mean of its nearest neighbours in the existing
+    layout. The projection is recomputed from scratch once the samples changed this way
+    exceed ``max_drift`` of the collection, or when the samples are unchanged but their
+    embeddings differ.
+
+    Args:
+        session: Database session.
+        collection_id: Collection identifier.
+        embedding_model_id: Embedding model identifier.
+        max_drift: Fraction of samples that may be added or removed incrementally before
+            the projection is recomputed. 0 always recomputes. Defaults to
+            ``LIGHTLY_STUDIO_2D_EMBEDDING_MAX_DRIFT``.
+
+    Returns:
+        The projection, empty if the collection has no embeddings.
+    """
+    if max_drift is None:
+        max_drift = env.LIGHTLY_STUDIO_2D_EMBEDDING_MAX_DRIFT
+    if max_drift < 0:
+        raise ValueError(f"max_drift must not be negative, got {max_drift}.")
+
     embedding_model = session.get(EmbeddingModelTable, embedding_model_id)
     if embedding_model is None:
         raise ValueError(f"Embedding model {embedding_model_id} not found.")
 
-    # Check if we have a cached 2D embedding for the given collection and embedding model.
+    # Read the version before the embeddings: if they change in between, the version stored
+    # with the cache entry is already outdated and the next call verifies it again.
+    embedding_version = sample_embedding_resolver.get_version(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+    )
+    cached = session.get(TwoDimEmbeddingTable, (collection_id, embedding_model_id))
+    if cached is not None and cached.embedding_version == embedding_version:
+        session.commit()
+        return _to_projection(cached=cached)
+
+    # The version changed, verify the cached entry against the embeddings hash.
     cache_key, sample_ids_of_samples_with_embeddings = (
         sample_embedding_resolver.get_hash_by_collection_id(
             session=session,
@@ -48,44 +154,252 @@ def get_twodim_embeddings(
     )
 
     if not sample_ids_of_samples_with_embeddings:
-        empty = np.array([], dtype=np.float32)
-        return empty, empty, []
+        session.commit()
+        return _empty_projection()
 
-    # If there is a cached entry, return it.
-    cached = session.get(TwoDimEmbeddingTable, cache_key)
-    if cached is not None:
-        x_values = np.array(cached.x, dtype=np.float32)
-        y_values = np.array(cached.y, dtype=np.float32)
-        return x_values, y_values, sample_ids_of_samples_with_embeddings
+    # If the cached entry was computed from the same embeddings, return it.
+    if cached is not None and cached.hash == cache_key:
+        cached.embedding_version = embedding_version
+        session.add(cached)
+        session.commit()
+        return _to_projection(cached=cached)
 
-    # No cached entry found - load the high-dimensional embeddings.
-    # The order is defined by sample_ids_of_samples_with_embeddings.
-    sample_embeddings = sample_embedding_resolver.get_by_sample_ids(
+    projection = _update_projection(
         session=session,
+        cached=cached,
         sample_ids=sample_ids_of_samples_with_embeddings,
         embedding_model_id=embedding_model_id,
+        max_drift=max_drift,
     )
 
     # If there are no embeddings, return empty arrays.
-    if not sample_embeddings:
-        empty = np.array([], dtype=np.float32)
-        return empty, empty, []
+    if not projection.sample_ids:
+        session.commit()
+        return _empty_projection()
+
+    # Write the 2D embeddings to the cache, replacing the previous projection.
+    x_bytes = encode_coordinates(projection.x)
+    y_bytes = encode_coordinates(projection.y)
+    sample_id_bytes = encode_sample_ids(projection.sample_ids)
+    if cached is None:
+        cached = TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            hash=cache_key,
+            x=x_bytes,
+            y=y_bytes,
+            sample_ids=sample_id_bytes,
+        )
+    cached.hash = cache_key
+    cached.embedding_version = embedding_version
+    cached.x = x_bytes
+    cached.y = y_bytes
+    cached.sample_ids = sample_id_bytes
+    cached.num_changed_samples = projection.num_changed_samples
+    session.add(cached)
+    session.commit()
+
+    return _to_projection(cached=cached)
+
+
+def encode_coordinates(values: Sequence[float] | NDArray[np.float32]) -> bytes:
+    """Encode coordinates in the binary layout of ``TwoDimEmbeddingTable``."""
+    return np.asarray(values, dtype=_COORDINATE_DTYPE).tobytes()
+
+
+def encode_sample_ids(sample_ids: Iterable[UUID]) -> bytes:
+    """Encode sample IDs in the binary layout of ``TwoDimEmbeddingTable``."""
+    return b"".join(sample_id.bytes for sample_id in sample_ids)
+
+
+def decode_sample_ids(sample_id_bytes: bytes) -> list[UUID]:
+    """Decode sample IDs stored in the binary layout of ``TwoDimEmbeddingTable``."""
+    return [
+        UUID(bytes=sample_id_bytes[start : start + SAMPLE_ID_NUM_BYTES])
+        for start in range(0, len(sample_id_bytes), SAMPLE_ID_NUM_BYTES)
+    ]
+
+
+def _to_projection(cached: TwoDimEmbeddingTable) -> TwoDimProjection:
+    """Return a cached projection as views on its stored bytes."""
+    return TwoDimProjection(
+        x=np.frombuffer(cached.x, dtype=_COORDINATE_DTYPE),
+        y=np.frombuffer(cached.y, dtype=_COORDINATE_DTYPE),
+        sample_id_bytes=cached.sample_ids,
+    )
+
+
+def _empty_projection() -> TwoDimProjection:
+    """Return the projection of a collection without embeddings."""
+    empty = np.array([], dtype=np.float32)
+    return TwoDimProjection(x=empty, y=empty, sample_id_bytes=b"")
+
+
+def _update_projection(
+    session: Session,
+    cached: TwoDimEmbeddingTable | None,
+    sample_ids: list[UUID],
+    embedding_model_id: UUID,
+    max_drift: float,
+) -> _Projection:
+    """Extend the cached projection to the given samples, or compute it from scratch."""
+    if cached is not None:
+        projection = _extend_projection(
+            session=session,
+            cached=cached,
+            sample_ids=sample_ids,
+            embedding_model_id=embedding_model_id,
+            max_drift=max_drift,
+        )
+        if projection is not None:
+            return projection
+    return _compute_projection(
+        session=session, sample_ids=sample_ids, embedding_model_id=embedding_model_id
+    )
+
+
+def _compute_projection(
+    session: Session, sample_ids: list[UUID], embedding_model_id: UUID
+) -> _Projection:
+    """Compute the 2D projection of the given samples from scratch."""
+    # Load the high-dimensional embeddings. The order is defined by sample_ids.
+    sample_embeddings = sample_embedding_resolver.get_by_sample_ids(
+        session=session,
+        sample_ids=sample_ids,
+        embedding_model_id=embedding_model_id,
+    )
 
     # Compute the 2D embedding from the high-dimensional embeddings.
     # The order is now defined by sample_embeddings. They are the ordered subset of the
-    # sample_ids_of_samples_with_embeddings that have embeddings.
-    sample_ids_of_samples_with_embeddings = [embedding.sample_id for embedding in sample_embeddings]
+    # sample_ids that have embeddings.
     embedding_values = [embedding.embedding for embedding in sample_embeddings]
     planar_embeddings = _calculate_2d_embeddings(embedding_values)
-    embeddings_2d = np.asarray(planar_embeddings, dtype=np.float32)
-    x_values, y_values = embeddings_2d[:, 0], embeddings_2d[:, 1]
+    embeddings_2d = np.asarray(planar_embeddings, dtype=np.float32).reshape(-1, 2)
+    return _Projection(
+        x=embeddings_2d[:, 0],
+        y=embeddings_2d[:, 1],
+        sample_ids=[embedding.sample_id for embedding in sample_embeddings],
+        num_changed_samples=0,
+    )
+
+
+def _extend_projection(
+    session: Session,
+    cached: TwoDimEmbeddingTable,
+    sample_ids: list[UUID],
+    embedding_model_id: UUID,
+    max_drift: float,
+) -> _Projection | None:
+    """Update a cached projection to the given samples without recomputing it.
+
+    Returns:
+        The updated projection, or None if it has to be recomputed from scratch: because
+        too many samples changed since the last full computation, because the cached and
+        the current samples do not overlap, or because the same samples got different
+        embeddings.
+    """
+    cached_projection = _to_projection(cached=cached)
+    cached_sample_id_list = cached_projection.sample_ids
+    cached_sample_ids = set(cached_sample_id_list)
+    kept_sample_ids = [sample_id for sample_id in sample_ids if sample_id in cached_sample_ids]
+    added_sample_ids = [sample_id for sample_id in sample_ids if sample_id not in cached_sample_ids]
+    num_removed = len(cached_sample_ids) - len(kept_sample_ids)
+    if not added_sample_ids and num_removed == 0:
+        # The samples are unchanged, so their embeddings must have changed.
+        return None
+    if not kept_sample_ids:
+        return None
+    num_changed_samples = cached.num_changed_samples + len(added_sample_ids) + num_removed
+    if num_changed_samples > max_drift * len(sample_ids):
+        return None
+
+    coordinates = {
+        sample_id: (x, y)
+        for sample_id, x, y in zip(
+            cached_sample_id_list, cached_projection.x.tolist(), cached_projection.y.tolist()
+        )
+    }
+    if added_sample_ids:
+        # Place the new samples next to their neighbours among (a subset of) the kept ones.
+        reference_indices = np.unique(
+            np.linspace(0, len(kept_sample_ids) - 1, num=_MAX_REFERENCE_SAMPLES, dtype=np.int64)
+        )
+        reference_rows = sample_embedding_resolver.get_by_sample_ids(
+            session=session,
+            sample_ids=[kept_sample_ids[index] for index in reference_indices],
+            embedding_model_id=embedding_model_id,
+        )
+        added_rows = sample_embedding_resolver.get_by_sample_ids(
+            session=session,
+            sample_ids=added_sample_ids,
+            embedding_model_id=embedding_model_id,
+        )
+        if not reference_rows or not added_rows:
+            return None
+        added_xy = _project_out_of_sample(
+            reference_embeddings=np.stack([row.embedding for row in reference_rows]),
+            reference_xy=np.asarray(
+                [coordinates[row.sample_id] for row in reference_rows], dtype=np.float32
+            ),
+            new_embeddings=np.stack([row.embedding for row in added_rows]),
+        )
+        coordinates.update(
+            (row.sample_id, (float(x), float(y))) for row, (x, y) in zip(added_rows, added_xy)
+        )
+
+    # Keep the order of the current samples, as a full computation would.
+    projected_sample_ids = [sample_id for sample_id in sample_ids if sample_id in coordinates]
+    projected_xy = np.asarray(
+        [coordinates[sample_id] for sample_id in projected_sample_ids], dtype=np.float32
+    ).reshape(-1, 2)
+    return _Projection(
+        x=projected_xy[:, 0],
+        y=projected_xy[:, 1],
+        sample_ids=projected_sample_ids,
+        num_changed_samples=num_changed_samples,
+    )
+
+
+def _project_out_of_sample(
+    reference_embeddings: NDArray[np.float32],
+    reference_xy: NDArray[np.float32],
+    new_embeddings: NDArray[np.float32],
+) -> NDArray[np.float32]:
+    """Place new embeddings into an existing 2D layout.
+
+    Each new embedding is placed at the mean position of its nearest reference
+    embeddings by cosine similarity, weighted by the inverse cosine distance so that a
+    duplicate lands on its original.
+
+    Args:
+        reference_embeddings: Embeddings of the already projected samples, shape (N, D).
+        reference_xy: 2D positions of the already projected samples, shape (N, 2).
+        new_embeddings: Embeddings to place, shape (M, D).
+
+    Returns:
+        2D positions of the new embeddings, shape (M, 2).
+    """
+    reference_unit = _normalize_rows(reference_embeddings)
+    num_neighbors = min(_NUM_NEIGHBORS, len(reference_unit))
+    positions = np.empty((len(new_embeddings), 2), dtype=np.float32)
+    for start in range(0, len(new_embeddings), _NEIGHBOR_SEARCH_BATCH_SIZE):
+        batch = _normalize_rows(new_embeddings[start : start + _NEIGHBOR_SEARCH_BATCH_SIZE])
+        similarities = batch @ reference_unit.T
+        neighbors = np.argpartition(-similarities, num_neighbors - 1, axis=1)[:, :num_neighbors]
+        neighbor_similarities = np.take_along_axis(similarities, neighbors, axis=1)
+        weights = 1.0 / (1.0 - np.clip(neighbor_similarities, -1.0, 1.0) + 1e-6)
+        weights /= weights.sum(axis=1, keepdims=True)
+        positions[start : start + len(batch)] = np.einsum(
+            "mk,mkd->md", weights, reference_xy[neighbors]
+        )
+    return positions
 
-    # Write the computed 2D embeddings to the cache.
-    cache_entry = TwoDimEmbeddingTable(hash=cache_key, x=list(x_values), y=list(y_values))
-    session.add(cache_entry)
-    session.commit()
 
-    return x_values, y_values, sample_ids_of_samples_with_embeddings
+def _normalize_rows(values: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Scale each row to unit length, leaving all-zero rows unchanged."""
+    values = np.asarray(values, dtype=np.float32)
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    return values / np.where(norms == 0, 1.0, norms)  # type: ignore[no-any-return]
 
 
 def _calculate_2d_embeddings(
@@ -17,6 +17,11 @@ from lightly_studio.resolvers.video_frame_resolver.get_frame_infos_by_ids import
     VideoFrameInfoRow,
     get_frame_infos_by_ids,
 )
+from lightly_studio.resolvers.video_frame_resolver.get_frame_media_infos import (
+    VideoFrameMediaInfo,
+    get_frame_media_infos_by_ids,
+    get_frame_media_infos_by_video,
+)
 from lightly_studio.resolvers.video_frame_resolver.get_sample_ids import (
     build_sample_ids_query,
     get_sample_ids,
@@ -34,6 +39,7 @@ from lightly_studio.resolvers.video_frame_resolver.video_frame_adjacent_filter i
 __all__ = [
     "VideoFrameAdjacentFilter",
     "VideoFrameInfoRow",
+    "VideoFrameMediaInfo",
     "build_sample_ids_query",
     "create_many",
     "get_adjacent_video_frames",
@@ -41,6 +47,8 @@ __all__ = [
     "get_all_by_video_ids",
     "get_by_id",
     "get_frame_infos_by_ids",
+    "get_frame_media_infos_by_ids",
+    "get_frame_media_infos_by_video",
     "get_sample_ids",
     "get_table_fields_bounds",
     "get_video_frames_count_annotation_views",
@@ -15,6 +15,7 @@ from lightly_studio.api.routes.api.validators import Paginated
 from lightly_studio.models.annotation.annotation_base import AnnotationBaseTable
 from lightly_studio.models.sample import SampleTable
 from lightly_studio.models.video import VideoFrameTable, VideoTable
+from lightly_studio.resolvers.adjacents import keyset_seek
 from lightly_studio.resolvers.video_frame_resolver.video_frame_filter import VideoFrameFilter
 
 
@@ -24,6 +25,15 @@ class VideoFramesWithCount(BaseModel):
     samples: Sequence[VideoFrameTable]
     total_count: int
     next_cursor: int | None = None
+    next_seek_cursor: str | None = None
+
+
+# Frames are sorted by video path and frame number; the sample ID makes the order total.
+_SORT_KEYS: list[keyset_seek.SortKey] = [
+    (col(VideoTable.file_path_abs), True),
+    (col(VideoFrameTable.frame_number), True),
+    (col(VideoFrameTable.sample_id), True),
+]
 
 
 def get_all_by_collection_id(
@@ -31,8 +41,13 @@ def get_all_by_collection_id(
     collection_id: UUID,
     pagination: Paginated | None = None,
     video_frame_filter: VideoFrameFilter | None = None,
+    seek_cursor: str | None = None,
 ) -> VideoFramesWithCount:
-    """Retrieve video frame samples for a specific collection with optional filtering."""
+    """Retrieve video frame samples for a specific collection with optional filtering.
+
+    Paginated results also return ``next_seek_cursor``. Passing it as ``seek_cursor`` for
+    the next page seeks to the page instead of skipping ``pagination.offset`` rows.
+    """
     filters: list[Any] = [SampleTable.collection_id == collection_id]
 
     base_query = (
@@ -46,12 +61,17 @@ def get_all_by_collection_id(
         base_query = video_frame_filter.apply(base_query)
 
     samples_query = base_query.options(_get_load_options()).order_by(
-        col(VideoTable.file_path_abs).asc(), col(VideoFrameTable.frame_number).asc()
+        *keyset_seek.order_by_columns(sort_keys=_SORT_KEYS)
     )
 
     # Apply pagination if provided
     if pagination is not None:
-        samples_query = samples_query.offset(pagination.offset).limit(pagination.limit)
+        samples_query = keyset_seek.paginate(
+            query=samples_query,
+            pagination=pagination,
+            sort_keys=_SORT_KEYS,
+            seek_cursor=seek_cursor,
+        )
 
     total_count_query = select(func.count()).select_from(base_query.subquery())
     total_count = session.exec(total_count_query).one()
@@ -59,11 +79,31 @@ def get_all_by_collection_id(
     if pagination and pagination.offset + pagination.limit < total_count:
         next_cursor = pagination.offset + pagination.limit
 
+    samples = session.exec(samples_query).all()
+    next_seek_cursor = None
+    if pagination is not None and len(samples) == pagination.limit:
+        next_seek_cursor = _seek_cursor_after(session=session, sample_id=samples[-1].sample_id)
+
     return VideoFramesWithCount(
-        samples=session.exec(samples_query).all(),
+        samples=samples,
         total_count=total_count,
         next_cursor=next_cursor,
+        next_seek_cursor=next_seek_cursor,
+    )
+
+
+def _seek_cursor_after(session: Session, sample_id: UUID) -> str | None:
+    """Return the cursor of the page after the given frame."""
+    values = keyset_seek.fetch_anchor(
+        session=session,
+        query=select(*[column for column, _ in _SORT_KEYS])
+        .select_from(VideoFrameTable)
+        .join(VideoFrameTable.video)
+        .where(col(VideoFrameTable.sample_id) == sample_id),
     )
+    if values is None:
+        return None
+    return keyset_seek.encode_cursor(sort_keys=_SORT_KEYS, values=values)
 
 
 def _get_load_options() -> LoaderOption:
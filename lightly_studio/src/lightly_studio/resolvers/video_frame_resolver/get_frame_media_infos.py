@@ -0,0 +1,87 @@
+"""Retrieve what is needed to decode video frames, by sample ID or frame range."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
+
+from lightly_studio.models.video import VideoFrameTable, VideoTable
+from lightly_studio.utils import batching
+
+
+class VideoFrameMediaInfo(NamedTuple):
+    """A frame's sample ID with the location and orientation of its pixels."""
+
+    sample_id: UUID
+    video_path: str
+    frame_number: int
+    rotation_deg: int
+
+
+def get_frame_media_infos_by_ids(
+    session: Session,
+    sample_ids: Sequence[UUID],
+) -> list[VideoFrameMediaInfo]:
+    """Retrieve the media info of the given frames.
+
+    Output order matches the input order. Sample IDs with no matching frame are omitted.
+
+    Args:
+        session: The database session.
+        sample_ids: Frame sample IDs to load.
+
+    Returns:
+        Media info rows, in the same order as ``sample_ids``.
+    """
+    info_by_sample_id: dict[UUID, VideoFrameMediaInfo] = {}
+    # Batch the ids to stay under PostgreSQL's 65,535 bind-parameter limit.
+    for batch in batching.batched(items=sample_ids):
+        statement = _select_media_infos().where(col(VideoFrameTable.sample_id).in_(batch))
+        for row in session.exec(statement).all():
+            info = VideoFrameMediaInfo(*row)
+            info_by_sample_id[info.sample_id] = info
+    return [
+        info_by_sample_id[sample_id] for sample_id in sample_ids if sample_id in info_by_sample_id
+    ]
+
+
+def get_frame_media_infos_by_video(
+    session: Session,
+    video_id: UUID,
+    start_frame: int,
+    end_frame: int,
+) -> list[VideoFrameMediaInfo]:
+    """Retrieve the media info of a range of frames of one video, in frame order.
+
+    Args:
+        session: The database session.
+        video_id: Sample ID of the video.
+        start_frame: Number of the first frame of the range.
+        end_frame: Number of the frame after the last frame of the range.
+
+    Returns:
+        Media info rows of the frames in the range, ordered by frame number.
+    """
+    statement = (
+        _select_media_infos()
+        .where(
+            col(VideoFrameTable.parent_sample_id) == video_id,
+            col(VideoFrameTable.frame_number) >= start_frame,
+            col(VideoFrameTable.frame_number) < end_frame,
+        )
+        .order_by(col(VideoFrameTable.frame_number))
+    )
+    return [VideoFrameMediaInfo(*row) for row in session.exec(statement).all()]
+
+
+def _select_media_infos() -> Select[tuple[UUID, str, int, int]]:
+    return select(
+        VideoFrameTable.sample_id,
+        VideoTable.file_path_abs,
+        VideoFrameTable.frame_number,
+        VideoFrameTable.rotation_deg,
+    ).join(VideoTable, col(VideoTable.sample_id) == col(VideoFrameTable.parent_sample_id))
@@ -9,6 +9,7 @@ from sqlmodel import Session, col, delete, select
 from lightly_studio.models.sample import SampleTable
 from lightly_studio.models.sample_embedding import SampleEmbeddingTable
 from lightly_studio.models.video import VideoFrameTable, VideoTable
+from lightly_studio.resolvers import sample_embedding_resolver
 from lightly_studio.utils import batching
 
 
@@ -40,6 +41,7 @@ def delete_with_frames(session: Session, video_sample_id: UUID) -> None:
         session.exec(
             delete(SampleEmbeddingTable).where(col(SampleEmbeddingTable.sample_id).in_(batch))
         )
+    sample_embedding_resolver.increment_versions(session=session, sample_ids=sample_ids)
     # 2. video_frame rows reference both sample.sample_id and video.sample_id.
     session.exec(
         delete(VideoFrameTable).where(col(VideoFrameTable.parent_sample_id) == video_sample_id)
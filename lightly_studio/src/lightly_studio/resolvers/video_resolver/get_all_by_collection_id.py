@@ -22,13 +22,22 @@ from lightly_studio.models.video import (
     VideoView,
     VideoViewsWithCount,
 )
+from lightly_studio.resolvers import grid_count
+from lightly_studio.resolvers.adjacents import keyset_seek
 from lightly_studio.resolvers.similarity_utils import (
     apply_similarity_join,
     distance_to_similarity,
+    fetch_similarity_page,
     get_distance_expression,
 )
 from lightly_studio.resolvers.video_resolver.video_filter import VideoFilter
 
+# Videos are sorted by path; the sample ID makes the order total.
+_SORT_KEYS: list[keyset_seek.SortKey] = [
+    (col(VideoTable.file_path_abs), True),
+    (col(VideoTable.sample_id), True),
+]
+
 
 def _get_load_options() -> list[LoaderOption]:
     """Get common load options for video and frame relationships."""
@@ -83,6 +92,22 @@ def _compute_next_cursor(
     return None
 
 
+def _count_fingerprint(
+    collection_id: UUID,
+    embedding_model_id: UUID | None,
+    sample_ids: list[UUID] | None,
+    filters: VideoFilter | None,
+) -> tuple[Any, ...]:
+    """Identify the videos counted by a grid query, for the count cache."""
+    return (
+        "video",
+        collection_id,
+        embedding_model_id,
+        sample_ids,
+        filters.model_dump_json() if filters is not None else None,
+    )
+
+
 def get_all_by_collection_id(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
@@ -90,19 +115,27 @@ def get_all_by_collection_id(  # noqa: PLR0913
     sample_ids: list[UUID] | None = None,
     filters: VideoFilter | None = None,
     text_embedding: list[float] | None = None,
+    seek_cursor: str | None = None,
 ) -> VideoViewsWithCount:
-    """Retrieve samples for a specific collection with optional filtering."""
+    """Retrieve samples for a specific collection with optional filtering.
+
+    Total counts are cached until the next database write, so later pages of the same query
+    do not count again. Paginated results without similarity search also return
+    ``next_seek_cursor``. Passing it as ``seek_cursor`` for the next page seeks to the page
+    instead of skipping ``pagination.offset`` rows.
+    """
     embedding_model_id, distance_expr = get_distance_expression(
         session=session,
         collection_id=collection_id,
         text_embedding=text_embedding,
     )
 
-    if distance_expr is not None and embedding_model_id is not None:
+    if distance_expr is not None and embedding_model_id is not None and text_embedding is not None:
         return _get_all_with_similarity(
             session=session,
             collection_id=collection_id,
             embedding_model_id=embedding_model_id,
+            text_embedding=text_embedding,
             distance_expr=distance_expr,
             pagination=pagination,
             sample_ids=sample_ids,
@@ -114,6 +147,7 @@ def get_all_by_collection_id(  # noqa: PLR0913
         pagination=pagination,
         sample_ids=sample_ids,
         filters=filters,
+        seek_cursor=seek_cursor,
     )
 
 
@@ -121,6 +155,7 @@ def _get_all_with_similarity(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
     embedding_model_id: UUID,
+    text_embedding: list[float],
     distance_expr: ColumnElement[float],
     pagination: Paginated | None,
     sample_ids: list[UUID] | None,
@@ -179,11 +214,36 @@ def _get_all_with_similarity(  # noqa: PLR0913
 
     samples_query = samples_query.order_by(distance_expr)
 
-    if pagination is not None:
-        samples_query = samples_query.offset(pagination.offset).limit(pagination.limit)
-
-    total_count = session.exec(total_count_query).one()
-    results = session.exec(samples_query).all()
+    def fetch_page(
+        candidate_sample_ids: Sequence[UUID] | None,
+    ) -> Sequence[tuple[VideoTable, VideoFrameTable | None, float]]:
+        page_query = samples_query
+        if candidate_sample_ids is not None:
+            page_query = page_query.where(
+                db_array.in_array(column=col(VideoTable.sample_id), values=candidate_sample_ids)
+            )
+        if pagination is not None:
+            page_query = page_query.offset(pagination.offset).limit(pagination.limit)
+        return session.exec(page_query).all()
+
+    total_count = grid_count.get_total_count(
+        session=session,
+        query=total_count_query,
+        fingerprint=_count_fingerprint(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            sample_ids=sample_ids,
+            filters=filters,
+        ),
+    ).count
+    results = fetch_similarity_page(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        text_embedding=text_embedding,
+        pagination=pagination,
+        fetch_page=fetch_page,
+    )
 
     video_views = [
         convert_video_table_to_view(
@@ -201,12 +261,13 @@ def _get_all_with_similarity(  # noqa: PLR0913
     )
 
 
-def _get_all_without_similarity(
+def _get_all_without_similarity(  # noqa: PLR0913
     session: Session,
     collection_id: UUID,
     pagination: Paginated | None,
     sample_ids: list[UUID] | None,
     filters: VideoFilter | None,
+    seek_cursor: str | None,
 ) -> VideoViewsWithCount:
     """Get videos without similarity search - returns (VideoTable, VideoFrameTable) tuples."""
     load_options = _get_load_options()
@@ -249,12 +310,26 @@ def _get_all_without_similarity(
         samples_query = filters.apply(samples_query)
         total_count_query = filters.apply(total_count_query)
 
-    samples_query = samples_query.order_by(col(VideoTable.file_path_abs).asc())
+    samples_query = samples_query.order_by(*keyset_seek.order_by_columns(sort_keys=_SORT_KEYS))
 
     if pagination is not None:
-        samples_query = samples_query.offset(pagination.offset).limit(pagination.limit)
+        samples_query = keyset_seek.paginate(
+            query=samples_query,
+            pagination=pagination,
+            sort_keys=_SORT_KEYS,
+            seek_cursor=seek_cursor,
+        )
 
-    total_count = session.exec(total_count_query).one()
+    total_count = grid_count.get_total_count(
+        session=session,
+        query=total_count_query,
+        fingerprint=_count_fingerprint(
+            collection_id=collection_id,
+            embedding_model_id=None,
+            sample_ids=sample_ids,
+            filters=filters,
+        ),
+    ).count
     results = session.exec(samples_query).all()
 
     video_views = [
@@ -262,10 +337,18 @@ def _get_all_without_similarity(
         for video, first_frame in results
     ]
 
+    next_seek_cursor = None
+    if pagination is not None and len(results) == pagination.limit:
+        last_video = results[-1][0]
+        next_seek_cursor = keyset_seek.encode_cursor(
+            sort_keys=_SORT_KEYS, values=(last_video.file_path_abs, last_video.sample_id)
+        )
+
     return VideoViewsWithCount(
         samples=video_views,
         total_count=total_count,
         next_cursor=_compute_next_cursor(pagination, total_count),
+        next_seek_cursor=next_seek_cursor,
     )
 
 
@@ -113,12 +113,12 @@ class Mundig:
             strength:
                 The strength of the similarity strategy.
         """
-        embeddings_ndarray = np.array(embeddings, dtype=np.float32)
+        embeddings_ndarray = np.asarray(embeddings, dtype=np.float32)
         self._check_consistent_input_size(embeddings_ndarray.shape[0])
         similarity = lightly_mundig.Similarity(
             key_embeddings=embeddings_ndarray,
         )
-        query_embeddings_ndarray = np.array(query_embeddings, dtype=np.float32)
+        query_embeddings_ndarray = np.asarray(query_embeddings, dtype=np.float32)
         weights = similarity.calculate_similarity(query_embeddings=query_embeddings_ndarray)
         self.add_weighting(weights=weights, strength=strength)
 
@@ -5,9 +5,10 @@ from __future__ import annotations
 from collections.abc import Sequence
 from uuid import UUID
 
+import numpy as np
+from numpy.typing import NDArray
 from sqlmodel import Session
 
-from lightly_studio.database.db_vector import Embedding
 from lightly_studio.models.tag import TagCreate
 from lightly_studio.resolvers import (
     embedding_model_resolver,
@@ -21,22 +22,22 @@ def get_embeddings_by_sample_ids(
     collection_id: UUID,
     sample_ids: Sequence[UUID],
     embedding_model_name: str | None,
-) -> list[Embedding]:
+) -> NDArray[np.float32]:
     """Resolve sample embeddings for the given model and sample ids.
 
-    Output order matches ``sample_ids``.
+    Output order matches ``sample_ids``; row ``i`` of the matrix is the embedding of the
+    ``i``-th sample that has one.
     """
     embedding_model_id = embedding_model_resolver.get_by_name(
         session=session,
         collection_id=collection_id,
         embedding_model_name=embedding_model_name,
     ).embedding_model_id
-    embedding_tables = sample_embedding_resolver.get_by_sample_ids(
+    return sample_embedding_resolver.get_matrix_by_sample_ids(
         session=session,
-        sample_ids=list(sample_ids),
+        sample_ids=sample_ids,
         embedding_model_id=embedding_model_id,
-    )
-    return [embedding.embedding for embedding in embedding_tables]
+    ).embeddings
 
 
 def create_result_tag(
@@ -430,14 +430,13 @@ def _add_strategy_to_mundig(
         )
         if query_tag is None:
             raise ValueError(f"Query tag with name {strat.query_tag_name} not found.")
-        query_embedding_tables = sample_embedding_resolver.get_all_by_collection_id(
+        query_embeddings = sample_embedding_resolver.get_matrix_by_collection_id(
             session=session,
             collection_id=context.collection_id,
             embedding_model_id=embedding_model_id,
             filters=SampleFilter(tag_ids=[query_tag.tag_id]),
-        )
-        query_embeddings = [embedding.embedding for embedding in query_embedding_tables]
-        if not query_embeddings:
+        ).embeddings
+        if len(query_embeddings) == 0:
             raise ValueError(
                 "Query tag "
                 f"{strat.query_tag_name} does not have embeddings for embedding model "
@@ -32,6 +32,7 @@ QueryType = TypeVar(
     Select[tuple[int, int]],
     Select[tuple[str, int]],
     Select[tuple[UUID, int]],
+    Select[tuple[UUID, UUID]],
     Select[tuple[AnnotationBaseTable, Any]],
     Select[tuple[ImageTable, Any]],
     Select[tuple[ImageTable, float]],
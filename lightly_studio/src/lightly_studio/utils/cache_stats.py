@@ -0,0 +1,22 @@
+"""Counters shared by the in-memory and on-disk caches."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    num_entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache, 0 if there were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import os
 from concurrent.futures import ThreadPoolExecutor
 
+from lightly_studio.utils.workers import default_num_workers
+
 _executors: dict[str, ThreadPoolExecutor] = {}
 
 
@@ -22,9 +23,7 @@ def get_media_executor(thread_name_prefix: str) -> ThreadPoolExecutor:
         The cached ``ThreadPoolExecutor`` for the given prefix.
     """
     if thread_name_prefix not in _executors:
-        cpu_count = os.cpu_count() or 1
-        max_workers = max(1, min(cpu_count - 1 or 1, 16))
         _executors[thread_name_prefix] = ThreadPoolExecutor(
-            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+            max_workers=default_num_workers(), thread_name_prefix=thread_name_prefix
         )
     return _executors[thread_name_prefix]
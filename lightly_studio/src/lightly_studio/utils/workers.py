@@ -0,0 +1,18 @@
+"""Default number of worker threads for CPU-bound work."""
+
+from __future__ import annotations
+
+import os
+
+# Upper bound of the default number of workers, to prevent runaway usage on large machines.
+MAX_DEFAULT_WORKERS = 16
+
+
+def default_num_workers() -> int:
+    """Return the default number of threads for CPU-bound work.
+
+    Uses the available cores - 1 (at least 1), leaving a core for the calling thread,
+    capped at ``MAX_DEFAULT_WORKERS``.
+    """
+    cpu_count = os.cpu_count() or 1
+    return max(1, min(cpu_count - 1 or 1, MAX_DEFAULT_WORKERS))
@@ -4,8 +4,14 @@ from __future__ import annotations
 
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from lightly_studio.api.routes.api.embedding_coloring import coloring_helpers
-from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import DiscreteColorScale
+from lightly_studio.api.routes.api.embedding_coloring.coloring_helpers import (
+    ColorCategories,
+    DiscreteColorScale,
+    SampleIndex,
+)
 
 
 class TestDiscreteColorScale:
@@ -137,14 +143,14 @@ def test_assign_color_categories() -> None:
     sample_to_values = {ids[0]: ["cat"], ids[1]: ["dog"]}
 
     categories, legend = coloring_helpers.assign_color_categories(
-        sample_ids=ids,
+        sample_index=SampleIndex.from_sample_ids(ids),
         sample_to_values=sample_to_values,
         scale=scale,
     )
 
     # No reserved entries: the legend only describes the color scale.
     assert legend == {3: "cat", 4: "dog"}
-    assert categories == [[3], [4]]
+    assert categories.to_lists() == [[3], [4]]
 
 
 def test_assign_color_categories__multiple_values_sorted_by_category() -> None:
@@ -153,14 +159,14 @@ def test_assign_color_categories__multiple_values_sorted_by_category() -> None:
     scale = DiscreteColorScale.from_values(values=["cat", "dog", "fish"])
 
     categories, legend = coloring_helpers.assign_color_categories(
-        sample_ids=[sid],
+        sample_index=SampleIndex.from_sample_ids([sid]),
         # Values out of order; the output is sorted by color category.
         sample_to_values={sid: {"fish", "dog"}},
         scale=scale,
     )
 
     assert legend == {3: "cat", 4: "dog", 5: "fish"}
-    assert categories == [[4, 5]]
+    assert categories.to_lists() == [[4, 5]]
 
 
 def test_assign_color_categories__missing_value_is_empty() -> None:
@@ -169,7 +175,7 @@ def test_assign_color_categories__missing_value_is_empty() -> None:
     sample_to_values = {ids[0]: ["cat"]}  # ids[1] is missing
 
     categories, legend = coloring_helpers.assign_color_categories(
-        sample_ids=ids,
+        sample_index=SampleIndex.from_sample_ids(ids),
         sample_to_values=sample_to_values,
         scale=scale,
     )
@@ -177,7 +183,7 @@ def test_assign_color_categories__missing_value_is_empty() -> None:
     assert legend == {3: "cat"}
     # Samples without a value map to an empty list; the filter/unassigned
     # reserved categories are assigned downstream.
-    assert categories == [[3], []]
+    assert categories.to_lists() == [[3], []]
 
 
 def test_assign_color_categories__mixed() -> None:
@@ -191,26 +197,26 @@ def test_assign_color_categories__mixed() -> None:
     }
 
     categories, legend = coloring_helpers.assign_color_categories(
-        sample_ids=ids,
+        sample_index=SampleIndex.from_sample_ids(ids),
         sample_to_values=sample_to_values,
         scale=scale,
     )
 
     assert legend == {3: "London", 4: "Paris"}
-    assert categories == [[4], [], [3, 4]]
+    assert categories.to_lists() == [[4], [], [3, 4]]
 
 
 def test_assign_color_categories__empty() -> None:
     scale = DiscreteColorScale.from_values(values=["x"])
 
     categories, legend = coloring_helpers.assign_color_categories(
-        sample_ids=[],
+        sample_index=SampleIndex.from_sample_ids([]),
         sample_to_values={},
         scale=scale,
     )
 
     assert legend == {3: "x"}
-    assert categories == []
+    assert categories.to_lists() == []
 
 
 def test_assign_color_categories__unmapped_value_is_empty() -> None:
@@ -219,13 +225,13 @@ def test_assign_color_categories__unmapped_value_is_empty() -> None:
     scale = DiscreteColorScale.from_values(values=["known"])
 
     categories, legend = coloring_helpers.assign_color_categories(
-        sample_ids=[sid],
+        sample_index=SampleIndex.from_sample_ids([sid]),
         sample_to_values={sid: ["unknown"]},
         scale=scale,
     )
 
     assert legend == {3: "known"}
-    assert categories == [[]]
+    assert categories.to_lists() == [[]]
 
 
 def test_order_values_by_frequency() -> None:
@@ -279,3 +285,36 @@ def test_order_values_by_frequency__value_counts_once_per_sample() -> None:
     )
     # "dup" repeats within one sample but counts once -> tie, broken by label.
     assert ordered == ["dup", "single"]
+
+
+def test_sample_index__positions() -> None:
+    ids = [uuid4() for _ in range(4)]
+    sample_index = SampleIndex.from_sample_ids(ids)
+
+    assert len(sample_index) == 4
+    assert sample_index.sample_ids == ids
+    assert sample_index.positions([ids[2], uuid4(), ids[0]]).tolist() == [2, -1, 0]
+    assert sample_index.mask([ids[3], ids[1], uuid4()]).tolist() == [False, True, False, True]
+
+
+def test_sample_index__empty() -> None:
+    sample_index = SampleIndex.from_sample_ids([])
+
+    assert len(sample_index) == 0
+    assert sample_index.positions([uuid4()]).tolist() == [-1]
+    assert sample_index.mask([uuid4()]).tolist() == []
+
+
+def test_color_categories__from_pairs() -> None:
+    categories = ColorCategories.from_pairs(
+        num_samples=4,
+        positions=np.array([3, 0, 3, 0], dtype=np.int64),
+        categories=np.array([5, 4, 3, 7], dtype=np.uint8),
+    )
+
+    assert categories.offsets.tolist() == [0, 2, 2, 2, 4]
+    assert categories.to_lists() == [[4, 7], [], [], [3, 5]]
+
+
+def test_color_categories__empty() -> None:
+    assert ColorCategories.empty(num_samples=2).to_lists() == [[], []]
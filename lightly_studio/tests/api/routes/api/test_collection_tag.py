@@ -13,7 +13,11 @@ from lightly_studio.api.routes.api.status import (
 from lightly_studio.models.collection import SampleType
 from lightly_studio.models.sample import SampleTagLinkTable
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
-from lightly_studio.resolvers import collection_resolver, sample_embedding_resolver
+from lightly_studio.resolvers import (
+    collection_resolver,
+    sample_embedding_resolver,
+    twodim_embedding_resolver,
+)
 from tests.helpers_resolvers import (
     ImageStub,
     create_annotation,
@@ -184,9 +188,16 @@ def test_add_samples_by_filter__image_filter_with_embedding_region_tags_only_reg
     }
     db_session.add(
         TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(cached_sample_ids),
             hash=cache_key,
-            x=[coordinates_by_sample[sid][0] for sid in cached_sample_ids],
-            y=[coordinates_by_sample[sid][1] for sid in cached_sample_ids],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sid][0] for sid in cached_sample_ids]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sid][1] for sid in cached_sample_ids]
+            ),
         )
     )
     db_session.commit()
@@ -284,9 +295,16 @@ def test_add_samples_by_filter__annotations_filter_with_embedding_region_tags_on
     }
     db_session.add(
         TwoDimEmbeddingTable(
+            collection_id=annotation_collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(cached_sample_ids),
             hash=cache_key,
-            x=[coordinates_by_sample[sid][0] for sid in cached_sample_ids],
-            y=[coordinates_by_sample[sid][1] for sid in cached_sample_ids],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sid][0] for sid in cached_sample_ids]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sid][1] for sid in cached_sample_ids]
+            ),
         )
     )
     db_session.commit()
@@ -13,6 +13,7 @@ from pyarrow import ipc
 from pytest_mock import MockerFixture
 from sqlmodel import Session
 
+from lightly_studio.api.routes.api import embeddings2d
 from lightly_studio.dataset.mobileclip_embedding_generator import EMBEDDING_DIMENSION
 from lightly_studio.models.collection import SampleType
 from lightly_studio.models.tag import TagCreate
@@ -308,3 +309,80 @@ def test_get_embeddings2d_2d_benchmark(
     elapsed = time.perf_counter() - start_time
 
     raise ValueError(f"Benchmark: n_samples={n_samples}, elapsed={elapsed:.3f}s")
+
+
+def test_get_embeddings2d__serves_repeated_requests_from_cache(
+    test_client: TestClient,
+    db_session: Session,
+    mocker: MockerFixture,
+) -> None:
+    collection_id = fill_db_with_samples_and_embeddings(
+        session=db_session,
+        n_samples=5,
+        embedding_model_names=["model_a"],
+        embedding_dimension=EMBEDDING_DIMENSION,
+    )
+    url = f"/api/collections/{collection_id}/embeddings2d/default"
+    # Computing the projection writes it to the database, which invalidates the cache.
+    test_client.post(url, json={"filters": {}})
+    build_spy = mocker.spy(embeddings2d, "_build_arrow_stream")
+
+    first = test_client.post(url, json={"filters": {}})
+    second = test_client.post(url, json={"filters": {}})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    build_spy.assert_called_once()
+
+    # A request carrying the current ETag gets an empty 304.
+    not_modified = test_client.post(
+        url, json={"filters": {}}, headers={"If-None-Match": second.headers["etag"]}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_get_embeddings2d__database_write_invalidates_cache(
+    test_client: TestClient,
+    db_session: Session,
+) -> None:
+    collection_id = fill_db_with_samples_and_embeddings(
+        session=db_session,
+        n_samples=5,
+        embedding_model_names=["model_a"],
+        embedding_dimension=EMBEDDING_DIMENSION,
+    )
+    samples = image_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+    ).samples
+    tag = tag_resolver.create(
+        session=db_session,
+        tag=TagCreate(collection_id=collection_id, name="tagged", kind="sample"),
+    )
+    url = f"/api/collections/{collection_id}/embeddings2d/default"
+    json_body = {
+        "filters": ImageFilter(sample_filter=SampleFilter(tag_ids=[tag.tag_id])).model_dump(
+            mode="json"
+        )
+    }
+    before = test_client.post(url, json=json_body)
+    assert _num_fulfilling(before.content) == 0
+
+    tag_resolver.add_tag_to_sample(session=db_session, tag_id=tag.tag_id, sample=samples[0].sample)
+
+    after = test_client.post(url, json=json_body)
+    assert after.headers["etag"] != before.headers["etag"]
+    assert _num_fulfilling(after.content) == 1
+    # The ETag of the outdated response no longer matches.
+    revalidated = test_client.post(
+        url, json=json_body, headers={"If-None-Match": before.headers["etag"]}
+    )
+    assert revalidated.status_code == 200
+
+
+def _num_fulfilling(content: bytes) -> int:
+    table = ipc.open_stream(pa.BufferReader(content)).read_all()
+    return int(table.column("fulfils_filter").to_numpy(zero_copy_only=False).sum())
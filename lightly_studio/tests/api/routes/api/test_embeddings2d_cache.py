@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from lightly_studio.api.routes.api import embeddings2d_cache
+from lightly_studio.api.routes.api.embeddings2d_cache import ResponseCache
+from lightly_studio.utils.cache_stats import CacheStats
+
+
+def test_response_cache__get_and_put() -> None:
+    cache = ResponseCache(max_bytes=100)
+
+    assert cache.get("a") is None
+    cache.put("a", b"payload")
+
+    assert cache.get("a") == b"payload"
+    assert cache.stats() == CacheStats(
+        hits=1, misses=1, evictions=0, num_entries=1, size_bytes=len(b"payload")
+    )
+    assert cache.stats().hit_rate == 0.5
+
+
+def test_response_cache__evicts_least_recently_used() -> None:
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    # Mark "a" as recently used, so that "b" is evicted first.
+    assert cache.get("a") == b"aaaa"
+
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.num_entries == 2
+    assert stats.size_bytes == 8
+
+
+def test_response_cache__replaces_entry() -> None:
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("a", b"aaaaaa")
+
+    assert cache.get("a") == b"aaaaaa"
+    assert cache.stats().size_bytes == 6
+    assert cache.stats().evictions == 0
+
+
+def test_response_cache__skips_oversized_payloads() -> None:
+    cache = ResponseCache(max_bytes=4)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbbb")
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+
+
+def test_response_cache__disabled() -> None:
+    cache = ResponseCache(max_bytes=0)
+    cache.put("a", b"a")
+
+    assert cache.get("a") is None
+    assert cache.stats().num_entries == 0
+
+
+def test_response_cache__clear() -> None:
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.get("a")
+
+    cache.clear()
+
+    assert cache.stats() == CacheStats(hits=0, misses=0, evictions=0, num_entries=0, size_bytes=0)
+
+
+def test_etag_for() -> None:
+    etag = embeddings2d_cache.etag_for(("collection", 1))
+
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert embeddings2d_cache.etag_for(("collection", 1)) == etag
+    assert embeddings2d_cache.etag_for(("collection", 2)) != etag
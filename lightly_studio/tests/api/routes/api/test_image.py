@@ -106,6 +106,8 @@ def test_read_samples_calls_get_all(mocker: MockerFixture, test_client: TestClie
         text_embedding=json_body["text_embedding"],
         sample_ids=None,
         order_by=None,
+        seek_cursor=None,
+        allow_estimated_count=False,
     )
 
 
@@ -7,7 +7,9 @@ from sqlmodel import Session
 
 from lightly_studio.api.routes.api.status import (
     HTTP_STATUS_OK,
+    HTTP_STATUS_UNPROCESSABLE_ENTITY,
 )
+from lightly_studio.api.routes.api.text_embedding import MAX_BATCH_TEXTS
 from lightly_studio.dataset.embedding_manager import (
     EmbeddingManager,
     EmbeddingManagerProvider,
@@ -71,3 +73,68 @@ def test_embed_text_embedding_invalid_model_id(
     )
     assert response.status_code == 500
     assert response.json() == {"detail": f"No embedding model found with ID {test_uuid}"}
+
+
+def test_embed_texts(db_session: Session, mocker: MockerFixture, test_client: TestClient) -> None:
+    collection_id = helpers_resolvers.create_collection(session=db_session).collection_id
+    embedding_manager = EmbeddingManager()
+    mocker.patch.object(
+        EmbeddingManagerProvider,
+        "get_embedding_manager",
+        return_value=embedding_manager,
+    )
+    embed_texts_mock = mocker.patch.object(
+        EmbeddingManager,
+        "embed_texts",
+        return_value=[[0.1, 0.2], [0.3, 0.4]],
+    )
+
+    response = test_client.post(
+        f"/api/text_embedding/for_collection/{collection_id!s}/batch",
+        json={"texts": ["a cat", "a dog"]},
+    )
+
+    assert response.status_code == HTTP_STATUS_OK
+    assert response.json() == [[0.1, 0.2], [0.3, 0.4]]
+    embed_texts_mock.assert_called_once_with(
+        collection_id=collection_id, texts=["a cat", "a dog"], embedding_model_id=None
+    )
+
+
+def test_embed_texts__invalid_model_id(
+    db_session: Session,
+    mocker: MockerFixture,
+    test_client: TestClient,
+) -> None:
+    collection_id = helpers_resolvers.create_collection(session=db_session).collection_id
+    mocker.patch.object(
+        EmbeddingManagerProvider,
+        "get_embedding_manager",
+        return_value=EmbeddingManager(),
+    )
+    test_uuid = uuid4()
+
+    response = test_client.post(
+        f"/api/text_embedding/for_collection/{collection_id!s}/batch",
+        json={"texts": ["a cat"], "embedding_model_id": str(test_uuid)},
+    )
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": f"No embedding model found with ID {test_uuid}"}
+
+
+def test_embed_texts__too_many_texts(
+    db_session: Session,
+    mocker: MockerFixture,
+    test_client: TestClient,
+) -> None:
+    collection_id = helpers_resolvers.create_collection(session=db_session).collection_id
+    embed_texts_mock = mocker.patch.object(EmbeddingManager, "embed_texts")
+
+    response = test_client.post(
+        f"/api/text_embedding/for_collection/{collection_id!s}/batch",
+        json={"texts": ["a cat"] * (MAX_BATCH_TEXTS + 1)},
+    )
+
+    assert response.status_code == HTTP_STATUS_UNPROCESSABLE_ENTITY
+    embed_texts_mock.assert_not_called()
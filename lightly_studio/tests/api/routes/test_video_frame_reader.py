@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import av
+import cv2
+import numpy as np
+import numpy.typing as npt
+import pytest
+from pytest_mock import MockerFixture
+
+from lightly_studio.api.routes import video_frame_reader
+from lightly_studio.api.routes.video_frame_reader import (
+    CapturePool,
+    FrameCache,
+    KeyframeIndexCache,
+)
+
+_NUM_FRAMES = 30
+_GOP_SIZE = 10
+
+
+@pytest.fixture
+def video_path(tmp_path: Path) -> str:
+    """A video whose frames differ in brightness, with a keyframe every 10 frames."""
+    path = tmp_path / "video.mp4"
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=10)
+        stream.width = 64
+        stream.height = 48
+        stream.pix_fmt = "yuv420p"
+        stream.codec_context.gop_size = _GOP_SIZE
+        stream.codec_context.options = {"sc_threshold": "0"}
+        for frame_number in range(_NUM_FRAMES):
+            image = np.full((48, 64, 3), 8 * frame_number, dtype=np.uint8)
+            frame = av.VideoFrame.from_ndarray(image, format="rgb24")
+            frame.pts = frame_number
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_reader(mocker: MockerFixture) -> None:
+    mocker.patch.object(video_frame_reader, "capture_pool", CapturePool(max_idle=16))
+    mocker.patch.object(video_frame_reader, "frame_cache", FrameCache(max_bytes=1024 * 1024))
+    mocker.patch.object(video_frame_reader, "keyframe_indexes", KeyframeIndexCache(max_videos=4))
+
+
+def _read_with_seek(video_path: str, frame_number: int) -> npt.NDArray[np.uint8]:
+    cap = cv2.VideoCapture(video_path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    ret, frame = cap.read()
+    cap.release()
+    assert ret
+    return np.asarray(frame)
+
+
+def test_build_keyframe_index(video_path: str) -> None:
+    assert video_frame_reader.build_keyframe_index(video_path=video_path) == [0, 10, 20]
+
+
+def test_build_keyframe_index__no_video_stream(tmp_path: Path) -> None:
+    path = tmp_path / "audio.wav"
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("pcm_s16le", rate=8000)
+        frame = av.AudioFrame.from_ndarray(
+            np.zeros((1, 800), dtype=np.int16), format="s16", layout="mono"
+        )
+        frame.sample_rate = 8000
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+    assert video_frame_reader.build_keyframe_index(video_path=str(path)) is None
+
+
+def test_keyframe_index_cache__unexpected_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(video_frame_reader, "build_keyframe_index", side_effect=IndexError)
+    cache = KeyframeIndexCache(max_videos=4)
+
+    with pytest.raises(IndexError):
+        cache.wait(video_path="video.mp4")
+
+    # The failed build is not pending anymore, so later calls do not raise again.
+    assert cache.wait(video_path="video.mp4") is None
+
+
+def test_can_decode_forward() -> None:
+    keyframes = [0, 10, 20]
+    assert video_frame_reader.can_decode_forward(next_frame=3, frame_number=9, keyframes=keyframes)
+    assert video_frame_reader.can_decode_forward(
+        next_frame=10, frame_number=15, keyframes=keyframes
+    )
+    # A seek to the keyframe at 10 decodes less.
+    assert not video_frame_reader.can_decode_forward(
+        next_frame=3, frame_number=12, keyframes=keyframes
+    )
+    assert not video_frame_reader.can_decode_forward(
+        next_frame=5, frame_number=4, keyframes=keyframes
+    )
+    # Without an index, only the next frame is read without seeking.
+    assert video_frame_reader.can_decode_forward(next_frame=5, frame_number=5, keyframes=None)
+    assert not video_frame_reader.can_decode_forward(next_frame=5, frame_number=6, keyframes=None)
+
+
+@pytest.mark.parametrize("build_index", [True, False])
+def test_read_frame__matches_seek(video_path: str, build_index: bool) -> None:
+    if build_index:
+        video_frame_reader.keyframe_indexes.wait(video_path=video_path)
+    # Forward within a GOP, across keyframes, backwards and repeated.
+    for frame_number in [0, 1, 2, 5, 9, 12, 25, 3, 29, 29, 14]:
+        frame = video_frame_reader.read_frame(video_path=video_path, frame_number=frame_number)
+        expected = _read_with_seek(video_path=video_path, frame_number=frame_number)
+        np.testing.assert_array_equal(frame, expected)
+
+
+def test_read_frame__reuses_capture(video_path: str, mocker: MockerFixture) -> None:
+    video_frame_reader.keyframe_indexes.wait(video_path=video_path)
+    video_frame_reader.read_frame(video_path=video_path, frame_number=1)
+    capture_class = mocker.spy(cv2, "VideoCapture")
+
+    video_frame_reader.read_frame(video_path=video_path, frame_number=4)
+
+    capture_class.assert_not_called()
+    assert video_frame_reader.capture_pool.num_idle(video_path=video_path) == 1
+
+
+def test_read_frame__caches_frames(video_path: str) -> None:
+    frame = video_frame_reader.read_frame(video_path=video_path, frame_number=7)
+    cached = video_frame_reader.read_frame(video_path=video_path, frame_number=7)
+
+    assert cached is frame
+    assert not frame.flags.writeable
+    stats = video_frame_reader.frame_cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.num_entries == 1
+    assert stats.size_bytes == frame.nbytes
+
+
+def test_read_frame__out_of_range(video_path: str) -> None:
+    with pytest.raises(ValueError, match="No frame at index 100"):
+        video_frame_reader.read_frame(video_path=video_path, frame_number=100)
+    # The capture with an unknown position is closed.
+    assert video_frame_reader.capture_pool.num_idle(video_path=video_path) == 0
+
+
+def test_read_frame__missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        video_frame_reader.read_frame(video_path=str(tmp_path / "missing.mp4"), frame_number=0)
+
+
+def test_capture_pool__prefers_closest_capture_before_frame(video_path: str) -> None:
+    pool = CapturePool(max_idle=4)
+    first = pool.acquire(video_path=video_path, frame_number=0, keyframes=None)
+    second = pool.acquire(video_path=video_path, frame_number=0, keyframes=None)
+    first.next_frame = 2
+    second.next_frame = 5
+    pool.release(capture=first)
+    pool.release(capture=second)
+
+    assert pool.acquire(video_path=video_path, frame_number=7, keyframes=[0, 10]) is second
+    assert pool.acquire(video_path=video_path, frame_number=3, keyframes=[0, 10]) is first
+
+
+def test_capture_pool__closes_least_recently_released(video_path: str) -> None:
+    pool = CapturePool(max_idle=2)
+    captures = [
+        pool.acquire(video_path=video_path, frame_number=0, keyframes=None) for _ in range(3)
+    ]
+    for capture in captures:
+        pool.release(capture=capture)
+
+    assert pool.num_idle() == 2
+    assert not captures[0].cap.isOpened()
+    assert captures[0].stream.closed
+    assert captures[2].cap.isOpened()
+
+    pool.clear()
+    assert pool.num_idle() == 0
+    assert not captures[2].cap.isOpened()
+
+
+def test_frame_cache__evicts_least_recently_used() -> None:
+    cache = FrameCache(max_bytes=250)
+    frames = [np.full(100, i, dtype=np.uint8) for i in range(3)]
+    cache.put(video_path="a.mp4", frame_number=0, frame=frames[0])
+    cache.put(video_path="a.mp4", frame_number=1, frame=frames[1])
+    assert cache.get(video_path="a.mp4", frame_number=0) is frames[0]
+
+    cache.put(video_path="a.mp4", frame_number=2, frame=frames[2])
+
+    assert cache.get(video_path="a.mp4", frame_number=1) is None
+    assert cache.get(video_path="a.mp4", frame_number=0) is frames[0]
+    assert cache.stats().evictions == 1
+    assert cache.stats().size_bytes == 200
+
+
+def test_frame_cache__disabled() -> None:
+    cache = FrameCache(max_bytes=0)
+    cache.put(video_path="a.mp4", frame_number=0, frame=np.zeros(10, dtype=np.uint8))
+
+    assert cache.get(video_path="a.mp4", frame_number=0) is None
+    assert cache.stats().num_entries == 0
+
+
+def test_keyframe_index_cache__unreadable_file(tmp_path: Path) -> None:
+    path = tmp_path / "broken.mp4"
+    path.write_bytes(b"not a video")
+    cache = KeyframeIndexCache(max_videos=4)
+
+    assert cache.wait(video_path=str(path)) is None
+    assert cache.get(video_path=str(path)) is None
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import io
+import os
 from pathlib import Path
 
 import cv2
 import numpy as np
 from fastapi.testclient import TestClient
 from PIL import Image as PILImage
+from pytest_mock import MockerFixture
 from sqlmodel import Session
 
 import lightly_studio.utils.executor as executor_module
+from lightly_studio.core.image import thumbnail_cache, thumbnail_pyramid
 from lightly_studio.models.collection import SampleType
 from tests.helpers_resolvers import create_collection, create_image
 
@@ -128,6 +132,181 @@ def test_stream_image_high_requires_bounds(
     assert response.status_code == 400
 
 
+def test_stream_image_high_serves_cached_thumbnail(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    """Test that repeated thumbnail requests are served from the cache with an ETag."""
+    image_path = tmp_path / "test_image.png"
+    PILImage.new("RGB", (400, 200), color="blue").save(image_path)
+
+    collection = create_collection(session=db_session, sample_type=SampleType.IMAGE)
+    image = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs=str(image_path),
+        width=400,
+        height=200,
+    )
+    url = f"/images/sample/{image.sample_id}"
+    params: dict[str, str | int] = {"quality": "high", "max_width": 100}
+
+    first = media_test_client.get(url, params=params)
+    second = media_test_client.get(url, params=params)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    stats = thumbnail_cache.thumbnail_cache.stats()
+    assert (stats.hits, stats.misses, stats.num_entries) == (1, 1, 1)
+
+    # Another size is a separate thumbnail.
+    other_size = media_test_client.get(url, params={"quality": "high", "max_width": 50})
+    assert other_size.headers["etag"] != first.headers["etag"]
+    assert thumbnail_cache.thumbnail_cache.stats().num_entries == 2
+
+
+def test_stream_image_high_not_modified(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    """Test that a matching If-None-Match is answered with a 304 until the file changes."""
+    image_path = tmp_path / "test_image.png"
+    PILImage.new("RGB", (400, 200), color="blue").save(image_path)
+
+    collection = create_collection(session=db_session, sample_type=SampleType.IMAGE)
+    image = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs=str(image_path),
+        width=400,
+        height=200,
+    )
+    url = f"/images/sample/{image.sample_id}"
+    params: dict[str, str | int] = {"quality": "high", "max_width": 100}
+    etag = media_test_client.get(url, params=params).headers["etag"]
+
+    not_modified = media_test_client.get(url, params=params, headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    # Replacing the file changes its modification time and thus the ETag.
+    PILImage.new("RGB", (400, 200), color="red").save(image_path)
+    stat = image_path.stat()
+    os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    modified = media_test_client.get(url, params=params, headers={"If-None-Match": etag})
+
+    assert modified.status_code == 200
+    assert modified.headers["etag"] != etag
+
+
+def test_stream_image_high_derives_from_thumbnail_pyramid(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    """Test that small thumbnails are derived from the pyramid instead of the original."""
+    image_path = tmp_path / "test_image.png"
+    PILImage.new("RGB", (1000, 500), color="blue").save(image_path)
+
+    collection = create_collection(session=db_session, sample_type=SampleType.IMAGE)
+    image = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs=str(image_path),
+        width=1000,
+        height=500,
+    )
+    thumbnail_pyramid.generate(file_paths=[str(image_path)], show_progress=False)
+    url = f"/images/sample/{image.sample_id}"
+
+    # Bounds of a level are served with the level itself.
+    level = media_test_client.get(
+        url, params={"quality": "high", "max_width": 256, "max_height": 256}
+    )
+    # Other bounds are resized from the smallest level covering them.
+    resized = media_test_client.get(
+        url, params={"quality": "high", "max_width": 200, "max_height": 200}
+    )
+
+    assert level.status_code == 200
+    assert resized.status_code == 200
+    with PILImage.open(io.BytesIO(level.content)) as level_image:
+        assert level_image.size == (256, 128)
+    with PILImage.open(io.BytesIO(resized.content)) as resized_image:
+        assert resized_image.size == (200, 100)
+    # Only the resized thumbnail was cached, both were derived from stored levels.
+    assert thumbnail_cache.thumbnail_cache.stats().num_entries == 1
+    assert thumbnail_pyramid.pyramid_cache.stats().hits == 2
+
+
+def test_stream_image_high_skips_thumbnail_pyramid_when_disabled(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Test that without stored pyramids, thumbnails are resized from the original."""
+    image_path = tmp_path / "test_image.png"
+    PILImage.new("RGB", (1000, 500), color="blue").save(image_path)
+
+    collection = create_collection(session=db_session, sample_type=SampleType.IMAGE)
+    image = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs=str(image_path),
+        width=1000,
+        height=500,
+    )
+    mocker.patch.object(
+        thumbnail_pyramid,
+        "pyramid_cache",
+        thumbnail_cache.ThumbnailCache(directory=tmp_path / "thumbnail_pyramids", max_bytes=0),
+    )
+    spy_get_or_create_level = mocker.spy(thumbnail_pyramid, "get_or_create_level")
+
+    response = media_test_client.get(
+        f"/images/sample/{image.sample_id}",
+        params={"quality": "high", "max_width": 200, "max_height": 200},
+    )
+
+    assert response.status_code == 200
+    with PILImage.open(io.BytesIO(response.content)) as thumbnail:
+        assert thumbnail.size == (200, 100)
+    spy_get_or_create_level.assert_not_called()
+
+
+def test_stream_image_high_unsupported_file(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    """Test that a file that is no image is rejected, also for bounds of a pyramid level."""
+    image_path = tmp_path / "not_an_image.png"
+    image_path.write_bytes(b"not an image")
+
+    collection = create_collection(session=db_session, sample_type=SampleType.IMAGE)
+    image = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs=str(image_path),
+    )
+
+    for bounds in (128, 1024):
+        response = media_test_client.get(
+            f"/images/sample/{image.sample_id}",
+            params={"quality": "high", "max_width": bounds, "max_height": bounds},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Unsupported image file for thumbnail conversion"}
+
+
 def test_stream_image_sample_not_found(
     media_test_client: TestClient,
 ) -> None:
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import json
+import threading
 from pathlib import Path
+from uuid import uuid4
 
 import cv2
 import numpy as np
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 from sqlmodel import Session
 
-import lightly_studio.api.routes.video_frames_media as video_frames_media_module
 import lightly_studio.utils.executor as executor_module
+from lightly_studio.api.routes import video_frame_reader
+from lightly_studio.api.routes.video_frame_reader import KeyframeIndexCache
 from lightly_studio.api.routes.video_frames_media import (
-    _CAP_CACHE_SIZE,
-    _get_cached_capture,
+    MAX_STRIP_FRAMES,
+    STRIP_INDEX_LENGTH_BYTES,
 )
 from lightly_studio.models.collection import SampleType
 from tests.helpers_resolvers import create_collection
@@ -143,107 +148,6 @@ def test_stream_frame_high_requires_bounds(
     assert response.status_code == 400
 
 
-def test_get_cached_capture_creates_new(
-    tmp_path: Path,
-) -> None:
-    """Test _get_cached_capture creates new VideoCapture when not cached."""
-    video_path = create_video_file(
-        output_path=tmp_path / "test_video.mp4",
-        width=320,
-        height=240,
-        num_frames=5,
-        fps=1,
-    )
-
-    cap = _get_cached_capture(str(video_path))
-
-    assert cap is not None
-    assert isinstance(cap, cv2.VideoCapture)
-    assert cap.isOpened()
-
-
-def test_get_cached_capture_reuses_cached(
-    tmp_path: Path,
-) -> None:
-    """Test _get_cached_capture reuses cached VideoCapture for same video."""
-    video_path = create_video_file(
-        output_path=tmp_path / "test_video.mp4",
-        width=320,
-        height=240,
-        num_frames=5,
-        fps=1,
-    )
-
-    # Get capture first time
-    cap1 = _get_cached_capture(str(video_path))
-    cap1_id = id(cap1)
-
-    # Get capture second time - should be same object
-    cap2 = _get_cached_capture(str(video_path))
-    cap2_id = id(cap2)
-
-    assert cap1_id == cap2_id, "VideoCapture should be reused from cache"
-
-
-def test_get_cached_capture_lru_eviction(
-    tmp_path: Path,
-) -> None:
-    """Test _get_cached_capture evicts least recently used entries when cache is full."""
-    # Create multiple video files
-    video_paths = []
-    for i in range(_CAP_CACHE_SIZE + 2):  # Create more than cache size
-        video_path = create_video_file(
-            output_path=tmp_path / f"test_video_{i}.mp4",
-            width=320,
-            height=240,
-            num_frames=5,
-            fps=1,
-        )
-        video_paths.append(str(video_path))
-
-    # Fill cache to capacity
-    for path in video_paths[:_CAP_CACHE_SIZE]:
-        _get_cached_capture(path)
-
-    # Access cache to verify size
-    cache = video_frames_media_module._thread_local.cap_cache
-    assert len(cache) == _CAP_CACHE_SIZE
-
-    # Add one more - should evict the oldest
-    _get_cached_capture(video_paths[_CAP_CACHE_SIZE])
-
-    # Cache should still be at max size
-    assert len(cache) == _CAP_CACHE_SIZE
-
-    # The first video should be evicted (oldest)
-    assert video_paths[0] not in cache
-
-
-def test_get_cached_capture_handles_stale_entry(
-    tmp_path: Path,
-) -> None:
-    """Test _get_cached_capture handles stale (closed) VideoCapture entries."""
-    video_path = create_video_file(
-        output_path=tmp_path / "test_video.mp4",
-        width=320,
-        height=240,
-        num_frames=5,
-        fps=1,
-    )
-
-    # Get and cache a capture
-    cap1 = _get_cached_capture(str(video_path))
-    assert cap1.isOpened()
-
-    # Manually close it to simulate stale entry
-    cap1.release()
-
-    # Get capture again - should create new one since old is closed
-    cap2 = _get_cached_capture(str(video_path))
-    assert cap2.isOpened()
-    assert id(cap1) != id(cap2), "Should create new VideoCapture for stale entry"
-
-
 def test_get_media_executor_creates_singleton() -> None:
     """Test get_media_executor returns the same executor instance on repeated calls."""
     executor_module._executors.clear()
@@ -306,3 +210,194 @@ def test_stream_frame_multiple_frames_same_video(
     # All should succeed (caching helps with performance)
     assert len(responses) == 3
     assert all(r.status_code == 200 for r in responses)
+
+
+def _split_strip(content: bytes) -> dict[str, bytes]:
+    """Return the frames packed into a strip response by sample ID."""
+    index_length = int.from_bytes(content[:STRIP_INDEX_LENGTH_BYTES], "big")
+    index = json.loads(content[STRIP_INDEX_LENGTH_BYTES : STRIP_INDEX_LENGTH_BYTES + index_length])
+    frames = content[STRIP_INDEX_LENGTH_BYTES + index_length :]
+    offsets = index["offsets"]
+    assert offsets[-1] == len(frames)
+    return {
+        sample_id: frames[start:end]
+        for sample_id, start, end in zip(index["sample_ids"], offsets, offsets[1:])
+    }
+
+
+def test_stream_frame_strip__sample_ids(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    videos = [
+        create_video_with_frames(
+            session=db_session,
+            collection_id=collection.collection_id,
+            video=VideoStub(
+                path=str(
+                    create_video_file(
+                        output_path=tmp_path / f"video_{index}.mp4",
+                        width=320,
+                        height=240,
+                        num_frames=5,
+                        fps=1,
+                    )
+                ),
+                width=320,
+                height=240,
+                duration_s=5.0,
+                fps=1.0,
+            ),
+        )
+        for index in range(2)
+    ]
+    sample_ids = [
+        videos[1].frame_sample_ids[3],
+        videos[0].frame_sample_ids[2],
+        uuid4(),
+        videos[1].frame_sample_ids[0],
+    ]
+
+    response = media_test_client.post(
+        "/frames/media/strip",
+        params={"quality": "high", "max_width": 80, "max_height": 80},
+        json={"sample_ids": [str(sample_id) for sample_id in sample_ids]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Frame-Media-Type"] == "image/jpeg"
+    frames = _split_strip(content=response.content)
+    # Unknown sample IDs are left out, the others keep the order of the request.
+    assert list(frames) == [str(sample_ids[0]), str(sample_ids[1]), str(sample_ids[3])]
+    for content in frames.values():
+        decoded = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert decoded.shape == (60, 80, 3)
+
+
+def test_stream_frame_strip__frame_range(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    video_path = create_video_file(
+        output_path=tmp_path / "test_video.mp4",
+        width=320,
+        height=240,
+        num_frames=5,
+        fps=1,
+    )
+    video_with_frames = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path=str(video_path), width=320, height=240, duration_s=5.0, fps=1.0),
+    )
+
+    response = media_test_client.post(
+        "/frames/media/strip",
+        json={"video_id": str(video_with_frames.video_sample_id), "start_frame": 1},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Frame-Media-Type"] == "image/png"
+    frames = _split_strip(content=response.content)
+    assert list(frames) == [str(sample_id) for sample_id in video_with_frames.frame_sample_ids[1:]]
+    assert all(content.startswith(b"\x89PNG\r\n\x1a\n") for content in frames.values())
+
+
+def test_stream_frame_strip__index_not_in_headers(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    video_path = create_video_file(
+        output_path=tmp_path / "test_video.mp4",
+        width=320,
+        height=240,
+        num_frames=30,
+        fps=2,
+    )
+    video_with_frames = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path=str(video_path), width=320, height=240, duration_s=15.0, fps=2.0),
+    )
+
+    response = media_test_client.post(
+        "/frames/media/strip",
+        params={"quality": "high", "max_width": 8},
+        json={"sample_ids": [str(sample_id) for sample_id in video_with_frames.frame_sample_ids]},
+    )
+
+    assert response.status_code == 200
+    assert len(_split_strip(content=response.content)) == 30
+    # 30 sample IDs alone take more than 1 KB, the headers do not grow with the frames.
+    assert sum(len(key) + len(value) for key, value in response.headers.items()) < 512
+
+
+def test_stream_frame_strip__does_not_wait_for_keyframe_index(
+    media_test_client: TestClient,
+    db_session: Session,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    video_path = create_video_file(
+        output_path=tmp_path / "test_video.mp4",
+        width=320,
+        height=240,
+        num_frames=5,
+        fps=1,
+    )
+    video_with_frames = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path=str(video_path), width=320, height=240, duration_s=5.0, fps=1.0),
+    )
+    mocker.patch.object(video_frame_reader, "keyframe_indexes", KeyframeIndexCache(max_videos=4))
+    build_released = threading.Event()
+
+    def build_keyframe_index(video_path: str) -> list[int]:  # noqa: ARG001
+        build_released.wait(timeout=30)
+        return [0]
+
+    mocker.patch.object(video_frame_reader, "build_keyframe_index", build_keyframe_index)
+
+    try:
+        response = media_test_client.post(
+            "/frames/media/strip",
+            json={"video_id": str(video_with_frames.video_sample_id)},
+        )
+
+        # The frames were read by seeking while the index is still being built.
+        assert response.status_code == 200
+        assert list(_split_strip(content=response.content)) == [
+            str(sample_id) for sample_id in video_with_frames.frame_sample_ids
+        ]
+        assert video_frame_reader.keyframe_indexes.get(video_path=str(video_path)) is None
+    finally:
+        build_released.set()
+
+
+def test_stream_frame_strip__invalid_request(media_test_client: TestClient) -> None:
+    # Neither sample IDs nor a video.
+    assert media_test_client.post("/frames/media/strip", json={}).status_code == 400
+    # Both sample IDs and a video.
+    response = media_test_client.post(
+        "/frames/media/strip", json={"sample_ids": [str(uuid4())], "video_id": str(uuid4())}
+    )
+    assert response.status_code == 400
+    # Too many frames.
+    response = media_test_client.post(
+        "/frames/media/strip",
+        json={"video_id": str(uuid4()), "start_frame": 0, "end_frame": MAX_STRIP_FRAMES + 1},
+    )
+    assert response.status_code == 400
+    response = media_test_client.post(
+        "/frames/media/strip",
+        json={"sample_ids": [str(uuid4()) for _ in range(MAX_STRIP_FRAMES + 1)]},
+    )
+    assert response.status_code == 422
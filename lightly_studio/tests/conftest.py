@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 from collections.abc import Generator, Sequence
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
@@ -18,6 +19,7 @@ from testcontainers.postgres import PostgresContainer  # type: ignore[import-unt
 from lightly_studio.analytics import tracking
 from lightly_studio.api import features
 from lightly_studio.api.app import app
+from lightly_studio.core.image import thumbnail_cache, thumbnail_pyramid
 from lightly_studio.database import db_manager
 from lightly_studio.database.db_manager import DatabaseBackend, DatabaseEngine
 from lightly_studio.dataset import embedding_manager
@@ -81,6 +83,26 @@ def _disable_analytics(mocker: MockerFixture) -> None:
     mocker.patch.object(tracking, "_tracker", None)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_thumbnail_cache(
+    mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Keep thumbnails of one test out of the next one and out of the developer's caches."""
+    directory: Path = tmp_path_factory.mktemp("thumbnails")
+    mocker.patch.object(
+        thumbnail_cache,
+        "thumbnail_cache",
+        thumbnail_cache.ThumbnailCache(directory=directory, max_bytes=1024 * 1024),
+    )
+    mocker.patch.object(
+        thumbnail_pyramid,
+        "pyramid_cache",
+        thumbnail_cache.ThumbnailCache(
+            directory=tmp_path_factory.mktemp("thumbnail_pyramids"), max_bytes=1024 * 1024
+        ),
+    )
+
+
 @pytest.fixture(scope="session")
 def _use_postgres(request: pytest.FixtureRequest) -> bool:
     """Return True when the test suite is running against Postgres."""
@@ -28,7 +28,7 @@ from pytest_mock import MockerFixture
 from sqlmodel import Session
 
 from lightly_studio.core import labelformat_helpers
-from lightly_studio.core.image import add_annotations, add_images
+from lightly_studio.core.image import add_annotations, add_images, image_header
 from lightly_studio.models.image import ImageCreate
 from lightly_studio.resolvers import image_resolver
 from tests import helpers_resolvers
@@ -237,6 +237,109 @@ def test_load_into_collection_from_paths__deduplicates_in_run_duplicates(
     assert len(sample_ids) == 1
 
 
+def test_load_into_dataset_from_paths__num_workers_preserves_input_order(
+    db_session: Session, tmp_path: Path
+) -> None:
+    # Arrange: more images than one database batch, read by several workers.
+    collection = helpers_resolvers.create_collection(db_session)
+    image_paths = []
+    for i in range(add_images.SAMPLE_BATCH_SIZE + 5):
+        image_path = str(tmp_path / f"image{i:03d}.jpg")
+        PILImage.new("RGB", (10 + i, 20 + i)).save(image_path)
+        image_paths.append(image_path)
+
+    # Act
+    sample_ids = add_images.load_into_dataset_from_paths(
+        session=db_session,
+        root_collection_id=collection.collection_id,
+        image_paths=image_paths,
+        num_workers=4,
+    )
+
+    # Assert: the created sample ids follow the input order and carry the right dimensions.
+    images = image_resolver.get_many_by_id(session=db_session, sample_ids=sample_ids)
+    image_by_id = {image.sample_id: image for image in images}
+    assert [image_by_id[sample_id].file_path_abs for sample_id in sample_ids] == image_paths
+    assert [image_by_id[sample_id].width for sample_id in sample_ids] == [
+        10 + i for i in range(len(image_paths))
+    ]
+
+
+def test_load_into_dataset_from_paths__invalid_num_workers(
+    db_session: Session, tmp_path: Path
+) -> None:
+    collection = helpers_resolvers.create_collection(db_session)
+    image_path = str(tmp_path / "image1.jpg")
+    PILImage.new("RGB", (100, 100)).save(image_path)
+
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        add_images.load_into_dataset_from_paths(
+            session=db_session,
+            root_collection_id=collection.collection_id,
+            image_paths=[image_path],
+            num_workers=0,
+        )
+
+
+def test_load_into_dataset_from_paths__consume_images(
+    db_session: Session, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # Arrange: more images than one database batch, and one whose pixels are truncated.
+    collection = helpers_resolvers.create_collection(db_session)
+    image_paths = []
+    for i in range(add_images.SAMPLE_BATCH_SIZE + 5):
+        image_path = str(tmp_path / f"image{i:03d}.png")
+        PILImage.new("L", (10 + i, 20)).save(image_path)
+        image_paths.append(image_path)
+    truncated_path = tmp_path / "truncated.jpg"
+    PILImage.effect_noise((64, 64), sigma=64).save(truncated_path)
+    truncated_path.write_bytes(truncated_path.read_bytes()[:1000])
+    image_paths.append(str(truncated_path))
+    spy_read_image_size = mocker.spy(image_header, "read_image_size")
+    consumed: list[tuple[UUID, PILImage.Image]] = []
+
+    # Act
+    sample_ids = add_images.load_into_dataset_from_paths(
+        session=db_session,
+        root_collection_id=collection.collection_id,
+        image_paths=image_paths,
+        consume_images=lambda ids, images, _hashes: consumed.extend(zip(ids, images)),
+    )
+
+    # Assert: every file is added, the headers are not read a second time, and the decoded
+    # RGB pixels of every readable file are handed on with the ID of its sample.
+    assert len(sample_ids) == len(image_paths)
+    spy_read_image_size.assert_not_called()
+    assert [sample_id for sample_id, _ in consumed] == sample_ids[:-1]
+    assert [image.size for _, image in consumed] == [
+        (10 + i, 20) for i in range(add_images.SAMPLE_BATCH_SIZE + 5)
+    ]
+    assert all(image.mode == "RGB" for _, image in consumed)
+
+
+def test_load_into_dataset_from_paths__consume_images_downscales(
+    db_session: Session, tmp_path: Path
+) -> None:
+    collection = helpers_resolvers.create_collection(db_session)
+    jpeg_path = tmp_path / "large.jpg"
+    PILImage.new("RGB", (2048, 1024)).save(jpeg_path)
+    png_path = tmp_path / "tall.png"
+    PILImage.new("RGB", (600, 1200)).save(png_path)
+    consumed: list[PILImage.Image] = []
+
+    sample_ids = add_images.load_into_dataset_from_paths(
+        session=db_session,
+        root_collection_id=collection.collection_id,
+        image_paths=[str(jpeg_path), str(png_path)],
+        consume_images=lambda _ids, images, _hashes: consumed.extend(images),
+    )
+
+    # The samples keep the original size, only the handed on pixels are downscaled.
+    images = image_resolver.get_many_by_id(session=db_session, sample_ids=sample_ids)
+    assert sorted((image.width, image.height) for image in images) == [(600, 1200), (2048, 1024)]
+    assert [image.size for image in consumed] == [(1024, 512), (512, 1024)]
+
+
 def test_load_into_dataset_from_labelformat__records_missing_already_present_added_outcomes(
     db_session: Session, tmp_path: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
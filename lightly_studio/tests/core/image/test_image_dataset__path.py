@@ -9,7 +9,8 @@ from pytest_mock import MockerFixture as Mocker
 
 from lightly_studio import ImageDataset
 from lightly_studio.core.file_outcome_report import AllInputFilesFailedError
-from lightly_studio.core.image import add_images
+from lightly_studio.core.image import add_images, thumbnail_pyramid
+from lightly_studio.dataset.embedding_manager import EmbeddingManager
 
 
 class TestDataset:
@@ -198,6 +199,57 @@ class TestDataset:
         assert len(samples) == 1
         assert len(samples[0].sample_table.embeddings) == 0
 
+    def test_dataset_add_images_from_path__embeds_while_loading(
+        self,
+        patch_collection: None,  # noqa: ARG002
+        tmp_path: Path,
+        mocker: Mocker,
+    ) -> None:
+        _create_sample_images([tmp_path / "image1.jpg", tmp_path / "image2.png"])
+        spy_embed_images = mocker.spy(EmbeddingManager, "embed_images")
+        spy_embed_pil_images = mocker.spy(EmbeddingManager, "embed_and_store_pil_images")
+
+        dataset = ImageDataset.create(name="test_dataset")
+        dataset.add_images_from_path(path=tmp_path)
+
+        # The images are embedded from the pixels read while loading, not read again.
+        spy_embed_images.assert_not_called()
+        spy_embed_pil_images.assert_called_once()
+        samples = dataset.query().to_list()
+        assert all(len(sample.sample_table.embeddings) == 1 for sample in samples)
+
+    def test_compute_embeddings(
+        self,
+        patch_collection: None,  # noqa: ARG002
+        tmp_path: Path,
+        mocker: Mocker,
+    ) -> None:
+        _create_sample_images([tmp_path / "image1.jpg", tmp_path / "image2.png"])
+        dataset = ImageDataset.create(name="test_dataset")
+        dataset.add_images_from_path(path=tmp_path, embed=False)
+        spy_embed_images = mocker.spy(EmbeddingManager, "embed_images")
+
+        dataset.compute_embeddings()
+        samples = dataset.query().to_list()
+        assert all(len(sample.sample_table.embeddings) == 1 for sample in samples)
+
+        # Nothing is left to embed on a second call.
+        dataset.compute_embeddings()
+        spy_embed_images.assert_called_once()
+
+    def test_dataset_add_images_from_path__generate_thumbnails(
+        self,
+        patch_collection: None,  # noqa: ARG002
+        tmp_path: Path,
+    ) -> None:
+        _create_sample_images([tmp_path / "image1.jpg", tmp_path / "image2.png"])
+
+        dataset = ImageDataset.create(name="test_dataset")
+        dataset.add_images_from_path(path=tmp_path, embed=False, generate_thumbnails=True)
+
+        stats = thumbnail_pyramid.pyramid_cache.stats()
+        assert stats.num_entries == 2 * len(thumbnail_pyramid.PYRAMID_SIZES)
+
     def test_dataset_add_images_from_path__limit(
         self,
         patch_collection: None,  # noqa: ARG002
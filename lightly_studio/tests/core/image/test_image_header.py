@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import fsspec
+import pytest
+from PIL import Image as PILImage
+from PIL import UnidentifiedImageError
+from pytest_mock import MockerFixture
+
+from lightly_studio.core.image import image_header
+
+
+@pytest.mark.parametrize("image_format", ["JPEG", "PNG", "WEBP", "BMP", "GIF", "TIFF"])
+def test_read_image_size(tmp_path: Path, image_format: str) -> None:
+    path = tmp_path / f"image.{image_format.lower()}"
+    PILImage.new("RGB", (123, 45)).save(path, format=image_format)
+
+    assert image_header.read_image_size(path=str(path)) == (123, 45)
+
+
+def test_read_image_size__reads_only_a_prefix(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Incompressible content makes the file much larger than the probed prefix.
+    path = tmp_path / "image.png"
+    PILImage.effect_noise((1000, 1000), 100).save(path)
+    assert path.stat().st_size > 4 * 1024
+
+    spy = mocker.spy(fsspec.implementations.local.LocalFileSystem, "cat_file")
+    size = image_header.read_image_size(path=str(path), initial_probe_bytes=1024)
+
+    assert size == (1000, 1000)
+    assert spy.call_count == 1
+    assert spy.call_args.kwargs == {"start": 0, "end": 1024}
+
+
+def test_read_image_size__grows_probe_for_large_jpeg_segments(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # A large EXIF segment pushes the JPEG frame header beyond the first probe.
+    path = tmp_path / "image.jpg"
+    exif = PILImage.Exif()
+    exif[0x010E] = "x" * 20_000  # ImageDescription
+    PILImage.new("RGB", (64, 32)).save(path, exif=exif.tobytes())
+
+    spy = mocker.spy(fsspec.implementations.local.LocalFileSystem, "cat_file")
+    size = image_header.read_image_size(
+        path=str(path), initial_probe_bytes=1024, max_probe_bytes=8 * 1024
+    )
+
+    assert size == (64, 32)
+    assert [call.kwargs for call in spy.call_args_list] == [
+        {"start": 0, "end": 1024},
+        {"start": 0, "end": 4096},
+        {"start": 0, "end": 8192},
+        {},
+    ]
+
+
+def test_read_image_size__broken_file(tmp_path: Path) -> None:
+    path = tmp_path / "broken.jpg"
+    path.write_bytes(b"not a real image")
+
+    with pytest.raises(UnidentifiedImageError):
+        image_header.read_image_size(path=str(path))
+
+
+def test_read_image_size__decompression_bomb(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "bomb.png"
+    PILImage.new("RGB", (300, 300)).save(path)
+    monkeypatch.setattr(PILImage, "MAX_IMAGE_PIXELS", 20_000)
+
+    with pytest.raises(PILImage.DecompressionBombError):
+        image_header.read_image_size(path=str(path))
+
+
+def test_read_image_size__invalid_initial_probe_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "image.png"
+    PILImage.new("RGB", (10, 10)).save(path)
+
+    with pytest.raises(ValueError, match="initial_probe_bytes must be at least 1"):
+        image_header.read_image_size(path=str(path), initial_probe_bytes=0)
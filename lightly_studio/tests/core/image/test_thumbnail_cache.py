@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from lightly_studio.core.image import thumbnail_cache
+from lightly_studio.core.image.thumbnail_cache import ThumbnailCache
+from lightly_studio.utils.cache_stats import CacheStats
+
+
+def test_thumbnail_cache__get_and_put(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=100)
+
+    assert cache.get("ab12") is None
+    cache.put("ab12", b"thumbnail")
+
+    assert cache.get("ab12") == b"thumbnail"
+    assert cache.stats() == CacheStats(
+        hits=1, misses=1, evictions=0, num_entries=1, size_bytes=len(b"thumbnail")
+    )
+
+
+def test_thumbnail_cache__evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=10)
+    cache.put("aa", b"aaaa")
+    cache.put("bb", b"bbbb")
+    # Mark "aa" as recently used, so that "bb" is evicted first.
+    assert cache.get("aa") == b"aaaa"
+
+    cache.put("cc", b"cccc")
+
+    assert cache.get("bb") is None
+    assert cache.get("aa") == b"aaaa"
+    assert cache.get("cc") == b"cccc"
+    assert cache.stats().evictions == 1
+    assert cache.stats().size_bytes == 8
+    assert sorted(path.name for path in tmp_path.glob("*/*")) == [
+        "aa.thumbnail",
+        "cc.thumbnail",
+    ]
+
+
+def test_thumbnail_cache__loads_existing_entries(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=10)
+    cache.put("aa", b"aaaa")
+    cache.put("bb", b"bbbb")
+    # Make "bb" the least recently used entry of the directory, although it was put last.
+    os.utime(tmp_path / "bb" / "bb.thumbnail", (0, 0))
+
+    reopened = ThumbnailCache(directory=tmp_path, max_bytes=10)
+    reopened.put("cc", b"cccc")
+
+    assert reopened.get("bb") is None
+    assert reopened.get("aa") == b"aaaa"
+    assert reopened.stats().size_bytes == 8
+
+
+def test_thumbnail_cache__entry_removed_by_other_process(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=10)
+    cache.put("aa", b"aaaa")
+    (tmp_path / "aa" / "aa.thumbnail").unlink()
+
+    assert cache.get("aa") is None
+    assert cache.stats().num_entries == 0
+    assert cache.stats().size_bytes == 0
+
+
+def test_thumbnail_cache__skips_oversized_thumbnails(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=4)
+    cache.put("aa", b"aaaaa")
+
+    assert cache.get("aa") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_thumbnail_cache__disabled(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=0)
+    cache.put("aa", b"a")
+
+    assert not cache.enabled
+    assert cache.get("aa") is None
+    assert cache.stats().misses == 0
+
+
+def test_thumbnail_cache__clear(tmp_path: Path) -> None:
+    cache = ThumbnailCache(directory=tmp_path, max_bytes=10)
+    cache.put("aa", b"aaaa")
+    cache.get("aa")
+
+    cache.clear()
+
+    assert cache.stats() == CacheStats(hits=0, misses=0, evictions=0, num_entries=0, size_bytes=0)
+    assert list(tmp_path.glob("*/*")) == []
+
+
+def test_source_version() -> None:
+    assert thumbnail_cache.source_version({"mtime": 1.5, "size": 3}) == "mtime=1.5;size=3"
+    # The ETag of an object is preferred over its modification time.
+    assert (
+        thumbnail_cache.source_version({"ETag": '"abc"', "LastModified": "today", "size": 3})
+        == 'ETag="abc";size=3'
+    )
+    assert thumbnail_cache.source_version({"size": 3}) is None
+
+
+def test_thumbnail_key() -> None:
+    key = thumbnail_cache.thumbnail_key(
+        file_path="image.png", version="mtime=1", max_width=100, max_height=None, jpeg_quality=75
+    )
+
+    assert key == thumbnail_cache.thumbnail_key(
+        file_path="image.png", version="mtime=1", max_width=100, max_height=None, jpeg_quality=75
+    )
+    assert key != thumbnail_cache.thumbnail_key(
+        file_path="image.png", version="mtime=2", max_width=100, max_height=None, jpeg_quality=75
+    )
+    assert key != thumbnail_cache.thumbnail_key(
+        file_path="image.png", version="mtime=1", max_width=200, max_height=None, jpeg_quality=75
+    )
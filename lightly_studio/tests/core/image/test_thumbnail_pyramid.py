@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import io
+import logging
+from pathlib import Path
+
+import fsspec
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from lightly_studio.core.image import thumbnail_cache, thumbnail_pyramid
+
+
+def test_generate(tmp_path: Path) -> None:
+    image_path = tmp_path / "image.jpg"
+    Image.new("RGB", (1000, 500), color="red").save(image_path)
+    broken_path = tmp_path / "broken.jpg"
+    broken_path.write_bytes(b"not an image")
+
+    num_generated = thumbnail_pyramid.generate(
+        file_paths=[str(image_path), str(broken_path), str(tmp_path / "missing.jpg")],
+        show_progress=False,
+    )
+
+    assert num_generated == 1
+    assert thumbnail_pyramid.pyramid_cache.stats().num_entries == len(
+        thumbnail_pyramid.PYRAMID_SIZES
+    )
+    for size in thumbnail_pyramid.PYRAMID_SIZES:
+        level = _get_level(image_path=image_path, size=size)
+        with Image.open(io.BytesIO(level)) as level_image:
+            assert level_image.format == "JPEG"
+            assert level_image.size == (size, size // 2)
+
+
+def test_generate__does_not_upscale(tmp_path: Path) -> None:
+    image_path = tmp_path / "image.png"
+    Image.new("RGBA", (200, 100)).save(image_path)
+
+    thumbnail_pyramid.generate(file_paths=[str(image_path)], show_progress=False)
+
+    sizes = []
+    for size in thumbnail_pyramid.PYRAMID_SIZES:
+        with Image.open(io.BytesIO(_get_level(image_path=image_path, size=size))) as level:
+            sizes.append(level.size)
+    assert sizes == [(128, 64), (200, 100), (200, 100)]
+
+
+def test_generate__applies_exif_orientation(tmp_path: Path) -> None:
+    image_path = tmp_path / "image.jpg"
+    exif = Image.Exif()
+    # Rotated by 90 degrees.
+    exif[0x0112] = 6
+    Image.new("RGB", (1000, 500)).save(image_path, exif=exif)
+
+    thumbnail_pyramid.generate(file_paths=[str(image_path)], show_progress=False)
+
+    with Image.open(io.BytesIO(_get_level(image_path=image_path, size=256))) as level:
+        assert level.size == (128, 256)
+
+
+def test_generate__survives_eviction_from_thumbnail_cache(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    image_path = tmp_path / "image.jpg"
+    Image.new("RGB", (1000, 500), color="red").save(image_path)
+    mocker.patch.object(
+        thumbnail_cache,
+        "thumbnail_cache",
+        thumbnail_cache.ThumbnailCache(directory=tmp_path / "thumbnails", max_bytes=1000),
+    )
+
+    thumbnail_pyramid.generate(file_paths=[str(image_path)], show_progress=False)
+    # Thumbnails cached while browsing a large dataset.
+    for index in range(10):
+        thumbnail_cache.thumbnail_cache.put(key=f"{index:064x}", content=bytes(500))
+
+    assert thumbnail_cache.thumbnail_cache.stats().evictions > 0
+    for size in thumbnail_pyramid.PYRAMID_SIZES:
+        assert _get_level(image_path=image_path, size=size)
+
+
+def test_generate__warns_about_evicted_pyramids(
+    tmp_path: Path, mocker: MockerFixture, caplog: pytest.LogCaptureFixture
+) -> None:
+    image_paths = [tmp_path / f"image{index}.jpg" for index in range(3)]
+    for image_path in image_paths:
+        Image.effect_noise((600, 600), 64).convert("RGB").save(image_path)
+    levels = thumbnail_pyramid._build(content=image_paths[0].read_bytes())
+    level_bytes = sum(len(level) for level in levels.values())
+    mocker.patch.object(
+        thumbnail_pyramid,
+        "pyramid_cache",
+        thumbnail_cache.ThumbnailCache(
+            directory=tmp_path / "thumbnail_pyramids", max_bytes=2 * level_bytes
+        ),
+    )
+
+    with caplog.at_level(logging.WARNING, logger=thumbnail_pyramid.__name__):
+        thumbnail_pyramid.generate(
+            file_paths=[str(image_path) for image_path in image_paths], show_progress=False
+        )
+
+    assert "LIGHTLY_STUDIO_THUMBNAIL_PYRAMID_MAX_BYTES" in caplog.text
+
+
+def test_generate__no_warning_within_bound(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    image_path = tmp_path / "image.jpg"
+    Image.new("RGB", (1000, 500), color="red").save(image_path)
+
+    with caplog.at_level(logging.WARNING, logger=thumbnail_pyramid.__name__):
+        thumbnail_pyramid.generate(file_paths=[str(image_path)], show_progress=False)
+
+    assert caplog.text == ""
+
+
+def test_covering_level() -> None:
+    assert thumbnail_pyramid.covering_level(max_width=100, max_height=50) == 128
+    assert thumbnail_pyramid.covering_level(max_width=128, max_height=200) == 256
+    assert thumbnail_pyramid.covering_level(max_width=512, max_height=512) == 512
+    assert thumbnail_pyramid.covering_level(max_width=513, max_height=100) is None
+    assert thumbnail_pyramid.covering_level(max_width=100, max_height=None) is None
+
+
+def test_get_or_create_level(tmp_path: Path) -> None:
+    image_path = tmp_path / "image.jpg"
+    Image.new("RGB", (1000, 500)).save(image_path)
+    fs, fs_path = fsspec.core.url_to_fs(str(image_path))
+    version = thumbnail_cache.source_version(info=fs.info(fs_path))
+    assert version is not None
+
+    created = thumbnail_pyramid.get_or_create_level(
+        fs=fs, fs_path=fs_path, file_path=str(image_path), version=version, size=256
+    )
+    cached = thumbnail_pyramid.get_or_create_level(
+        fs=fs, fs_path=fs_path, file_path=str(image_path), version=version, size=128
+    )
+
+    assert created == _get_level(image_path=image_path, size=256)
+    assert cached == _get_level(image_path=image_path, size=128)
+    stats = thumbnail_pyramid.pyramid_cache.stats()
+    # The first call builds all levels, the second one reads one of them.
+    assert stats.num_entries == len(thumbnail_pyramid.PYRAMID_SIZES)
+    assert stats.hits >= 1
+
+
+def _get_level(image_path: Path, size: int) -> bytes:
+    fs, fs_path = fsspec.core.url_to_fs(str(image_path))
+    version = thumbnail_cache.source_version(info=fs.info(fs_path))
+    assert version is not None
+    level = thumbnail_pyramid.pyramid_cache.get(
+        key=thumbnail_pyramid._level_key(file_path=str(image_path), version=version, size=size)
+    )
+    assert level is not None
+    return level
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import os
 from argparse import ArgumentParser
+from fractions import Fraction
 from pathlib import Path
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
+import av
 import fsspec
+import numpy as np
 import pytest
 from av import container
 from av.codec.context import ThreadType
@@ -236,6 +239,19 @@ def _fail_after_frame_creation(
     )
 
 
+def test__read_video_create__without_average_rate() -> None:
+    video_stream = MagicMock(average_rate=None, width=320, height=240, duration=None)
+    video_container = MagicMock()
+    video_container.streams.video = [video_stream]
+
+    video = add_videos._read_video_create(
+        video_container=video_container, video_channel=0, video_path="/videos/video.mp4"
+    )
+
+    assert video.fps == 0.0
+    assert (video.width, video.height, video.duration_s) == (320, 240, None)
+
+
 def test__create_video_frame_samples(db_session: Session, tmp_path: Path) -> None:
     """Test _create_video_frame_samples function directly."""
     collection = create_collection(db_session, sample_type=SampleType.VIDEO)
@@ -427,6 +443,193 @@ def test_load_into_collection_from_paths__invalid_fps_raises(
         )
 
 
+def test_load_into_collection_from_paths__invalid_num_workers_raises(
+    db_session: Session,
+) -> None:
+    with pytest.raises(ValueError, match="num_workers must be at least 1"):
+        add_videos.load_into_collection_from_paths(
+            session=db_session,
+            collection_id=uuid4(),
+            video_paths=[],
+            num_workers=0,
+        )
+
+
+def test_load_into_collection_from_paths__num_workers(db_session: Session, tmp_path: Path) -> None:
+    collection = create_collection(db_session, sample_type=SampleType.VIDEO)
+    video_paths = [
+        str(create_video_file(output_path=tmp_path / f"video_{i}.mp4", num_frames=3 + i, fps=2))
+        for i in range(4)
+    ]
+
+    video_sample_ids, frame_sample_ids = add_videos.load_into_collection_from_paths(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video_paths=video_paths,
+        target_fps=1,
+        num_workers=3,
+    )
+
+    # Video IDs follow the input order and each video keeps every second frame.
+    videos = [
+        video_resolver.get_by_id(session=db_session, sample_id=sample_id)
+        for sample_id in video_sample_ids
+    ]
+    assert [video.file_path_abs for video in videos if video is not None] == video_paths
+    assert len(frame_sample_ids) == 2 + 2 + 3 + 3
+    frames_by_video = {
+        video.file_name: sorted(frame.frame_number for frame in video.frames)
+        for video in videos
+        if video is not None
+    }
+    assert frames_by_video == {
+        "video_0.mp4": [0, 2],
+        "video_1.mp4": [0, 2],
+        "video_2.mp4": [0, 2, 4],
+        "video_3.mp4": [0, 2, 4],
+    }
+
+
+def test_load_into_collection_from_paths__warns_about_options_ignored_when_embedding(
+    db_session: Session, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    collection = create_collection(db_session, sample_type=SampleType.VIDEO)
+    video_frames_collection_id = collection_resolver.get_or_create_child_collection(
+        session=db_session,
+        collection_id=collection.collection_id,
+        sample_type=SampleType.VIDEO_FRAME,
+    )
+    EmbeddingManagerProvider.get_embedding_manager().register_embedding_model(
+        session=db_session,
+        collection_id=video_frames_collection_id,
+        embedding_generator=RandomEmbeddingGenerator(),
+        set_as_default=True,
+    )
+    video_path = create_video_file(output_path=tmp_path / "video.mp4", num_frames=2, fps=1)
+
+    with caplog.at_level("WARNING"):
+        _, frame_sample_ids = add_videos.load_into_collection_from_paths(
+            session=db_session,
+            collection_id=collection.collection_id,
+            video_paths=[str(video_path)],
+            embed_frames=True,
+            num_workers=4,
+            frame_indexing=add_videos.FrameIndexingMode.DEMUX,
+        )
+
+    assert len(frame_sample_ids) == 2
+    assert "Ignoring num_workers=4 and frame_indexing=FrameIndexingMode.DEMUX" in caplog.text
+
+
+def test_load_into_collection_from_paths__num_workers_records_outcomes(
+    db_session: Session, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    collection = create_collection(db_session, sample_type=SampleType.VIDEO)
+    good_path = create_video_file(output_path=tmp_path / "good.mp4", num_frames=2, fps=1)
+    present_path = create_video_file(output_path=tmp_path / "present.mp4", num_frames=2, fps=1)
+    create_videos(db_session, collection.collection_id, [VideoStub(path=str(present_path))])
+    missing_path = tmp_path / "missing.mp4"
+    broken_path = tmp_path / "broken.mp4"
+    broken_path.write_bytes(b"not a real video")
+
+    with caplog.at_level("INFO"):
+        video_sample_ids, frame_sample_ids = add_videos.load_into_collection_from_paths(
+            session=db_session,
+            collection_id=collection.collection_id,
+            video_paths=[
+                str(path)
+                for path in [good_path, present_path, missing_path, broken_path, good_path]
+            ],
+            num_workers=2,
+        )
+
+    assert len(video_sample_ids) == 1
+    assert len(frame_sample_ids) == 2
+    videos = video_resolver.get_all_by_collection_id(
+        session=db_session, collection_id=collection.collection_id
+    ).samples
+    assert {video.file_name for video in videos} == {"good.mp4", "present.mp4"}
+    assert "added=1" in caplog.text
+    assert "already_present=2" in caplog.text
+    assert "missing=1" in caplog.text
+    assert "broken=1" in caplog.text
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+@pytest.mark.parametrize("target_fps", [None, 1])
+def test_load_into_collection_from_paths__demux_frame_indexing(
+    db_session: Session, tmp_path: Path, mocker: MockerFixture, num_workers: int, target_fps: float
+) -> None:
+    video_paths = [
+        str(create_video_file(output_path=tmp_path / f"video_{i}.mp4", num_frames=5 + i, fps=2))
+        for i in range(2)
+    ]
+    decode_frames = _load_frame_metadata(
+        session=db_session,
+        video_paths=video_paths,
+        num_workers=num_workers,
+        target_fps=target_fps,
+        frame_indexing=add_videos.FrameIndexingMode.DECODE,
+    )
+    spy_decode = mocker.spy(add_videos, "_iter_kept_frames")
+
+    demux_frames = _load_frame_metadata(
+        session=db_session,
+        video_paths=video_paths,
+        num_workers=num_workers,
+        target_fps=target_fps,
+        frame_indexing=add_videos.FrameIndexingMode.DEMUX,
+    )
+
+    # Constant frame rate videos are indexed without decoding all frames.
+    assert spy_decode.call_count == 0
+    assert demux_frames == decode_frames
+
+
+def test_load_into_collection_from_paths__demux_falls_back_to_decode(
+    db_session: Session, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    video_path = _create_video_file_with_pts(
+        output_path=tmp_path / "variable_rate.mp4", frame_pts=[0, 1, 2, 5, 6, 9]
+    )
+    decode_frames = _load_frame_metadata(
+        session=db_session,
+        video_paths=[str(video_path)],
+        num_workers=1,
+        target_fps=None,
+        frame_indexing=add_videos.FrameIndexingMode.DECODE,
+    )
+    spy_decode = mocker.spy(add_videos, "_iter_kept_frames")
+
+    demux_frames = _load_frame_metadata(
+        session=db_session,
+        video_paths=[str(video_path)],
+        num_workers=1,
+        target_fps=None,
+        frame_indexing=add_videos.FrameIndexingMode.DEMUX,
+    )
+
+    assert spy_decode.call_count == 1
+    assert demux_frames == decode_frames
+    assert [frame[0] for frame in demux_frames] == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    ("sorted_pts", "expected"),
+    [
+        ([], True),
+        ([7], True),
+        ([0, 512, 1024, 1536], True),
+        # Timestamps rounded to milliseconds, e.g. 29.97 fps in Matroska.
+        ([0, 33, 67, 100, 133], True),
+        ([0, 512, 1024, 2048], False),
+        ([0, 512, 512, 1024], False),
+    ],
+)
+def test__has_constant_frame_interval(sorted_pts: list[int], expected: bool) -> None:
+    assert add_videos._has_constant_frame_interval(sorted_pts=sorted_pts) is expected
+
+
 def test__configure_stream_threading__with_explicit_thread_count() -> None:
     """Test configuring threading with explicit thread count."""
     video_stream = MagicMock()
@@ -1003,6 +1206,53 @@ class _ObjectDetectionTrackInput(ObjectDetectionTrackInput):
         return list({annotation.video for annotation in self._video_annotations})
 
 
+def _load_frame_metadata(
+    session: Session,
+    video_paths: list[str],
+    num_workers: int,
+    target_fps: float | None,
+    frame_indexing: add_videos.FrameIndexingMode,
+) -> list[tuple[int, float, int, int]]:
+    """Load videos into a new collection and return the metadata of their frames."""
+    collection = create_collection(session, sample_type=SampleType.VIDEO)
+    _, frame_sample_ids = add_videos.load_into_collection_from_paths(
+        session=session,
+        collection_id=collection.collection_id,
+        video_paths=video_paths,
+        target_fps=target_fps,
+        num_workers=num_workers,
+        frame_indexing=frame_indexing,
+    )
+    frames = [
+        video_frame_resolver.get_by_id(session=session, sample_id=sample_id)
+        for sample_id in frame_sample_ids
+    ]
+    return [
+        (frame.frame_number, frame.frame_timestamp_s, frame.frame_timestamp_pts, frame.rotation_deg)
+        for frame in frames
+    ]
+
+
+def _create_video_file_with_pts(output_path: Path, frame_pts: list[int]) -> Path:
+    """Create a video whose frames have the given timestamps, in units of 1/10 s."""
+    with av.open(str(output_path), mode="w") as output_container:
+        stream = output_container.add_stream("libx264", rate=10)
+        stream.width = 64
+        stream.height = 48
+        stream.pix_fmt = "yuv420p"
+        for pts in frame_pts:
+            av_frame = av.VideoFrame.from_ndarray(
+                np.zeros((48, 64, 3), dtype=np.uint8), format="rgb24"
+            )
+            av_frame.pts = pts
+            av_frame.time_base = Fraction(1, 10)
+            for packet in stream.encode(av_frame):
+                output_container.mux(packet)
+        for packet in stream.encode():
+            output_container.mux(packet)
+    return output_path
+
+
 def _get_object_detection_track(
     filename: str,
     number_of_frames: int,
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from sqlmodel import Session, select, text
+
+from lightly_studio.database import db_generation
+from lightly_studio.models.collection import CollectionTable
+from tests.helpers_resolvers import create_collection
+
+
+def test_get__unchanged_by_reads(db_session: Session) -> None:
+    create_collection(session=db_session)
+    generation = db_generation.get()
+
+    db_session.exec(select(CollectionTable)).all()
+    db_session.commit()
+
+    assert db_generation.get() == generation
+
+
+def test_get__incremented_by_writes(db_session: Session) -> None:
+    generation = db_generation.get()
+
+    create_collection(session=db_session)
+
+    assert db_generation.get() > generation
+
+
+def test_get__incremented_by_raw_writes(db_session: Session) -> None:
+    collection = create_collection(session=db_session)
+    generation = db_generation.get()
+
+    db_session.exec(  # type: ignore[call-overload]
+        text("UPDATE collection SET name = 'renamed' WHERE collection_id = :collection_id"),
+        params={"collection_id": collection.collection_id},
+    )
+
+    assert db_generation.get() > generation
+
+
+def test_is_write() -> None:
+    assert not db_generation._is_write(statement="SELECT 1")
+    assert not db_generation._is_write(statement="\n  select * from sample")
+    assert db_generation._is_write(statement="INSERT INTO sample VALUES (1)")
+    assert db_generation._is_write(statement="WITH deleted AS (DELETE FROM sample) SELECT 1")
+    assert not db_generation._is_write(statement="SET LOCAL hnsw.ef_search = 100")
+    assert not db_generation._is_write(statement="SHOW hnsw.ef_search")
+    assert not db_generation._is_write(
+        statement="EXPLAIN (FORMAT JSON) SELECT count(*) FROM sample"
+    )
+    assert db_generation._is_write(statement="EXPLAIN ANALYZE DELETE FROM sample")
@@ -7,7 +7,7 @@ from typing import Any
 import pytest
 import sqlalchemy
 from duckdb_engine import Dialect
-from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import postgresql, sqlite
 
 from lightly_studio.database import db_json
 
@@ -236,3 +236,27 @@ def test_json_extract__repeated_renders_share_one_parameter(dialect: Any) -> Non
     assert len(result.params) == 1
     select_sql, group_by_sql = str(result).split(" GROUP BY ")
     assert group_by_sql.strip() in select_sql
+
+
+def test_json_object_merge__duckdb() -> None:
+    other = sqlalchemy.column("patch", sqlalchemy.JSON)
+    sql = str(_compile(db_json.json_object_merge(_COLUMN, other), Dialect()))
+
+    assert sql == (
+        "CAST(map_concat(CAST(data AS MAP(VARCHAR, JSON)), "
+        "CAST(patch AS MAP(VARCHAR, JSON))) AS JSON)"
+    )
+
+
+def test_json_object_merge__postgresql() -> None:
+    other = sqlalchemy.column("patch", sqlalchemy.JSON)
+    postgres = postgresql.dialect()  # type: ignore[no-untyped-call]
+    sql = str(_compile(db_json.json_object_merge(_COLUMN, other), postgres))
+
+    assert sql == "(CAST(data AS JSONB) || CAST(patch AS JSONB))::json"
+
+
+def test_json_object_merge__unsupported() -> None:
+    expr = db_json.json_object_merge(_COLUMN, _COLUMN)
+    with pytest.raises(NotImplementedError, match="Unsupported dialect: sqlite"):
+        expr.compile(dialect=sqlite.dialect())
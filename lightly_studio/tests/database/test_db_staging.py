@@ -0,0 +1,31 @@
+"""Tests for staging client-side rows as a table."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select, text
+
+from lightly_studio.database import db_staging
+
+
+def test_staged_text_table(db_session: Session) -> None:
+    with db_staging.staged_text_table(
+        session=db_session,
+        name="staged_rows",
+        columns=("key", "value"),
+        rows=[("a", "1"), ("b", "2")],
+    ) as staged:
+        rows = db_session.exec(select(staged.c.key, staged.c.value).order_by(staged.c.key)).all()
+
+    assert [tuple(row) for row in rows] == [("a", "1"), ("b", "2")]
+
+
+def test_staged_text_table__removed_on_exit(db_session: Session) -> None:
+    with db_staging.staged_text_table(
+        session=db_session, name="staged_rows", columns=("key",), rows=[("a",)]
+    ):
+        pass
+
+    with pytest.raises(SQLAlchemyError):
+        db_session.exec(text("SELECT * FROM staged_rows"))  # type: ignore[call-overload]
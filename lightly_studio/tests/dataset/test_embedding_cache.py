@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lightly_studio.core.file_outcome_report import AllInputFilesFailedError
+from lightly_studio.dataset import embedding_cache, file_utils
+from lightly_studio.dataset.embedding_cache import EmbeddingCache
+from lightly_studio.dataset.embedding_generator import ImageCrop
+from lightly_studio.dataset.embedding_result import EmbeddingResult
+from lightly_studio.utils.cache_stats import CacheStats
+
+
+def test_embedding_cache__get_and_put(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=100)
+
+    assert cache.get_many(["a"]) == [None]
+    cache.put_many([("a", np.array([1.0, 2.0], dtype=np.float32))])
+
+    cached = cache.get_many(["a", "b"])
+    assert cached[0] is not None
+    assert cached[0].tolist() == [1.0, 2.0]
+    assert cached[1] is None
+    assert cache.stats() == CacheStats(hits=1, misses=2, evictions=0, num_entries=1, size_bytes=8)
+
+
+def test_embedding_cache__evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=20)
+    cache.put_many([("a", np.zeros(2, dtype=np.float32))])
+    cache.put_many([("b", np.zeros(2, dtype=np.float32))])
+    # Mark "a" as recently used, so that "b" is evicted first.
+    cache.get_many(["a"])
+
+    cache.put_many([("c", np.zeros(2, dtype=np.float32))])
+
+    assert [embedding is not None for embedding in cache.get_many(["a", "b", "c"])] == [
+        True,
+        False,
+        True,
+    ]
+    assert cache.stats().evictions == 1
+    assert cache.stats().size_bytes == 16
+
+
+def test_embedding_cache__persists_across_instances(tmp_path: Path) -> None:
+    EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=100).put_many(
+        [("a", np.array([3.0], dtype=np.float32))]
+    )
+
+    reopened = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=100)
+
+    cached = reopened.get_many(["a"])[0]
+    assert cached is not None
+    assert cached.tolist() == [3.0]
+
+
+def test_embedding_cache__tracks_total_size(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=100)
+    cache.put_many([("a", np.zeros(2, dtype=np.float32)), ("b", np.zeros(3, dtype=np.float32))])
+    # Replacing an entry counts only its new size.
+    cache.put_many([("a", np.zeros(4, dtype=np.float32))])
+    assert cache.stats().size_bytes == 28
+
+    cache.clear()
+    assert cache.stats().size_bytes == 0
+
+
+def test_embedding_cache__total_size_of_existing_database(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL, "
+        "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+    )
+    connection.execute("INSERT INTO embeddings VALUES ('a', x'00000000', 4, 0)")
+    connection.commit()
+    connection.close()
+
+    cache = EmbeddingCache(path=path, max_bytes=100)
+    cache.put_many([("b", np.zeros(2, dtype=np.float32))])
+
+    assert cache.stats().size_bytes == 12
+
+
+def test_embedding_cache__disabled(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=0)
+    cache.put_many([("a", np.zeros(2, dtype=np.float32))])
+
+    assert cache.get_many(["a"]) == [None]
+    assert not (tmp_path / "cache.sqlite").exists()
+
+
+def test_crop_keys__same_content_at_other_path(tmp_path: Path) -> None:
+    (tmp_path / "a.png").write_bytes(b"content")
+    (tmp_path / "copy.png").write_bytes(b"content")
+    (tmp_path / "other.png").write_bytes(b"other content")
+
+    keys = embedding_cache.crop_keys(
+        image_crops=[
+            ImageCrop(filepath=str(tmp_path / "a.png"), x=0, y=0, width=1, height=1),
+            ImageCrop(filepath=str(tmp_path / "copy.png"), x=0, y=0, width=1, height=1),
+            ImageCrop(filepath=str(tmp_path / "copy.png"), x=0, y=0, width=2, height=1),
+            ImageCrop(filepath=str(tmp_path / "other.png"), x=0, y=0, width=1, height=1),
+            ImageCrop(filepath=str(tmp_path / "missing.png"), x=0, y=0, width=1, height=1),
+        ],
+        embedding_model_hash="model",
+    )
+
+    assert keys[0] == keys[1]
+    assert len({keys[1], keys[2], keys[3]}) == 3
+    assert keys[4] is None
+    assert keys[0] == embedding_cache.embedding_key(
+        content_hash=file_utils.get_bytes_xxhash(b"content"),
+        embedding_model_hash="model",
+        crop=(0, 0, 1, 1),
+    )
+
+
+def test_embed_with_cache__embeds_only_misses(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=1000)
+    cache.put_many([("a", np.array([1.0], dtype=np.float32))])
+    embedded: list[list[int]] = []
+
+    def embed(indices: list[int]) -> EmbeddingResult:
+        embedded.append(indices)
+        # The item at position 1 of the given indices is broken.
+        return EmbeddingResult(
+            embeddings=np.array([[10.0 + indices[0]], [10.0 + indices[2]]], dtype=np.float32),
+            kept_indices=[0, 2],
+        )
+
+    result = embedding_cache.embed_with_cache(keys=["b", "a", None, "d"], embed=embed, cache=cache)
+
+    assert embedded == [[0, 2, 3]]
+    assert result.kept_indices == [0, 1, 3]
+    assert result.embeddings[:, 0].tolist() == [10.0, 1.0, 13.0]
+    # The new embeddings are cached, except for the item without a key.
+    assert [embedding is not None for embedding in cache.get_many(["b", "d"])] == [True, True]
+
+
+def test_embed_with_cache__all_misses_broken(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=1000)
+
+    def embed(indices: list[int]) -> EmbeddingResult:  # noqa: ARG001
+        raise AllInputFilesFailedError()
+
+    # Without a cached embedding the run fails ...
+    with pytest.raises(AllInputFilesFailedError):
+        embedding_cache.embed_with_cache(keys=["a", "b"], embed=embed, cache=cache)
+
+    # ... but with one it keeps the cached embedding.
+    cache.put_many([("a", np.array([1.0], dtype=np.float32))])
+    result = embedding_cache.embed_with_cache(keys=["a", "b"], embed=embed, cache=cache)
+    assert result.kept_indices == [0]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from uuid import UUID, uuid4
 
 import numpy as np
@@ -11,7 +12,9 @@ from PIL import Image
 from pytest_mock import MockerFixture
 from sqlmodel import Session, select
 
-from lightly_studio.dataset import embedding_manager
+from lightly_studio.core.file_outcome_report import AllInputFilesFailedError
+from lightly_studio.dataset import embedding_cache, embedding_manager
+from lightly_studio.dataset.embedding_cache import EmbeddingCache
 from lightly_studio.dataset.embedding_generator import (
     ImageCrop,
     ImageEmbeddingGenerator,
@@ -30,6 +33,7 @@ from lightly_studio.models.sample_embedding import SampleEmbeddingTable
 from lightly_studio.resolvers import (
     collection_resolver,
     embedding_model_resolver,
+    image_resolver,
     sample_embedding_resolver,
 )
 from tests.helpers_resolvers import (
@@ -214,6 +218,93 @@ def test_embed_text_with_invalid_model(
         embedding_manager.embed_text(collection_id=collection.collection_id, text_query=query)
 
 
+def test_embed_text__cached(
+    db_session: Session,
+    collection: CollectionTable,
+    mocker: MockerFixture,
+) -> None:
+    embedding_manager = EmbeddingManager()
+    generator = RandomEmbeddingGenerator()
+    embedding_manager.register_embedding_model(
+        session=db_session,
+        embedding_generator=generator,
+        collection_id=collection.collection_id,
+        set_as_default=True,
+    )
+    embed_texts_spy = mocker.spy(generator, "embed_texts")
+
+    first = embedding_manager.embed_text(
+        collection_id=collection.collection_id, text_query=TextEmbedQuery(text="a cat")
+    )
+    # Surrounding and repeated whitespace does not change the key.
+    second = embedding_manager.embed_text(
+        collection_id=collection.collection_id, text_query=TextEmbedQuery(text="  a   cat ")
+    )
+
+    assert second == first
+    embed_texts_spy.assert_called_once_with(["a cat"])
+    stats = embedding_manager.text_embedding_cache_stats()
+    assert (stats.hits, stats.misses, stats.num_entries) == (1, 1, 1)
+
+
+def test_embed_texts(
+    db_session: Session,
+    collection: CollectionTable,
+    mocker: MockerFixture,
+) -> None:
+    embedding_manager = EmbeddingManager()
+    generator = RandomEmbeddingGenerator()
+    embedding_manager.register_embedding_model(
+        session=db_session,
+        embedding_generator=generator,
+        collection_id=collection.collection_id,
+        set_as_default=True,
+    )
+    cached = embedding_manager.embed_text(
+        collection_id=collection.collection_id, text_query=TextEmbedQuery(text="a dog")
+    )
+    embed_texts_spy = mocker.spy(generator, "embed_texts")
+
+    embeddings = embedding_manager.embed_texts(
+        collection_id=collection.collection_id,
+        texts=["a cat", "a dog", "a bird", "a cat"],
+    )
+
+    # The uncached texts are embedded once, in a single call.
+    embed_texts_spy.assert_called_once_with(["a cat", "a bird"])
+    assert len(embeddings) == 4
+    assert embeddings[1] == cached
+    assert embeddings[3] == embeddings[0]
+    assert embeddings[2] != embeddings[0]
+
+
+def test_embed_texts__without_batch_method(
+    db_session: Session,
+    collection: CollectionTable,
+) -> None:
+    class TextOnlyGenerator(RandomEmbeddingGenerator):
+        """Generator implementing only ``embed_text``, like a custom generator may."""
+
+        embed_texts = None  # type: ignore[assignment]
+
+        def embed_text(self, text: str) -> list[float]:
+            return [float(len(text)), 0.0, 0.0]
+
+    embedding_manager = EmbeddingManager()
+    embedding_manager.register_embedding_model(
+        session=db_session,
+        embedding_generator=TextOnlyGenerator(),
+        collection_id=collection.collection_id,
+        set_as_default=True,
+    )
+
+    embeddings = embedding_manager.embed_texts(
+        collection_id=collection.collection_id, texts=["a", "abc"]
+    )
+
+    assert embeddings == [[1.0, 0.0, 0.0], [3.0, 0.0, 0.0]]
+
+
 def test_embed_images(
     db_session: Session,
     collection: CollectionTable,
@@ -253,6 +344,145 @@ def test_embed_images(
         assert embedding.sample_id in sample_ids
 
 
+def test_embed_images__commits_each_chunk_and_resumes(
+    db_session: Session,
+    collection: CollectionTable,
+    samples: list[ImageTable],
+    mocker: MockerFixture,
+) -> None:
+    """Chunks finished before a failure are kept, and a second run embeds only the rest."""
+    mocker.patch.object(embedding_manager, "IMAGE_EMBED_BATCH_SIZE", 4)
+    generator = RandomEmbeddingGenerator()
+    manager = EmbeddingManager()
+    model_id = manager.register_embedding_model(
+        session=db_session,
+        embedding_generator=generator,
+        collection_id=collection.collection_id,
+        set_as_default=True,
+    ).embedding_model_id
+    sample_ids = [sample.sample_id for sample in samples]
+
+    # The third chunk fails, as if the run was interrupted.
+    embed_images = generator.embed_images
+    mocker.patch.object(
+        generator,
+        "embed_images",
+        side_effect=[
+            embed_images(["a"] * 4),
+            embed_images(["a"] * 4),
+            RuntimeError("interrupted"),
+        ],
+    )
+    with pytest.raises(RuntimeError, match="interrupted"):
+        manager.embed_images(
+            session=db_session, collection_id=collection.collection_id, sample_ids=sample_ids
+        )
+
+    unembedded_ids = image_resolver.get_unembedded_image_ids(
+        session=db_session, collection_id=collection.collection_id, embedding_model_id=model_id
+    )
+    assert len(unembedded_ids) == 2
+
+    mocker.patch.object(generator, "embed_images", side_effect=embed_images)
+    manager.embed_images(
+        session=db_session, collection_id=collection.collection_id, sample_ids=unembedded_ids
+    )
+
+    stored_embeddings = db_session.exec(
+        select(SampleEmbeddingTable).where(SampleEmbeddingTable.embedding_model_id == model_id)
+    ).all()
+    assert {embedding.sample_id for embedding in stored_embeddings} == set(sample_ids)
+
+
+def test_embed_images__raises_only_if_every_chunk_failed(
+    db_session: Session,
+    collection: CollectionTable,
+    samples: list[ImageTable],
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(embedding_manager, "IMAGE_EMBED_BATCH_SIZE", 4)
+    generator = RandomEmbeddingGenerator()
+    manager = EmbeddingManager()
+    manager.register_embedding_model(
+        session=db_session,
+        embedding_generator=generator,
+        collection_id=collection.collection_id,
+        set_as_default=True,
+    )
+    sample_ids = [sample.sample_id for sample in samples]
+    embed_images = generator.embed_images
+
+    # Only the first chunk is all broken: its error is tolerated.
+    mocker.patch.object(
+        generator,
+        "embed_images",
+        side_effect=[
+            AllInputFilesFailedError(),
+            embed_images(["a"] * 4),
+            embed_images(["a"] * 2),
+        ],
+    )
+    manager.embed_images(
+        session=db_session, collection_id=collection.collection_id, sample_ids=sample_ids
+    )
+
+    # Every chunk is all broken: the run fails.
+    mocker.patch.object(generator, "embed_images", side_effect=AllInputFilesFailedError())
+    with pytest.raises(AllInputFilesFailedError):
+        manager.embed_images(
+            session=db_session, collection_id=collection.collection_id, sample_ids=sample_ids
+        )
+
+
+def test_embed_images__reuses_cached_embeddings_of_identical_files(
+    db_session: Session,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Copies of already embedded files in another collection are not embedded again."""
+    mocker.patch.object(
+        embedding_cache,
+        "embedding_cache",
+        EmbeddingCache(path=tmp_path / "cache.sqlite", max_bytes=1024 * 1024),
+    )
+    generator = RandomEmbeddingGenerator()
+    spy_embed_images = mocker.spy(generator, "embed_images")
+    manager = EmbeddingManager()
+    stored: list[list[list[float]]] = []
+    for copy in ("original", "copy"):
+        (tmp_path / copy).mkdir()
+        collection = create_collection(session=db_session, collection_name=copy)
+        images = []
+        for i in range(3):
+            file_path = tmp_path / copy / f"image_{i}.png"
+            Image.new("RGB", (10, 10), color=(i, 0, 0)).save(file_path)
+            images.append(
+                create_image(
+                    session=db_session,
+                    collection_id=collection.collection_id,
+                    file_path_abs=str(file_path),
+                )
+            )
+        model_id = manager.register_embedding_model(
+            session=db_session,
+            embedding_generator=generator,
+            collection_id=collection.collection_id,
+            set_as_default=True,
+        ).embedding_model_id
+        sample_ids = [image.sample_id for image in images]
+        manager.embed_images(
+            session=db_session, collection_id=collection.collection_id, sample_ids=sample_ids
+        )
+        embeddings = sample_embedding_resolver.get_by_sample_ids(
+            session=db_session, sample_ids=sample_ids, embedding_model_id=model_id
+        )
+        embedding_by_id = {embedding.sample_id: embedding.embedding for embedding in embeddings}
+        stored.append([list(embedding_by_id[sample_id]) for sample_id in sample_ids])
+
+    spy_embed_images.assert_called_once()
+    assert stored[0] == stored[1]
+
+
 def test_embed_images_with_incompatible_generator(
     db_session: Session,
     collection: CollectionTable,
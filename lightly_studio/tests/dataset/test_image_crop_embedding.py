@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -5,11 +6,13 @@ import pytest
 import torch
 from numpy.typing import NDArray
 from PIL import Image
+from pytest_mock import MockerFixture
 
 from lightly_studio.core.file_outcome_report import AllInputFilesFailedError
 from lightly_studio.dataset import image_crop_embedding
 from lightly_studio.dataset.embedding_generator import ImageCrop
 from lightly_studio.dataset.image_embedding import EmbeddingContext
+from lightly_studio.utils import workers
 
 
 def test_embed_image_crops_batched__empty_input_returns_empty_array() -> None:
@@ -75,6 +78,41 @@ def test_embed_image_crops_batched__preserves_input_order_across_filepaths(
     assert result.embeddings[:, 0].tolist() == [5.0, 6.0, 7.0, 8.0]
 
 
+def test_embed_image_crops_batched__preprocesses_files_on_worker_threads(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(workers, "default_num_workers", return_value=3)
+    image_crops: list[ImageCrop] = []
+    for file_index in range(7):
+        image_path = tmp_path / f"image_{file_index}.png"
+        Image.new("RGB", (100, 100)).save(image_path)
+        image_crops.extend(
+            ImageCrop(filepath=str(image_path), x=0, y=0, width=file_index * 10 + i, height=5)
+            for i in range(1, 4)
+        )
+    preprocess_threads: set[str] = set()
+
+    def preprocess(image: Image.Image) -> torch.Tensor:
+        preprocess_threads.add(threading.current_thread().name)
+        return torch.tensor([float(image.size[0])])
+
+    result = image_crop_embedding.embed_image_crops_batched(
+        image_crops=image_crops,
+        context=EmbeddingContext(
+            embedding_dimension=1,
+            max_batch_size=4,
+            device=torch.device("cpu"),
+            preprocess=preprocess,
+            encode_batch=lambda images_tensor: images_tensor.numpy().astype(np.float32),
+        ),
+        show_progress=False,
+    )
+
+    assert threading.main_thread().name not in preprocess_threads
+    assert result.kept_indices == list(range(len(image_crops)))
+    assert result.embeddings[:, 0].tolist() == [float(crop.width) for crop in image_crops]
+
+
 def test_embed_image_crops_batched__skips_broken_file(tmp_path: Path) -> None:
     # Crops of a broken/missing source file are skipped per-file: the embeddings cover
     # only crops of readable files and kept_indices maps each row back to its input
@@ -40,6 +40,15 @@ class TestMobileCLIPEmbeddingGenerator:
         assert np.isclose(embedding_normed[2], 0.0922, atol=1e-4)
         assert np.isclose(embedding_normed[3], 0.0159, atol=1e-4)
 
+    def test_embed_texts(self) -> None:
+        mobileclip = MobileCLIPEmbeddingGenerator()
+        embeddings = mobileclip.embed_texts(["a cat", "a dog"])
+
+        assert len(embeddings) == 2
+        assert np.allclose(embeddings[0], mobileclip.embed_text("a cat"), atol=1e-5)
+        assert np.allclose(embeddings[1], mobileclip.embed_text("a dog"), atol=1e-5)
+        assert mobileclip.embed_texts([]) == []
+
     def test_embed_images(self) -> None:
         mobileclip = MobileCLIPEmbeddingGenerator()
         cat_image_path = FIXTURES_DIR / "cat.jpg"
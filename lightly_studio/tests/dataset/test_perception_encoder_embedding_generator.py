@@ -44,6 +44,15 @@ class TestPerceptionEncoderEmbeddingGenerator:
         assert np.isclose(embedding_normed[2], -0.0406, atol=1e-4)
         assert np.isclose(embedding_normed[3], -0.0312, atol=1e-4)
 
+    def test_embed_texts(self) -> None:
+        perception_encoder = PerceptionEncoderEmbeddingGenerator()
+        embeddings = perception_encoder.embed_texts(["a cat", "a dog"])
+
+        assert len(embeddings) == 2
+        assert np.allclose(embeddings[0], perception_encoder.embed_text("a cat"), atol=1e-5)
+        assert np.allclose(embeddings[1], perception_encoder.embed_text("a dog"), atol=1e-5)
+        assert perception_encoder.embed_texts([]) == []
+
     def test_embed_images(self) -> None:
         perception_encoder = PerceptionEncoderEmbeddingGenerator()
         cat_image_path = FIXTURES_DIR / "cat.jpg"
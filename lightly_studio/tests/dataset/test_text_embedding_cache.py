@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from lightly_studio.dataset.text_embedding_cache import TextEmbeddingCache, normalize_text
+
+
+def test_text_embedding_cache__get_put() -> None:
+    cache = TextEmbeddingCache(max_entries=2)
+    model_id = uuid4()
+
+    assert cache.get(embedding_model_id=model_id, text="a cat") is None
+    cache.put(embedding_model_id=model_id, text="a cat", embedding=[0.1, 0.2])
+
+    assert cache.get(embedding_model_id=model_id, text="a cat") == [0.1, 0.2]
+    # Entries of another model are not shared.
+    assert cache.get(embedding_model_id=uuid4(), text="a cat") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.num_entries, stats.size_bytes) == (1, 2, 1, 16)
+
+
+def test_text_embedding_cache__evicts_least_recently_used() -> None:
+    cache = TextEmbeddingCache(max_entries=2)
+    model_id = uuid4()
+    cache.put(embedding_model_id=model_id, text="a", embedding=[1.0])
+    cache.put(embedding_model_id=model_id, text="b", embedding=[2.0])
+    # Mark "a" as recently used, so that "b" is evicted.
+    cache.get(embedding_model_id=model_id, text="a")
+    cache.put(embedding_model_id=model_id, text="c", embedding=[3.0])
+
+    assert cache.get(embedding_model_id=model_id, text="a") == [1.0]
+    assert cache.get(embedding_model_id=model_id, text="b") is None
+    assert cache.get(embedding_model_id=model_id, text="c") == [3.0]
+    assert cache.stats().evictions == 1
+
+
+def test_text_embedding_cache__disabled() -> None:
+    cache = TextEmbeddingCache(max_entries=0)
+    model_id = uuid4()
+    cache.put(embedding_model_id=model_id, text="a", embedding=[1.0])
+
+    assert cache.get(embedding_model_id=model_id, text="a") is None
+    assert cache.stats().num_entries == 0
+
+
+def test_text_embedding_cache__clear() -> None:
+    cache = TextEmbeddingCache(max_entries=2)
+    model_id = uuid4()
+    cache.put(embedding_model_id=model_id, text="a", embedding=[1.0])
+    cache.get(embedding_model_id=model_id, text="a")
+    cache.clear()
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.num_entries) == (0, 0, 0)
+
+
+def test_normalize_text() -> None:
+    assert normalize_text("  A  cat\tin\nthe hat ") == "A cat in the hat"
@@ -38,6 +38,11 @@ from lightly_studio.resolvers import (
 from lightly_studio.resolvers.annotations.annotations_filter import (
     AnnotationsFilter,
 )
+from lightly_studio.resolvers.sample_embedding_resolver import EmbeddingMatrix
+from lightly_studio.utils import batching
+from tests.resolvers.evaluation_sample_metric_resolver import (
+    helpers as evaluation_sample_metric_helpers,
+)
 
 
 class TestClassifierManager:
@@ -545,8 +550,8 @@ class TestClassifierManager:
 
         mocker.patch.object(
             sample_embedding_resolver,
-            "get_all_by_collection_id",
-            return_value=fine_tuning_embeddings,
+            "get_matrix_by_collection_id",
+            return_value=_to_matrix(embeddings=fine_tuning_embeddings),
         )
         # Get samples for fine-tuning
         result = classifier_manager.get_samples_for_fine_tuning(
@@ -633,8 +638,8 @@ class TestClassifierManager:
         )
         mocker.patch.object(
             sample_embedding_resolver,
-            "get_all_by_collection_id",
-            return_value=input_embeddings,
+            "get_matrix_by_collection_id",
+            return_value=_to_matrix(embeddings=input_embeddings),
         )
         # Get samples for fine-tuning
         result = classifier_manager.get_samples_for_fine_tuning(
@@ -752,21 +757,16 @@ class TestClassifierManager:
         ).annotations
         assert not annotations
 
+        # Predict the first embedding value as confidence of the first class, so that the
+        # expected confidence of each sample does not depend on the prediction order.
+        confidences = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.91]
+        expected_confidence = {
+            sample.sample_id: confidence for sample, confidence in zip(samples, confidences)
+        }
         mocker.patch.object(
             RandomForest,
             "predict",
-            return_value=[
-                [0.1, 0.0],
-                [0.2, 0.0],
-                [0.3, 0.0],
-                [0.4, 0.0],
-                [0.5, 0.0],
-                [0.6, 0.0],
-                [0.7, 0.0],
-                [0.8, 0.0],
-                [0.9, 0.0],
-                [0.91, 0.0],
-            ],
+            side_effect=lambda embeddings: [[float(e[0]), 0.0] for e in embeddings],
         )
         # create dummy embeddings for the samples.
         sample_embedding_resolver.create_many(
@@ -774,10 +774,10 @@ class TestClassifierManager:
             sample_embeddings=[
                 SampleEmbeddingCreate(
                     sample_id=sample.sample_id,
-                    embedding=np.array([0.1, 0.2, 0.3], dtype=np.float32),
+                    embedding=np.array([confidence, 0.2, 0.3], dtype=np.float32),
                     embedding_model_id=embedding_model.embedding_model_id,
                 )
-                for sample in samples
+                for sample, confidence in zip(samples, confidences)
             ],
         )
 
@@ -796,7 +796,7 @@ class TestClassifierManager:
         # Store one annotation to check it is updated correctly.
         annotation_sample_id = annotations[0].parent_sample_id
         assert annotations[0].confidence is not None
-        assert np.isclose(annotations[0].confidence, 0.1)
+        assert np.isclose(annotations[0].confidence, expected_confidence[annotation_sample_id])
 
         # Predictions must land in a child collection named after the classifier.
         classifier_collection_id = collection_resolver.get_by_name(
@@ -819,18 +819,7 @@ class TestClassifierManager:
         mocker.patch.object(
             RandomForest,
             "predict",
-            return_value=[
-                [0.15, 0.0],
-                [0.25, 0.0],
-                [0.35, 0.0],
-                [0.45, 0.0],
-                [0.55, 0.0],
-                [0.65, 0.0],
-                [0.75, 0.0],
-                [0.85, 0.0],
-                [0.95, 0.0],
-                [0.96, 0.0],
-            ],
+            side_effect=lambda embeddings: [[float(e[0]) + 0.05, 0.0] for e in embeddings],
         )
 
         classifier_manager.run_classifier(
@@ -847,7 +836,9 @@ class TestClassifierManager:
         assert len(annotations_updated) == 10
         assert annotations_updated[0].parent_sample_id == annotation_sample_id
         assert annotations_updated[0].confidence is not None
-        assert np.isclose(annotations_updated[0].confidence, 0.15)
+        assert np.isclose(
+            annotations_updated[0].confidence, expected_confidence[annotation_sample_id] + 0.05
+        )
         assert (
             annotations_updated[0].annotation_label.annotation_label_name
             == "test_classifier_class1"
@@ -863,6 +854,191 @@ class TestClassifierManager:
         ).annotations
         assert len(annotations_in_classifier_collection) == 10
 
+    def test_run_classifier__batched(
+        self,
+        db_session: Session,
+        samples: list[ImageTable],
+        mocker: MockerFixture,
+        classifier: ClassifierEntry,
+        embedding_model: EmbeddingModelTable,
+    ) -> None:
+        """Test that the classifier runs in batches and reports progress."""
+        classifier_manager = ClassifierManager()
+        classifier_manager._classifiers[classifier.classifier_id] = classifier
+        collection_id = samples[0].sample.collection_id
+        sample_embedding_resolver.create_many(
+            session=db_session,
+            sample_embeddings=[
+                SampleEmbeddingCreate(
+                    sample_id=sample.sample_id,
+                    embedding=np.array([0.1, 0.2, 0.3], dtype=np.float32),
+                    embedding_model_id=embedding_model.embedding_model_id,
+                )
+                for sample in samples
+            ],
+        )
+        predict = mocker.patch.object(
+            RandomForest,
+            "predict",
+            side_effect=lambda embeddings: [[1.0, 0.0]] * len(embeddings),
+        )
+        progress: list[tuple[int, int]] = []
+
+        classifier_manager.run_classifier(
+            session=db_session,
+            classifier_id=classifier.classifier_id,
+            collection_id=collection_id,
+            batch_size=4,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert [len(call.args[0]) for call in predict.call_args_list] == [4, 4, 2]
+        assert progress == [(4, 10), (8, 10), (10, 10)]
+        annotations = annotation_resolver.get_all(
+            session=db_session,
+            filters=AnnotationsFilter(annotation_types=[AnnotationType.CLASSIFICATION]),
+        ).annotations
+        assert len(annotations) == 10
+        assert {annotation.parent_sample_id for annotation in annotations} == {
+            sample.sample_id for sample in samples
+        }
+
+    def test_run_classifier__failed_batch_keeps_previous_annotations(
+        self,
+        db_session: Session,
+        samples: list[ImageTable],
+        mocker: MockerFixture,
+        classifier: ClassifierEntry,
+        embedding_model: EmbeddingModelTable,
+    ) -> None:
+        """Test that a failing batch rolls back the replacement of the annotations."""
+        classifier_manager = ClassifierManager()
+        classifier_manager._classifiers[classifier.classifier_id] = classifier
+        collection_id = samples[0].sample.collection_id
+        sample_embedding_resolver.create_many(
+            session=db_session,
+            sample_embeddings=[
+                SampleEmbeddingCreate(
+                    sample_id=sample.sample_id,
+                    embedding=np.array([0.1, 0.2, 0.3], dtype=np.float32),
+                    embedding_model_id=embedding_model.embedding_model_id,
+                )
+                for sample in samples
+            ],
+        )
+        mocker.patch.object(
+            RandomForest,
+            "predict",
+            side_effect=lambda embeddings: [[0.9, 0.1]] * len(embeddings),
+        )
+        classifier_manager.run_classifier(
+            session=db_session,
+            classifier_id=classifier.classifier_id,
+            collection_id=collection_id,
+        )
+
+        # The second batch fails after the first one was written.
+        mocker.patch.object(
+            RandomForest,
+            "predict",
+            side_effect=[[[0.8, 0.2]] * 4, RuntimeError("predict failed")],
+        )
+        with pytest.raises(RuntimeError, match="predict failed"):
+            classifier_manager.run_classifier(
+                session=db_session,
+                classifier_id=classifier.classifier_id,
+                collection_id=collection_id,
+                batch_size=4,
+            )
+
+        annotations = annotation_resolver.get_all(
+            session=db_session,
+            filters=AnnotationsFilter(annotation_types=[AnnotationType.CLASSIFICATION]),
+        ).annotations
+        assert len(annotations) == 10
+        assert all(
+            annotation.confidence is not None and np.isclose(annotation.confidence, 0.9)
+            for annotation in annotations
+        )
+
+    def test_run_classifier__failed_batch_keeps_annotations_with_metrics(
+        self,
+        db_session: Session,
+        samples: list[ImageTable],
+        mocker: MockerFixture,
+        classifier: ClassifierEntry,
+        embedding_model: EmbeddingModelTable,
+    ) -> None:
+        """Test that a failing batch keeps previous annotations referenced by metrics."""
+        classifier_manager = ClassifierManager()
+        classifier_manager._classifiers[classifier.classifier_id] = classifier
+        collection_id = samples[0].sample.collection_id
+        sample_embedding_resolver.create_many(
+            session=db_session,
+            sample_embeddings=[
+                SampleEmbeddingCreate(
+                    sample_id=sample.sample_id,
+                    embedding=np.array([0.1, 0.2, 0.3], dtype=np.float32),
+                    embedding_model_id=embedding_model.embedding_model_id,
+                )
+                for sample in samples
+            ],
+        )
+        mocker.patch.object(
+            RandomForest,
+            "predict",
+            side_effect=lambda embeddings: [[0.9, 0.1]] * len(embeddings),
+        )
+        classifier_manager.run_classifier(
+            session=db_session,
+            classifier_id=classifier.classifier_id,
+            collection_id=collection_id,
+        )
+        previous_annotations = annotation_resolver.get_all(
+            session=db_session,
+            filters=AnnotationsFilter(annotation_types=[AnnotationType.CLASSIFICATION]),
+        ).annotations
+        run = evaluation_sample_metric_helpers.create_run(
+            session=db_session, collection_id=collection_id
+        )
+        evaluation_sample_metric_helpers.create_annotation_metrics(
+            session=db_session,
+            run_id=run.id,
+            annotation_metrics=[
+                evaluation_sample_metric_helpers.AnnotationMetricStub(
+                    sample_id=annotation.parent_sample_id,
+                    metric_name="score",
+                    value=0.5,
+                    pred_annotation_id=annotation.sample_id,
+                )
+                for annotation in previous_annotations
+            ],
+        )
+
+        # Delete the previous annotations in several batches, then fail the second
+        # classification batch after the first one was written.
+        mocker.patch.object(batching, "DEFAULT_BATCH_SIZE", 4)
+        mocker.patch.object(
+            RandomForest,
+            "predict",
+            side_effect=[[[0.8, 0.2]] * 4, RuntimeError("predict failed")],
+        )
+        with pytest.raises(RuntimeError, match="predict failed"):
+            classifier_manager.run_classifier(
+                session=db_session,
+                classifier_id=classifier.classifier_id,
+                collection_id=collection_id,
+                batch_size=4,
+            )
+
+        annotations = annotation_resolver.get_all(
+            session=db_session,
+            filters=AnnotationsFilter(annotation_types=[AnnotationType.CLASSIFICATION]),
+        ).annotations
+        assert {annotation.sample_id for annotation in annotations} == {
+            annotation.sample_id for annotation in previous_annotations
+        }
+
     def test_run_classifier__no_samples_in_database(
         self,
         db_session: Session,
@@ -895,3 +1071,10 @@ class TestClassifierManager:
                 classifier_id=classifier.classifier_id,
                 collection_id=collection_id,
             )
+
+
+def _to_matrix(embeddings: list[SampleEmbeddingTable]) -> EmbeddingMatrix:
+    return EmbeddingMatrix(
+        sample_ids=[embedding.sample_id for embedding in embeddings],
+        embeddings=np.stack([embedding.embedding for embedding in embeddings]),
+    )
@@ -11,6 +11,7 @@ from sklearn.utils import validation  # type: ignore[import-untyped]
 from lightly_studio.few_shot_classifier.classifier import AnnotatedEmbedding
 from lightly_studio.few_shot_classifier.random_forest_classifier import (
     RandomForest,
+    compile_random_forest,
     load_lightly_random_forest,
     load_random_forest_classifier,
     predict_with_lightly_random_forest,
@@ -420,3 +421,70 @@ class TestRandomForestClassifier:
         # Verify predictions match for both export formats.
         assert np.allclose(predictions_original, predictions_sklearn, atol=1e-6)
         assert np.allclose(predictions_original, predictions_lightly, atol=1e-6)
+
+    def test_compiled_random_forest__parity_with_sklearn(self) -> None:
+        """Test that the compiled lightly export predicts the same as sklearn."""
+        rng = np.random.default_rng(seed=0)
+        class_labels = ["a", "b", "c", "d"]
+        classifier = RandomForest(
+            name="classifier_name",
+            classes=class_labels,
+            embedding_model_hash="hash",
+            embedding_model_name="name",
+        )
+        train_embeddings = rng.normal(size=(300, 16)).astype(np.float32)
+        # Class "d" is never annotated, so its probability column must stay zero.
+        train_labels = rng.integers(0, 3, size=300)
+        classifier.train(
+            [
+                AnnotatedEmbedding(embedding=embedding, annotation=class_labels[label])
+                for embedding, label in zip(train_embeddings, train_labels)
+            ]
+        )
+        buffer = io.BytesIO()
+        classifier.export(export_path=None, buffer=buffer, export_type="lightly")
+        buffer.seek(0)
+        compiled = compile_random_forest(model=load_lightly_random_forest(path=None, buffer=buffer))
+
+        test_embeddings = rng.normal(size=(1000, 16)).astype(np.float32)
+        # A small batch size makes the batches cover the embeddings unevenly.
+        predictions = compiled.predict(embeddings=test_embeddings, batch_size=300)
+
+        assert predictions.shape == (1000, 4)
+        assert np.allclose(predictions, classifier.predict(list(test_embeddings)), atol=1e-12)
+        assert np.all(predictions[:, 3] == 0.0)
+        assert len(compiled.roots) == 100
+
+    def test_compiled_random_forest__predict_validates_input(self) -> None:
+        """Test empty input and embeddings of the wrong dimensionality."""
+        classifier = RandomForest(
+            name="classifier_name",
+            classes=["0", "1"],
+            embedding_model_hash="hash",
+            embedding_model_name="name",
+        )
+        classifier.train(
+            [
+                AnnotatedEmbedding(
+                    embedding=np.array([0.1, 0.2], dtype=np.float32), annotation="0"
+                ),
+                AnnotatedEmbedding(
+                    embedding=np.array([0.9, 0.8], dtype=np.float32), annotation="1"
+                ),
+            ]
+        )
+        buffer = io.BytesIO()
+        classifier.export(export_path=None, buffer=buffer, export_type="lightly")
+        buffer.seek(0)
+        exported_classifier = load_lightly_random_forest(path=None, buffer=buffer)
+
+        assert predict_with_lightly_random_forest(exported_classifier, []) == []
+        with pytest.raises(ValueError, match="wrong dimensionality"):
+            predict_with_lightly_random_forest(
+                exported_classifier, [np.array([0.1, 0.2, 0.3], dtype=np.float32)]
+            )
+        with pytest.raises(ValueError, match="wrong dimensionality"):
+            predict_with_lightly_random_forest(
+                exported_classifier,
+                [np.array([0.1, 0.2], dtype=np.float32), np.array([0.1], dtype=np.float32)],
+            )
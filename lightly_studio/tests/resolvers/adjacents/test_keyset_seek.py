@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlmodel import col
+
+from lightly_studio.models.annotation.annotation_base import AnnotationBaseTable
+from lightly_studio.models.image import ImageTable
+from lightly_studio.resolvers.adjacents import keyset_seek
+
+_SORT_KEYS: list[keyset_seek.SortKey] = [
+    (col(ImageTable.file_path_abs), True),
+    (col(AnnotationBaseTable.created_at), False),
+    (col(ImageTable.sample_id), True),
+]
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        # SQLite returns naive datetimes.
+        datetime(2025, 1, 2, 3, 4, 5, 678901),  # noqa: DTZ001
+        datetime(2025, 1, 2, tzinfo=timezone.utc),
+    ],
+)
+def test_encode_cursor__round_trip(created_at: datetime) -> None:
+    values = ("/data/ä b.png", created_at, uuid4())
+
+    cursor = keyset_seek.encode_cursor(sort_keys=_SORT_KEYS, values=values)
+
+    assert "=" not in cursor
+    assert keyset_seek.decode_cursor(sort_keys=_SORT_KEYS, cursor=cursor) == values
+
+
+def test_decode_cursor__other_sort_keys() -> None:
+    cursor = keyset_seek.encode_cursor(
+        sort_keys=_SORT_KEYS, values=("/a.png", datetime(2025, 1, 1, tzinfo=timezone.utc), uuid4())
+    )
+    reversed_first_key: list[keyset_seek.SortKey] = [(_SORT_KEYS[0][0], False), *_SORT_KEYS[1:]]
+
+    assert keyset_seek.decode_cursor(sort_keys=reversed_first_key, cursor=cursor) is None
+    assert keyset_seek.decode_cursor(sort_keys=_SORT_KEYS[:2], cursor=cursor) is None
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!", "e30", "W10"])
+def test_decode_cursor__malformed(cursor: str) -> None:
+    assert keyset_seek.decode_cursor(sort_keys=_SORT_KEYS, cursor=cursor) is None
@@ -219,6 +219,69 @@ def test_get_all_with_payload__with_video_frame(db_session: Session) -> None:
     )
 
 
+@pytest.mark.parametrize("sample_type", [SampleType.IMAGE, SampleType.VIDEO])
+def test_get_all_with_payload__with_seek_cursor(
+    db_session: Session, sample_type: SampleType
+) -> None:
+    collection = create_collection(session=db_session, sample_type=sample_type)
+    if sample_type == SampleType.IMAGE:
+        parent_sample_ids = [
+            create_image(
+                session=db_session, collection_id=collection.collection_id, file_path_abs=path
+            ).sample_id
+            for path in ["/b.png", "/a.png"]
+        ]
+    else:
+        parent_sample_ids = create_video_with_frames(
+            session=db_session,
+            collection_id=collection.collection_id,
+            video=VideoStub(path="/a.mp4", duration_s=2.0, fps=1.0),
+        ).frame_sample_ids
+    label = create_annotation_label(
+        session=db_session, root_collection_id=collection.collection_id, label_name="car"
+    )
+    # Several annotations per parent, so that pages end inside a parent.
+    annotation = None
+    for parent_sample_id in parent_sample_ids:
+        for _ in range(3):
+            annotation = create_annotation(
+                session=db_session,
+                sample_id=parent_sample_id,
+                annotation_label_id=label.annotation_label_id,
+                collection_id=collection.collection_id,
+            )
+    assert annotation is not None
+    annotation_collection_id = annotation.sample.collection_id
+
+    offset_ids = [
+        view.annotation.sample_id
+        for offset in range(0, 6, 4)
+        for view in annotation_resolver.get_all_with_payload(
+            session=db_session,
+            collection_id=annotation_collection_id,
+            pagination=Paginated(offset=offset, limit=4),
+        ).annotations
+    ]
+    first_page = annotation_resolver.get_all_with_payload(
+        session=db_session,
+        collection_id=annotation_collection_id,
+        pagination=Paginated(offset=0, limit=4),
+    )
+    second_page = annotation_resolver.get_all_with_payload(
+        session=db_session,
+        collection_id=annotation_collection_id,
+        pagination=Paginated(offset=1000, limit=4),
+        seek_cursor=first_page.next_seek_cursor,
+    )
+
+    assert first_page.next_seek_cursor is not None
+    assert second_page.next_seek_cursor is None
+    assert second_page.total_count == 6
+    assert [
+        view.annotation.sample_id for view in first_page.annotations + second_page.annotations
+    ] == offset_ids
+
+
 def test_get_all_with_payload__orders_by_text_embedding_similarity(
     db_session: Session,
 ) -> None:
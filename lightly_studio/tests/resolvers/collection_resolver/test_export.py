@@ -5,7 +5,11 @@ from sqlmodel import Session
 from lightly_studio.models.embedding_region import EmbeddingRegion, Point2D
 from lightly_studio.models.image import ImageTable
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
-from lightly_studio.resolvers import collection_resolver, sample_embedding_resolver
+from lightly_studio.resolvers import (
+    collection_resolver,
+    sample_embedding_resolver,
+    twodim_embedding_resolver,
+)
 from lightly_studio.resolvers.image_filter import ImageFilter
 from lightly_studio.resolvers.sample_resolver.sample_filter import SampleFilter
 from tests.helpers_resolvers import (
@@ -119,9 +123,16 @@ def _setup_embedding_region(
     }
     db_session.add(
         TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(ordered_sample_ids),
             hash=cache_key,
-            x=[coordinates[sid][0] for sid in ordered_sample_ids],
-            y=[coordinates[sid][1] for sid in ordered_sample_ids],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates[sid][0] for sid in ordered_sample_ids]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates[sid][1] for sid in ordered_sample_ids]
+            ),
         )
     )
     db_session.commit()
@@ -171,6 +171,9 @@ def test_delete_dataset__with_embeddings(db_session: Session) -> None:
         embedding_model_id=embedding_model_id,
         embedding=[1.0, 2.0, 3.0],
     )
+    version = sample_embedding_resolver.get_version(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
 
     # Act
     dataset_resolver.delete_dataset(
@@ -178,7 +181,13 @@ def test_delete_dataset__with_embeddings(db_session: Session) -> None:
         dataset_id=dataset.dataset_id,
     )
 
-    # Assert - collection deleted, embeddings deleted
+    # Assert - collection deleted, embeddings deleted and caches of them invalidated
+    assert (
+        sample_embedding_resolver.get_version(
+            session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+        )
+        == version + 1
+    )
     assert collection_resolver.get_by_id(session=db_session, collection_id=collection_id) is None
     embeddings = sample_embedding_resolver.get_all_by_collection_id(
         session=db_session,
@@ -7,7 +7,7 @@ from sqlmodel import Session
 from lightly_studio.models.embedding_region import EmbeddingRegion, Point2D
 from lightly_studio.models.image import ImageTable
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
-from lightly_studio.resolvers import sample_embedding_resolver
+from lightly_studio.resolvers import sample_embedding_resolver, twodim_embedding_resolver
 from lightly_studio.resolvers.image_filter import ImageFilter
 from lightly_studio.resolvers.image_resolver import annotation_count_helpers
 from lightly_studio.resolvers.sample_resolver.sample_filter import SampleFilter
@@ -133,9 +133,16 @@ def _persist_two_dim_projection(
     coordinates_by_sample = {image.sample_id: coord for image, coord in zip(images, coordinates)}
     session.add(
         TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(sample_ids_ordered),
             hash=cache_key,
-            x=[coordinates_by_sample[sid][0] for sid in sample_ids_ordered],
-            y=[coordinates_by_sample[sid][1] for sid in sample_ids_ordered],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sid][0] for sid in sample_ids_ordered]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sid][1] for sid in sample_ids_ordered]
+            ),
         )
     )
     session.commit()
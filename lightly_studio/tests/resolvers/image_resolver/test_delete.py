@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from lightly_studio.resolvers import image_resolver, sample_embedding_resolver
+from tests.helpers_resolvers import (
+    create_collection,
+    create_embedding_model,
+    create_image,
+    create_sample_embedding,
+)
+
+
+def test_delete(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    image = create_image(session=db_session, collection_id=collection_id)
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+    create_sample_embedding(
+        session=db_session,
+        sample_id=image.sample_id,
+        embedding=[1.0, 2.0, 3.0],
+        embedding_model_id=embedding_model_id,
+    )
+    version = sample_embedding_resolver.get_version(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
+
+    assert image_resolver.delete(session=db_session, sample_id=image.sample_id)
+
+    assert image_resolver.get_by_id(session=db_session, sample_id=image.sample_id) is None
+    # Caches derived from the collection's embeddings are invalidated.
+    assert (
+        sample_embedding_resolver.get_version(
+            session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+        )
+        == version + 1
+    )
+
+
+def test_delete__missing_image(db_session: Session) -> None:
+    assert not image_resolver.delete(session=db_session, sample_id=uuid4())
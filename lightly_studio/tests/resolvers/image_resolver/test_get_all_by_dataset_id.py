@@ -4,12 +4,14 @@ from uuid import UUID
 
 import pytest
 from pydantic_core._pydantic_core import ValidationError
+from pytest_mock import MockerFixture
 from sqlmodel import Session
 
 from lightly_studio.api.routes.api.validators import Paginated
 from lightly_studio.core.dataset_query.image_sample_field import ImageSampleField
 from lightly_studio.core.dataset_query.order_by import (
     OrderByEvaluationMetricField,
+    OrderByExpression,
     OrderByField,
     OrderByMetadataField,
 )
@@ -17,10 +19,12 @@ from lightly_studio.models.embedding_region import EmbeddingRegion, Point2D
 from lightly_studio.models.image import ImageTable
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
 from lightly_studio.resolvers import (
+    grid_count,
     image_resolver,
     metadata_resolver,
     sample_embedding_resolver,
     tag_resolver,
+    twodim_embedding_resolver,
 )
 from lightly_studio.resolvers.annotations.annotations_filter import AnnotationsFilter
 from lightly_studio.resolvers.image_filter import (
@@ -1120,9 +1124,16 @@ def _setup_collection_with_2d_coordinates(
     )
     session.add(
         TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(cached_sample_ids),
             hash=cache_key,
-            x=[coordinates_by_sample[sample_id][0] for sample_id in cached_sample_ids],
-            y=[coordinates_by_sample[sample_id][1] for sample_id in cached_sample_ids],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sample_id][0] for sample_id in cached_sample_ids]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates_by_sample[sample_id][1] for sample_id in cached_sample_ids]
+            ),
         )
     )
     session.commit()
@@ -1209,9 +1220,16 @@ def test_get_all_by_collection_id__embedding_region_combined_with_dimension_filt
     )
     db_session.add(
         TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(cached_sample_ids),
             hash=cache_key,
-            x=[coordinates[sample_id][0] for sample_id in cached_sample_ids],
-            y=[coordinates[sample_id][1] for sample_id in cached_sample_ids],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates[sample_id][0] for sample_id in cached_sample_ids]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates[sample_id][1] for sample_id in cached_sample_ids]
+            ),
         )
     )
     db_session.commit()
@@ -1353,3 +1371,180 @@ def test_get_all_by_collection_id__sort_by_metadata_places_missing_values_last(
 
     assert [s.file_name for s in ascending.samples] == ["a.png", "b.png", "c.png"]
     assert [s.file_name for s in descending.samples] == ["b.png", "a.png", "c.png"]
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        None,
+        [OrderByField(ImageSampleField.height)],
+        [OrderByField(ImageSampleField.height).desc()],
+    ],
+)
+def test_get_all_by_collection_id__seek_cursor_pages_match_offset_pages(
+    db_session: Session, order_by: list[OrderByExpression] | None
+) -> None:
+    collection = create_collection(session=db_session)
+    collection_id = collection.collection_id
+    # Ties on height and on file path leave only the sample ID to order the rows.
+    for path, height in [("/c.png", 300), ("/a.png", 200), ("/b.png", 200), ("/a.png", 200)]:
+        create_image(
+            session=db_session, collection_id=collection_id, file_path_abs=path, height=height
+        )
+    create_image(
+        session=db_session, collection_id=collection_id, file_path_abs="/d.png", height=100
+    )
+
+    offset_ids = [
+        sample.sample_id
+        for offset in range(0, 5, 2)
+        for sample in image_resolver.get_all_by_collection_id(
+            session=db_session,
+            collection_id=collection_id,
+            pagination=Paginated(offset=offset, limit=2),
+            order_by=order_by,
+        ).samples
+    ]
+
+    seek_ids: list[UUID] = []
+    seek_cursor = None
+    for _ in range(4):
+        page = image_resolver.get_all_by_collection_id(
+            session=db_session,
+            collection_id=collection_id,
+            # The offset is ignored while the cursor is valid.
+            pagination=Paginated(offset=0 if seek_cursor is None else 1000, limit=2),
+            order_by=order_by,
+            seek_cursor=seek_cursor,
+        )
+        seek_ids.extend(sample.sample_id for sample in page.samples)
+        seek_cursor = page.next_seek_cursor
+        if seek_cursor is None:
+            break
+
+    assert seek_cursor is None
+    assert len(offset_ids) == 5
+    assert seek_ids == offset_ids
+
+
+def test_get_all_by_collection_id__seek_cursor_of_other_sort_falls_back_to_offset(
+    db_session: Session,
+) -> None:
+    collection = create_collection(session=db_session)
+    collection_id = collection.collection_id
+    images = create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(path=f"/{name}.png") for name in "abcd"],
+    )
+    first_page = image_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        pagination=Paginated(offset=0, limit=2),
+    )
+    assert first_page.next_seek_cursor is not None
+
+    result = image_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        pagination=Paginated(offset=1, limit=2),
+        order_by=[OrderByField(ImageSampleField.file_path_abs).desc()],
+        seek_cursor=first_page.next_seek_cursor,
+    )
+    assert [s.sample_id for s in result.samples] == [images[2].sample_id, images[1].sample_id]
+
+    result = image_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        pagination=Paginated(offset=1, limit=2),
+        seek_cursor="not-a-cursor",
+    )
+    assert [s.sample_id for s in result.samples] == [images[1].sample_id, images[2].sample_id]
+
+
+def test_get_all_by_collection_id__no_seek_cursor_for_metadata_sort(db_session: Session) -> None:
+    collection = create_collection(session=db_session)
+    collection_id = collection.collection_id
+    create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(path=f"/{name}.png") for name in "abc"],
+    )
+
+    result = image_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        pagination=Paginated(offset=0, limit=2),
+        order_by=[OrderByMetadataField("score")],
+    )
+
+    assert len(result.samples) == 2
+    assert result.next_cursor == 2
+    assert result.next_seek_cursor is None
+
+
+def test_get_all_by_collection_id__reuses_total_count_across_pages(
+    db_session: Session, mocker: MockerFixture
+) -> None:
+    collection = create_collection(session=db_session)
+    collection_id = collection.collection_id
+    create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(path=f"/{name}.png") for name in "abc"],
+    )
+    mocker.patch.object(grid_count, "count_cache", grid_count.CountCache(max_entries=16))
+    get_total_count = mocker.spy(grid_count, "get_total_count")
+    count_executions = mocker.spy(grid_count.count_cache, "put")
+
+    pages = [
+        image_resolver.get_all_by_collection_id(
+            session=db_session,
+            collection_id=collection_id,
+            pagination=Paginated(offset=offset, limit=2),
+        )
+        for offset in (0, 2)
+    ]
+
+    assert get_total_count.call_count == 2
+    assert count_executions.call_count == 1
+    assert [page.total_count for page in pages] == [3, 3]
+    assert all(page.total_count_is_exact for page in pages)
+    assert [page.next_cursor for page in pages] == [2, None]
+
+
+def test_get_all_by_collection_id__estimated_count(
+    db_session: Session, mocker: MockerFixture
+) -> None:
+    collection = create_collection(session=db_session)
+    collection_id = collection.collection_id
+    create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(path=f"/{name}.png") for name in "abc"],
+    )
+    mocker.patch.object(grid_count, "estimate_count", return_value=2_000_000)
+
+    estimated = [
+        image_resolver.get_all_by_collection_id(
+            session=db_session,
+            collection_id=collection_id,
+            pagination=Paginated(offset=offset, limit=2),
+            allow_estimated_count=True,
+        )
+        for offset in (0, 2)
+    ]
+    filtered = image_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        pagination=Paginated(offset=0, limit=2),
+        filters=ImageFilter(width=FilterDimensions(min=0)),
+        allow_estimated_count=True,
+    )
+
+    assert [page.total_count for page in estimated] == [2_000_000, 2_000_000]
+    assert not any(page.total_count_is_exact for page in estimated)
+    # The end of an estimated count is where a page is not full.
+    assert [page.next_cursor for page in estimated] == [2, None]
+    assert filtered.total_count == 3
+    assert filtered.total_count_is_exact
@@ -5,7 +5,11 @@ from sqlmodel import Session
 
 from lightly_studio.models.embedding_region import EmbeddingRegion, Point2D
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
-from lightly_studio.resolvers import image_resolver, sample_embedding_resolver
+from lightly_studio.resolvers import (
+    image_resolver,
+    sample_embedding_resolver,
+    twodim_embedding_resolver,
+)
 from lightly_studio.resolvers.image_filter import FilterDimensions, ImageFilter
 from lightly_studio.resolvers.image_resolver import ImageExportPreload
 from lightly_studio.resolvers.sample_resolver.sample_filter import SampleFilter
@@ -139,7 +143,16 @@ def test_get_for_export__with_embedding_region_filter(db_session: Session) -> No
     y[inside2_i] = 5.0
     x[outside_i] = 100.0
     y[outside_i] = 100.0
-    db_session.add(TwoDimEmbeddingTable(hash=cache_key, x=x, y=y))
+    db_session.add(
+        TwoDimEmbeddingTable(
+            collection_id=collection.collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(sample_ids_in_order),
+            hash=cache_key,
+            x=twodim_embedding_resolver.encode_coordinates(x),
+            y=twodim_embedding_resolver.encode_coordinates(y),
+        )
+    )
     db_session.commit()
 
     region = EmbeddingRegion(
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from sqlmodel import Session
+
+from lightly_studio.resolvers import image_resolver
+from tests.helpers_resolvers import (
+    create_collection,
+    create_embedding_model,
+    create_image,
+    create_sample_embedding,
+)
+
+
+def test_get_unembedded_image_ids(db_session: Session) -> None:
+    collection = create_collection(session=db_session)
+    other_collection = create_collection(session=db_session, collection_name="other")
+    embedded_image = create_image(
+        session=db_session, collection_id=collection.collection_id, file_path_abs="/a.png"
+    )
+    unembedded_image_b = create_image(
+        session=db_session, collection_id=collection.collection_id, file_path_abs="/b.png"
+    )
+    unembedded_image_c = create_image(
+        session=db_session, collection_id=collection.collection_id, file_path_abs="/c.png"
+    )
+    create_image(session=db_session, collection_id=other_collection.collection_id)
+    embedding_model = create_embedding_model(
+        session=db_session, collection_id=collection.collection_id
+    )
+    other_model = create_embedding_model(
+        session=db_session, collection_id=collection.collection_id, embedding_model_name="other"
+    )
+    create_sample_embedding(
+        session=db_session,
+        sample_id=embedded_image.sample_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        embedding=[0.1, 0.2, 0.3],
+    )
+    # An embedding of another model does not count.
+    create_sample_embedding(
+        session=db_session,
+        sample_id=unembedded_image_c.sample_id,
+        embedding_model_id=other_model.embedding_model_id,
+        embedding=[0.1, 0.2, 0.3],
+    )
+
+    unembedded_ids = image_resolver.get_unembedded_image_ids(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+    )
+
+    assert unembedded_ids == [unembedded_image_b.sample_id, unembedded_image_c.sample_id]
@@ -4,6 +4,7 @@ from collections.abc import Mapping
 from typing import Any
 from uuid import UUID
 
+import pytest
 from sqlmodel import Session, select
 
 from lightly_studio.models.metadata import SampleMetadataTable
@@ -163,3 +164,75 @@ def test_bulk_update_metadata__overwrite_existing_metadata(
         ).all()
     )
     assert metadata_count_sample1 == 1
+
+
+def test_bulk_update_metadata__replaces_top_level_values(
+    db_session: Session,
+) -> None:
+    collection = create_collection(session=db_session)
+    sample = create_image(session=db_session, collection_id=collection.collection_id).sample
+    metadata_resolver.bulk_update_metadata(
+        db_session, [(sample.sample_id, {"nested": {"a": 1, "b": 2}, "note": "first"})]
+    )
+
+    # Nested objects are replaced as a whole and None is stored rather than dropped.
+    metadata_resolver.bulk_update_metadata(
+        db_session, [(sample.sample_id, {"nested": {"c": None}, "empty": None})]
+    )
+
+    metadata = db_session.exec(
+        select(SampleMetadataTable).where(SampleMetadataTable.sample_id == sample.sample_id)
+    ).one()
+    assert metadata.data == {"nested": {"c": None}, "note": "first", "empty": None}
+    assert metadata.metadata_schema == {"nested": "dict", "note": "string", "empty": "null"}
+
+
+def test_bulk_update_metadata__same_sample_twice(
+    db_session: Session,
+) -> None:
+    collection = create_collection(session=db_session)
+    sample = create_image(session=db_session, collection_id=collection.collection_id).sample
+
+    metadata_resolver.bulk_update_metadata(
+        db_session,
+        [
+            (sample.sample_id, {"temperature": 25, "location": "city"}),
+            (sample.sample_id, {"temperature": 30}),
+        ],
+    )
+
+    assert sample["temperature"] == 30
+    assert sample["location"] == "city"
+
+
+def test_bulk_update_metadata__type_mismatch(
+    db_session: Session,
+) -> None:
+    collection = create_collection(session=db_session)
+    sample1 = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs="/path/to/sample1.png",
+    ).sample
+    sample2 = create_image(
+        session=db_session,
+        collection_id=collection.collection_id,
+        file_path_abs="/path/to/sample2.png",
+    ).sample
+    metadata_resolver.bulk_update_metadata(db_session, [(sample1.sample_id, {"temperature": 25})])
+
+    with pytest.raises(
+        ValueError,
+        match=r"Value type mismatch for key 'temperature'\. Expected integer, got string\.",
+    ):
+        metadata_resolver.bulk_update_metadata(
+            db_session,
+            [
+                (sample2.sample_id, {"temperature": "warm"}),
+                (sample1.sample_id, {"temperature": "hot"}),
+            ],
+        )
+
+    # Nothing was written.
+    assert sample1["temperature"] == 25
+    assert sample2["temperature"] is None
@@ -9,7 +9,11 @@ from sqlmodel import Session
 
 from lightly_studio.models.embedding_region import EmbeddingRegion, Point2D
 from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
-from lightly_studio.resolvers import embedding_region_resolver, sample_embedding_resolver
+from lightly_studio.resolvers import (
+    embedding_region_resolver,
+    sample_embedding_resolver,
+    twodim_embedding_resolver,
+)
 from tests import helpers_resolvers
 from tests.helpers_resolvers import ImageStub
 
@@ -114,9 +118,16 @@ def _seed_2d_coordinates(
     )
     session.add(
         TwoDimEmbeddingTable(
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            sample_ids=twodim_embedding_resolver.encode_sample_ids(sample_ids),
             hash=cache_key,
-            x=[coordinates[sample_id][0] for sample_id in sample_ids],
-            y=[coordinates[sample_id][1] for sample_id in sample_ids],
+            x=twodim_embedding_resolver.encode_coordinates(
+                [coordinates[sample_id][0] for sample_id in sample_ids]
+            ),
+            y=twodim_embedding_resolver.encode_coordinates(
+                [coordinates[sample_id][1] for sample_id in sample_ids]
+            ),
         )
     )
     session.commit()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlmodel import Session, func, select, text
+
+from lightly_studio.dataset import env
+from lightly_studio.models.image import ImageTable
+from lightly_studio.resolvers import grid_count
+from lightly_studio.resolvers.grid_count import CountCache, TotalCount
+from tests.helpers_resolvers import create_collection, create_image
+
+
+@pytest.fixture(autouse=True)
+def _isolate_count_cache(mocker: MockerFixture) -> None:
+    mocker.patch.object(grid_count, "count_cache", CountCache(max_entries=16))
+
+
+def test_get_total_count__reuses_count_until_write(db_session: Session) -> None:
+    collection = create_collection(session=db_session)
+    create_image(session=db_session, collection_id=collection.collection_id, file_path_abs="/a")
+    count_query = select(func.count()).select_from(ImageTable)
+    fingerprint = ("image", collection.collection_id)
+
+    assert grid_count.get_total_count(
+        session=db_session, query=count_query, fingerprint=fingerprint
+    ) == TotalCount(count=1, is_exact=True)
+    # The count is served from the cache, without running the query.
+    other_query = select(func.count()).select_from(ImageTable).where(ImageTable.width < 0)
+    assert (
+        grid_count.get_total_count(
+            session=db_session, query=other_query, fingerprint=fingerprint
+        ).count
+        == 1
+    )
+    assert (
+        grid_count.get_total_count(
+            session=db_session, query=other_query, fingerprint=(*fingerprint, "width < 0")
+        ).count
+        == 0
+    )
+
+    create_image(session=db_session, collection_id=collection.collection_id, file_path_abs="/b")
+
+    assert (
+        grid_count.get_total_count(
+            session=db_session, query=count_query, fingerprint=fingerprint
+        ).count
+        == 2
+    )
+
+
+def test_get_total_count__exact_without_planner_estimate(
+    db_session: Session, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(env, "LIGHTLY_STUDIO_ESTIMATED_COUNT_MIN_ROWS", 0)
+    mocker.patch.object(grid_count, "estimate_count", return_value=None)
+    collection = create_collection(session=db_session)
+    create_image(session=db_session, collection_id=collection.collection_id)
+
+    total_count = grid_count.get_total_count(
+        session=db_session,
+        query=select(func.count()).select_from(ImageTable),
+        fingerprint=("image",),
+        allow_estimate=True,
+    )
+
+    assert total_count == TotalCount(count=1, is_exact=True)
+
+
+@pytest.mark.parametrize(("min_rows", "expected_is_exact"), [(0, False), (1_000_000, True)])
+def test_get_total_count__estimate_from_min_rows(
+    db_session: Session, mocker: MockerFixture, min_rows: int, expected_is_exact: bool
+) -> None:
+    mocker.patch.object(env, "LIGHTLY_STUDIO_ESTIMATED_COUNT_MIN_ROWS", min_rows)
+    mocker.patch.object(grid_count, "estimate_count", return_value=500)
+
+    total_count = grid_count.get_total_count(
+        session=db_session,
+        query=select(func.count()).select_from(ImageTable),
+        fingerprint=("image",),
+        allow_estimate=True,
+    )
+
+    assert total_count.is_exact == expected_is_exact
+    assert total_count.count == (0 if expected_is_exact else 500)
+
+
+def test_estimate_count__duckdb(db_session: Session) -> None:
+    if db_session.get_bind().dialect.name != "duckdb":
+        pytest.skip("DuckDB only")
+    query = select(func.count()).select_from(ImageTable)
+    assert grid_count.estimate_count(session=db_session, query=query) is None
+
+
+@pytest.mark.postgres_only
+def test_estimate_count__postgres(db_session: Session) -> None:
+    collection = create_collection(session=db_session)
+    for index in range(20):
+        create_image(
+            session=db_session, collection_id=collection.collection_id, file_path_abs=f"/{index}"
+        )
+    db_session.commit()
+    db_session.execute(text("ANALYZE image"))
+
+    count_query = select(func.count()).select_from(ImageTable)
+
+    # Statistics of a small table are exact after ANALYZE.
+    assert grid_count.estimate_count(session=db_session, query=count_query) == (
+        db_session.exec(count_query).one()
+    )
+
+
+def test_counted_rows__parallel_plan() -> None:
+    plan: dict[str, Any] = {
+        "Node Type": "Aggregate",
+        "Plan Rows": 1,
+        "Plans": [
+            {
+                "Node Type": "Gather",
+                "Workers Planned": 2,
+                "Plan Rows": 2,
+                "Plans": [
+                    {
+                        "Node Type": "Aggregate",
+                        "Plan Rows": 1,
+                        "Plans": [{"Node Type": "Seq Scan", "Plan Rows": 1000}],
+                    }
+                ],
+            }
+        ],
+    }
+
+    # Two workers and a leader contributing 40%.
+    assert grid_count._counted_rows(node=plan) == 2400
+
+
+def test_count_cache__evicts_least_recently_used() -> None:
+    cache = CountCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
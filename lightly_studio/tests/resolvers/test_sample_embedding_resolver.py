@@ -3,11 +3,12 @@ from __future__ import annotations
 from uuid import uuid4
 
 import numpy as np
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from lightly_studio.models.sample_embedding import (
     SampleEmbeddingCreate,
 )
+from lightly_studio.models.sample_embedding_version import SampleEmbeddingVersionTable
 from lightly_studio.resolvers import image_resolver, sample_embedding_resolver, tag_resolver
 from lightly_studio.resolvers.sample_resolver.sample_filter import SampleFilter
 from tests.helpers_resolvers import (
@@ -239,6 +240,135 @@ def test_get_all_by_collection_id_with_filter(db_session: Session) -> None:
     assert embedding_by_id[samples[1].sample_id] == [1.0, 2.0, 3.0]
 
 
+def test_iter_batches_by_collection_id(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    other_collection_id = create_collection(
+        session=db_session, collection_name="other"
+    ).collection_id
+    images = create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(f"sample{i}.png") for i in range(5)],
+    )
+    other_image = create_image(session=db_session, collection_id=other_collection_id)
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+    for index, image in enumerate([*images, other_image]):
+        create_sample_embedding(
+            session=db_session,
+            sample_id=image.sample_id,
+            embedding_model_id=embedding_model_id,
+            embedding=[float(index), 0.0, 0.0],
+        )
+
+    batches = list(
+        sample_embedding_resolver.iter_batches_by_collection_id(
+            session=db_session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            batch_size=2,
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row.sample_id for row in rows] == sorted(image.sample_id for image in images)
+    embedding_by_sample_id = {row.sample_id: row.embedding for row in rows}
+    for index, image in enumerate(images):
+        assert list(embedding_by_sample_id[image.sample_id]) == [float(index), 0.0, 0.0]
+
+
+def test_get_matrix_by_collection_id(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    images = create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(f"sample{i}.png") for i in range(3)],
+    )
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+    for index, image in enumerate(images):
+        create_sample_embedding(
+            session=db_session,
+            sample_id=image.sample_id,
+            embedding_model_id=embedding_model_id,
+            embedding=[float(index), 1.0, 2.0],
+        )
+
+    matrix = sample_embedding_resolver.get_matrix_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+    )
+
+    rows = sample_embedding_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+    )
+    assert matrix.sample_ids == [row.sample_id for row in rows]
+    assert matrix.embeddings.dtype == np.float32
+    assert matrix.embeddings.flags.c_contiguous
+    np.testing.assert_array_equal(matrix.embeddings, np.stack([row.embedding for row in rows]))
+
+    # Filter down to the first sample.
+    filtered = sample_embedding_resolver.get_matrix_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        filters=SampleFilter(sample_ids=[images[0].sample_id]),
+    )
+    assert filtered.sample_ids == [images[0].sample_id]
+    np.testing.assert_array_equal(filtered.embeddings, [[0.0, 1.0, 2.0]])
+
+
+def test_get_matrix_by_collection_id__empty(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+
+    matrix = sample_embedding_resolver.get_matrix_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+    )
+
+    assert matrix.sample_ids == []
+    assert matrix.embeddings.shape == (0, 0)
+
+
+def test_get_matrix_by_sample_ids(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    images = create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub(f"sample{i}.png") for i in range(3)],
+    )
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+    # The last image has no embedding.
+    for index, image in enumerate(images[:2]):
+        create_sample_embedding(
+            session=db_session,
+            sample_id=image.sample_id,
+            embedding_model_id=embedding_model_id,
+            embedding=[float(index), 0.0, 0.0],
+        )
+
+    matrix = sample_embedding_resolver.get_matrix_by_sample_ids(
+        session=db_session,
+        sample_ids=[images[2].sample_id, images[1].sample_id, images[0].sample_id],
+        embedding_model_id=embedding_model_id,
+    )
+
+    assert matrix.sample_ids == [images[1].sample_id, images[0].sample_id]
+    np.testing.assert_array_equal(matrix.embeddings, [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+
+
 def test_get_embedding_count(db_session: Session) -> None:
     # Create collections
     col1_id = create_collection(session=db_session).collection_id
@@ -288,3 +418,122 @@ def test_get_embedding_count(db_session: Session) -> None:
         embedding_model_id=embedding_model_2_id,
     )
     assert count == 0
+
+
+def test_get_version(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    other_collection_id = create_collection(
+        session=db_session, collection_name="other"
+    ).collection_id
+    images = create_images(
+        db_session=db_session,
+        collection_id=collection_id,
+        images=[ImageStub("sample1.png"), ImageStub("sample2.png")],
+    )
+    [other_image] = create_images(
+        db_session=db_session, collection_id=other_collection_id, images=[ImageStub("other.png")]
+    )
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+
+    def get_versions() -> tuple[int, int]:
+        return (
+            sample_embedding_resolver.get_version(
+                session=db_session,
+                collection_id=collection_id,
+                embedding_model_id=embedding_model_id,
+            ),
+            sample_embedding_resolver.get_version(
+                session=db_session,
+                collection_id=other_collection_id,
+                embedding_model_id=embedding_model_id,
+            ),
+        )
+
+    assert get_versions() == (0, 0)
+
+    # Inserting embeddings increments the version of their collection only.
+    sample_embedding_resolver.create_many(
+        session=db_session,
+        sample_embeddings=[
+            SampleEmbeddingCreate(
+                sample_id=image.sample_id,
+                embedding_model_id=embedding_model_id,
+                embedding=np.array([0.0, 0.0, 0.0], dtype=np.float32),
+            )
+            for image in images
+        ],
+    )
+    assert get_versions() == (1, 0)
+
+    create_sample_embedding(
+        session=db_session,
+        sample_id=other_image.sample_id,
+        embedding=[1.0, 2.0, 3.0],
+        embedding_model_id=embedding_model_id,
+    )
+    assert get_versions() == (1, 1)
+
+    # Any change to the samples' embeddings increments the version.
+    sample_embedding_resolver.increment_versions(
+        session=db_session, sample_ids=[images[0].sample_id, images[1].sample_id]
+    )
+    assert get_versions() == (2, 1)
+
+
+def test_increment_versions__inserts_missing_version(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    [image] = create_images(
+        db_session=db_session, collection_id=collection_id, images=[ImageStub("sample1.png")]
+    )
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+
+    # No version was read before, so there is no row to update.
+    create_sample_embedding(
+        session=db_session,
+        sample_id=image.sample_id,
+        embedding=[1.0, 2.0, 3.0],
+        embedding_model_id=embedding_model_id,
+    )
+
+    version = sample_embedding_resolver.get_version(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
+    assert version == 1
+
+
+def test_get_version__does_not_write(db_session: Session) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+
+    version = sample_embedding_resolver.get_version(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
+
+    assert version == 0
+    assert db_session.exec(select(SampleEmbeddingVersionTable)).all() == []
+
+
+def test_increment_collection_versions__only_models_of_the_collections(
+    db_session: Session,
+) -> None:
+    collection_id = create_collection(session=db_session).collection_id
+    other_collection_id = create_collection(session=db_session).collection_id
+    embedding_model_id = create_embedding_model(
+        session=db_session, collection_id=collection_id
+    ).embedding_model_id
+    create_embedding_model(session=db_session, collection_id=other_collection_id)
+
+    sample_embedding_resolver.increment_collection_versions(
+        session=db_session, collection_ids=[collection_id]
+    )
+
+    versions = db_session.exec(select(SampleEmbeddingVersionTable)).all()
+    assert [
+        (version.collection_id, version.embedding_model_id, version.version) for version in versions
+    ] == [(collection_id, embedding_model_id, 1)]
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from sqlmodel import Session
+
+from lightly_studio.api.routes.api.validators import Paginated
+from lightly_studio.dataset import env
+from lightly_studio.models.sample_embedding import SampleEmbeddingCreate
+from lightly_studio.resolvers import image_resolver, sample_embedding_resolver, similarity_index
+from lightly_studio.resolvers.similarity_index import IVFIndex
+from tests.helpers_resolvers import (
+    ImageStub,
+    create_collection,
+    create_embedding_model,
+    create_images,
+)
+
+
+def _clustered_embeddings(
+    num_embeddings: int, dimension: int, seed: int = 0
+) -> NDArray[np.float32]:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(32, dimension))
+    points = centers[rng.integers(0, len(centers), size=num_embeddings)]
+    embeddings: NDArray[np.float32] = (points + 0.3 * rng.normal(size=points.shape)).astype(
+        np.float32
+    )
+    return embeddings
+
+
+def _exact_nearest(
+    embeddings: NDArray[np.float32], query: NDArray[np.float32], k: int
+) -> NDArray[np.int64]:
+    unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return np.argsort(-(unit @ (query / np.linalg.norm(query))), kind="stable")[:k]
+
+
+def test_ivf_index__search_recall() -> None:
+    embeddings = _clustered_embeddings(num_embeddings=5000, dimension=32)
+    sample_ids = [uuid4() for _ in range(len(embeddings))]
+    index = IVFIndex.build(sample_ids=sample_ids, embeddings=embeddings, embedding_version=1)
+
+    assert len(index) == 5000
+    assert len(index.centroids) == 71
+    queries = _clustered_embeddings(num_embeddings=20, dimension=32, seed=1)
+    recalls = []
+    for query in queries:
+        expected = {sample_ids[i] for i in _exact_nearest(embeddings=embeddings, query=query, k=50)}
+        found = index.search(query_embedding=query, k=50)
+        assert len(found) == 50
+        recalls.append(len(expected.intersection(found)) / 50)
+    assert np.mean(recalls) >= 0.95
+
+
+def test_ivf_index__search_returns_nearest_first() -> None:
+    embeddings = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 0.1], [-1.0, 0.0]], dtype=np.float32)
+    sample_ids = [uuid4() for _ in range(len(embeddings))]
+    index = IVFIndex.build(sample_ids=sample_ids, embeddings=embeddings, embedding_version=1)
+
+    found = index.search(query_embedding=[1.0, 0.0], k=3, num_probes=len(index.centroids))
+
+    assert found == [sample_ids[0], sample_ids[2], sample_ids[1]]
+
+
+def test_ivf_index__probes_enough_lists_for_k() -> None:
+    embeddings = _clustered_embeddings(num_embeddings=1000, dimension=8)
+    sample_ids = [uuid4() for _ in range(len(embeddings))]
+    index = IVFIndex.build(sample_ids=sample_ids, embeddings=embeddings, embedding_version=1)
+
+    found = index.search(query_embedding=embeddings[0], k=900, num_probes=1)
+
+    assert len(found) == 900
+    assert len(set(found)) == 900
+
+
+def test_ivf_index__save_and_load(tmp_path: Path) -> None:
+    embeddings = _clustered_embeddings(num_embeddings=500, dimension=16)
+    sample_ids = [uuid4() for _ in range(len(embeddings))]
+    index = IVFIndex.build(sample_ids=sample_ids, embeddings=embeddings, embedding_version=7)
+    path = tmp_path / "index" / "model.npz"
+
+    index.save(path=path)
+    loaded = IVFIndex.load(path=path)
+
+    assert loaded.embedding_version == 7
+    assert loaded.sample_id_bytes == index.sample_id_bytes
+    np.testing.assert_array_equal(loaded.centroids, index.centroids)
+    np.testing.assert_array_equal(loaded.list_offsets, index.list_offsets)
+    np.testing.assert_array_equal(loaded.embeddings, index.embeddings)
+    assert loaded.search(query_embedding=embeddings[3], k=10) == index.search(
+        query_embedding=embeddings[3], k=10
+    )
+    assert list(path.parent.iterdir()) == [path]
+
+
+def _create_embedded_images(
+    session: Session, embeddings: NDArray[np.float32]
+) -> tuple[UUID, UUID, list[UUID]]:
+    collection_id = create_collection(session=session).collection_id
+    embedding_model = create_embedding_model(
+        session=session, collection_id=collection_id, embedding_dimension=embeddings.shape[1]
+    )
+    images = create_images(
+        db_session=session,
+        collection_id=collection_id,
+        images=[ImageStub(path=f"/images/{i:04d}.png") for i in range(len(embeddings))],
+    )
+    sample_embedding_resolver.create_many(
+        session=session,
+        sample_embeddings=[
+            SampleEmbeddingCreate(
+                sample_id=image.sample_id,
+                embedding_model_id=embedding_model.embedding_model_id,
+                embedding=embedding,
+            )
+            for image, embedding in zip(images, embeddings)
+        ],
+    )
+    return (
+        collection_id,
+        embedding_model.embedding_model_id,
+        [image.sample_id for image in images],
+    )
+
+
+def _build_ivf_index(session: Session, collection_id: UUID, embedding_model_id: UUID) -> None:
+    """Search once to schedule building the IVF index, and wait for it."""
+    similarity_index.search(
+        session=session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        query_embedding=[1.0] * 8,
+        k=1,
+    )
+    similarity_index.wait_for_ivf_builds()
+
+
+def test_search__none_below_threshold(db_session: Session) -> None:
+    embeddings = _clustered_embeddings(num_embeddings=20, dimension=4)
+    collection_id, embedding_model_id, _ = _create_embedded_images(
+        session=db_session, embeddings=embeddings
+    )
+
+    assert (
+        similarity_index.search(
+            session=db_session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            query_embedding=embeddings[0].tolist(),
+            k=5,
+        )
+        is None
+    )
+
+
+def test_search__candidates_above_threshold(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(env, "LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS", 0)
+    embeddings = _clustered_embeddings(num_embeddings=200, dimension=8)
+    collection_id, embedding_model_id, sample_ids = _create_embedded_images(
+        session=db_session, embeddings=embeddings
+    )
+    _build_ivf_index(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
+
+    candidates = similarity_index.search(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        query_embedding=embeddings[0].tolist(),
+        k=10,
+    )
+
+    assert candidates is not None
+    assert len(candidates) == 10
+    assert candidates[0] == sample_ids[0]
+    # Asking for all embeddings falls back to a full scan.
+    assert (
+        similarity_index.search(
+            session=db_session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            query_embedding=embeddings[0].tolist(),
+            k=200,
+        )
+        is None
+    )
+
+
+def test_search__finds_embeddings_added_after_a_search(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(env, "LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS", 0)
+    embeddings = _clustered_embeddings(num_embeddings=200, dimension=8)
+    collection_id, embedding_model_id, _ = _create_embedded_images(
+        session=db_session, embeddings=embeddings
+    )
+    query = np.random.default_rng(1).normal(size=8).astype(np.float32)
+    similarity_index.search(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        query_embedding=query.tolist(),
+        k=10,
+    )
+    similarity_index.wait_for_ivf_builds()
+    # End the request, discarding anything it did not commit.
+    db_session.rollback()
+
+    [new_image] = create_images(
+        db_session=db_session, collection_id=collection_id, images=[ImageStub(path="/new.png")]
+    )
+    sample_embedding_resolver.create_many(
+        session=db_session,
+        sample_embeddings=[
+            SampleEmbeddingCreate(
+                sample_id=new_image.sample_id,
+                embedding_model_id=embedding_model_id,
+                embedding=query,
+            )
+        ],
+    )
+    _build_ivf_index(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
+    candidates = similarity_index.search(
+        session=db_session,
+        collection_id=collection_id,
+        embedding_model_id=embedding_model_id,
+        query_embedding=query.tolist(),
+        k=10,
+    )
+
+    assert candidates is not None
+    assert candidates[0] == new_image.sample_id
+
+
+def test_image_resolver__similarity_page_matches_exact_search(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    embeddings = _clustered_embeddings(num_embeddings=300, dimension=8)
+    collection_id, embedding_model_id, _ = _create_embedded_images(
+        session=db_session, embeddings=embeddings
+    )
+    query = embeddings[10].tolist()
+    pagination = Paginated(offset=20, limit=10)
+
+    exact = image_resolver.get_all_by_collection_id(
+        session=db_session, collection_id=collection_id, pagination=pagination, text_embedding=query
+    )
+    monkeypatch.setattr(env, "LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS", 0)
+    _build_ivf_index(
+        session=db_session, collection_id=collection_id, embedding_model_id=embedding_model_id
+    )
+    approximate = image_resolver.get_all_by_collection_id(
+        session=db_session, collection_id=collection_id, pagination=pagination, text_embedding=query
+    )
+
+    assert [sample.sample_id for sample in approximate.samples] == [
+        sample.sample_id for sample in exact.samples
+    ]
+    assert approximate.similarity_scores == exact.similarity_scores
+    assert approximate.total_count == exact.total_count == 300
+    assert approximate.next_cursor == exact.next_cursor == 30
+
+
+def test_search__full_scan_while_index_is_built(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(env, "LIGHTLY_STUDIO_ANN_MIN_EMBEDDINGS", 0)
+    embeddings = _clustered_embeddings(num_embeddings=200, dimension=8)
+    collection_id, embedding_model_id, sample_ids = _create_embedded_images(
+        session=db_session, embeddings=embeddings
+    )
+    release = threading.Event()
+    num_builds = 0
+    build = IVFIndex.build
+
+    def blocking_build(*args: Any, **kwargs: Any) -> IVFIndex:
+        nonlocal num_builds
+        num_builds += 1
+        release.wait(timeout=10)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(IVFIndex, "build", blocking_build)
+
+    def search() -> list[UUID] | None:
+        return similarity_index.search(
+            session=db_session,
+            collection_id=collection_id,
+            embedding_model_id=embedding_model_id,
+            query_embedding=embeddings[0].tolist(),
+            k=10,
+        )
+
+    try:
+        assert search() is None
+        assert search() is None
+    finally:
+        release.set()
+    similarity_index.wait_for_ivf_builds()
+
+    candidates = search()
+    assert candidates is not None
+    assert candidates[0] == sample_ids[0]
+    assert num_builds == 1
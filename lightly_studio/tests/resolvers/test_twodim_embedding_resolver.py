@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from uuid import UUID, uuid4
+
 import numpy as np
+import pytest
 from pytest_mock import MockerFixture
 from sqlmodel import Session
 
-from lightly_studio.resolvers import twodim_embedding_resolver
+from lightly_studio.models.two_dim_embedding import TwoDimEmbeddingTable
+from lightly_studio.resolvers import sample_embedding_resolver, twodim_embedding_resolver
 from tests import helpers_resolvers
 from tests.helpers_resolvers import (
     ImageStub,
@@ -143,6 +147,56 @@ def test_get_twodim_embeddings__cache_hit(
     assert sample_ids_first_call == sample_ids_third_call
 
 
+def test_get_twodim_projection__stores_binary_layout(db_session: Session) -> None:
+    collection = helpers_resolvers.create_collection(session=db_session)
+    embedding_model = helpers_resolvers.create_embedding_model(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_dimension=3,
+    )
+    helpers_resolvers.create_samples_with_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        images_and_embeddings=[
+            (ImageStub(path="sample_1.jpg"), [0.1, 0.2, 0.3]),
+            (ImageStub(path="sample_2.jpg"), [0.4, 0.5, 0.6]),
+            (ImageStub(path="sample_3.jpg"), [0.7, 0.8, 0.1]),
+        ],
+    )
+
+    projection = twodim_embedding_resolver.get_twodim_projection(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+    )
+
+    cached = db_session.get(
+        TwoDimEmbeddingTable, (collection.collection_id, embedding_model.embedding_model_id)
+    )
+    assert cached is not None
+    assert cached.x == projection.x.astype("<f4").tobytes()
+    assert cached.y == projection.y.astype("<f4").tobytes()
+    assert cached.sample_ids == projection.sample_id_bytes
+    assert len(projection.sample_id_bytes) == 3 * twodim_embedding_resolver.SAMPLE_ID_NUM_BYTES
+    x_values, y_values, sample_ids = twodim_embedding_resolver.get_twodim_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+    )
+    np.testing.assert_array_equal(x_values, projection.x)
+    np.testing.assert_array_equal(y_values, projection.y)
+    assert sample_ids == projection.sample_ids
+
+
+def test_encode_and_decode_sample_ids() -> None:
+    sample_ids = [uuid4(), UUID(int=0), uuid4()]
+    encoded = twodim_embedding_resolver.encode_sample_ids(sample_ids)
+    assert len(encoded) == 3 * twodim_embedding_resolver.SAMPLE_ID_NUM_BYTES
+    assert twodim_embedding_resolver.decode_sample_ids(encoded) == sample_ids
+    assert twodim_embedding_resolver.decode_sample_ids(b"") == []
+
+
 def test_get_twodim_embeddings__recomputes_when_samples_change(
     db_session: Session,
     mocker: MockerFixture,
@@ -207,3 +261,171 @@ def test_get_twodim_embeddings__recomputes_when_samples_change(
     assert x_second.shape == (2,)
     assert y_second.shape == (2,)
     assert len(sample_ids_second) == 2
+
+
+def test_get_twodim_embeddings__extends_projection_for_added_samples(
+    db_session: Session,
+    mocker: MockerFixture,
+) -> None:
+    collection = helpers_resolvers.create_collection(session=db_session)
+    embedding_model = helpers_resolvers.create_embedding_model(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_dimension=3,
+    )
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(30, 3)).tolist()
+    images = helpers_resolvers.create_samples_with_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        images_and_embeddings=[
+            (ImageStub(path=f"sample_{i}.jpg"), embedding) for i, embedding in enumerate(embeddings)
+        ],
+    )
+    calculate_spy = mocker.spy(twodim_embedding_resolver, "_calculate_2d_embeddings")
+    x_first, y_first, sample_ids_first = twodim_embedding_resolver.get_twodim_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        max_drift=0.1,
+    )
+    first_coordinates = dict(zip(sample_ids_first, zip(x_first, y_first)))
+
+    # Add a duplicate of the first sample, which changes 1 of 31 samples.
+    [added_image] = helpers_resolvers.create_samples_with_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        images_and_embeddings=[(ImageStub(path="sample_duplicate.jpg"), embeddings[0])],
+    )
+    x_second, y_second, sample_ids_second = twodim_embedding_resolver.get_twodim_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        max_drift=0.1,
+    )
+
+    # The projection was extended instead of recomputed.
+    calculate_spy.assert_called_once()
+    assert sorted(sample_ids_second) == sorted([*sample_ids_first, added_image.sample_id])
+    second_coordinates = dict(zip(sample_ids_second, zip(x_second, y_second)))
+    for sample_id, coordinate in first_coordinates.items():
+        assert second_coordinates[sample_id] == coordinate
+    # The duplicate lands on the sample it duplicates.
+    np.testing.assert_allclose(
+        second_coordinates[added_image.sample_id],
+        first_coordinates[images[0].sample_id],
+        atol=1e-3,
+    )
+
+
+def test_get_twodim_embeddings__recomputes_past_max_drift(
+    db_session: Session,
+    mocker: MockerFixture,
+) -> None:
+    collection = helpers_resolvers.create_collection(session=db_session)
+    embedding_model = helpers_resolvers.create_embedding_model(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_dimension=3,
+    )
+    rng = np.random.default_rng(0)
+    calculate_spy = mocker.spy(twodim_embedding_resolver, "_calculate_2d_embeddings")
+
+    # Add 2 of 12, then 2 of 14 samples: the first update stays within a drift of 0.25,
+    # the second one exceeds it with 4 changed samples.
+    for num_samples, expected_calls in [(10, 1), (2, 1), (2, 2)]:
+        helpers_resolvers.create_samples_with_embeddings(
+            session=db_session,
+            collection_id=collection.collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            images_and_embeddings=[
+                (ImageStub(path=f"sample_{expected_calls}_{i}.jpg"), embedding)
+                for i, embedding in enumerate(rng.normal(size=(num_samples, 3)).tolist())
+            ],
+        )
+        _, _, sample_ids = twodim_embedding_resolver.get_twodim_embeddings(
+            session=db_session,
+            collection_id=collection.collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            max_drift=0.25,
+        )
+        assert calculate_spy.call_count == expected_calls
+    assert len(sample_ids) == 14
+
+
+def test_get_twodim_embeddings__negative_max_drift(db_session: Session) -> None:
+    collection = helpers_resolvers.create_collection(session=db_session)
+    embedding_model = helpers_resolvers.create_embedding_model(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_dimension=3,
+    )
+
+    with pytest.raises(ValueError, match="max_drift must not be negative"):
+        twodim_embedding_resolver.get_twodim_embeddings(
+            session=db_session,
+            collection_id=collection.collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+            max_drift=-0.1,
+        )
+
+
+def test__project_out_of_sample() -> None:
+    reference_embeddings = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+    reference_xy = np.array([[0.0, 0.0], [10.0, 10.0]], dtype=np.float32)
+    new_embeddings = np.array([[2.0, 0.0], [1.0, 1.0]], dtype=np.float32)
+
+    projected = twodim_embedding_resolver._project_out_of_sample(
+        reference_embeddings=reference_embeddings,
+        reference_xy=reference_xy,
+        new_embeddings=new_embeddings,
+    )
+
+    # A scaled copy of a reference lands on it, an equidistant point halfway between.
+    np.testing.assert_allclose(projected, [[0.0, 0.0], [5.0, 5.0]], atol=1e-3)
+
+
+def test_get_twodim_embeddings__skips_hash_while_version_is_unchanged(
+    db_session: Session,
+    mocker: MockerFixture,
+) -> None:
+    collection = helpers_resolvers.create_collection(session=db_session)
+    embedding_model = helpers_resolvers.create_embedding_model(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_dimension=3,
+    )
+    helpers_resolvers.create_samples_with_embeddings(
+        session=db_session,
+        collection_id=collection.collection_id,
+        embedding_model_id=embedding_model.embedding_model_id,
+        images_and_embeddings=[
+            (ImageStub(path="sample_1.jpg"), [0.1, 0.2, 0.3]),
+            (ImageStub(path="sample_2.jpg"), [0.4, 0.5, 0.6]),
+        ],
+    )
+    hash_spy = mocker.spy(sample_embedding_resolver, "get_hash_by_collection_id")
+
+    # The first call computes the projection, the second one only checks the version.
+    for _ in range(2):
+        _, _, sample_ids = twodim_embedding_resolver.get_twodim_embeddings(
+            session=db_session,
+            collection_id=collection.collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+        )
+        assert len(sample_ids) == 2
+    assert hash_spy.call_count == 1
+
+    # A version change without a content change is verified with the hash.
+    sample_embedding_resolver.increment_versions(session=db_session, sample_ids=sample_ids)
+    calculate_spy = mocker.spy(twodim_embedding_resolver, "_calculate_2d_embeddings")
+    for _ in range(2):
+        twodim_embedding_resolver.get_twodim_embeddings(
+            session=db_session,
+            collection_id=collection.collection_id,
+            embedding_model_id=embedding_model.embedding_model_id,
+        )
+    assert hash_spy.call_count == 2
+    calculate_spy.assert_not_called()
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from sqlmodel import Session
 
 from lightly_studio.api.routes.api.validators import Paginated
@@ -335,3 +337,32 @@ def test_get_all_by_collection_id__with_video_id(db_session: Session) -> None:
 
     assert result.samples[1].frame_number == 1
     assert result.samples[1].parent_sample_id == video_frames.video_sample_id
+
+
+def test_get_all_by_collection_id__with_seek_cursor(db_session: Session) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    video_b = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path="/b.mp4", duration_s=3.0, fps=1.0),
+    )
+    video_a = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path="/a.mp4", duration_s=2.0, fps=1.0),
+    )
+
+    seek_ids: list[UUID] = []
+    seek_cursor = None
+    for _ in range(3):
+        page = video_frame_resolver.get_all_by_collection_id(
+            session=db_session,
+            collection_id=video_a.video_frames_collection_id,
+            pagination=Paginated(offset=0, limit=2),
+            seek_cursor=seek_cursor,
+        )
+        seek_ids.extend(frame.sample_id for frame in page.samples)
+        seek_cursor = page.next_seek_cursor
+
+    assert seek_ids == video_a.frame_sample_ids + video_b.frame_sample_ids
+    assert seek_cursor is None
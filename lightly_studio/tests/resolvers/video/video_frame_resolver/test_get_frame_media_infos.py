@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from lightly_studio.models.collection import SampleType
+from lightly_studio.resolvers import video_frame_resolver
+from lightly_studio.resolvers.video_frame_resolver import VideoFrameMediaInfo
+from tests.helpers_resolvers import create_collection
+from tests.resolvers.video.helpers import VideoStub, create_video_with_frames
+
+
+def test_get_frame_media_infos_by_ids(db_session: Session) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    video_a = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path="/data/a.mp4", duration_s=2.0, fps=1.0),
+    )
+    video_b = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path="/data/b.mp4", duration_s=2.0, fps=1.0),
+    )
+
+    frames = video_frame_resolver.get_frame_media_infos_by_ids(
+        session=db_session,
+        sample_ids=[video_b.frame_sample_ids[1], uuid4(), video_a.frame_sample_ids[0]],
+    )
+
+    assert frames == [
+        VideoFrameMediaInfo(
+            sample_id=video_b.frame_sample_ids[1],
+            video_path="/data/b.mp4",
+            frame_number=1,
+            rotation_deg=0,
+        ),
+        VideoFrameMediaInfo(
+            sample_id=video_a.frame_sample_ids[0],
+            video_path="/data/a.mp4",
+            frame_number=0,
+            rotation_deg=0,
+        ),
+    ]
+
+
+def test_get_frame_media_infos_by_ids__empty(db_session: Session) -> None:
+    assert (
+        video_frame_resolver.get_frame_media_infos_by_ids(session=db_session, sample_ids=[]) == []
+    )
+
+
+def test_get_frame_media_infos_by_video(db_session: Session) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    video = create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path="/data/a.mp4", duration_s=5.0, fps=1.0),
+    )
+    create_video_with_frames(
+        session=db_session,
+        collection_id=collection.collection_id,
+        video=VideoStub(path="/data/b.mp4", duration_s=5.0, fps=1.0),
+    )
+
+    frames = video_frame_resolver.get_frame_media_infos_by_video(
+        session=db_session, video_id=video.video_sample_id, start_frame=1, end_frame=4
+    )
+
+    assert [frame.sample_id for frame in frames] == video.frame_sample_ids[1:4]
+    assert [frame.frame_number for frame in frames] == [1, 2, 3]
+    assert {frame.video_path for frame in frames} == {"/data/a.mp4"}
@@ -548,3 +548,35 @@ def test_get_all_by_collection_id__with_classification_annotation(db_session: Se
     assert video.sample.annotations[0].annotation_label.annotation_label_name == "car"
     assert video.sample.annotations[0].object_detection_details is None
     assert video.sample.annotations[0].segmentation_details is None
+
+
+def test_get_all_by_collection_id__with_seek_cursor(db_session: Session) -> None:
+    collection = create_collection(session=db_session, sample_type=SampleType.VIDEO)
+    collection_id = collection.collection_id
+    # Two videos share a path, so only the sample ID orders them.
+    create_videos(
+        session=db_session,
+        collection_id=collection_id,
+        videos=[VideoStub(path=path) for path in ["/c.mp4", "/a.mp4", "/b.mp4", "/a.mp4"]],
+    )
+    offset_pages = [
+        video_resolver.get_all_by_collection_id(
+            session=db_session,
+            collection_id=collection_id,
+            pagination=Paginated(offset=offset, limit=2),
+        )
+        for offset in (0, 2)
+    ]
+
+    next_page = video_resolver.get_all_by_collection_id(
+        session=db_session,
+        collection_id=collection_id,
+        pagination=Paginated(offset=1000, limit=2),
+        seek_cursor=offset_pages[0].next_seek_cursor,
+    )
+
+    assert offset_pages[0].next_seek_cursor is not None
+    assert [video.sample_id for video in next_page.samples] == [
+        video.sample_id for video in offset_pages[1].samples
+    ]
+    assert next_page.total_count == 4
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from pytest_mock import MockerFixture
+
+from lightly_studio.utils import workers
+
+
+@pytest.mark.parametrize(
+    ("cpu_count", "expected"),
+    [(None, 1), (1, 1), (2, 1), (8, 7), (17, 16), (64, 16)],
+)
+def test_default_num_workers(mocker: MockerFixture, cpu_count: int | None, expected: int) -> None:
+    mocker.patch.object(os, "cpu_count", return_value=cpu_count)
+    assert workers.default_num_workers() == expected